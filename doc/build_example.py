@@ -825,6 +825,10 @@ class ExGenSeries(ExGen):
             yield f's2 = {icls}({kwa(SERIES_INIT_A)})'
             yield 's2'
             yield f"s1.{attr_func}(s2)"
+        elif attr == 'ewm()':
+            yield f's1 = {icls}({kwa(SERIES_INIT_E)})'
+            yield 's1'
+            yield f"s1.{attr_func}(span=2).mean()"
         elif attr in (
                 'drop_duplicated()',
                 'dropna()',
@@ -2047,6 +2051,10 @@ class ExGenFrame(ExGen):
             yield f'f1 = {icls}({kwa(FRAME_INIT_D)})'
             yield 'f1'
             yield f"f1.{attr_func}()"
+        elif attr == 'ewm()':
+            yield f'f1 = {icls}({kwa(FRAME_INIT_D)})'
+            yield 'f1'
+            yield f"f1.{attr_func}(span=2).mean()"
         elif attr in (
                 'drop_duplicated()',
                 'dropna()',
@@ -2192,12 +2200,34 @@ class ExGenFrame(ExGen):
             yield f'f2 = {icls}.from_fields({kwa(FRAME_INIT_FROM_FIELDS_L)})'
             yield 'f2'
             yield f"f1.{attr_func}(f2, left_columns='c', right_columns='f')"
+        elif attr == 'join_asof()':
+            yield f'f1 = {icls}.from_fields({kwa(FRAME_INIT_FROM_FIELDS_K)})'
+            yield 'f1'
+            yield f'f2 = {icls}.from_fields({kwa(FRAME_INIT_FROM_FIELDS_L)})'
+            yield 'f2'
+            yield f"f1.{attr_func}(f2, left_columns='a', right_columns='d')"
+        elif attr in ('join_semi()', 'join_anti()'):
+            yield f'f1 = {icls}.from_fields({kwa(FRAME_INIT_FROM_FIELDS_K)})'
+            yield 'f1'
+            yield f'f2 = {icls}.from_fields({kwa(FRAME_INIT_FROM_FIELDS_L)})'
+            yield 'f2'
+            yield f"f1.{attr_func}(f2, left_columns='c', right_columns='f')"
         elif attr == 'join_outer()':
             yield f'f1 = {icls}.from_fields({kwa(FRAME_INIT_FROM_FIELDS_K)})'
             yield 'f1'
             yield f'f2 = {icls}.from_fields({kwa(FRAME_INIT_FROM_FIELDS_L)})'
             yield 'f2'
             yield f"f1.{attr_func}(f2, left_columns='c', right_columns='f')"
+        elif attr in ('nlargest()', 'nsmallest()'):
+            yield f'f1 = {icls}.from_fields({kwa(FRAME_INIT_FROM_FIELDS_K)})'
+            yield 'f1'
+            yield f"f1.{attr_func}('a', 2)"
+        elif attr == 'group_by()':
+            yield f'f1 = {icls}.from_fields({kwa(FRAME_INIT_FROM_FIELDS_K)})'
+            yield 'f1'
+            yield f"g = f1.{attr_func}('c')"
+            yield "g.reduce.sum()"
+            yield "g.reduce.max()"
         elif attr == 'pivot()':
             yield f'f1 = {icls}.from_fields({kwa(FRAME_INIT_FROM_FIELDS_K)})'
             yield 'f1'
@@ -16,6 +16,7 @@ from static_frame.core.display import DisplayActive as DisplayActive
 from static_frame.core.display_config import DisplayConfig as DisplayConfig
 from static_frame.core.display_config import DisplayConfigs as DisplayConfigs
 from static_frame.core.display_config import DisplayFormats as DisplayFormats
+from static_frame.core.ewm import EWM as EWM
 from static_frame.core.exception import AxisInvalid as AxisInvalid
 from static_frame.core.exception import ErrorInit as ErrorInit
 from static_frame.core.exception import ErrorInitBus as ErrorInitBus
@@ -43,6 +44,7 @@ from static_frame.core.generic_aliases import TIndexAny as TIndexAny
 from static_frame.core.generic_aliases import TIndexHierarchyAny as TIndexHierarchyAny
 from static_frame.core.generic_aliases import TSeriesAny as TSeriesAny
 from static_frame.core.generic_aliases import TSeriesHEAny as TSeriesHEAny
+from static_frame.core.group_by import GroupBy as GroupBy
 from static_frame.core.hloc import HLoc as HLoc
 from static_frame.core.index import ILoc as ILoc
 from static_frame.core.index import Index as Index
@@ -73,6 +75,7 @@ from static_frame.core.index_datetime import IndexYearMonthGO as IndexYearMonthG
 from static_frame.core.index_hierarchy import IndexHierarchy as IndexHierarchy
 from static_frame.core.index_hierarchy import IndexHierarchyGO as IndexHierarchyGO
 from static_frame.core.interface_meta import InterfaceMeta as InterfaceMeta
+from static_frame.core.join import JoinIndex as JoinIndex
 from static_frame.core.memory_measure import MemoryDisplay as MemoryDisplay
 from static_frame.core.node_dt import InterfaceBatchDatetime as InterfaceBatchDatetime
 from static_frame.core.node_dt import InterfaceDatetime as InterfaceDatetime
@@ -82,6 +85,7 @@ from static_frame.core.node_iter import IterNodeApplyType as IterNodeApplyType
 from static_frame.core.node_iter import IterNodeAxis as IterNodeAxis
 from static_frame.core.node_iter import IterNodeDelegate as IterNodeDelegate
 from static_frame.core.node_iter import IterNodeDelegateMapable as IterNodeDelegateMapable
+from static_frame.core.node_iter import IterNodeDelegateReducible as IterNodeDelegateReducible
 from static_frame.core.node_iter import IterNodeDepthLevel as IterNodeDepthLevel
 from static_frame.core.node_iter import IterNodeDepthLevelAxis as IterNodeDepthLevelAxis
 from static_frame.core.node_iter import IterNodeGroup as IterNodeGroup
@@ -89,6 +93,7 @@ from static_frame.core.node_iter import IterNodeGroupAxis as IterNodeGroupAxis
 from static_frame.core.node_iter import IterNodeNoArgMapable as IterNodeNoArgMapable
 from static_frame.core.node_iter import IterNodeType as IterNodeType
 from static_frame.core.node_iter import IterNodeWindow as IterNodeWindow
+from static_frame.core.node_lazy import InterfaceLazy as InterfaceLazy
 from static_frame.core.node_re import InterfaceRe as InterfaceRe
 from static_frame.core.node_selector import InterfaceAssignQuartet as InterfaceAssignQuartet
 from static_frame.core.node_selector import InterfaceAssignTrio as InterfaceAssignTrio
@@ -114,6 +119,8 @@ from static_frame.core.series import SeriesHE as SeriesHE
 from static_frame.core.store_config import StoreConfig as StoreConfig
 from static_frame.core.store_config import StoreConfigMap as StoreConfigMap
 from static_frame.core.store_filter import StoreFilter as StoreFilter
+from static_frame.core.type_blocks import ConsolidationPolicy as ConsolidationPolicy
+from static_frame.core.type_blocks import ThreadPoolPolicy as ThreadPoolPolicy
 from static_frame.core.type_blocks import TypeBlocks as TypeBlocks
 from static_frame.core.type_clinic import CallGuard as CallGuard
 from static_frame.core.type_clinic import ClinicError as ClinicError
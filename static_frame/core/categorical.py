@@ -0,0 +1,392 @@
+'''
+A dictionary-encoded representation of a 1D array of low-cardinality values, stored as integer codes into an array of categories.
+'''
+from __future__ import annotations
+
+import operator
+
+import numpy as np
+import typing_extensions as tp
+
+from static_frame.core.archive_npy import Archive
+from static_frame.core.archive_npy import ArchiveDirectory
+from static_frame.core.archive_npy import ArchiveZip
+from static_frame.core.util import DEFAULT_STABLE_SORT_KIND
+from static_frame.core.util import DTYPE_INT_DEFAULT
+from static_frame.core.util import DTYPE_OBJECT
+from static_frame.core.util import DTYPE_OBJECT_KIND
+from static_frame.core.util import DTYPE_STR_KINDS
+from static_frame.core.util import PositionsAllocator
+from static_frame.core.util import argsort_array
+from static_frame.core.util import arrays_equal
+from static_frame.core.util import isin
+
+if tp.TYPE_CHECKING:
+    from static_frame.core.generic_aliases import TSeriesAny  # pylint: disable=W0611 #pragma: no cover
+    from static_frame.core.index_base import IndexBase  # pylint: disable=W0611 #pragma: no cover
+    from static_frame.core.util import TLabel  # pylint: disable=W0611 #pragma: no cover
+    from static_frame.core.util import TPathSpecifier  # pylint: disable=W0611 #pragma: no cover
+    TNDArrayAny = np.ndarray[tp.Any, tp.Any] # pylint: disable=W0611 #pragma: no cover
+    TDtypeAny = np.dtype[tp.Any] # pylint: disable=W0611 #pragma: no cover
+
+# unsigned integer dtypes for codes, in order of increasing size
+_DTYPES_CODES = (np.dtype(np.uint8), np.dtype(np.uint16), np.dtype(np.uint32), np.dtype(np.uint64))
+
+def dtype_codes(count: int) -> TDtypeAny:
+    '''Return the smallest unsigned integer dtype that can hold codes for ``count`` categories.
+    '''
+    for dtype in _DTYPES_CODES:
+        if count <= np.iinfo(dtype).max + 1:
+            return dtype
+    raise RuntimeError(f'too many categories: {count}') #pragma: no cover
+
+def factorize(array: TNDArrayAny) -> tp.Tuple[TNDArrayAny, TNDArrayAny]:
+    '''
+    Return the unique values of a 1D array of hashable values, sorted if orderable, and the position of each element in those values. As hashing is faster than sorting strings, values are hashed and only the unique values are sorted.
+    '''
+    store: tp.Dict[tp.Any, int] = {}
+    indexer = np.fromiter(
+            (store.setdefault(v, len(store)) for v in array.tolist()),
+            dtype=DTYPE_INT_DEFAULT,
+            count=len(array),
+            )
+    if array.dtype.kind == DTYPE_OBJECT_KIND:
+        unique = np.empty(len(store), dtype=DTYPE_OBJECT)
+        unique[:] = list(store)
+    else:
+        unique = np.array(list(store), dtype=array.dtype)
+    del store
+
+    # unorderable values retain their order of appearance
+    order = argsort_array(unique)
+    remap = np.empty(len(order), dtype=DTYPE_INT_DEFAULT)
+    remap[order] = PositionsAllocator.get(len(order))
+    return unique[order], remap[indexer]
+
+#-------------------------------------------------------------------------------
+
+class Categorical:
+    '''
+    An immutable, dictionary-encoded 1D array, where each element is stored as an integer code into an array of unique categories. For columns of few distinct values, codes use much less memory than strings; comparisons, ``isin()``, grouping, and sorting are evaluated once per category and then applied to codes. The decoded array is created only when ``values`` is accessed.
+
+    This type is not yet public: as :obj:`TypeBlocks` holds only NumPy arrays, it is not yet held by containers.
+    '''
+    __slots__ = (
+            '_codes',
+            '_categories',
+            '_ordered',
+            '_values',
+            )
+
+    _codes: TNDArrayAny
+    _categories: TNDArrayAny
+    _ordered: bool
+    _values: tp.Optional[TNDArrayAny]
+
+    FILE_CODES = '__codes__.npy'
+    FILE_CATEGORIES = '__categories__.npy'
+    KEY_DTYPE = '__dtype__'
+    KEY_ORDERED = '__ordered__'
+
+    @classmethod
+    def from_array(cls, array: TNDArrayAny) -> tp.Self:
+        '''Create a :obj:`Categorical` from a 1D array. If the values are orderable, categories are sorted.
+        '''
+        if array.ndim != 1:
+            raise RuntimeError('a Categorical must be created from a 1D array.')
+        ordered = True
+        if array.dtype.kind in DTYPE_STR_KINDS or array.dtype.kind == DTYPE_OBJECT_KIND:
+            categories, indexer = factorize(array)
+        else:
+            # NaN values are collected into one category
+            categories, indexer = np.unique(array, return_inverse=True)
+        codes = indexer.astype(dtype_codes(len(categories)))
+        if categories.dtype.kind == DTYPE_OBJECT_KIND and len(categories) > 1:
+            # if values are not orderable, categories are in order of appearance
+            try:
+                ordered = bool((categories[:-1] < categories[1:]).all())
+            except TypeError:
+                ordered = False
+        return cls(codes, categories, ordered=ordered)
+
+    @classmethod
+    def from_codes(cls,
+            codes: TNDArrayAny,
+            categories: TNDArrayAny,
+            *,
+            ordered: bool = False,
+            ) -> tp.Self:
+        '''Create a :obj:`Categorical` from integer codes and an array of unique categories.
+
+        Args:
+            ordered: if True, ``categories`` are known to be sorted, permitting sorting by codes.
+        '''
+        if codes.ndim != 1 or categories.ndim != 1:
+            raise RuntimeError('codes and categories must be 1D arrays.')
+        if codes.dtype.kind not in ('i', 'u'):
+            raise RuntimeError('codes must be an integer array.')
+        if len(codes) and (codes.min() < 0 or codes.max() >= len(categories)):
+            raise RuntimeError('codes must be positions in categories.')
+        return cls(codes.astype(dtype_codes(len(categories)), copy=False),
+                categories,
+                ordered=ordered,
+                )
+
+    def __init__(self,
+            codes: TNDArrayAny,
+            categories: TNDArrayAny,
+            *,
+            ordered: bool,
+            ) -> None:
+        '''Initializer for internal use; use :obj:`Categorical.from_array` or :obj:`Categorical.from_codes`.
+        '''
+        if codes.flags.writeable:
+            codes = codes.copy()
+            codes.flags.writeable = False
+        if categories.flags.writeable:
+            categories = categories.copy()
+            categories.flags.writeable = False
+        self._codes = codes
+        self._categories = categories
+        self._ordered = ordered
+        self._values = None
+
+    #---------------------------------------------------------------------------
+    # properties
+
+    @property
+    def codes(self) -> TNDArrayAny:
+        '''The immutable array of integer codes.'''
+        return self._codes
+
+    @property
+    def categories(self) -> TNDArrayAny:
+        '''The immutable array of unique categories.'''
+        return self._categories
+
+    @property
+    def values(self) -> TNDArrayAny:
+        '''The immutable decoded array, created on first access.'''
+        if self._values is None:
+            values = self._categories[self._codes]
+            values.flags.writeable = False
+            self._values = values
+        return self._values
+
+    @property
+    def dtype(self) -> TDtypeAny:
+        '''The dtype of the decoded array.'''
+        return self._categories.dtype
+
+    @property
+    def shape(self) -> tp.Tuple[int]:
+        return self._codes.shape # type: ignore
+
+    @property
+    def ndim(self) -> int:
+        return 1
+
+    @property
+    def size(self) -> int:
+        return self._codes.size
+
+    @property
+    def nbytes(self) -> int:
+        '''The bytes of codes and categories, excluding a decoded array.'''
+        return self._codes.nbytes + self._categories.nbytes # type: ignore
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}: {len(self._codes)} elements, {len(self._categories)} categories, {self.dtype}>'
+
+    def __array__(self, dtype: tp.Optional[TDtypeAny] = None) -> TNDArrayAny:
+        if dtype is None:
+            return self.values
+        return self.values.astype(dtype)
+
+    def __iter__(self) -> tp.Iterator[tp.Any]:
+        return iter(self.values)
+
+    def __getitem__(self, key: tp.Any) -> tp.Any:
+        '''Select by position; an integer returns an element, other selections return a :obj:`Categorical` that shares categories.
+        '''
+        codes = self._codes[key]
+        if codes.__class__ is not np.ndarray:
+            return self._categories[codes]
+        codes.flags.writeable = False
+        return self.__class__(codes, self._categories, ordered=self._ordered)
+
+    #---------------------------------------------------------------------------
+    # comparison
+
+    def _compare(self,
+            other: tp.Any,
+            func: tp.Callable[[tp.Any, tp.Any], TNDArrayAny],
+            ) -> TNDArrayAny:
+        if isinstance(other, Categorical):
+            if other._categories is self._categories and func in (operator.eq, operator.ne):
+                post = func(self._codes, other._codes)
+            else:
+                post = func(self.values, other.values)
+        elif isinstance(other, np.ndarray) or isinstance(other, (list, tuple)):
+            post = func(self.values, other)
+        else: # an element is compared to each category, then selected by codes
+            post = np.asarray(func(self._categories, other))[self._codes]
+        post.flags.writeable = False
+        return post
+
+    def __eq__(self, other: tp.Any) -> TNDArrayAny: # type: ignore
+        return self._compare(other, operator.eq)
+
+    def __ne__(self, other: tp.Any) -> TNDArrayAny: # type: ignore
+        return self._compare(other, operator.ne)
+
+    def __lt__(self, other: tp.Any) -> TNDArrayAny:
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other: tp.Any) -> TNDArrayAny:
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other: tp.Any) -> TNDArrayAny:
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other: tp.Any) -> TNDArrayAny:
+        return self._compare(other, operator.ge)
+
+    __hash__ = None # type: ignore
+
+    def isin(self, other: tp.Iterable[tp.Any]) -> TNDArrayAny:
+        '''Return an immutable Boolean array that is True where an element is in ``other``.
+        '''
+        post = isin(self._categories, other, array_is_unique=True)[self._codes]
+        post.flags.writeable = False
+        return post
+
+    def equals(self, other: tp.Any) -> bool:
+        '''Return True if ``other`` is a :obj:`Categorical` with the same decoded values and dtype, where NA values are equal.
+        '''
+        if id(other) == id(self):
+            return True
+        if not isinstance(other, Categorical):
+            return False
+        if self.dtype != other.dtype or len(self) != len(other):
+            return False
+        if len(self._categories) == len(other._categories) and arrays_equal(
+                self._categories,
+                other._categories,
+                skipna=True,
+                ):
+            return arrays_equal(self._codes, other._codes, skipna=False)
+        return arrays_equal(self.values, other.values, skipna=True)
+
+    #---------------------------------------------------------------------------
+    # sorting and grouping
+
+    def _ranks(self) -> TNDArrayAny:
+        '''Return, for each category, its position in the sorted categories.
+        '''
+        if self._ordered:
+            return self._codes
+        order = argsort_array(self._categories)
+        ranks = np.empty(len(order), dtype=self._codes.dtype)
+        ranks[order] = np.arange(len(order), dtype=self._codes.dtype)
+        return ranks[self._codes] # type: ignore
+
+    def argsort(self, *, ascending: bool = True) -> TNDArrayAny:
+        '''Return the positions that sort the decoded values. As with :obj:`Series.sort_values`, a descending sort is the reverse of an ascending sort.
+        '''
+        order = np.argsort(self._ranks(), kind=DEFAULT_STABLE_SORT_KIND)
+        if ascending:
+            return order
+        return order[::-1]
+
+    def sort(self, *, ascending: bool = True) -> tp.Self:
+        '''Return a new :obj:`Categorical` with sorted values.
+        '''
+        return self[self.argsort(ascending=ascending)] # type: ignore
+
+    def unique(self) -> TNDArrayAny:
+        '''Return the categories that are present.
+        '''
+        post = self._categories[np.bincount(self._codes, minlength=len(self._categories)) > 0]
+        post.flags.writeable = False
+        return post
+
+    def iter_group_positions(self) -> tp.Iterator[tp.Tuple[tp.Any, TNDArrayAny]]:
+        '''Yield pairs of each present category and the ascending positions of its elements, in the order of categories.
+        '''
+        order = np.argsort(self._codes, kind=DEFAULT_STABLE_SORT_KIND)
+        counts = np.bincount(self._codes, minlength=len(self._categories))
+        start = 0
+        for category, count in zip(self._categories, counts):
+            if count:
+                yield category, order[start: start + count]
+                start += count
+
+    #---------------------------------------------------------------------------
+    # exporters
+
+    def to_series(self, *,
+            index: tp.Optional[tp.Union[IndexBase, tp.Iterable[TLabel]]] = None,
+            name: TLabel = None,
+            ) -> TSeriesAny:
+        '''Return a :obj:`Series` of the decoded values.
+        '''
+        from static_frame.core.series import Series
+        return Series(self.values, index=index, name=name)
+
+    def _to_archive(self, archive: Archive) -> None:
+        categories = self._categories
+        dtype = None
+        if categories.dtype == DTYPE_OBJECT:
+            # object categories of only strings are stored as a unicode array
+            if not all(isinstance(c, str) for c in categories):
+                raise RuntimeError('cannot archive object categories that are not all strings.')
+            categories = categories.astype(str)
+            dtype = 'object'
+        archive.write_array(self.FILE_CODES, self._codes)
+        archive.write_array(self.FILE_CATEGORIES, categories)
+        archive.write_metadata({self.KEY_DTYPE: dtype, self.KEY_ORDERED: self._ordered})
+
+    @classmethod
+    def _from_archive(cls, archive: Archive) -> tp.Self:
+        metadata = archive.read_metadata()
+        categories = archive.read_array(cls.FILE_CATEGORIES)
+        if metadata[cls.KEY_DTYPE] == 'object':
+            categories = categories.astype(object)
+        return cls(archive.read_array(cls.FILE_CODES),
+                categories,
+                ordered=metadata[cls.KEY_ORDERED],
+                )
+
+    def to_npz(self, fp: TPathSpecifier) -> None:
+        '''Write codes and categories to an uncompressed zip of NPY files.
+        '''
+        archive = ArchiveZip(fp, writeable=True, memory_map=False)
+        try:
+            self._to_archive(archive)
+        finally:
+            archive.__del__()
+
+    @classmethod
+    def from_npz(cls, fp: TPathSpecifier) -> tp.Self:
+        '''Create a :obj:`Categorical` from a zip of NPY files written by :obj:`Categorical.to_npz`.
+        '''
+        archive = ArchiveZip(fp, writeable=False, memory_map=False)
+        try:
+            return cls._from_archive(archive)
+        finally:
+            archive.__del__()
+
+    def to_npy(self, fp: TPathSpecifier) -> None:
+        '''Write codes and categories as NPY files in a new directory.
+        '''
+        self._to_archive(ArchiveDirectory(fp, writeable=True, memory_map=False))
+
+    @classmethod
+    def from_npy(cls, fp: TPathSpecifier) -> tp.Self:
+        '''Create a :obj:`Categorical` from a directory of NPY files written by :obj:`Categorical.to_npy`.
+        '''
+        return cls._from_archive(ArchiveDirectory(fp, writeable=False, memory_map=False))
@@ -30,6 +30,7 @@ from static_frame.core.util import DTYPE_BOOL
 from static_frame.core.util import DTYPE_OBJECT
 from static_frame.core.util import DTYPE_STR
 from static_frame.core.util import DTYPE_STR_KINDS
+from static_frame.core.util import EMPTY_ARRAY_INT
 from static_frame.core.util import INT_TYPES
 from static_frame.core.util import NULL_SLICE
 from static_frame.core.util import STATIC_ATTR
@@ -817,7 +818,7 @@ def matmul(lhs: tp.Any, rhs: tp.Any) -> tp.Any:
 
 def axis_window_items( *,
         source: tp.Union[TSeriesAny, TFrameAny, Quilt],
-        size: int,
+        size: tp.Union[int, np.timedelta64],
         axis: int = 0,
         step: int = 1,
         window_sized: bool = True,
@@ -827,7 +828,7 @@ def axis_window_items( *,
         label_missing_skips: bool = True,
         label_missing_raises: bool = False,
         start_shift: int = 0,
-        size_increment: int = 0,
+        size_increment: tp.Union[int, np.timedelta64] = 0,
         as_array: bool = False,
         derive_label: bool = True,
         ) -> tp.Iterator[tp.Tuple[TLabel, tp.Any]]:
@@ -841,10 +842,12 @@ def axis_window_items( *,
     from static_frame.core.frame import Frame
     from static_frame.core.series import Series
 
-    if size <= 0:
-        raise RuntimeError('window size must be greater than 0')
-    if step < 0:
-        raise RuntimeError('window step cannot be less than than 0')
+    duration = isinstance(size, np.timedelta64)
+    if not duration:
+        if size <= 0: # type: ignore
+            raise RuntimeError('window size must be greater than 0')
+        if step < 0:
+            raise RuntimeError('window step cannot be less than than 0')
 
     source_ndim = source.ndim
     values: tp.Optional[TNDArrayAny] = None
@@ -861,6 +864,51 @@ def axis_window_items( *,
             # for a Frame, when collecting rows, it is more efficient to pre-consolidate blocks prior to slicing. Note that this results in the same block coercion necessary for each window (which is not the same for axis 1, where block coercion is not required)
             values = source._blocks.values
 
+    def extract(key: slice) -> tp.Any:
+        if source_ndim == 1:
+            if as_array:
+                return values[key] #type: ignore
+            return source._extract_iloc(key)
+        if axis == 0: # extract rows
+            if as_array and values is not None:
+                return values[key]
+            if as_array:
+                return source._extract_array(key) #type: ignore
+            # use low level iloc selector
+            return source._extract(row_key=key) #type: ignore
+        # extract columns
+        if as_array:
+            return source._extract_array(NULL_SLICE, key) #type: ignore
+        return source._extract(column_key=key) #type: ignore
+
+    label = None
+
+    if duration:
+        # window bounds are found for all windows at once
+        starts, sizes, positions = axis_window_positions(
+                labels=labels,
+                size=size,
+                step=step,
+                window_sized=window_sized,
+                label_shift=label_shift,
+                label_missing_skips=label_missing_skips,
+                label_missing_raises=label_missing_raises,
+                start_shift=start_shift,
+                size_increment=size_increment,
+                )
+        for start, count_window, position in zip(starts, sizes, positions):
+            window = extract(slice(start, start + count_window))
+            if window_valid and not window_valid(window):
+                continue
+            if position < 0:
+                label = None
+            elif derive_label:
+                label = labels.iloc[position]
+            if window_func:
+                window = window_func(window)
+            yield label, window
+        return
+
     count_labels = len(labels)
     if start_shift >= 0:
         count_window_max = count_labels
@@ -870,36 +918,16 @@ def axis_window_items( *,
     idx_left_max = count_window_max - 1
     idx_left = start_shift
     count = 0
-    label = None
 
     while True:
         # idx_left, size can change over iterations
-        idx_right = idx_left + size - 1
+        idx_right = idx_left + size - 1 # type: ignore
 
         # floor idx_left at 0 so as to not wrap
         idx_left_floored = idx_left if idx_left > 0 else 0
         idx_right_floored = idx_right if idx_right > -1 else -1 # will add one
 
-        key = slice(idx_left_floored, idx_right_floored + 1)
-
-        if source_ndim == 1:
-            if as_array:
-                window = values[key] #type: ignore
-            else:
-                window = source._extract_iloc(key)
-        else:
-            if axis == 0: # extract rows
-                if as_array and values is not None:
-                    window = values[key]
-                elif as_array:
-                    window = source._extract_array(key) #type: ignore
-                else: # use low level iloc selector
-                    window = source._extract(row_key=key) #type: ignore
-            else: # extract columns
-                if as_array:
-                    window = source._extract_array(NULL_SLICE, key) #type: ignore
-                else:
-                    window = source._extract(column_key=key) #type: ignore
+        window = extract(slice(idx_left_floored, idx_right_floored + 1))
 
         valid = True
         if not len(window):
@@ -934,6 +962,95 @@ def axis_window_items( *,
         if count > count_window_max or idx_left > idx_left_max or size < 0:
             break
 
+def axis_window_positions(*,
+        labels: IndexBase,
+        size: tp.Union[int, np.timedelta64],
+        step: int = 1,
+        window_sized: bool = True,
+        label_shift: int = 0,
+        label_missing_skips: bool = True,
+        label_missing_raises: bool = False,
+        start_shift: int = 0,
+        size_increment: tp.Union[int, np.timedelta64] = 0,
+        ) -> tp.Tuple[TNDArrayAny, TNDArrayAny, TNDArrayAny]:
+    '''Return, for each window that :obj:`axis_window_items` would yield over ``labels``, the position of its first element, its size, and the position of its label. Positions of labels retained when missing are -1.
+
+    If ``size`` is a ``np.timedelta64``, ``labels`` must be an :obj:`IndexDatetime` of ascending labels. Each window then ends at an element, starting with the element at ``start_shift`` and advancing ``step`` elements per window, and contains all elements whose labels are greater than that element's label less ``size``; the bounds of all windows are found with a single ``searchsorted``. If ``window_sized``, windows that begin before the first label plus ``size`` are skipped.
+    '''
+    count = len(labels)
+    duration = isinstance(size, np.timedelta64)
+
+    if duration:
+        from static_frame.core.index_datetime import IndexDatetime
+        if not isinstance(labels, IndexDatetime):
+            raise RuntimeError('a window size given as a duration requires an IndexDatetime')
+        if size <= np.timedelta64(0): # type: ignore
+            raise RuntimeError('window size must be greater than 0')
+    elif size <= 0: # type: ignore
+        raise RuntimeError('window size must be greater than 0')
+    if step < 0:
+        raise RuntimeError('window step cannot be less than than 0')
+
+    if start_shift >= 0:
+        count_window_max = count
+    else:
+        count_window_max = count + abs(start_shift)
+
+    iterations = np.arange(count_window_max + 1)
+    # for count windows, the position of the first element; for duration windows, the position of the last element
+    idx_anchor = start_shift + iterations * step
+    sizes = size + iterations * size_increment
+
+    # the first window is always evaluated; as step is not negative, and size changes monotonically, iteration ends at the first failing window
+    proceed = ((idx_anchor <= (count - 1 if duration else count_window_max - 1))
+            & (sizes >= (np.timedelta64(0) if duration else 0))
+            )
+    proceed[0] = True
+    if not proceed.all():
+        stop = int(np.argmin(proceed))
+        idx_anchor = idx_anchor[:stop]
+        sizes = sizes[:stop]
+
+    if duration:
+        if not count:
+            return EMPTY_ARRAY_INT, EMPTY_ARRAY_INT, EMPTY_ARRAY_INT
+        values = labels.values
+        if (values[1:] < values[:-1]).any():
+            raise RuntimeError('a window size given as a duration requires ascending labels')
+        idx_right = idx_anchor
+        ends = np.minimum(np.maximum(idx_right, -1) + 1, count)
+        # labels of the last element of each window, where one exists
+        in_range = (idx_right >= 0) & (idx_right < count)
+        bounds = values[np.where(in_range, idx_right, 0)] - sizes
+        starts = np.where(in_range,
+                np.searchsorted(values.astype(bounds.dtype), bounds, side='right'),
+                ends,
+                )
+        lengths = np.maximum(ends - starts, 0)
+        valid = lengths > 0
+        if window_sized:
+            valid &= values[0] <= bounds
+    else:
+        idx_right = idx_anchor + sizes - 1
+        starts = np.maximum(idx_anchor, 0)
+        ends = np.minimum(np.maximum(idx_right, -1) + 1, count)
+        lengths = np.maximum(ends - starts, 0)
+        valid = lengths > 0
+        if window_sized:
+            valid &= lengths == sizes
+
+    idx_label = idx_right + label_shift
+    missing = valid & ((idx_label < 0) | (idx_label >= count))
+    if missing.any():
+        if label_missing_raises:
+            raise InvalidWindowLabel(int(idx_label[missing][0]))
+        if label_missing_skips:
+            valid &= ~missing
+        else:
+            idx_label[missing] = -1
+
+    return starts[valid], lengths[valid], idx_label[valid]
+
 def get_block_match(
         width: int,
         values_source: tp.List[TNDArrayAny],
@@ -290,6 +290,13 @@ class DOC_TEMPLATE:
             left_template='left_template: Provide a format string for naming left columns in the joined result.',
             right_template='right_template: Provide a format string for naming right columns in the joined result.',
             fill_value='fill_value: A value to be used to fill space created in the join.',
+            strategy='strategy: The method used to find matching rows. ``"hash"`` factorizes and hashes the join keys; ``"sort"`` merges sorted join keys, sorting the right keys if necessary; ``"auto"`` uses ``"sort"`` if both left and right join keys are already sorted, otherwise ``"hash"``.',
+            max_workers='max_workers: If provided, hash-partition left and right rows by join keys into this number of partitions, and find the matching rows of each partition in parallel with the ThreadPoolExecutor or ProcessPoolExecutor; if None, matching rows are found without partitioning.',
+            use_threads=USE_THREADS,
+            left_by='left_by: Specify one or more left columns that must match exactly in addition to the join predicate.',
+            right_by='right_by: Specify one or more right columns that must match exactly in addition to the join predicate.',
+            direction='direction: Either ``"backward"``, to match the last right key less than or equal to the left key; ``"forward"``, to match the first right key greater than or equal to the left key; or ``"nearest"``, to match the closest right key, preferring ``"backward"`` when equidistant.',
+            tolerance='tolerance: If provided, the maximum distance between left and right keys for a match, such as a ``np.timedelta64`` for datetime64 keys.',
             composite_index='composite_index: If True, an index of tuples will be returned, formed from the left index label and the right index label; if False, an index of matching labels, if unique, will be returned.',
             composite_index_fill_value='composite_index_fill_value: Value to be used when forming a composite index when a label is missing.'
             )
@@ -431,7 +438,7 @@ class DOC_TEMPLATE:
     window = dict(
             args = f'''
         Args:
-            size: Elements per window, given as an integer greater than 0.
+            size: Elements per window, given as an integer greater than 0; alternatively, for an :obj:`IndexDatetime` of ascending labels, a duration given as a ``np.timedelta64``, where each window ends at an element (advanced by ``step``) and contains all elements with labels within that duration.
             {AXIS}
             step: Element shift per window, given as an integer greater than 0. Determines the step size between windows. A step of 1 shifts each window 1 element; a step equal to the ``size`` will result in non-overlapping windows.
             window_sized: if True, windows with fewer elements than ``size`` are skipped.
@@ -0,0 +1,353 @@
+'''
+Exponentially weighted moving statistics of a :obj:`Series` or :obj:`Frame`, where each statistic is computed for all columns of a block at once.
+'''
+from __future__ import annotations
+
+import numpy as np
+import typing_extensions as tp
+
+from static_frame.core.exception import AxisInvalid
+from static_frame.core.type_blocks import TypeBlocks
+from static_frame.core.util import DTYPE_FLOAT_DEFAULT
+from static_frame.core.util import isna_array
+
+if tp.TYPE_CHECKING:
+    from static_frame.core.generic_aliases import TFrameAny  # pylint: disable=W0611 #pragma: no cover
+    from static_frame.core.generic_aliases import TSeriesAny  # pylint: disable=W0611 #pragma: no cover
+    TNDArrayAny = np.ndarray[tp.Any, tp.Any] # pylint: disable=W0611 #pragma: no cover
+
+# the largest exponent of the inverse of a decay used within a chunk of a decayed cumulative sum, such that the inverse (at most e**230, or about 1e100) is finite
+_DECAY_EXPONENT_MAX = 230.0
+# the smallest chunk for which a decayed cumulative sum is solved by chunks; for faster decays, powers of the decay underflow after fewer doublings
+_DECAY_CHUNK_MIN = 1024
+
+#-------------------------------------------------------------------------------
+
+def ewm_alpha(*,
+        span: tp.Optional[float] = None,
+        halflife: tp.Optional[float] = None,
+        alpha: tp.Optional[float] = None,
+        ) -> float:
+    '''Return the smoothing factor given exactly one of ``span``, ``halflife``, or ``alpha``.
+    '''
+    if sum(arg is not None for arg in (span, halflife, alpha)) != 1:
+        raise RuntimeError('exactly one of span, halflife, or alpha must be provided.')
+    if span is not None:
+        if span < 1:
+            raise RuntimeError('span must be greater than or equal to 1.')
+        return 2.0 / (span + 1.0)
+    if halflife is not None:
+        if halflife <= 0:
+            raise RuntimeError('halflife must be greater than 0.')
+        return 1.0 - np.exp(-np.log(2.0) / halflife) # type: ignore
+    if not 0 < alpha <= 1: # type: ignore
+        raise RuntimeError('alpha must be greater than 0 and less than or equal to 1.')
+    return float(alpha) # type: ignore
+
+
+def decayed_cumsum(values: TNDArrayAny, decay: float) -> TNDArrayAny:
+    '''
+    Return the cumulative sum, along axis 0, of ``values`` where the sum is multiplied by ``decay`` before adding each value; i.e., ``post[t] = decay * post[t - 1] + values[t]``.
+
+    For slow decays, the recurrence is solved for chunks of rows with a cumulative sum of values scaled by increasing powers of the inverse of ``decay``; chunks are sized such that these powers do not overflow, and the sum at the end of each chunk is carried into the next. For fast decays, the sum is found by doubling the span of each partial sum until the decay of the span underflows to zero.
+    '''
+    post = np.array(values, dtype=DTYPE_FLOAT_DEFAULT)
+    count = len(post)
+    if decay == 0 or count <= 1:
+        return post
+
+    chunk = int(_DECAY_EXPONENT_MAX / -np.log(decay))
+    if chunk < _DECAY_CHUNK_MIN and chunk < count:
+        span = 1
+        decay_span = decay
+        while span < count and decay_span > 0:
+            post[span:] += decay_span * post[:-span]
+            span *= 2
+            decay_span *= decay_span
+        return post
+
+    chunk = min(chunk, count)
+    powers = np.power(decay, -np.arange(chunk, dtype=DTYPE_FLOAT_DEFAULT))
+    powers = powers.reshape((chunk,) + (1,) * (post.ndim - 1))
+
+    carry = None
+    for start in range(0, count, chunk):
+        end = min(start + chunk, count)
+        scale = powers[:end - start]
+        segment = post[start:end]
+        segment *= scale
+        np.cumsum(segment, axis=0, out=segment)
+        if carry is not None:
+            segment += carry * decay
+        segment /= scale
+        carry = segment[-1].copy()
+    return post
+
+
+def linear_recurrence(factors: TNDArrayAny, terms: TNDArrayAny) -> TNDArrayAny:
+    '''
+    Return the solution, along axis 0, of ``post[t] = factors[t] * post[t - 1] + terms[t]``, where ``post[0] = terms[0]``.
+
+    The recurrence is solved by doubling the span of composed steps: after each pass, each element is expressed in terms of the element a span before, until all spans reach the start or all composed factors underflow to zero.
+    '''
+    post = np.array(terms, dtype=DTYPE_FLOAT_DEFAULT)
+    factor = np.array(factors, dtype=DTYPE_FLOAT_DEFAULT)
+    count = len(post)
+    if count:
+        factor[0] = 0.0
+    span = 1
+    while span < count and factor[span:].any():
+        post[span:] += factor[span:] * post[:-span]
+        factor[span:] *= factor[:-span]
+        span *= 2
+    return post
+
+
+def _ewm_na(
+        values: TNDArrayAny,
+        isna: TNDArrayAny,
+        *,
+        alpha: float,
+        adjust: bool,
+        statistic: str,
+        bias: bool,
+        ) -> TNDArrayAny:
+    '''
+    Return an exponentially weighted moving ``statistic`` where NA values are present. Each observation is averaged with the prior statistic, where the prior is weighted by the decay for all elements (including NA) since the prior observation; positions of NA values retain the prior statistic. As each statistic is updated from deviations from the prior mean, and the unbiased correction from its own non-negative recurrence, fast decay through NA values does not lose precision to subtraction.
+    '''
+    beta = 1.0 - alpha
+    valid = ~isna
+    positions = np.arange(len(values)).reshape((-1,) + (1,) * (values.ndim - 1))
+
+    # the position of the prior observation, or -1
+    last = np.where(valid, positions, -1)
+    np.maximum.accumulate(last, axis=0, out=last)
+
+    with np.errstate(invalid='ignore', divide='ignore', over='ignore', under='ignore'):
+        # factor is the normalized weight of the prior statistic, complement the normalized weight of the observation; NA values carry the prior; a first observation has no prior
+        if adjust:
+            # observations have a weight of 1; the prior has the decayed sum of weights
+            total = decayed_cumsum(valid.astype(DTYPE_FLOAT_DEFAULT), beta)
+            total_prior = np.zeros_like(total)
+            total_prior[1:] = total[:-1]
+            factor = np.where(valid, beta * total_prior / total, 1.0)
+            complement = np.where(valid, 1.0 / total, 0.0)
+        else:
+            # the prior is normalized to 1, observations have a weight of alpha
+            prior = np.empty_like(last)
+            prior[:1] = -1
+            prior[1:] = last[:-1]
+            started = prior >= 0
+            decay = np.power(beta, np.where(started, positions - prior, 1))
+            factor = np.where(valid, np.where(started, decay / (decay + alpha), 0.0), 1.0)
+            complement = np.where(valid, np.where(started, alpha / (decay + alpha), 1.0), 0.0)
+
+        x = np.where(valid, values, 0.0)
+        mean = linear_recurrence(factor, complement * x)
+
+        if statistic == 'mean':
+            post = mean
+        else:
+            mean_prior = np.zeros_like(mean)
+            mean_prior[1:] = mean[:-1]
+            terms = np.where(valid,
+                    factor * (mean_prior - mean) ** 2 + complement * (x - mean) ** 2,
+                    0.0,
+                    )
+            post = linear_recurrence(factor, terms)
+            if not bias:
+                # one less the normalized sum of squared weights, from a recurrence of non-negative terms
+                denominator = linear_recurrence(factor * factor, 2.0 * factor * complement)
+                post /= denominator
+                post[np.cumsum(valid, axis=0) < 2] = np.nan
+                post[~(denominator > 0)] = np.nan
+            if statistic == 'std':
+                np.sqrt(post, out=post)
+
+    post[~(last >= 0)] = np.nan
+    return post
+
+
+def ewm_array(
+        values: TNDArrayAny,
+        *,
+        alpha: float,
+        adjust: bool,
+        skipna: bool,
+        statistic: str,
+        bias: bool = False,
+        ) -> TNDArrayAny:
+    '''
+    Return an exponentially weighted moving ``statistic`` (one of ``mean``, ``var``, or ``std``) of each column of a 1D or 2D array, along axis 0.
+
+    Observations are weighted by their distance, in elements, from the current element. Without NA values, each statistic is a ratio of decayed cumulative sums of weighted values; with NA values, variances, and means without adjustment, are found from a recurrence over deviations from the prior mean. If ``adjust``, each observation has an initial weight of 1; otherwise, the first observation has an initial weight of 1 and subsequent observations an initial weight of ``alpha``. If ``skipna``, NA values have no weight but, as elements, still decay prior observations, and their position takes the statistic of the previous observation; otherwise, NA values propagate.
+    '''
+    dtype = values.dtype
+    if dtype.kind != 'f':
+        values = values.astype(DTYPE_FLOAT_DEFAULT)
+    isna = isna_array(values)
+    has_na = isna.any()
+    beta = 1.0 - alpha
+
+    if has_na and (not adjust or statistic != 'mean'):
+        post = _ewm_na(values,
+                isna,
+                alpha=alpha,
+                adjust=adjust,
+                statistic=statistic,
+                bias=bias,
+                )
+        if not skipna:
+            # any NA propagates to all subsequent elements
+            post[np.logical_or.accumulate(isna, axis=0)] = np.nan
+        if dtype.kind == 'f':
+            return post.astype(dtype, copy=False)
+        return post
+
+    if has_na:
+        weights = (~isna).astype(DTYPE_FLOAT_DEFAULT)
+    else:
+        # without NA, weights are the same for all columns
+        weights = np.full(len(values), 1.0 if adjust else alpha, dtype=DTYPE_FLOAT_DEFAULT)
+        if not adjust and len(weights):
+            weights[0] = 1.0
+        weights = weights.reshape((len(values),) + (1,) * (values.ndim - 1))
+
+    if statistic == 'mean':
+        x = np.where(isna, 0.0, values) if has_na else values
+    else:
+        # shifting by the mean of observations does not change the variance, but reduces the loss of precision of subtracting squares
+        with np.errstate(invalid='ignore', divide='ignore'):
+            shift = np.nanmean(values, axis=0) if has_na else values.mean(axis=0)
+        shift = np.where(np.isfinite(shift), shift, 0.0)
+        x = np.where(isna, 0.0, values - shift) if has_na else values - shift
+
+    total = decayed_cumsum(weights, beta)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = decayed_cumsum(weights * x, beta) / total
+        if statistic == 'mean':
+            post = mean
+        else:
+            post = decayed_cumsum(weights * x * x, beta) / total - mean * mean
+            np.maximum(post, 0.0, out=post)
+            # with a single observation, the biased variance is zero, not the rounding error of subtracting squares
+            post[np.broadcast_to(np.cumsum(~isna, axis=0) == 1, post.shape)] = 0.0
+            if not bias:
+                total_squared = total * total
+                # the cross-weight term, the square of the sum of weights less the sum of squared weights, accumulated without subtraction
+                total_prior = np.zeros_like(total)
+                total_prior[1:] = total[:-1]
+                denominator = decayed_cumsum(2.0 * beta * total_prior * weights, beta * beta)
+                post *= total_squared / denominator
+                # fewer than two observations have no unbiased variance
+                post[np.cumsum(~isna, axis=0) < 2] = np.nan
+                post[np.broadcast_to(~(denominator > 0), post.shape)] = np.nan
+            if statistic == 'std':
+                np.sqrt(post, out=post)
+
+    if has_na:
+        if not skipna:
+            # any NA propagates to all subsequent elements
+            post[np.logical_or.accumulate(isna, axis=0)] = np.nan
+        elif beta == 0:
+            # without decay, the statistic is not retained through NA values, and is taken from the previous observation
+            previous = np.where(isna, 0, np.arange(len(values)).reshape((-1,) + (1,) * (values.ndim - 1)))
+            np.maximum.accumulate(previous, axis=0, out=previous)
+            post = np.take_along_axis(post, previous, axis=0)
+
+    if dtype.kind == 'f':
+        return post.astype(dtype, copy=False)
+    return post
+
+#-------------------------------------------------------------------------------
+
+class EWM:
+    '''
+    Exponentially weighted moving statistics of a :obj:`Series` or :obj:`Frame`, returning a container of the same shape, index, and columns. Statistics are computed for all columns of each block at once with a vectorized recurrence; float blocks retain their dtype.
+    '''
+    __slots__ = (
+            '_container',
+            '_alpha',
+            '_adjust',
+            '_axis',
+            )
+
+    def __init__(self,
+            container: tp.Union[TFrameAny, TSeriesAny],
+            *,
+            span: tp.Optional[float] = None,
+            halflife: tp.Optional[float] = None,
+            alpha: tp.Optional[float] = None,
+            adjust: bool = True,
+            axis: int = 0,
+            ) -> None:
+        if axis not in (0, 1) or (axis == 1 and container.ndim == 1):
+            raise AxisInvalid(f'invalid axis: {axis}')
+
+        self._container = container
+        self._alpha = ewm_alpha(span=span, halflife=halflife, alpha=alpha)
+        self._adjust = adjust
+        self._axis = axis
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}: alpha {self._alpha:.6g}, adjust {self._adjust}, axis {self._axis}>'
+
+    def _compute(self, statistic: str, *, skipna: bool, bias: bool = False) -> tp.Union[TFrameAny, TSeriesAny]:
+        container = self._container
+
+        def func(values: TNDArrayAny) -> TNDArrayAny:
+            post = ewm_array(values,
+                    alpha=self._alpha,
+                    adjust=self._adjust,
+                    skipna=skipna,
+                    statistic=statistic,
+                    bias=bias,
+                    )
+            post.flags.writeable = False
+            return post
+
+        if container.ndim == 1:
+            return container.__class__(func(container.values),
+                    index=container.index,
+                    name=container.name,
+                    )
+
+        if self._axis == 0:
+            blocks = TypeBlocks.from_blocks(func(b) for b in container._blocks._blocks) # type: ignore
+        else:
+            # a row-wise recurrence requires all values of a row in one array
+            blocks = TypeBlocks.from_blocks(func(container._blocks.values.T).T) # type: ignore
+
+        return container.__class__(blocks,
+                index=container.index,
+                columns=container.columns, # type: ignore
+                name=container.name,
+                own_data=True,
+                )
+
+    #---------------------------------------------------------------------------
+    def mean(self, *, skipna: bool = True) -> tp.Union[TFrameAny, TSeriesAny]:
+        '''Return the exponentially weighted moving mean.
+
+        Args:
+            skipna: If True, NA values are given no weight; otherwise, NA values propagate.
+        '''
+        return self._compute('mean', skipna=skipna)
+
+    def var(self, *, skipna: bool = True, bias: bool = False) -> tp.Union[TFrameAny, TSeriesAny]:
+        '''Return the exponentially weighted moving variance.
+
+        Args:
+            skipna: If True, NA values are given no weight; otherwise, NA values propagate.
+            bias: If False, correct for the effective count of weighted observations.
+        '''
+        return self._compute('var', skipna=skipna, bias=bias)
+
+    def std(self, *, skipna: bool = True, bias: bool = False) -> tp.Union[TFrameAny, TSeriesAny]:
+        '''Return the exponentially weighted moving standard deviation.
+
+        Args:
+            skipna: If True, NA values are given no weight; otherwise, NA values propagate.
+            bias: If False, correct for the effective count of weighted observations.
+        '''
+        return self._compute('std', skipna=skipna, bias=bias)
@@ -64,6 +64,7 @@ from static_frame.core.display_config import DisplayConfig
 from static_frame.core.display_config import DisplayFormats
 from static_frame.core.doc_str import doc_inject
 from static_frame.core.doc_str import doc_update
+from static_frame.core.ewm import EWM
 from static_frame.core.exception import AxisInvalid
 from static_frame.core.exception import ErrorInitColumns
 from static_frame.core.exception import ErrorInitFrame
@@ -71,6 +72,7 @@ from static_frame.core.exception import ErrorInitIndex
 from static_frame.core.exception import ErrorInitIndexNonUnique
 from static_frame.core.exception import InvalidFillValue
 from static_frame.core.exception import RelabelInvalid
+from static_frame.core.group_by import GroupBy
 from static_frame.core.index import Index
 from static_frame.core.index import IndexGO
 from static_frame.core.index import _index_initializer_needs_init
@@ -83,7 +85,10 @@ from static_frame.core.index_base import IndexBase
 from static_frame.core.index_correspondence import IndexCorrespondence
 from static_frame.core.index_hierarchy import IndexHierarchy
 from static_frame.core.index_hierarchy import IndexHierarchyGO
+from static_frame.core.join import JoinIndex
 from static_frame.core.join import join
+from static_frame.core.join import join_asof
+from static_frame.core.join import join_mask
 from static_frame.core.metadata import JSONMeta
 from static_frame.core.node_dt import InterfaceDatetime
 from static_frame.core.node_fill_value import InterfaceFillValue
@@ -96,7 +101,8 @@ from static_frame.core.node_iter import IterNodeDepthLevelAxis
 from static_frame.core.node_iter import IterNodeGroupAxis
 from static_frame.core.node_iter import IterNodeGroupOther
 from static_frame.core.node_iter import IterNodeType
-from static_frame.core.node_iter import IterNodeWindow
+from static_frame.core.node_iter import IterNodeWindowReducible
+from static_frame.core.node_lazy import InterfaceLazy
 from static_frame.core.node_re import InterfaceRe
 from static_frame.core.node_selector import InterfaceAssignQuartet
 from static_frame.core.node_selector import InterfaceConsolidate
@@ -111,9 +117,13 @@ from static_frame.core.node_transpose import InterfaceTranspose
 from static_frame.core.node_values import InterfaceValues
 from static_frame.core.pivot import pivot_derive_constructors
 from static_frame.core.pivot import pivot_index_map
+from static_frame.core.pivot import pivot_stack_complete
+from static_frame.core.pivot import pivot_unstack_complete
 from static_frame.core.protocol_dfi import DFIDataFrame
 from static_frame.core.rank import RankMethod
 from static_frame.core.rank import rank_1d
+from static_frame.core.reduce import ReduceGroup
+from static_frame.core.reduce import ReduceWindow
 from static_frame.core.series import Series
 from static_frame.core.store_filter import STORE_FILTER_DEFAULT
 from static_frame.core.store_filter import StoreFilter
@@ -181,6 +191,7 @@ from static_frame.core.util import TUFunc
 from static_frame.core.util import WarningsSilent
 from static_frame.core.util import argmax_2d
 from static_frame.core.util import argmin_2d
+from static_frame.core.util import argpartition_extreme
 from static_frame.core.util import array2d_to_tuples
 from static_frame.core.util import array_to_duplicated
 from static_frame.core.util import blocks_to_array_2d
@@ -3664,6 +3675,12 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 container=self,
                 )
 
+    @property
+    def via_lazy(self) -> InterfaceLazy[TFrameAny]:
+        '''
+        Interface for deferring the evaluation of binary and unary operators, such that chained operators are evaluated together in chunks of rows.
+        '''
+        return InterfaceLazy(self)
 
     def via_fill_value(self,
             fill_value: tp.Any = np.nan,
@@ -3791,6 +3808,7 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 container=self,
                 function_values=self._axis_group_loc,
                 function_items=self._axis_group_loc_items,
+                function_reduce=self._axis_group_reduce,
                 yield_type=IterNodeType.VALUES,
                 apply_type=IterNodeApplyType.SERIES_ITEMS_GROUP_VALUES,
                 )
@@ -3804,6 +3822,7 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 container=self,
                 function_values=self._axis_group_loc,
                 function_items=self._axis_group_loc_items,
+                function_reduce=self._axis_group_reduce,
                 yield_type=IterNodeType.ITEMS,
                 apply_type=IterNodeApplyType.SERIES_ITEMS_GROUP_VALUES,
                 )
@@ -3818,6 +3837,7 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 container=self,
                 function_values=partial(self._axis_group_loc, as_array=True),
                 function_items=partial(self._axis_group_loc_items, as_array=True),
+                function_reduce=self._axis_group_reduce,
                 yield_type=IterNodeType.VALUES,
                 apply_type=IterNodeApplyType.SERIES_ITEMS_GROUP_VALUES,
                 )
@@ -3831,6 +3851,7 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 container=self,
                 function_values=partial(self._axis_group_loc, as_array=True),
                 function_items=partial(self._axis_group_loc_items, as_array=True),
+                function_reduce=self._axis_group_reduce,
                 yield_type=IterNodeType.ITEMS,
                 apply_type=IterNodeApplyType.SERIES_ITEMS_GROUP_VALUES,
                 )
@@ -3951,7 +3972,7 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
     #---------------------------------------------------------------------------
     @property
     @doc_inject(selector='window')
-    def iter_window(self) -> IterNodeWindow[TFrameAny]:
+    def iter_window(self) -> IterNodeWindowReducible[TFrameAny]:
         '''
         Iterator of windowed values, where values are given as a :obj:`Frame`.
 
@@ -3959,17 +3980,18 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
         '''
         function_values = partial(self._axis_window, as_array=False)
         function_items = partial(self._axis_window_items, as_array=False)
-        return IterNodeWindow(
+        return IterNodeWindowReducible(
                 container=self,
                 function_values=function_values,
                 function_items=function_items,
+                function_reduce=self._axis_window_reduce,
                 yield_type=IterNodeType.VALUES,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
                 )
 
     @property
     @doc_inject(selector='window')
-    def iter_window_items(self) -> IterNodeWindow[TFrameAny]:
+    def iter_window_items(self) -> IterNodeWindowReducible[TFrameAny]:
         '''
         Iterator of pairs of label, windowed values, where values are given as a :obj:`Frame`.
 
@@ -3977,17 +3999,18 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
         '''
         function_values = partial(self._axis_window, as_array=False)
         function_items = partial(self._axis_window_items, as_array=False)
-        return IterNodeWindow(
+        return IterNodeWindowReducible(
                 container=self,
                 function_values=function_values,
                 function_items=function_items,
+                function_reduce=self._axis_window_reduce,
                 yield_type=IterNodeType.ITEMS,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
                 )
 
     @property
     @doc_inject(selector='window')
-    def iter_window_array(self) -> IterNodeWindow[TFrameAny]:
+    def iter_window_array(self) -> IterNodeWindowReducible[TFrameAny]:
         '''
         Iterator of windowed values, where values are given as a :obj:`np.array`.
 
@@ -3995,17 +4018,18 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
         '''
         function_values = partial(self._axis_window, as_array=True)
         function_items = partial(self._axis_window_items, as_array=True)
-        return IterNodeWindow(
+        return IterNodeWindowReducible(
                 container=self,
                 function_values=function_values,
                 function_items=function_items,
+                function_reduce=self._axis_window_reduce,
                 yield_type=IterNodeType.VALUES,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
                 )
 
     @property
     @doc_inject(selector='window')
-    def iter_window_array_items(self) -> IterNodeWindow[TFrameAny]:
+    def iter_window_array_items(self) -> IterNodeWindowReducible[TFrameAny]:
         '''
         Iterator of pairs of label, windowed values, where values are given as a :obj:`np.array`.
 
@@ -4013,10 +4037,11 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
         '''
         function_values = partial(self._axis_window, as_array=True)
         function_items = partial(self._axis_window_items, as_array=True)
-        return IterNodeWindow(
+        return IterNodeWindowReducible(
                 container=self,
                 function_values=function_values,
                 function_items=function_items,
+                function_reduce=self._axis_window_reduce,
                 yield_type=IterNodeType.ITEMS,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
                 )
@@ -5543,6 +5568,9 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             name = None
         elif other.__class__ is InterfaceFillValue:
             raise RuntimeError('via_fill_value interfaces can only be used on the left-hand side of binary expressions.')
+        elif other.__class__ is InterfaceLazy:
+            # defer to the reverse operator of the lazy expression
+            return NotImplemented
         else:
             other = iterable_to_array_nd(other)
             if other.ndim == 0:# only for elements should we keep name
@@ -5855,6 +5883,14 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 as_array=as_array,
                 ))
 
+    def _axis_group_reduce(self,
+            key: TLocSelector,
+            *,
+            axis: int = 0,
+            drop: bool = False,
+            ) -> ReduceGroup:
+        return self.group_by(key, axis=axis, drop=drop).reduce
+
     #-----------------------------------------------------------------------
     def _axis_group_labels_items(self,
             depth_level: TDepthLevel = 0,
@@ -6025,7 +6061,7 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
 
     #---------------------------------------------------------------------------
     def _axis_window_items(self, *,
-            size: int,
+            size: tp.Union[int, np.timedelta64],
             axis: int = 0,
             step: int = 1,
             window_sized: bool = True,
@@ -6035,7 +6071,7 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             label_missing_skips: bool = True,
             label_missing_raises: bool = False,
             start_shift: int = 0,
-            size_increment: int = 0,
+            size_increment: tp.Union[int, np.timedelta64] = 0,
             as_array: bool = False,
             ) -> tp.Iterator[tp.Tuple[TLabel, tp.Any]]:
         '''Generator of index, processed-window pairs.
@@ -6059,7 +6095,7 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
 
 
     def _axis_window(self, *,
-            size: int,
+            size: tp.Union[int, np.timedelta64],
             axis: int = 0,
             step: int = 1,
             window_sized: bool = True,
@@ -6069,7 +6105,7 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             label_missing_skips: bool = True,
             label_missing_raises: bool = False,
             start_shift: int = 0,
-            size_increment: int = 0,
+            size_increment: tp.Union[int, np.timedelta64] = 0,
             as_array: bool = False,
             ) -> tp.Iterator[TFrameAny]:
         yield from (x for _, x in axis_window_items(
@@ -6089,6 +6125,33 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 derive_label=False,
                 ))
 
+    def _axis_window_reduce(self, *,
+            size: tp.Union[int, np.timedelta64],
+            axis: int = 0,
+            step: int = 1,
+            window_sized: bool = True,
+            window_func: tp.Optional[TCallableAny] = None,
+            window_valid: tp.Optional[TCallableAny] = None,
+            label_shift: int = 0,
+            label_missing_skips: bool = True,
+            label_missing_raises: bool = False,
+            start_shift: int = 0,
+            size_increment: tp.Union[int, np.timedelta64] = 0,
+            ) -> ReduceWindow:
+        return ReduceWindow.from_container(self,
+                size=size,
+                axis=axis,
+                step=step,
+                window_sized=window_sized,
+                window_func=window_func,
+                window_valid=window_valid,
+                label_shift=label_shift,
+                label_missing_skips=label_missing_skips,
+                label_missing_raises=label_missing_raises,
+                start_shift=start_shift,
+                size_increment=size_increment,
+                )
+
 
     #---------------------------------------------------------------------------
 
@@ -6302,6 +6365,48 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 own_index=True
                 )
 
+    def _extreme_rows(self,
+            label: TLabel,
+            count: int,
+            *,
+            largest: bool,
+            ) -> tp.Self:
+        iloc_key = self._columns._loc_to_iloc(label)
+        if not isinstance(iloc_key, INT_TYPES):
+            raise RuntimeError('label must select a single column.')
+        order = argpartition_extreme(
+                self._blocks._extract_array_column(iloc_key),
+                count,
+                largest=largest,
+                )
+        return self._extract(row_key=order)
+
+    def nlargest(self,
+            label: TLabel,
+            count: int,
+            ) -> tp.Self:
+        '''
+        Return a new :obj:`Frame` of the ``count`` rows with the largest values in the column selected by ``label``, ordered from largest to smallest. Rows are selected with a partition rather than a full sort; of equal values, rows that appear first are selected first. NA values are excluded.
+
+        Args:
+            label: A label to select the column by which rows are selected.
+            count: The number of rows to return.
+        '''
+        return self._extreme_rows(label, count, largest=True)
+
+    def nsmallest(self,
+            label: TLabel,
+            count: int,
+            ) -> tp.Self:
+        '''
+        Return a new :obj:`Frame` of the ``count`` rows with the smallest values in the column selected by ``label``, ordered from smallest to largest. Rows are selected with a partition rather than a full sort; of equal values, rows that appear first are selected first. NA values are excluded.
+
+        Args:
+            label: A label to select the column by which rows are selected.
+            count: The number of rows to return.
+        '''
+        return self._extreme_rows(label, count, largest=False)
+
     def isin(self, other: tp.Any) -> TFrameAny:
         '''
         Return a same-sized Boolean :obj:`Frame` that shows if the same-positioned element is in the passed iterable.
@@ -7713,6 +7818,51 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 name=self._name,
                 )
 
+    def ewm(self,
+            *,
+            span: tp.Optional[float] = None,
+            halflife: tp.Optional[float] = None,
+            alpha: tp.Optional[float] = None,
+            adjust: bool = True,
+            axis: int = 0,
+            ) -> EWM:
+        '''
+        Return an :obj:`EWM`, providing exponentially weighted moving statistics, such as ``mean()``, ``var()``, and ``std()``, as a :obj:`Frame` of the same shape. Exactly one of ``span``, ``halflife``, or ``alpha`` must be provided.
+
+        Args:
+            span: the decay in terms of span, where ``alpha`` is 2 / (span + 1).
+            halflife: the decay in terms of half-life, where ``alpha`` is 1 - exp(-ln(2) / halflife).
+            alpha: the smoothing factor, greater than 0 and less than or equal to 1.
+            adjust: if True, weights are normalized by the sum of weights of all observations; if False, statistics are given by the recurrence of weighting each new observation by ``alpha``.
+            axis: if 0, statistics are computed down rows for each column; if 1, across columns for each row.
+        '''
+        return EWM(self,
+                span=span,
+                halflife=halflife,
+                alpha=alpha,
+                adjust=adjust,
+                axis=axis,
+                )
+
+    #---------------------------------------------------------------------------
+    # group family
+
+    def group_by(self,
+            key: TLocSelector,
+            *,
+            axis: int = 0,
+            drop: bool = False,
+            ) -> GroupBy:
+        '''
+        Group rows by the values in one or more columns (axis 0), or columns by the values in one or more rows (axis 1), returning a :obj:`GroupBy`. The group ordering, boundaries, and labels are found once and retained, such that multiple reductions and iterations of the groups do not re-sort.
+
+        Args:
+            key: label(s) of the column(s) (axis 0) or row(s) (axis 1) to group by.
+            axis: if 0, group rows; if 1, group columns.
+            drop: exclude the target of the group in the grouped containers.
+        '''
+        return GroupBy.from_frame(self, key, axis=axis, drop=drop)
+
     #---------------------------------------------------------------------------
     # pivot family
 
@@ -7724,6 +7874,8 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             func: tp.Optional[TCallableOrCallableMap] = np.nansum,
             fill_value: tp.Any = np.nan,
             index_constructor: TIndexCtorSpecifier = None,
+            max_workers: tp.Optional[int] = None,
+            use_threads: bool = False,
             ) -> TFrameAny:
         '''
         Produce a pivot table, where one or more columns is selected for each of index_fields, columns_fields, and data_fields. Unique values from the provided ``index_fields`` will be used to create a new index; unique values from the provided ``columns_fields`` will be used to create a new columns; if one ``data_fields`` value is selected, that is the value that will be displayed; if more than one values is given, those values will be presented with a hierarchical index on the columns; if ``data_fields`` is not provided, all unused fields will be displayed.
@@ -7736,9 +7888,13 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             fill_value: If the index expansion produces coordinates that have no existing data value, fill that position with this value.
             func: function to apply to ``data_fields``, or a dictionary of labelled functions to apply to data fields, producing an additional hierarchical level.
             index_constructor:
+            max_workers: If provided, and ``columns_fields`` are provided, the columns of each data field and function, or of each partition of ``columns_fields`` values, are computed in parallel with this number of workers; functions must be picklable if not using threads.
+            use_threads: Use the ThreadPoolExecutor instead of the ProcessPoolExecutor.
         '''
         if is_fill_value_factory_initializer(fill_value):
             raise InvalidFillValue(fill_value, 'pivot')
+        if max_workers is not None and max_workers < 1:
+            raise RuntimeError('max_workers must be greater than zero.')
 
         # NOTE: default in Pandas pivot_table is a mean
         if func is None:
@@ -7785,6 +7941,8 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 func_map=func_map,
                 fill_value=fill_value,
                 index_constructor=index_constructor,
+                max_workers=max_workers,
+                use_threads=use_threads,
                 )
 
     #---------------------------------------------------------------------------
@@ -7810,6 +7968,11 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
         if is_fill_value_factory_initializer(fill_value):
             raise InvalidFillValue(fill_value, 'pivot_stack')
 
+        # if columns are a complete product of groups and targets, blocks only need to be reshaped
+        post = pivot_stack_complete(self, depth_level)
+        if post is not None:
+            return post
+
         pim = pivot_index_map(
                 index_src=columns_src,
                 depth_level=depth_level,
@@ -7891,6 +8054,11 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
         if is_fill_value_factory_initializer(fill_value):
             raise InvalidFillValue(fill_value, 'pivot_unstack')
 
+        # if the index is a complete product of groups and targets, blocks only need to be reshaped
+        post = pivot_unstack_complete(self, depth_level)
+        if post is not None:
+            return post
+
         # We produce the resultant frame by iterating over the source index labels (providing outer-most hierarchical levels), we then extend each label of that index with each unique "target", or new labels coming from the columns.
 
         pim = pivot_index_map(
@@ -7947,7 +8115,7 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
     #---------------------------------------------------------------------------
     @doc_inject(selector='join')
     def join_inner(self,
-            other: TFrameAny, # support a named Series as a 1D frame?
+            other: tp.Union[TFrameAny, JoinIndex], # support a named Series as a 1D frame?
             *,
             left_depth_level: tp.Optional[TDepthLevel] = None,
             left_columns: TLocSelector = None,
@@ -7957,6 +8125,9 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             right_template: str = '{}',
             fill_value: tp.Any = np.nan,
             include_index: bool = False,
+            strategy: str = 'auto',
+            max_workers: tp.Optional[int] = None,
+            use_threads: bool = False,
             # composite_index: bool = True,
             # composite_index_fill_value: TLabel = None,
             ) -> TFrameAny:
@@ -7971,6 +8142,9 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             {left_template}
             {right_template}
             {fill_value}
+            {strategy}
+            {max_workers}
+            {use_threads}
 
         Returns:
             :obj:`Frame`
@@ -7986,13 +8160,16 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 right_template=right_template,
                 fill_value=fill_value,
                 include_index=include_index,
+                strategy=strategy,
+                max_workers=max_workers,
+                use_threads=use_threads,
                 # composite_index=composite_index,
                 # composite_index_fill_value=composite_index_fill_value,
                 )
 
     @doc_inject(selector='join')
     def join_left(self,
-            other: TFrameAny, # support a named Series as a 1D frame?
+            other: tp.Union[TFrameAny, JoinIndex], # support a named Series as a 1D frame?
             *,
             left_depth_level: tp.Optional[TDepthLevel] = None,
             left_columns: TLocSelector = None,
@@ -8002,6 +8179,9 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             right_template: str = '{}',
             fill_value: tp.Any = np.nan,
             include_index: bool = False,
+            strategy: str = 'auto',
+            max_workers: tp.Optional[int] = None,
+            use_threads: bool = False,
             # composite_index: bool = True,
             # composite_index_fill_value: TLabel = None,
             ) -> TFrameAny:
@@ -8016,6 +8196,9 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             {left_template}
             {right_template}
             {fill_value}
+            {strategy}
+            {max_workers}
+            {use_threads}
 
         Returns:
             :obj:`Frame`
@@ -8031,13 +8214,16 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 right_template=right_template,
                 fill_value=fill_value,
                 include_index=include_index,
+                strategy=strategy,
+                max_workers=max_workers,
+                use_threads=use_threads,
                 # composite_index=composite_index,
                 # composite_index_fill_value=composite_index_fill_value,
                 )
 
     @doc_inject(selector='join')
     def join_right(self,
-            other: TFrameAny, # support a named Series as a 1D frame?
+            other: tp.Union[TFrameAny, JoinIndex], # support a named Series as a 1D frame?
             *,
             left_depth_level: tp.Optional[TDepthLevel] = None,
             left_columns: TLocSelector = None,
@@ -8047,6 +8233,9 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             right_template: str = '{}',
             fill_value: tp.Any = np.nan,
             include_index: bool = False,
+            strategy: str = 'auto',
+            max_workers: tp.Optional[int] = None,
+            use_threads: bool = False,
             # composite_index: bool = True,
             # composite_index_fill_value: TLabel = None,
             ) -> TFrameAny:
@@ -8061,6 +8250,9 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             {left_template}
             {right_template}
             {fill_value}
+            {strategy}
+            {max_workers}
+            {use_threads}
 
         Returns:
             :obj:`Frame`
@@ -8076,13 +8268,16 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 right_template=right_template,
                 fill_value=fill_value,
                 include_index=include_index,
+                strategy=strategy,
+                max_workers=max_workers,
+                use_threads=use_threads,
                 # composite_index=composite_index,
                 # composite_index_fill_value=composite_index_fill_value,
                 )
 
     @doc_inject(selector='join')
     def join_outer(self,
-            other: TFrameAny, # support a named Series as a 1D frame?
+            other: tp.Union[TFrameAny, JoinIndex], # support a named Series as a 1D frame?
             *,
             left_depth_level: tp.Optional[TDepthLevel] = None,
             left_columns: TLocSelector = None,
@@ -8092,6 +8287,9 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             right_template: str = '{}',
             fill_value: tp.Any = np.nan,
             include_index: bool = False,
+            strategy: str = 'auto',
+            max_workers: tp.Optional[int] = None,
+            use_threads: bool = False,
             # composite_index: bool = True,
             # composite_index_fill_value: TLabel = None,
             ) -> TFrameAny:
@@ -8106,6 +8304,9 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             {left_template}
             {right_template}
             {fill_value}
+            {strategy}
+            {max_workers}
+            {use_threads}
 
         Returns:
             :obj:`Frame`
@@ -8121,10 +8322,129 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 right_template=right_template,
                 fill_value=fill_value,
                 include_index=include_index,
+                strategy=strategy,
+                max_workers=max_workers,
+                use_threads=use_threads,
                 # composite_index=composite_index,
                 # composite_index_fill_value=composite_index_fill_value,
                 )
 
+    @doc_inject(selector='join')
+    def join_asof(self,
+            other: TFrameAny,
+            *,
+            left_depth_level: tp.Optional[TDepthLevel] = None,
+            left_columns: TLocSelector = None,
+            right_depth_level: tp.Optional[TDepthLevel] = None,
+            right_columns: TLocSelector = None,
+            left_by: TLocSelector = None,
+            right_by: TLocSelector = None,
+            direction: str = 'backward',
+            tolerance: tp.Any = None,
+            left_template: str = '{}',
+            right_template: str = '{}',
+            fill_value: tp.Any = np.nan,
+            include_index: bool = False,
+            ) -> TFrameAny:
+        '''
+        Perform an as-of join, a left outer join where each left row is joined to at most one right row: the row with the nearest key in the specified direction. The join predicate must be a single sortable column or index depth on each side, such as datetime64 values of an ``IndexDatetime``.
+
+        Args:
+            {left_depth_level}
+            {left_columns}
+            {right_depth_level}
+            {right_columns}
+            {left_by}
+            {right_by}
+            {direction}
+            {tolerance}
+            {left_template}
+            {right_template}
+            {fill_value}
+
+        Returns:
+            :obj:`Frame`
+        '''
+        return join_asof(frame=self,
+                other=other,
+                left_depth_level=left_depth_level,
+                left_columns=left_columns,
+                right_depth_level=right_depth_level,
+                right_columns=right_columns,
+                left_by=left_by,
+                right_by=right_by,
+                direction=direction,
+                tolerance=tolerance,
+                left_template=left_template,
+                right_template=right_template,
+                fill_value=fill_value,
+                include_index=include_index,
+                )
+
+    @doc_inject(selector='join')
+    def join_semi(self,
+            other: TFrameAny,
+            *,
+            left_depth_level: tp.Optional[TDepthLevel] = None,
+            left_columns: TLocSelector = None,
+            right_depth_level: tp.Optional[TDepthLevel] = None,
+            right_columns: TLocSelector = None,
+            ) -> tp.Self:
+        '''
+        Perform a semi-join, returning the rows of this :obj:`Frame` that match at least one row of ``other``. No columns of ``other`` are included, and rows are never repeated.
+
+        Args:
+            {left_depth_level}
+            {left_columns}
+            {right_depth_level}
+            {right_columns}
+
+        Returns:
+            :obj:`Frame`
+        '''
+        row_key = join_mask(frame=self,
+                other=other,
+                left_depth_level=left_depth_level,
+                left_columns=left_columns,
+                right_depth_level=right_depth_level,
+                right_columns=right_columns,
+                )
+        if self.STATIC and row_key.all():
+            return self
+        return self._extract(row_key=row_key)
+
+    @doc_inject(selector='join')
+    def join_anti(self,
+            other: TFrameAny,
+            *,
+            left_depth_level: tp.Optional[TDepthLevel] = None,
+            left_columns: TLocSelector = None,
+            right_depth_level: tp.Optional[TDepthLevel] = None,
+            right_columns: TLocSelector = None,
+            ) -> tp.Self:
+        '''
+        Perform an anti-join, returning the rows of this :obj:`Frame` that match no row of ``other``. No columns of ``other`` are included.
+
+        Args:
+            {left_depth_level}
+            {left_columns}
+            {right_depth_level}
+            {right_columns}
+
+        Returns:
+            :obj:`Frame`
+        '''
+        row_key = ~join_mask(frame=self,
+                other=other,
+                left_depth_level=left_depth_level,
+                left_columns=left_columns,
+                right_depth_level=right_depth_level,
+                right_columns=right_columns,
+                )
+        if self.STATIC and row_key.all():
+            return self
+        return self._extract(row_key=row_key)
+
     #---------------------------------------------------------------------------
     def _insert(self,
             key: int | np.integer[tp.Any], # iloc positions
@@ -9347,6 +9667,7 @@ class FrameGO(Frame[TVIndex, TVColumns]):
         # Wait until after extracting block from value before updating _columns, as value evaluation might fail.
         self._columns.append(key)
         self._blocks.append(block)
+        self._blocks = TypeBlocks.CONSOLIDATION_POLICY.apply(self._blocks)
 
     def extend_items(self,
             pairs: tp.Iterable[tp.Tuple[TLabel, TSeriesAny]],
@@ -9387,6 +9708,7 @@ class FrameGO(Frame[TVIndex, TVColumns]):
         elif isinstance(container, Series):
             self._columns.append(container.name)
             self._blocks.append(container.values)
+        self._blocks = TypeBlocks.CONSOLIDATION_POLICY.apply(self._blocks)
 
         # this should never happen, and is hard to test!
         assert len(self._columns) == self._blocks._index.columns #pragma: no cover
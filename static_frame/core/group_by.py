@@ -0,0 +1,467 @@
+'''
+A grouping of a :obj:`Frame` that retains the group ordering, boundaries, and labels, such that multiple reductions, transforms, and iterations can be performed without re-sorting.
+'''
+from __future__ import annotations
+
+import numpy as np
+import typing_extensions as tp
+from arraykit import name_filter
+
+from static_frame.core.exception import AxisInvalid
+from static_frame.core.index import Index
+from static_frame.core.index_base import IndexBase
+from static_frame.core.reduce import ReduceGroup
+from static_frame.core.series import Series
+from static_frame.core.type_blocks import TypeBlocks
+from static_frame.core.type_blocks import group_sorted_transitions
+from static_frame.core.util import DEFAULT_STABLE_SORT_KIND
+from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_INT_DEFAULT
+from static_frame.core.util import DTYPE_NA_KINDS
+from static_frame.core.util import INT_TYPES
+from static_frame.core.util import PositionsAllocator
+from static_frame.core.util import TILocSelector
+from static_frame.core.util import TLabel
+from static_frame.core.util import TLocSelector
+from static_frame.core.util import argpartition_extreme
+from static_frame.core.util import array2d_to_tuples
+from static_frame.core.util import array_to_groups_and_locations_hashed
+from static_frame.core.util import isna_array
+from static_frame.core.util import iterable_to_array_1d
+
+if tp.TYPE_CHECKING:
+    from static_frame.core.generic_aliases import TFrameAny  # pylint: disable=W0611 #pragma: no cover
+    TNDArrayAny = np.ndarray[tp.Any, tp.Any] # pylint: disable=W0611 #pragma: no cover
+    TSeriesAny = Series[tp.Any, tp.Any] # pylint: disable=W0611 #pragma: no cover
+
+# the smallest group for which extreme values are selected with a partition of the group, rather than with one sort of the values of all smaller groups
+_EXTREME_PARTITION_SIZE_MIN = 4096
+# for selections of at most this count, extreme values of numeric groups are found by repeated reductions of all groups rather than by a sort
+_EXTREME_SELECT_COUNT_MAX = 8
+_EXTREME_SELECT_KINDS = ('f', 'i', 'u')
+
+def extreme_select(
+        values: TNDArrayAny,
+        sizes: TNDArrayAny,
+        count: int,
+        *,
+        largest: bool,
+        ) -> TNDArrayAny:
+    '''
+    Given non-NA numeric ``values`` of contiguous groups of (non-zero) ``sizes``, return the ascending positions of the ``count`` largest (or smallest) values of each group. Each of ``count`` passes finds the extreme of each group with one ``reduceat``, then selects, per group, the first remaining position with that value, such that equal values are selected by position.
+    '''
+    if values.dtype.kind == 'f':
+        sentinel = -np.inf if largest else np.inf
+    else:
+        info = np.iinfo(values.dtype)
+        sentinel = info.min if largest else info.max
+    ufunc = np.maximum if largest else np.minimum
+
+    starts = np.cumsum(sizes) - sizes
+    codes = np.repeat(PositionsAllocator.get(len(sizes)), sizes)
+    work = values.copy()
+    remaining = np.full(len(values), True, dtype=DTYPE_BOOL)
+    parts = []
+    for i in range(min(count, int(sizes.max()) if len(sizes) else 0)):
+        extremes = ufunc.reduceat(work, starts)
+        # as selected values are replaced with the sentinel, a match must also be remaining
+        matches = np.flatnonzero(remaining & (work == np.repeat(extremes, sizes)))
+        matches_codes = codes[matches]
+        first = np.empty(len(matches), dtype=DTYPE_BOOL)
+        first[:1] = True
+        np.not_equal(matches_codes[1:], matches_codes[:-1], out=first[1:])
+        # groups with no more than i values have nothing remaining
+        first &= sizes[matches_codes] > i
+        selected = matches[first]
+        work[selected] = sentinel
+        remaining[selected] = False
+        parts.append(selected)
+
+    if not parts:
+        return np.empty(0, dtype=DTYPE_INT_DEFAULT)
+    return np.sort(np.concatenate(parts))
+
+def _sort_key(values: TNDArrayAny, largest: bool) -> TNDArrayAny:
+    '''Return an array that, sorted ascending, orders ``values`` ascending, or descending if ``largest``.
+    '''
+    if values.dtype.kind == 'f':
+        return -values if largest else values
+    _, ranks = np.unique(values, return_inverse=True)
+    return -ranks if largest else ranks # type: ignore
+
+
+def group_by_sort(
+        blocks: TypeBlocks,
+        *,
+        key: TILocSelector,
+        axis: int,
+        ) -> tp.Tuple[TypeBlocks, TNDArrayAny, TNDArrayAny, tp.Iterable[TLabel]]:
+    '''
+    Order ``blocks`` by group, returning the ordered blocks, the ordering (positions in the original), the start of each group, and the group labels. If ``axis`` is 0, rows are grouped by the values in the column(s) selected by ``key``; if 1, columns are grouped by the values in the row(s) selected by ``key``.
+    '''
+    count = blocks.shape[axis]
+    try:
+        # NOTE: TypeBlocks.sort axis 1 orders rows by column(s)
+        blocks_sorted, ordering = blocks.sort(key=key, axis=not axis, kind=DEFAULT_STABLE_SORT_KIND)
+    except TypeError: # unsortable keys: find groups by hashing
+        blocks_sorted = None
+
+    if axis == 0:
+        group_source = (blocks if blocks_sorted is None else blocks_sorted)._extract_array(column_key=key)
+    else: # present values of 2D keys per column
+        group_source = (blocks if blocks_sorted is None else blocks_sorted)._extract_array(row_key=key).T
+
+    labels: tp.Iterable[TLabel]
+    if blocks_sorted is not None:
+        if count:
+            starts = np.concatenate((
+                    np.zeros(1, dtype=DTYPE_INT_DEFAULT),
+                    group_sorted_transitions(group_source),
+                    ))
+        else:
+            starts = np.empty(0, dtype=DTYPE_INT_DEFAULT)
+        labels = group_source[starts]
+        if labels.ndim == 2:
+            labels = array2d_to_tuples(labels)
+    else:
+        labels, locations = array_to_groups_and_locations_hashed(group_source)
+        ordering = np.argsort(locations, kind=DEFAULT_STABLE_SORT_KIND)
+        if axis == 0:
+            blocks_sorted = blocks._extract(row_key=ordering)
+        else:
+            blocks_sorted = blocks._extract(column_key=ordering)
+        counts = np.bincount(locations, minlength=len(labels))
+        starts = np.cumsum(counts) - counts
+
+    ordering.flags.writeable = False
+    starts.flags.writeable = False
+    return blocks_sorted, ordering, starts, labels
+
+
+class GroupBy:
+    '''
+    A grouping of a :obj:`Frame` by the values in one or more columns (axis 0) or rows (axis 1). The group ordering, boundaries, and labels are found once, such that reductions, iteration, and application of functions to groups do not need to re-sort.
+    '''
+    __slots__ = (
+            '_container',
+            '_axis',
+            '_blocks',
+            '_ordering',
+            '_starts',
+            '_ends',
+            '_index',
+            '_columns',
+            '_labels',
+            '_broadcast',
+            )
+
+    _container: TFrameAny
+    _axis: int
+    _blocks: TypeBlocks
+    _ordering: TNDArrayAny
+    _starts: TNDArrayAny
+    _ends: TNDArrayAny
+    _index: IndexBase
+    _columns: IndexBase
+    _labels: IndexBase
+    _broadcast: tp.Optional[TNDArrayAny]
+
+    @classmethod
+    def from_frame(cls,
+            frame: TFrameAny,
+            key: TLocSelector,
+            *,
+            axis: int = 0,
+            drop: bool = False,
+            ) -> 'GroupBy':
+        '''
+        Group a :obj:`Frame` by one or more columns (axis 0) or rows (axis 1).
+
+        Args:
+            key: label(s) of the column(s) (axis 0) or row(s) (axis 1) to group by.
+            axis: if 0, group rows; if 1, group columns.
+            drop: exclude the target of the group in the grouped containers.
+        '''
+        if axis == 0:
+            iloc_key = frame._columns._loc_to_iloc(key)
+        elif axis == 1:
+            iloc_key = frame._index._loc_to_iloc(key)
+        else:
+            raise AxisInvalid(f'invalid axis: {axis}')
+
+        blocks, ordering, starts, labels = group_by_sort(frame._blocks,
+                key=iloc_key,
+                axis=axis,
+                )
+
+        index = frame._index
+        columns = frame._columns
+        if drop:
+            # drop the target of the group on the opposite axis
+            drop_mask = np.full(blocks.shape[not axis], True, dtype=DTYPE_BOOL)
+            drop_mask[iloc_key] = False
+            if axis == 0:
+                blocks = blocks._extract(column_key=drop_mask)
+                columns = columns._extract_iloc(drop_mask)
+            else:
+                blocks = blocks._extract(row_key=drop_mask)
+                index = index._extract_iloc(drop_mask)
+
+        try:
+            name = name_filter(key)
+        except TypeError:
+            name = None
+
+        return cls(container=frame,
+                axis=axis,
+                blocks=blocks,
+                ordering=ordering,
+                starts=starts,
+                index=index,
+                columns=columns,
+                labels=Index(labels, name=name),
+                )
+
+    def __init__(self, *,
+            container: TFrameAny,
+            axis: int,
+            blocks: TypeBlocks,
+            ordering: TNDArrayAny,
+            starts: TNDArrayAny,
+            index: IndexBase,
+            columns: IndexBase,
+            labels: IndexBase,
+            ) -> None:
+        '''
+        Args:
+            container: the grouped :obj:`Frame`.
+            axis: if 0, rows are grouped; if 1, columns are grouped.
+            blocks: values of ``container``, less any dropped values, ordered by group along ``axis``.
+            ordering: the position in ``container`` of each ordered row (axis 0) or column (axis 1).
+            starts: the position of the first row (axis 0) or column (axis 1) of each group.
+            index: the index of ``blocks`` if axis is 1; otherwise, the unordered index of ``container``.
+            columns: the columns of ``blocks`` if axis is 0; otherwise, the unordered columns of ``container``.
+            labels: the labels of the groups.
+        '''
+        self._container = container
+        self._axis = axis
+        self._blocks = blocks
+        self._ordering = ordering
+        self._starts = starts
+        self._ends = np.append(starts[1:], len(ordering)) if len(starts) else starts
+        self._index = index
+        self._columns = columns
+        self._labels = labels
+        self._broadcast = None
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}: {len(self._labels)} groups, axis {self._axis}>'
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def __iter__(self) -> tp.Iterator[TLabel]:
+        return self._labels.__iter__()
+
+    #---------------------------------------------------------------------------
+    @property
+    def labels(self) -> IndexBase:
+        '''The labels of the groups, as an :obj:`Index`.
+        '''
+        return self._labels
+
+    @property
+    def reduce(self) -> ReduceGroup:
+        '''
+        Return an interface of reductions, such as ``sum()`` and ``mean()``, that are applied to all groups at once, returning a :obj:`Frame` with a row per group (axis 0) or a column per group (axis 1).
+        '''
+        if self._axis == 0:
+            return ReduceGroup(
+                    blocks=self._blocks,
+                    starts=self._starts,
+                    index=self._labels,
+                    columns=self._columns,
+                    constructor=self._container.__class__,
+                    )
+        # reduce groups of columns as rows of the transposed blocks
+        return ReduceGroup(
+                blocks=self._blocks.transpose(),
+                starts=self._starts,
+                index=self._labels,
+                columns=self._index,
+                constructor=self._container.__class__,
+                transpose=True,
+                )
+
+    @property
+    def transform(self) -> ReduceGroup:
+        '''
+        Return an interface of reductions, such as ``sum()`` and ``mean()``, that are applied to all groups at once, where the reduction of each group is taken into every row (axis 0) or column (axis 1) of that group, returning a :obj:`Frame` aligned to the grouped :obj:`Frame`.
+        '''
+        if self._broadcast is None:
+            # the group position of each ordered row, placed at its original position
+            broadcast = np.empty(len(self._ordering), dtype=DTYPE_INT_DEFAULT)
+            broadcast[self._ordering] = np.repeat(
+                    PositionsAllocator.get(len(self._starts)),
+                    self._ends - self._starts,
+                    )
+            broadcast.flags.writeable = False
+            self._broadcast = broadcast
+
+        if self._axis == 0:
+            return ReduceGroup(
+                    blocks=self._blocks,
+                    starts=self._starts,
+                    index=self._index,
+                    columns=self._columns,
+                    constructor=self._container.__class__,
+                    broadcast=self._broadcast,
+                    )
+        return ReduceGroup(
+                blocks=self._blocks.transpose(),
+                starts=self._starts,
+                index=self._columns,
+                columns=self._index,
+                constructor=self._container.__class__,
+                transpose=True,
+                broadcast=self._broadcast,
+                )
+
+    #---------------------------------------------------------------------------
+    def _extract_ordered(self, key: TILocSelector) -> TFrameAny:
+        '''Extract rows (axis 0) or columns (axis 1) given by positions in group order.
+        '''
+        constructor = self._container.__class__
+        if self._axis == 0:
+            return constructor(self._blocks._extract(row_key=key),
+                    index=self._index._extract_iloc(self._ordering[key]),
+                    columns=self._columns,
+                    own_data=True,
+                    own_index=True,
+                    own_columns=self._container.STATIC, # own if static
+                    )
+        return constructor(self._blocks._extract(column_key=key),
+                index=self._index,
+                columns=self._columns._extract_iloc(self._ordering[key]),
+                own_data=True,
+                own_index=True,
+                own_columns=True,
+                )
+
+    def _extract_group(self, start: int, end: int) -> TFrameAny:
+        return self._extract_ordered(slice(start, end))
+
+    def items(self) -> tp.Iterator[tp.Tuple[TLabel, TFrameAny]]:
+        '''Iterator of pairs of group label and :obj:`Frame`.
+        '''
+        for label, start, end in zip(self._labels, self._starts, self._ends):
+            yield label, self._extract_group(start, end)
+
+    def values(self) -> tp.Iterator[TFrameAny]:
+        '''Iterator of :obj:`Frame` per group.
+        '''
+        for start, end in zip(self._starts, self._ends):
+            yield self._extract_group(start, end)
+
+    def apply(self,
+            func: tp.Callable[[TFrameAny], tp.Any],
+            *,
+            name: TLabel = None,
+            ) -> TSeriesAny:
+        '''
+        Apply a function to the :obj:`Frame` of each group, returning a :obj:`Series` indexed by group label.
+
+        Args:
+            func: function to be called with the :obj:`Frame` of each group.
+            name: name of the returned :obj:`Series`.
+        '''
+        array, _ = iterable_to_array_1d(
+                (func(f) for f in self.values()),
+                count=len(self._labels),
+                )
+        return Series(array, index=self._labels, name=name, own_index=True)
+
+    #---------------------------------------------------------------------------
+    def _extreme(self,
+            label: TLabel,
+            count: int,
+            *,
+            largest: bool,
+            ) -> TFrameAny:
+        if self._axis == 0:
+            iloc_key = self._columns._loc_to_iloc(label)
+        else:
+            iloc_key = self._index._loc_to_iloc(label)
+        if not isinstance(iloc_key, INT_TYPES):
+            raise RuntimeError('label must select a single column (axis 0) or row (axis 1).')
+
+        if self._axis == 0:
+            values = self._blocks._extract_array_column(iloc_key)
+        else:
+            values = self._blocks._extract_array(row_key=iloc_key)
+
+        sizes = self._ends - self._starts
+        codes_all = np.repeat(PositionsAllocator.get(len(sizes)), sizes)
+        # large groups are partitioned one at a time; all other groups larger than count are selected with one sort of all their values
+        partitioned = (sizes > count) & (sizes >= _EXTREME_PARTITION_SIZE_MIN)
+        sorted_ = (sizes > count) & ~partitioned
+
+        # all values of groups no larger than count are selected
+        parts = [np.flatnonzero(np.repeat(sizes <= count, sizes))]
+        if sorted_.any():
+            candidates = np.flatnonzero(np.repeat(sorted_, sizes))
+            if values.dtype.kind in DTYPE_NA_KINDS:
+                candidates = candidates[~isna_array(values[candidates])]
+            codes = codes_all[candidates]
+            counts = np.bincount(codes, minlength=len(sizes))
+            counts = counts[counts > 0]
+            if count <= _EXTREME_SELECT_COUNT_MAX and values.dtype.kind in _EXTREME_SELECT_KINDS:
+                parts.append(candidates[extreme_select(values[candidates], counts, count, largest=largest)])
+            else:
+                # order by group, then by value, then by position: as candidates are ascending, two stable sorts, the last on integer codes, are faster than a lexsort
+                order = np.argsort(_sort_key(values[candidates], largest), kind=DEFAULT_STABLE_SORT_KIND)
+                order = order[np.argsort(codes[order], kind=DEFAULT_STABLE_SORT_KIND)]
+                candidates = candidates[order]
+                # the position of each candidate within its group
+                offsets = PositionsAllocator.get(len(candidates)) - np.repeat(np.cumsum(counts) - counts, counts)
+                parts.append(candidates[offsets < count])
+        for start, end in zip(self._starts[partitioned], self._ends[partitioned]):
+            parts.append(start + argpartition_extreme(values[start: end],
+                    count,
+                    largest=largest,
+                    ordered=False,
+                    ))
+        selected = np.concatenate(parts)
+        if values.dtype.kind in DTYPE_NA_KINDS:
+            selected = selected[~isna_array(values[selected])]
+
+        # order by group, then by value, then by position
+        codes = codes_all[selected]
+        order = np.lexsort((selected, _sort_key(values[selected], largest), codes))
+        return self._extract_ordered(selected[order])
+
+    def nlargest(self,
+            label: TLabel,
+            count: int,
+            ) -> TFrameAny:
+        '''
+        Return a :obj:`Frame` of, for each group, the ``count`` rows (axis 0) or columns (axis 1) with the largest values in the column (axis 0) or row (axis 1) selected by ``label``. Values of large groups are selected with a partition of the group, values of other groups with one sort of those groups; groups are in order, and the selection of each group is ordered from largest to smallest. Of equal values, those that appear first are selected first. NA values are excluded.
+
+        Args:
+            label: A label to select the column (axis 0) or row (axis 1) of values.
+            count: The number of rows (axis 0) or columns (axis 1) to return per group.
+        '''
+        return self._extreme(label, count, largest=True)
+
+    def nsmallest(self,
+            label: TLabel,
+            count: int,
+            ) -> TFrameAny:
+        '''
+        Return a :obj:`Frame` of, for each group, the ``count`` rows (axis 0) or columns (axis 1) with the smallest values in the column (axis 0) or row (axis 1) selected by ``label``. Values of large groups are selected with a partition of the group, values of other groups with one sort of those groups; groups are in order, and the selection of each group is ordered from smallest to largest. Of equal values, those that appear first are selected first. NA values are excluded.
+
+        Args:
+            label: A label to select the column (axis 0) or row (axis 1) of values.
+            count: The number of rows (axis 0) or columns (axis 1) to return per group.
+        '''
+        return self._extreme(label, count, largest=False)
@@ -60,6 +60,7 @@ from static_frame.core.node_dt import InterfaceDatetime
 from static_frame.core.node_fill_value import InterfaceBatchFillValue
 from static_frame.core.node_fill_value import InterfaceFillValue
 from static_frame.core.node_hashlib import InterfaceHashlib
+from static_frame.core.node_lazy import InterfaceLazy
 from static_frame.core.node_re import InterfaceBatchRe
 from static_frame.core.node_re import InterfaceRe
 from static_frame.core.node_selector import Interface
@@ -231,6 +232,7 @@ INTERFACE_ATTRIBUTE_CLS = frozenset((
         InterfaceString,
         InterfaceDatetime,
         InterfaceTranspose,
+        InterfaceLazy,
         InterfaceHashlib,
         TypeClinic,
 
@@ -443,6 +445,7 @@ class InterfaceGroup:
     AccessorRe = 'Accessor Regular Expression'
     AccessorHashlib = 'Accessor Hashlib'
     AccessorTypeClinic = 'Accessor Type Clinic'
+    AccessorLazy = 'Accessor Lazy'
 
 # NOTE: order from definition retained
 INTERFACE_GROUP_ORDER = tuple(v for k, v in vars(InterfaceGroup).items()
@@ -468,7 +471,8 @@ INTERFACE_GROUP_DOC = {
     'Accessor Fill Value': 'Interface that permits supplying a fill value to be used when binary operator application forces reindexing.',
     'Accessor Regular Expression': 'Interface exposing regular expression application on container elements.',
     'Accessor Hashlib': 'Interface exposing cryptographic hashing via hashlib interfaces.',
-    'Accessor Type Clinic': 'Interface for providing a type hint from a container or validating a container against a type hint.'
+    'Accessor Type Clinic': 'Interface for providing a type hint from a container or validating a container against a type hint.',
+    'Accessor Lazy': 'Interface for deferring the evaluation of binary and unary operators, such that chained operators are evaluated together in chunks of rows.'
     }
 
 class InterfaceRecord(tp.NamedTuple):
@@ -815,6 +819,8 @@ class InterfaceRecord(tp.NamedTuple):
             group = InterfaceGroup.AccessorHashlib
         elif cls_interface is TypeClinic:
             group = InterfaceGroup.AccessorTypeClinic
+        elif cls_interface is InterfaceLazy:
+            group = InterfaceGroup.AccessorLazy
         else:
             raise NotImplementedError(cls_interface) #pragma: no cover
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+from enum import Enum
 from itertools import chain
-from itertools import product
 
 import numpy as np
 import typing_extensions as tp
@@ -9,32 +9,680 @@ from arraykit import resolve_dtype
 
 # from static_frame.core.container_util import FILL_VALUE_AUTO_DEFAULT
 from static_frame.core.container_util import arrays_from_index_frame
+from static_frame.core.container_util import index_many_concat
 from static_frame.core.container_util import is_fill_value_factory_initializer
+from static_frame.core.exception import ErrorInitIndexNonUnique
 from static_frame.core.exception import InvalidFillValue
 from static_frame.core.index import Index
-from static_frame.core.index_auto import IndexAutoFactory
+from static_frame.core.index_base import IndexBase
 from static_frame.core.type_blocks import TypeBlocks
 # from static_frame.core.util import NULL_SLICE
+from static_frame.core.util import DEFAULT_STABLE_SORT_KIND
+from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_INT_DEFAULT
+from static_frame.core.util import DTYPE_OBJECT
+from static_frame.core.util import DTYPE_UINT_DEFAULT
 from static_frame.core.util import Join
 from static_frame.core.util import Pair
 from static_frame.core.util import PairLeft
 from static_frame.core.util import PairRight
+from static_frame.core.util import PositionsAllocator
 from static_frame.core.util import TDepthLevel
 from static_frame.core.util import TLabel
 from static_frame.core.util import TLocSelector
-from static_frame.core.util import WarningsSilent
-from static_frame.core.util import array2d_to_tuples
-from static_frame.core.util import dtype_from_element
+from static_frame.core.util import concat_resolved
+from static_frame.core.util import get_concurrent_executor
+from static_frame.core.util import isna_array
+from static_frame.core.util import ufunc_unique1d_indexer
 
 if tp.TYPE_CHECKING:
     from static_frame.core.frame import Frame  # pylint: disable=W0611 #pragma: no cover
-    from static_frame.core.frame import FrameGO  # pylint: disable=W0611 #pragma: no cover
     from static_frame.core.generic_aliases import TFrameAny  # pylint: disable=W0611 #pragma: no cover
-    from static_frame.core.generic_aliases import TFrameGOAny  # pylint: disable=W0611 #pragma: no cover
+    TNDArrayAny = np.ndarray[tp.Any, tp.Any] # pylint: disable=W0611 #pragma: no cover
+    TDtypeAny = np.dtype[tp.Any] # pylint: disable=W0611 #pragma: no cover
+
+
+class JoinStrategy(str, Enum):
+    AUTO = 'auto'
+    HASH = 'hash'
+    SORT = 'sort'
+
+
+class JoinDirection(str, Enum):
+    BACKWARD = 'backward'
+    FORWARD = 'forward'
+    NEAREST = 'nearest'
+
+
+def _join_factorize(
+        target_left: TypeBlocks,
+        target_right: TypeBlocks,
+        ) -> tp.Tuple[TNDArrayAny, TNDArrayAny, int]:
+    '''
+    Factorize the rows of the left and right join targets into a shared space of integer codes, such that rows of equal values have equal codes. Each column is factorized independently and then combined. Rows that contain a NaN or NaT can never match and are given a code of -1.
+
+    Returns:
+        left codes, right codes, and the count of distinct codes.
+    '''
+    size_left = len(target_left)
+    size = size_left + len(target_right)
+
+    codes: tp.Optional[TNDArrayAny] = None
+    count = 1
+    valid: tp.Optional[TNDArrayAny] = None
+
+    for i in range(target_left.shape[1]):
+        values = concat_resolved((
+                target_left._extract_array_column(i),
+                target_right._extract_array_column(i),
+                ))
+        # NOTE: None is not a missing value here, as None == None
+        isna = isna_array(values, include_none=False)
+        if isna.any():
+            valid = ~isna if valid is None else valid & ~isna
+            # NaN values might not sort in object arrays, so only factorize those present
+            uniques, indexer = ufunc_unique1d_indexer(values[~isna])
+            codes_column = np.zeros(size, dtype=DTYPE_INT_DEFAULT)
+            codes_column[~isna] = indexer
+        else:
+            uniques, codes_column = ufunc_unique1d_indexer(values)
+
+        if codes is None:
+            codes = codes_column
+            count = len(uniques)
+        else: # combine with prior columns, then re-factorize to keep codes dense
+            uniques, codes = ufunc_unique1d_indexer(codes * len(uniques) + codes_column)
+            count = len(uniques)
+
+    if codes is None: # no columns: all rows match
+        codes = np.zeros(size, dtype=DTYPE_INT_DEFAULT)
+    if valid is not None:
+        codes = np.where(valid, codes, -1)
+
+    return codes[:size_left], codes[size_left:], count
+
+
+def _join_table(
+        codes_build: TNDArrayAny,
+        count: int,
+        ) -> tp.Tuple[TNDArrayAny, TNDArrayAny, TNDArrayAny]:
+    '''
+    Given factorized codes, build a table of codes to positions, represented as positions ordered by code and the count and start of each code within that order. As codes are dense, bucket bounds are found by counting. Codes are shifted by one, placing unmatchable rows in bucket 0.
+    '''
+    order = np.argsort(codes_build, kind=DEFAULT_STABLE_SORT_KIND)
+    bucket_counts = np.bincount(codes_build + 1, minlength=count + 1)
+    bucket_starts = np.cumsum(bucket_counts) - bucket_counts
+    return order, bucket_counts, bucket_starts
+
+
+def _join_probe(
+        codes_probe: TNDArrayAny,
+        order: TNDArrayAny,
+        bucket_counts: TNDArrayAny,
+        bucket_starts: TNDArrayAny,
+        ) -> tp.Tuple[TNDArrayAny, TNDArrayAny]:
+    '''
+    Probe a table built by ``_join_table`` with codes in the same space, returning parallel arrays of probe and build positions for all matching pairs, ordered by probe position and then by build position.
+    '''
+    probe_pos = np.flatnonzero(codes_probe >= 0)
+    buckets = codes_probe[probe_pos] + 1
+    match_counts = bucket_counts[buckets]
+
+    # repeat each probe position for each of its matches, and find the position within the bucket for each match
+    probe_pos = np.repeat(probe_pos, match_counts)
+    match_ends = np.cumsum(match_counts)
+    offsets = np.arange(len(probe_pos)) - np.repeat(match_ends - match_counts, match_counts)
+    build_pos = order[np.repeat(bucket_starts[buckets], match_counts) + offsets]
+    return probe_pos, build_pos
+
+
+def _join_pairs(
+        codes_left: TNDArrayAny,
+        codes_right: TNDArrayAny,
+        count: int,
+        ) -> tp.Tuple[TNDArrayAny, TNDArrayAny]:
+    '''
+    Given the factorized codes of the left and right targets, return parallel arrays of left and right positions for all matching pairs, ordered by left position and then by right position. A table of codes to positions is built from the smaller side and probed with the larger side.
+    '''
+    build_is_left = len(codes_left) < len(codes_right)
+    if build_is_left:
+        codes_build, codes_probe = codes_left, codes_right
+    else:
+        codes_build, codes_probe = codes_right, codes_left
+
+    probe_pos, build_pos = _join_probe(codes_probe, *_join_table(codes_build, count))
+
+    if build_is_left:
+        # pairs are ordered by right position; a stable sort by left position restores the expected order
+        reorder = np.argsort(build_pos, kind=DEFAULT_STABLE_SORT_KIND)
+        return build_pos[reorder], probe_pos[reorder]
+    return probe_pos, build_pos
+
+
+def _join_dtypes_sortable(
+        target_left: TypeBlocks,
+        target_right: TypeBlocks,
+        ) -> tp.Optional[tp.List[TDtypeAny]]:
+    '''
+    Return the resolved dtype of each pair of left and right columns if none resolve to an object dtype, such that keys can be sorted and searched together; otherwise, return None.
+    '''
+    dtypes: tp.List[TDtypeAny] = []
+    for dtype_left, dtype_right in zip(target_left.dtypes, target_right.dtypes):
+        dtype = resolve_dtype(dtype_left, dtype_right)
+        if dtype == DTYPE_OBJECT:
+            return None
+        dtypes.append(dtype)
+    return dtypes if dtypes else None
+
+
+def _join_keys_sortable(
+        target: TypeBlocks,
+        dtypes: tp.List[TDtypeAny],
+        ) -> TNDArrayAny:
+    '''
+    Return a 1D array of keys from the target, converted to the provided dtypes. Targets of more than one column are represented as a structured array, which sorts and searches lexicographically.
+    '''
+    if len(dtypes) == 1:
+        return target._extract_array_column(0).astype(dtypes[0], copy=False)
+
+    keys = np.empty(len(target),
+            dtype=np.dtype([(f'f{i}', dt) for i, dt in enumerate(dtypes)]),
+            )
+    for i in range(len(dtypes)):
+        keys[f'f{i}'] = target._extract_array_column(i)
+    return keys
+
+
+def _join_target_sorted(target: TypeBlocks) -> bool:
+    '''
+    Return True if the rows of the target are in ascending lexicographic order. As comparisons to NaN and NaT are always False, targets with missing values are not sorted.
+    '''
+    # rows not yet ordered by prior columns, as they are equal in all prior columns
+    undecided: tp.Optional[TNDArrayAny] = None
+    last = target.shape[1] - 1
+    for i in range(last + 1):
+        column = target._extract_array_column(i)
+        if i == last: # only need to know if ordered
+            ordered = column[1:] >= column[:-1]
+            if undecided is None:
+                return bool(ordered.all())
+            return not (undecided & ~ordered).any()
+
+        ascending = column[1:] > column[:-1]
+        equal = column[1:] == column[:-1]
+        if undecided is None:
+            if not (ascending | equal).all():
+                return False
+            undecided = equal
+        else:
+            if (undecided & ~(ascending | equal)).any():
+                return False
+            undecided = undecided & equal
+        if not undecided.any():
+            break
+    return True
+
+
+def _join_pairs_sorted(
+        keys_left: TNDArrayAny,
+        keys_right: TNDArrayAny,
+        *,
+        valid_left: tp.Optional[TNDArrayAny],
+        right_sorted: bool,
+        ) -> tp.Tuple[TNDArrayAny, TNDArrayAny]:
+    '''
+    Given sortable left and right keys, return parallel arrays of left and right positions for all matching pairs, ordered by left position and then by right position. The range of matching right positions is found for every left key with ``searchsorted``; when the left keys are sorted, this approaches a linear merge.
+
+    Args:
+        valid_left: if provided, a Boolean array where False marks left keys that can never match.
+        right_sorted: if False, the right keys will be stably sorted before searching.
+    '''
+    order_right: tp.Optional[TNDArrayAny] = None
+    if not right_sorted:
+        order_right = np.argsort(keys_right, kind=DEFAULT_STABLE_SORT_KIND)
+        keys_right = keys_right[order_right]
+
+    starts = np.searchsorted(keys_right, keys_left, side='left')
+    match_counts = np.searchsorted(keys_right, keys_left, side='right') - starts
+    if valid_left is not None:
+        match_counts[~valid_left] = 0
+
+    # expand each run of right matches into one pair per match
+    pos_left = np.repeat(np.arange(len(keys_left)), match_counts)
+    match_ends = np.cumsum(match_counts)
+    offsets = np.arange(len(pos_left)) - np.repeat(match_ends - match_counts, match_counts)
+    pos_right = np.repeat(starts, match_counts) + offsets
+
+    if order_right is not None:
+        pos_right = order_right[pos_right]
+    return pos_left, pos_right
+
+
+def _join_match(
+        target_left: TypeBlocks,
+        target_right: TypeBlocks,
+        strategy: JoinStrategy,
+        ) -> tp.Tuple[TNDArrayAny, TNDArrayAny]:
+    '''
+    Return parallel arrays of left and right positions for all matching pairs, ordered by left position and then by right position, using the provided strategy. The sort strategy is selected by the auto strategy only if both targets are already sorted.
+    '''
+    dtypes: tp.Optional[tp.List[TDtypeAny]] = None
+    right_sorted = False
+
+    if strategy is JoinStrategy.AUTO:
+        dtypes = _join_dtypes_sortable(target_left, target_right)
+        if dtypes is not None and not (_join_target_sorted(target_left)
+                and _join_target_sorted(target_right)):
+            dtypes = None
+        right_sorted = True
+    elif strategy is JoinStrategy.SORT:
+        dtypes = _join_dtypes_sortable(target_left, target_right)
+        if dtypes is None:
+            raise RuntimeError('The sort strategy requires join targets that resolve to non-object dtypes.')
+        right_sorted = _join_target_sorted(target_right)
+
+    if dtypes is not None:
+        # NaN and NaT never match; any missing value in a left row excludes it
+        valid_left: tp.Optional[TNDArrayAny] = None
+        for i in range(target_left.shape[1]):
+            isna = isna_array(target_left._extract_array_column(i))
+            if isna.any():
+                valid_left = ~isna if valid_left is None else valid_left & ~isna
+        return _join_pairs_sorted(
+                _join_keys_sortable(target_left, dtypes),
+                _join_keys_sortable(target_right, dtypes),
+                valid_left=valid_left,
+                right_sorted=right_sorted,
+                )
+
+    codes_left, codes_right, count = _join_factorize(target_left, target_right)
+    return _join_pairs(codes_left, codes_right, count)
+
+
+_HASH_MULTIPLIER = np.uint64(0x100000001b3)
+_HASH_MIX = np.uint64(0xff51afd7ed558ccd)
+_HASH_SHIFT = np.uint64(33)
+
+
+def _join_hash_array(array: TNDArrayAny) -> TNDArrayAny:
+    '''
+    Return an unsigned integer hash of each value of a 1D array, such that equal values have equal hashes. Object arrays use Python hashes; all other arrays are hashed from the bytes of each value.
+    '''
+    if array.dtype.kind == 'O':
+        return np.fromiter((hash(v) for v in array),
+                dtype=DTYPE_INT_DEFAULT,
+                count=len(array),
+                ).view(DTYPE_UINT_DEFAULT)
+
+    if array.dtype.kind in ('f', 'c'):
+        array = array + 0 # normalize -0.0 to 0.0, as they are equal
+    array = np.ascontiguousarray(array)
+
+    # view each value as one or more unsigned integers of the largest size that divides the itemsize
+    itemsize = array.dtype.itemsize
+    for unit in (8, 4, 2, 1):
+        if itemsize % unit == 0:
+            break
+    words = array.view(f'u{unit}').reshape(len(array), itemsize // unit)
+
+    hashes = np.zeros(len(array), dtype=DTYPE_UINT_DEFAULT)
+    for i in range(words.shape[1]):
+        hashes *= _HASH_MULTIPLIER
+        hashes ^= words[:, i]
+    return hashes
+
+
+def _join_partitions(
+        target_left: TypeBlocks,
+        target_right: TypeBlocks,
+        count: int,
+        ) -> tp.Tuple[TNDArrayAny, TNDArrayAny]:
+    '''
+    Assign each row of the left and right targets to one of ``count`` partitions by hashing join keys, such that rows that might match are always in the same partition.
+    '''
+    size_left = len(target_left)
+    hashes = np.zeros(size_left + len(target_right), dtype=DTYPE_UINT_DEFAULT)
+
+    for i in range(target_left.shape[1]):
+        # resolve left and right together, such that equal values of different dtypes have the same representation
+        values = concat_resolved((
+                target_left._extract_array_column(i),
+                target_right._extract_array_column(i),
+                ))
+        hashes *= _HASH_MULTIPLIER
+        hashes ^= _join_hash_array(values)
+
+    # mix high bits into low bits before taking the modulus
+    hashes ^= hashes >> _HASH_SHIFT
+    hashes *= _HASH_MIX
+    hashes ^= hashes >> _HASH_SHIFT
+    # the smallest dtype permits a faster stable sort of partitions
+    partitions = (hashes % np.uint64(count)).astype(np.min_scalar_type(count - 1))
+    return partitions[:size_left], partitions[size_left:]
+
+
+def _join_match_partition(
+        args: tp.Tuple[tp.List[TNDArrayAny], tp.List[TNDArrayAny], JoinStrategy],
+        ) -> tp.Tuple[TNDArrayAny, TNDArrayAny]:
+    '''
+    Find matching pairs of one partition; called in a worker of a pool executor.
+    '''
+    columns_left, columns_right, strategy = args
+    return _join_match(
+            TypeBlocks.from_blocks(columns_left),
+            TypeBlocks.from_blocks(columns_right),
+            strategy,
+            )
+
+
+def _join_match_partitioned(
+        target_left: TypeBlocks,
+        target_right: TypeBlocks,
+        strategy: JoinStrategy,
+        *,
+        max_workers: int,
+        use_threads: bool,
+        ) -> tp.Tuple[TNDArrayAny, TNDArrayAny]:
+    '''
+    Return the same pairs as ``_join_match``, but hash-partition both targets into ``max_workers`` partitions and find the pairs of each partition in parallel.
+    '''
+    partitions_left, partitions_right = _join_partitions(
+            target_left,
+            target_right,
+            max_workers,
+            )
+    # stable orders of positions by partition, and the bounds of each partition in that order
+    def bounds(partitions: TNDArrayAny) -> tp.Tuple[TNDArrayAny, TNDArrayAny]:
+        order = np.argsort(partitions, kind=DEFAULT_STABLE_SORT_KIND)
+        ends = np.cumsum(np.bincount(partitions, minlength=max_workers))
+        return order, np.concatenate(((0,), ends))
+
+    order_left, bounds_left = bounds(partitions_left)
+    order_right, bounds_right = bounds(partitions_right)
+
+    positions_left = [order_left[bounds_left[p]: bounds_left[p + 1]] for p in range(max_workers)]
+    positions_right = [order_right[bounds_right[p]: bounds_right[p + 1]] for p in range(max_workers)]
+
+    columns_left = [target_left._extract_array_column(i) for i in range(target_left.shape[1])]
+    columns_right = [target_right._extract_array_column(i) for i in range(target_right.shape[1])]
+
+    def args() -> tp.Iterator[tp.Tuple[tp.List[TNDArrayAny], tp.List[TNDArrayAny], JoinStrategy]]:
+        for pos_left, pos_right in zip(positions_left, positions_right):
+            yield ([c[pos_left] for c in columns_left],
+                    [c[pos_right] for c in columns_right],
+                    strategy,
+                    )
+
+    pool_executor = get_concurrent_executor(
+            use_threads=use_threads,
+            max_workers=max_workers,
+            mp_context=None,
+            )
+    with pool_executor() as executor:
+        pairs = list(executor.map(_join_match_partition, args()))
+
+    # map partition positions to target positions; as all matches of a left row are in the same partition, ordered by right position, a stable sort by left position restores the expected order
+    match_left = np.concatenate([p[m] for p, (m, _) in zip(positions_left, pairs)])
+    match_right = np.concatenate([p[m] for p, (_, m) in zip(positions_right, pairs)])
+    order = np.argsort(match_left, kind=DEFAULT_STABLE_SORT_KIND)
+    return match_left[order], match_right[order]
+
+
+def _join_asof_match(
+        key_left: TNDArrayAny,
+        key_right: TNDArrayAny,
+        *,
+        codes_left: tp.Optional[TNDArrayAny],
+        codes_right: tp.Optional[TNDArrayAny],
+        direction: JoinDirection,
+        tolerance: tp.Any,
+        ) -> TNDArrayAny:
+    '''
+    For each left key, return the position of the right key that is nearest in the provided direction, or -1 if there is no such key. If codes are provided, matches are limited to right keys of the same code. Keys that are NaN or NaT, and codes of -1, never match.
+
+    Args:
+        key_left: 1D array of left keys, of the same dtype as ``key_right``.
+        key_right: 1D array of right keys, of the same dtype as ``key_left``.
+    '''
+    size_left = len(key_left)
+    valid_left = ~isna_array(key_left)
+    valid_right = ~isna_array(key_right)
+    if codes_left is not None and codes_right is not None:
+        valid_left &= codes_left >= 0
+        valid_right &= codes_right >= 0
+
+    positions = np.full(size_left, -1, dtype=DTYPE_INT_DEFAULT)
+    candidates = np.flatnonzero(valid_right)
+    if not len(candidates) or not valid_left.any():
+        return positions
+
+    if codes_left is None or codes_right is None:
+        search_left = key_left
+        search_right = key_right[candidates]
+    else:
+        # to search by code and then by key, combine each code with the rank of its key among all valid keys into a single integer
+        keys = np.concatenate((key_left[valid_left], key_right[candidates]))
+        uniques, ranks = np.unique(keys, return_inverse=True)
+        count = len(uniques)
+        search_left = np.zeros(size_left, dtype=DTYPE_INT_DEFAULT)
+        search_left[valid_left] = codes_left[valid_left] * count + ranks[:-len(candidates)]
+        search_right = codes_right[candidates] * count + ranks[-len(candidates):]
+
+    order = np.argsort(search_right, kind=DEFAULT_STABLE_SORT_KIND)
+    search_right = search_right[order]
+    candidates = candidates[order]
+    last = len(candidates) - 1
+
+    def select(side: tp.Literal['left', 'right']) -> tp.Tuple[TNDArrayAny, TNDArrayAny]:
+        # return the right position found for each left key, and a Boolean array of where that position is a match
+        if side == 'right': # backward: the last key less than or equal to the left key
+            found = np.searchsorted(search_right, search_left, side='right') - 1
+            matched = valid_left & (found >= 0)
+        else: # forward: the first key greater than or equal to the left key
+            found = np.searchsorted(search_right, search_left, side='left')
+            matched = valid_left & (found <= last)
+        found = candidates[np.clip(found, 0, last)]
+        if codes_left is not None and codes_right is not None:
+            matched &= codes_right[found] == codes_left
+        return found, matched
+
+    if direction is JoinDirection.BACKWARD:
+        found, matched = select('right')
+        distance = key_left - key_right[found]
+    elif direction is JoinDirection.FORWARD:
+        found, matched = select('left')
+        distance = key_right[found] - key_left
+    else:
+        found_back, matched_back = select('right')
+        found_forward, matched_forward = select('left')
+        distance_back = key_left - key_right[found_back]
+        distance_forward = key_right[found_forward] - key_left
+        # prefer backward matches when equidistant
+        back = matched_back & ~(matched_forward & (distance_forward < distance_back))
+        found = np.where(back, found_back, found_forward)
+        matched = matched_back | matched_forward
+        distance = np.where(back, distance_back, distance_forward)
+
+    if tolerance is not None:
+        matched[matched] = distance[matched] <= tolerance
+
+    positions[matched] = found[matched]
+    return positions
+
+
+def _join_composite_index(
+        left_index: IndexBase,
+        right_index: IndexBase,
+        final_left: TNDArrayAny,
+        final_right: TNDArrayAny,
+        fill_value: TLabel,
+        ) -> Index[tp.Any]:
+    '''
+    Return an index of ``Pair`` of left and right labels for each final row; rows only from the left or the right are labeled with ``PairLeft`` or ``PairRight``, respectively.
+    '''
+    labels_left = list(left_index)
+    labels_right = list(right_index)
+
+    def labels() -> tp.Iterator[Pair]:
+        for pos_left, pos_right in zip(final_left.tolist(), final_right.tolist()):
+            if pos_right < 0:
+                yield PairLeft((labels_left[pos_left], fill_value))
+            elif pos_left < 0:
+                yield PairRight((fill_value, labels_right[pos_right]))
+            else:
+                yield Pair((labels_left[pos_left], labels_right[pos_right]))
+
+    return Index(labels())
+
+
+class JoinIndex:
+    '''
+    A reusable index of the join keys of a :obj:`Frame`, for repeated joins against the same right :obj:`Frame`. The right keys are factorized and their table of codes to positions is built once; each join then only factorizes and probes the left keys. A ``JoinIndex`` can be given as the ``other`` argument of ``Frame.join_inner``, ``Frame.join_left``, ``Frame.join_right``, and ``Frame.join_outer``; the ``strategy``, ``max_workers``, and ``use_threads`` arguments are not used.
+    '''
+    __slots__ = (
+            '_frame',
+            '_uniques',
+            '_combined',
+            '_order',
+            '_bucket_counts',
+            '_bucket_starts',
+            '_mappings',
+            )
+
+    _frame: TFrameAny
+    _uniques: tp.List[TNDArrayAny]
+    _combined: tp.List[tp.Optional[TNDArrayAny]]
+    _order: TNDArrayAny
+    _bucket_counts: TNDArrayAny
+    _bucket_starts: TNDArrayAny
+    _mappings: tp.Dict[int, tp.Dict[tp.Any, int]]
+
+    def __init__(self,
+            frame: TFrameAny,
+            *,
+            depth_level: tp.Optional[TDepthLevel] = None,
+            columns: TLocSelector = None,
+            ):
+        '''
+        Args:
+            frame: The right :obj:`Frame` of future joins.
+            depth_level: Specify one or more index depths to include in the join predicate.
+            columns: Specify one or more columns to include in the join predicate.
+        '''
+        if depth_level is None and columns is None:
+            raise RuntimeError('Must specify one or both of depth_level and columns.')
+
+        # a FrameGO can grow columns, but not rows; keep an immutable Frame
+        self._frame = frame if frame.STATIC else frame.to_frame()
+        target = TypeBlocks.from_blocks(
+                arrays_from_index_frame(self._frame, depth_level, columns))
+
+        size = len(target)
+        self._uniques = []
+        self._combined = []
+        self._mappings = {}
+
+        # factorize as in _join_factorize, but retain the sorted unique values of each column, and the sorted unique combinations of codes, such that other keys can be placed in the same space of codes
+        codes: tp.Optional[TNDArrayAny] = None
+        count = 0
+        for i in range(target.shape[1]):
+            values = target._extract_array_column(i)
+            isna = isna_array(values, include_none=False)
+            uniques, indexer = ufunc_unique1d_indexer(values[~isna])
+            codes_column = np.full(size, -1, dtype=DTYPE_INT_DEFAULT)
+            codes_column[~isna] = indexer
+            self._uniques.append(uniques)
+
+            if codes is None:
+                codes = codes_column
+                count = len(uniques)
+                self._combined.append(None)
+            else:
+                valid = (codes >= 0) & (codes_column >= 0)
+                combined, indexer = ufunc_unique1d_indexer(
+                        codes[valid] * len(uniques) + codes_column[valid])
+                codes = np.full(size, -1, dtype=DTYPE_INT_DEFAULT)
+                codes[valid] = indexer
+                count = len(combined)
+                self._combined.append(combined)
+
+        if codes is None:
+            raise RuntimeError('Must specify at least one column or depth level.')
+
+        self._order, self._bucket_counts, self._bucket_starts = _join_table(codes, count)
+
+    @property
+    def frame(self) -> TFrameAny:
+        '''The indexed :obj:`Frame`.
+        '''
+        return self._frame
+
+    @property
+    def depth(self) -> int:
+        '''The number of columns in the join predicate.
+        '''
+        return len(self._uniques)
+
+    def _codes_column(self, i: int, values: TNDArrayAny) -> TNDArrayAny:
+        '''
+        Return the codes of values in the space of codes of column ``i``, or -1 for values not found.
+        '''
+        uniques = self._uniques[i]
+        dtype = resolve_dtype(uniques.dtype, values.dtype)
+        if dtype != DTYPE_OBJECT:
+            # uniques are sorted; a found value is equal to the unique at its insertion position
+            if not len(uniques):
+                return np.full(len(values), -1, dtype=DTYPE_INT_DEFAULT)
+            uniques = uniques.astype(dtype, copy=False)
+            values = values.astype(dtype, copy=False)
+            pos = np.searchsorted(uniques, values)
+            np.minimum(pos, len(uniques) - 1, out=pos)
+            return np.where(uniques[pos] == values, pos, -1)
+
+        if i not in self._mappings:
+            self._mappings[i] = {v: code for code, v in enumerate(uniques.tolist())}
+        mapping = self._mappings[i]
+        codes = np.full(len(values), -1, dtype=DTYPE_INT_DEFAULT)
+        isna = isna_array(values, include_none=False)
+        for pos, v in enumerate(values.tolist()):
+            if not isna[pos]:
+                codes[pos] = mapping.get(v, -1)
+        return codes
+
+    def _match(self, target: TypeBlocks) -> tp.Tuple[TNDArrayAny, TNDArrayAny]:
+        '''
+        Return parallel arrays of positions in ``target`` and positions in the indexed :obj:`Frame` for all matching pairs, ordered by ``target`` position and then by indexed position.
+        '''
+        if target.shape[1] != self.depth:
+            raise RuntimeError('left and right selections must be the same width.')
+
+        codes: tp.Optional[TNDArrayAny] = None
+        for i in range(self.depth):
+            codes_column = self._codes_column(i, target._extract_array_column(i))
+            combined = self._combined[i]
+            if codes is None or combined is None:
+                codes = codes_column
+                continue
+            if not len(combined):
+                codes = np.full(len(target), -1, dtype=DTYPE_INT_DEFAULT)
+                continue
+            valid = (codes >= 0) & (codes_column >= 0)
+            keys = codes * len(self._uniques[i]) + codes_column
+            pos = np.searchsorted(combined, keys)
+            np.minimum(pos, len(combined) - 1, out=pos)
+            codes = np.where(valid & (combined[pos] == keys), pos, -1)
+
+        assert codes is not None
+        return _join_probe(codes,
+                self._order,
+                self._bucket_counts,
+                self._bucket_starts,
+                )
+
 
 
 def join(frame: TFrameAny,
-        other: TFrameAny, # support a named Series as a 1D frame?
+        other: tp.Union[TFrameAny, JoinIndex], # support a named Series as a 1D frame?
         *,
         join_type: Join, # intersect, left, right, union,
         left_depth_level: tp.Optional[TDepthLevel] = None,
@@ -45,9 +693,12 @@ def join(frame: TFrameAny,
         right_template: str = '{}',
         fill_value: tp.Any = np.nan,
         include_index: bool = False,
+        strategy: tp.Union[str, JoinStrategy] = JoinStrategy.AUTO,
+        max_workers: tp.Optional[int] = None,
+        use_threads: bool = False,
         ) -> TFrameAny:
 
-    from static_frame.core.frame import FrameGO
+    from static_frame.core.frame import Frame
 
     # NOTE: pre 1.0 these were optional parameters; now, we always return the data without an index; in the future, we might add back parameters to control how and if an index is returned
     # composite_index: bool = True,
@@ -56,198 +707,268 @@ def join(frame: TFrameAny,
     if is_fill_value_factory_initializer(fill_value):
         raise InvalidFillValue(fill_value, 'join')
 
-    left_index = frame._index
-    right_index = other._index
-    fill_value_dtype = dtype_from_element(fill_value)
-
     #-----------------------------------------------------------------------
     # find matches
 
     if left_depth_level is None and left_columns is None:
         raise RuntimeError('Must specify one or both of left_depth_level and left_columns.')
-    if right_depth_level is None and right_columns is None:
-        raise RuntimeError('Must specify one or both of right_depth_level and right_columns.')
 
-    # reduce the targets to 2D arrays; possible coercion in some cases, but seems inevitable as we will be doing row-wise comparisons
+    # reduce the targets to TypeBlocks; each column will be factorized independently, avoiding the coercion of consolidating mixed types
     target_left = TypeBlocks.from_blocks(
-            arrays_from_index_frame(frame, left_depth_level, left_columns)).values
-    target_right = TypeBlocks.from_blocks(
-            arrays_from_index_frame(other, right_depth_level, right_columns)).values
-
-    if target_left.shape[1] != target_right.shape[1]:
-        raise RuntimeError('left and right selections must be the same width.')
+            arrays_from_index_frame(frame, left_depth_level, left_columns))
 
     # Find matching pairs. Get iloc of left to iloc of right.
+    if isinstance(other, JoinIndex):
+        if right_depth_level is not None or right_columns is not None:
+            raise RuntimeError('Cannot specify right_depth_level or right_columns with a JoinIndex.')
+        match_left, match_right = other._match(target_left)
+        other = other.frame
+    else:
+        if right_depth_level is None and right_columns is None:
+            raise RuntimeError('Must specify one or both of right_depth_level and right_columns.')
+        target_right = TypeBlocks.from_blocks(
+                arrays_from_index_frame(other, right_depth_level, right_columns))
+        if target_left.shape[1] != target_right.shape[1]:
+            raise RuntimeError('left and right selections must be the same width.')
+        if max_workers is None:
+            match_left, match_right = _join_match(target_left,
+                    target_right,
+                    JoinStrategy(strategy),
+                    )
+        else:
+            if max_workers < 1:
+                raise RuntimeError('max_workers must be greater than zero.')
+            match_left, match_right = _join_match_partitioned(target_left,
+                    target_right,
+                    JoinStrategy(strategy),
+                    max_workers=max_workers,
+                    use_threads=use_threads,
+                    )
+
+    left_index = frame._index
+    right_index = other._index
 
-    is_many = False # one to many or many to many
-
-    map_iloc: tp.Dict[int, np.ndarray[tp.Any, np.dtype[np.int_]]] = {}
-    seen = set() # this stores
-
-    # NOTE: this could be optimized by always iterating over the shorter target
-
-    for idx_left, row_left in enumerate(target_left):
-        # Get 1D vector showing matches along right's full heigh
-        with WarningsSilent():
-            matched = row_left == target_right
-        if matched is False:
-            continue
-        matched = matched.all(axis=1)
-        if not matched.any():
-            continue
-        # convert Booleans to integer positions
-        matched_idx = np.flatnonzero(matched)
-        if not is_many: # if user did not select composite index
-            if len(matched_idx) > 1:
-                is_many = True
-            elif len(matched_idx) == 1:
-                if matched_idx[0] in seen:
-                    is_many = True
-                seen.add(matched_idx[0])
-        # build up a dictionary of left ilocs to an integer array of right matches
-        # note that if row_left is the same as a previous row_left, we duplicate the matched_idx
-        map_iloc[idx_left] = matched_idx
+    # one to many or many to many if any left or right position is matched more than once; as match_left is sorted, repeated values are adjacent
+    is_many = bool(len(match_left)) and (
+            bool((match_left[1:] == match_left[:-1]).any())
+            or int(np.bincount(match_right).max()) > 1
+            )
 
     #-----------------------------------------------------------------------
-    # store collections of matches, derive final index
+    # derive the final rows as left and right positions, where -1 marks a position to be filled
 
-    left_loc_set: tp.Set[TLabel] = set() # all left loc labels that match
-    right_loc_set: tp.Set[TLabel] = set() # all right loc labels that match
-    many_loc: tp.List[Pair] = []
+    size_left = len(left_index)
+    size_right = len(right_index)
 
-    cifv = composite_index_fill_value
+    matched_left = np.zeros(size_left, dtype=DTYPE_BOOL)
+    matched_left[match_left] = True
+    matched_right = np.zeros(size_right, dtype=DTYPE_BOOL)
+    matched_right[match_right] = True
 
-    # NOTE: doing selection and using iteration (from set, and with zip, below) reduces chances for type coercion in IndexHierarchy
-    left_loc = left_index[list(map_iloc.keys())]
+    if not isinstance(join_type, Join):
+        raise NotImplementedError(f'index source must be one of {tuple(Join)}')
 
-    # iter over idx_left, matched_idx in right, left loc labels
-    for (k, v), left_loc_element in zip(map_iloc.items(), left_loc):
-        left_loc_set.add(left_loc_element)
+    parts_left: tp.List[TNDArrayAny] = []
+    parts_right: tp.List[TNDArrayAny] = []
+
+    if is_many or join_type is Join.INNER:
+        # matched pairs, then unmatched left, then unmatched right
+        parts_left.append(match_left)
+        parts_right.append(match_right)
+        if join_type is Join.LEFT or join_type is Join.OUTER:
+            unmatched = np.flatnonzero(~matched_left)
+            parts_left.append(unmatched)
+            parts_right.append(np.full(len(unmatched), -1, dtype=DTYPE_INT_DEFAULT))
+    elif join_type is Join.RIGHT:
+        # all right in order
+        positions = np.full(size_right, -1, dtype=DTYPE_INT_DEFAULT)
+        positions[match_right] = match_left
+        parts_left.append(positions)
+        parts_right.append(PositionsAllocator.get(size_right))
+    else: # all left in order
+        positions = np.full(size_left, -1, dtype=DTYPE_INT_DEFAULT)
+        positions[match_left] = match_right
+        parts_left.append(PositionsAllocator.get(size_left))
+        parts_right.append(positions)
+
+    if (join_type is Join.OUTER
+            or (is_many and join_type is Join.RIGHT)):
+        unmatched = np.flatnonzero(~matched_right)
+        parts_left.append(np.full(len(unmatched), -1, dtype=DTYPE_INT_DEFAULT))
+        parts_right.append(unmatched)
+
+    final_left = parts_left[0] if len(parts_left) == 1 else np.concatenate(parts_left)
+    final_right = parts_right[0] if len(parts_right) == 1 else np.concatenate(parts_right)
 
-        right_loc_part = right_index.values[v]
-        if right_loc_part.ndim == 2:
-            right_loc_set.update(array2d_to_tuples(right_loc_part))
-        else:
-            right_loc_set.update(right_loc_part) # iter 1D array
+    #-----------------------------------------------------------------------
+    # get final_index; if is_many is True, a composite index of Pair instances is used
 
-        if is_many:
-            many_loc.extend(Pair(p) for p in product((left_loc_element,), right_loc_part))
+    final_index: tp.Optional[IndexBase] = None
+    if include_index:
+        if not is_many:
+            if join_type is Join.LEFT:
+                final_index = left_index
+            elif join_type is Join.RIGHT:
+                final_index = right_index
+            elif join_type is Join.INNER:
+                final_index = left_index._extract_iloc(final_left)
+            else:
+                try:
+                    final_index = index_many_concat((
+                            left_index,
+                            right_index._extract_iloc(final_right[size_left:]),
+                            ),
+                            Index,
+                            )
+                except ErrorInitIndexNonUnique:
+                    # labels of unmatched right rows are found in left; a composite index must be used
+                    pass
+        if final_index is None:
+            final_index = _join_composite_index(
+                    left_index,
+                    right_index,
+                    final_left,
+                    final_right,
+                    composite_index_fill_value,
+                    )
 
     #-----------------------------------------------------------------------
-    # get final_index; if is_many is True, many_loc (and Pair instances) will be used
-    final_index: Index[tp.Any]
-
-    if join_type is Join.INNER:
-        if is_many:
-            final_index = Index(many_loc)
-        else: # just those matched from the left, which are also on right
-            final_index = Index(left_loc)
-    elif join_type is Join.LEFT:
-        if is_many:
-            extend = (PairLeft((x, cifv))
-                    for x in left_index if x not in left_loc_set)
-            # What if we are extending an index that already has a tuple
-            final_index = Index(chain(many_loc, extend))
-        else:
-            final_index = left_index #type: ignore
-    elif join_type is Join.RIGHT:
-        if is_many:
-            extend = (PairRight((cifv, x))
-                    for x in right_index if x not in right_loc_set)
-            final_index = Index(chain(many_loc, extend))
-        else:
-            final_index = right_index #type: ignore
-    elif join_type is Join.OUTER:
-        extend_left = (PairLeft((x, cifv))
-                for x in left_index if x not in left_loc_set)
-        extend_right = (PairRight((cifv, x))
-                for x in right_index if x not in right_loc_set)
-        if is_many:
-            # must revese the many_loc so as to preserent right id first
-            final_index = Index(chain(many_loc, extend_left, extend_right))
-        else:
-            final_index = left_index.union(right_index) #type: ignore
-    else:
-        raise NotImplementedError(f'index source must be one of {tuple(Join)}')
+    # construct final frame, taking rows from each block of left and right
+
+    blocks = TypeBlocks.from_blocks(chain(
+            frame._blocks._take_blocks_fill_by_element(
+                    indexer=final_left,
+                    fill_value=fill_value,
+                    ),
+            other._blocks._take_blocks_fill_by_element(
+                    indexer=final_right,
+                    fill_value=fill_value,
+                    ),
+            ))
+    columns = chain(
+            (left_template.format(c) for c in frame.columns),
+            (right_template.format(c) for c in other.columns),
+            )
+    return Frame(blocks,
+            index=final_index,
+            columns=columns,
+            own_data=True,
+            )
+
+
+def join_asof(frame: TFrameAny,
+        other: TFrameAny,
+        *,
+        left_depth_level: tp.Optional[TDepthLevel] = None,
+        left_columns: TLocSelector = None,
+        right_depth_level: tp.Optional[TDepthLevel] = None,
+        right_columns: TLocSelector = None,
+        left_by: TLocSelector = None,
+        right_by: TLocSelector = None,
+        direction: tp.Union[str, JoinDirection] = JoinDirection.BACKWARD,
+        tolerance: tp.Any = None,
+        left_template: str = '{}',
+        right_template: str = '{}',
+        fill_value: tp.Any = np.nan,
+        include_index: bool = False,
+        ) -> TFrameAny:
 
-    #-----------------------------------------------------------------------
-    # construct final frame
-    final: TFrameGOAny
-    if not is_many:
-        final = FrameGO(index=final_index)
-        left_column_labels = (left_template.format(c) for c in frame.columns)
-        final.extend(frame.relabel(columns=left_column_labels), fill_value=fill_value)
-        # build up a Series for each new column
-        for idx_col, col in enumerate(other.columns):
-            values = []
-            for loc in final_index:
-                # what if loc is in both left and rihgt?
-                if loc in left_index and left_index._loc_to_iloc(loc) in map_iloc:
-                    iloc = map_iloc[left_index._loc_to_iloc(loc)] #type: ignore
-                    assert len(iloc) == 1 # not is_many, so all have to be length 1
-                    values.append(other._extract_iloc((iloc[0], idx_col)))
-                elif loc in right_index:
-                    values.append(other._extract_loc((loc, col)))
-                else:
-                    values.append(fill_value)
-            final[right_template.format(col)] = values
-
-        if include_index:
-            return final.to_frame()
-        return final.to_frame().relabel(IndexAutoFactory)
-
-    # From here, is_many is True
-    row_key: tp.List[int]  = []
-    final_index_left = []
-    for p in final_index:
-        if p.__class__ is Pair: # in both
-            iloc = left_index._loc_to_iloc(p[0]) #type: ignore
-            row_key.append(iloc) #type: ignore
-            final_index_left.append(p)
-        elif p.__class__ is PairLeft:
-            row_key.append(left_index._loc_to_iloc(p[0])) #type: ignore
-            final_index_left.append(p)
-
-    # extract potentially repeated rows
-    tb = frame._blocks._extract(row_key=row_key)
-    left_column_labels = (left_template.format(c) for c in frame.columns)
-
-    final = FrameGO(tb,
-            index=Index(final_index_left),
-            columns=left_column_labels,
-            own_data=True)
-
-    # only do this if we have PairRight above
-    if len(final_index_left) < len(final_index):
-        final = final.reindex(final_index, fill_value=fill_value)
-
-    # populate from right columns
-    # NOTE: find optimized path to avoid final_index iteration per column in all scenarios
-
-    other_dtypes = other.dtypes.values
-    for idx_col, col in enumerate(other.columns):
-        array = np.empty(len(final_index), dtype=other_dtypes[idx_col])
-        resolved_dtype = resolve_dtype(array.dtype, fill_value_dtype)
-
-        for i, pair in enumerate(final_index):
-            # NOTE: we used to support pair being something other than a Pair subclass (which would append fill_value to array), but it appears that if is_many is True, each value in final_index will be a Pair instance
-            # assert isinstance(pair, Pair)
-            if pair.__class__ is PairRight: # get from right
-                array[i] = other._extract(right_index._loc_to_iloc(pair[1]), idx_col) #type: ignore
-            elif pair.__class__ is PairLeft:
-                # get from left, but we do not have col, so fill value
-                if resolved_dtype != array.dtype:
-                    array = array.astype(resolved_dtype)
-                array[i] = fill_value
-            else:
-                array[i] = other._extract(right_index._loc_to_iloc(pair[1]), idx_col) # type: ignore
+    from static_frame.core.frame import Frame
 
-        array.flags.writeable = False
-        final[right_template.format(col)] = array
+    if is_fill_value_factory_initializer(fill_value):
+        raise InvalidFillValue(fill_value, 'join_asof')
 
-    if include_index:
-        return final.to_frame()
-    return final.to_frame().relabel(IndexAutoFactory)
+    direction = JoinDirection(direction)
+
+    if left_depth_level is None and left_columns is None:
+        raise RuntimeError('Must specify one or both of left_depth_level and left_columns.')
+    if right_depth_level is None and right_columns is None:
+        raise RuntimeError('Must specify one or both of right_depth_level and right_columns.')
+    if (left_by is None) != (right_by is None):
+        raise RuntimeError('Must specify both or neither of left_by and right_by.')
+
+    target_left = TypeBlocks.from_blocks(
+            arrays_from_index_frame(frame, left_depth_level, left_columns))
+    target_right = TypeBlocks.from_blocks(
+            arrays_from_index_frame(other, right_depth_level, right_columns))
+
+    if target_left.shape[1] != 1 or target_right.shape[1] != 1:
+        raise RuntimeError('left and right selections must each be a single column.')
+
+    dtype = resolve_dtype(target_left.dtypes[0], target_right.dtypes[0])
+    if dtype == DTYPE_OBJECT:
+        raise RuntimeError('left and right selections must resolve to a non-object dtype.')
+
+    codes_left: tp.Optional[TNDArrayAny] = None
+    codes_right: tp.Optional[TNDArrayAny] = None
+    if left_by is not None:
+        by_left = TypeBlocks.from_blocks(
+                arrays_from_index_frame(frame, None, left_by))
+        by_right = TypeBlocks.from_blocks(
+                arrays_from_index_frame(other, None, right_by))
+        if by_left.shape[1] != by_right.shape[1]:
+            raise RuntimeError('left_by and right_by selections must be the same width.')
+        codes_left, codes_right, _ = _join_factorize(by_left, by_right)
+
+    final_right = _join_asof_match(
+            target_left._extract_array_column(0).astype(dtype, copy=False),
+            target_right._extract_array_column(0).astype(dtype, copy=False),
+            codes_left=codes_left,
+            codes_right=codes_right,
+            direction=direction,
+            tolerance=tolerance,
+            )
+
+    # all left rows are retained in order, such that left blocks can be reused
+    blocks = TypeBlocks.from_blocks(chain(
+            frame._blocks._blocks,
+            other._blocks._take_blocks_fill_by_element(
+                    indexer=final_right,
+                    fill_value=fill_value,
+                    ),
+            ))
+    columns = chain(
+            (left_template.format(c) for c in frame.columns),
+            (right_template.format(c) for c in other.columns),
+            )
+    return Frame(blocks,
+            index=frame._index if include_index else None,
+            columns=columns,
+            own_data=True,
+            )
+
+
+def join_mask(frame: TFrameAny,
+        other: TFrameAny,
+        *,
+        left_depth_level: tp.Optional[TDepthLevel] = None,
+        left_columns: TLocSelector = None,
+        right_depth_level: tp.Optional[TDepthLevel] = None,
+        right_columns: TLocSelector = None,
+        ) -> TNDArrayAny:
+    '''
+    Return a Boolean array, with a value for each row of ``frame``, that is True where the row matches at least one row of ``other``. The join keys of both frames are factorized once; no values of ``other`` are taken.
+    '''
+    if left_depth_level is None and left_columns is None:
+        raise RuntimeError('Must specify one or both of left_depth_level and left_columns.')
+    if right_depth_level is None and right_columns is None:
+        raise RuntimeError('Must specify one or both of right_depth_level and right_columns.')
+
+    target_left = TypeBlocks.from_blocks(
+            arrays_from_index_frame(frame, left_depth_level, left_columns))
+    target_right = TypeBlocks.from_blocks(
+            arrays_from_index_frame(other, right_depth_level, right_columns))
+
+    if target_left.shape[1] != target_right.shape[1]:
+        raise RuntimeError('left and right selections must be the same width.')
+
+    codes_left, codes_right, count = _join_factorize(target_left, target_right)
+
+    # mark each code found in right; shifting codes by one maps unmatchable rows to a code never found
+    found = np.zeros(count + 1, dtype=DTYPE_BOOL)
+    found[codes_right + 1] = True
+    found[0] = False
+    return found[codes_left + 1]
 
 
 
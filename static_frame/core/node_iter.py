@@ -29,6 +29,7 @@ if tp.TYPE_CHECKING:
     from static_frame.core.frame import Frame  # pylint: disable=W0611 #pragma: no cover
     from static_frame.core.index import Index  # pylint: disable=W0611 #pragma: no cover
     from static_frame.core.quilt import Quilt  # pylint: disable=W0611 #pragma: no cover
+    from static_frame.core.reduce import ReduceGroup  # pylint: disable=W0611 #pragma: no cover
     from static_frame.core.series import Series  # pylint: disable=W0611 #pragma: no cover
     from static_frame.core.yarn import Yarn  # pylint: disable=W0611 #pragma: no cover
     TNDArrayAny = np.ndarray[tp.Any, tp.Any] # pylint: disable=W0611 #pragma: no cover
@@ -520,6 +521,43 @@ class IterNodeDelegateMapable(IterNodeDelegate[TContainerAny]):
                 index_constructor=index_constructor,
                 )
 
+class IterNodeDelegateReducible(IterNodeDelegate[TContainerAny]):
+    '''
+    Delegate returned from :obj:`static_frame.IterNode`, providing iteration, a family of apply methods, and, via ``reduce``, vectorized reductions.
+    '''
+
+    __slots__ = (
+            '_func_reduce',
+            )
+
+    def __init__(self,
+            func_values: tp.Callable[..., tp.Iterable[tp.Any]],
+            func_items: tp.Callable[..., tp.Iterable[tp.Tuple[tp.Any, tp.Any]]],
+            yield_type: IterNodeType,
+            apply_constructor: tp.Callable[..., TContainerAny],
+            apply_type: IterNodeApplyType,
+            func_reduce: tp.Callable[[], ReduceGroup],
+        ) -> None:
+        '''
+        Args:
+            func_reduce: Callable that returns an object providing vectorized reductions.
+        '''
+        IterNodeDelegate.__init__(self,
+                func_values=func_values,
+                func_items=func_items,
+                yield_type=yield_type,
+                apply_constructor=apply_constructor,
+                apply_type=apply_type,
+                )
+        self._func_reduce = func_reduce
+
+    @property
+    def reduce(self) -> ReduceGroup:
+        '''
+        Return an interface of reductions, such as ``sum()`` and ``mean()``, that are applied to all groups (or windows) at once, returning a container with a row per group (or window).
+        '''
+        return self._func_reduce()
+
 #-------------------------------------------------------------------------------
 
 class IterNode(tp.Generic[TContainerAny]):
@@ -531,6 +569,7 @@ class IterNode(tp.Generic[TContainerAny]):
         '_container',
         '_func_values',
         '_func_items',
+        '_func_reduce',
         '_yield_type',
         '_apply_type',
         )
@@ -542,15 +581,18 @@ class IterNode(tp.Generic[TContainerAny]):
             function_items: tp.Callable[..., tp.Iterable[tp.Tuple[tp.Any, tp.Any]]],
             yield_type: IterNodeType,
             apply_type: IterNodeApplyType,
+            function_reduce: tp.Optional[tp.Callable[..., tp.Any]] = None,
             ) -> None:
         '''
         Args:
             function_values: will be partialed with arguments given with __call__.
             function_items: will be partialed with arguments given with __call__.
+            function_reduce: if provided, will be partialed with arguments given with __call__ and used by delegates that provide reductions.
         '''
         self._container: TContainerAny = container
         self._func_values = function_values
         self._func_items = function_items
+        self._func_reduce = function_reduce
         self._yield_type = yield_type
         self._apply_type = apply_type
 
@@ -770,6 +812,15 @@ class IterNode(tp.Generic[TContainerAny]):
             ) -> IterNodeDelegateMapable[TContainerAny]:
         return IterNodeDelegateMapable(**self._get_delegate_kwargs(**kwargs))
 
+    def get_delegate_reducible(self,
+            **kwargs: object,
+            ) -> IterNodeDelegateReducible[TContainerAny]:
+        assert self._func_reduce is not None
+        return IterNodeDelegateReducible(
+                **self._get_delegate_kwargs(**kwargs),
+                func_reduce=partial(self._func_reduce, **kwargs),
+                )
+
 #-------------------------------------------------------------------------------
 # specialize IterNode based on arguments given to __call__
 
@@ -847,14 +898,15 @@ class IterNodeGroupAxis(IterNode[TContainerAny]):
     '''
 
     __slots__ = ()
+    CLS_DELEGATE = IterNodeDelegateReducible
 
     def __call__(self,
             key: KEY_ITERABLE_TYPES, # type: ignore
             *,
             axis: int = 0,
             drop: bool = False,
-            ) -> IterNodeDelegate[TContainerAny]:
-        return IterNode.get_delegate(self, key=key, axis=axis, drop=drop)
+            ) -> IterNodeDelegateReducible[TContainerAny]:
+        return IterNode.get_delegate_reducible(self, key=key, axis=axis, drop=drop)
 
 
 class IterNodeGroupOther(IterNode[TContainerAny]):
@@ -914,7 +966,7 @@ class IterNodeWindow(IterNode[TContainerAny]):
     __slots__ = ()
 
     def __call__(self, *,
-            size: int,
+            size: tp.Union[int, np.timedelta64],
             axis: int = 0,
             step: int = 1,
             window_sized: bool = True,
@@ -924,7 +976,7 @@ class IterNodeWindow(IterNode[TContainerAny]):
             label_missing_skips: bool = True,
             label_missing_raises: bool = False,
             start_shift: int = 0,
-            size_increment: int = 0,
+            size_increment: tp.Union[int, np.timedelta64] = 0,
             ) -> IterNodeDelegate[TContainerAny]:
         return IterNode.get_delegate(self,
                 axis=axis,
@@ -940,3 +992,38 @@ class IterNodeWindow(IterNode[TContainerAny]):
                 size_increment=size_increment,
                 )
 
+
+class IterNodeWindowReducible(IterNodeWindow[TContainerAny]):
+    '''
+    Iterator on windows that additionally provides vectorized reductions of all windows.
+    '''
+
+    __slots__ = ()
+    CLS_DELEGATE = IterNodeDelegateReducible
+
+    def __call__(self, *,
+            size: tp.Union[int, np.timedelta64],
+            axis: int = 0,
+            step: int = 1,
+            window_sized: bool = True,
+            window_func: tp.Optional[TCallableAny] = None,
+            window_valid: tp.Optional[TCallableAny] = None,
+            label_shift: int = 0,
+            label_missing_skips: bool = True,
+            label_missing_raises: bool = False,
+            start_shift: int = 0,
+            size_increment: tp.Union[int, np.timedelta64] = 0,
+            ) -> IterNodeDelegateReducible[TContainerAny]:
+        return IterNode.get_delegate_reducible(self,
+                axis=axis,
+                size=size,
+                step=step,
+                window_sized=window_sized,
+                window_func=window_func,
+                window_valid=window_valid,
+                label_shift=label_shift,
+                label_missing_skips=label_missing_skips,
+                label_missing_raises=label_missing_raises,
+                start_shift=start_shift,
+                size_increment=size_increment,
+                )
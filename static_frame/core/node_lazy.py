@@ -0,0 +1,448 @@
+'''
+Deferred evaluation of binary and unary operators applied to aligned containers, such that chained operators are evaluated in chunks of rows that fit in cache, writing into reused buffers instead of allocating a full array for each operator.
+'''
+from __future__ import annotations
+
+import numpy as np
+import typing_extensions as tp
+
+from static_frame.core.node_selector import Interface
+from static_frame.core.type_blocks import TypeBlocks
+from static_frame.core.util import DTYPE_NUMERICABLE_KINDS
+from static_frame.core.util import OPERATORS
+from static_frame.core.util import TLocSelector
+from static_frame.core.util import WarningsSilent
+
+if tp.TYPE_CHECKING:
+    from static_frame.core.frame import Frame  # pylint: disable = W0611 #pragma: no cover
+    from static_frame.core.series import Series  # pylint: disable = W0611 #pragma: no cover
+
+    TNDArrayAny = np.ndarray[tp.Any, tp.Any] # pylint: disable=W0611 #pragma: no cover
+    TFrameAny = Frame[tp.Any, tp.Any, tp.Unpack[tp.Tuple[tp.Any, ...]]] # type: ignore[type-arg] # pylint: disable=W0611 #pragma: no cover
+    TSeriesAny = Series[tp.Any, tp.Any] # pylint: disable=W0611 #pragma: no cover
+
+TVContainer_co = tp.TypeVar('TVContainer_co',
+        'Frame[tp.Any, tp.Any, tp.Unpack[tp.Tuple[tp.Any, ...]]]', # type: ignore[type-arg]
+        'Series[tp.Any, tp.Any]',
+        covariant=True,
+        )
+
+INTERFACE_LAZY = (
+        '__getitem__',
+        'evaluate',
+        '__pos__',
+        '__neg__',
+        '__abs__',
+        '__invert__',
+        '__add__',
+        '__sub__',
+        '__mul__',
+        '__truediv__',
+        '__floordiv__',
+        '__mod__',
+        '__pow__',
+        '__lshift__',
+        '__rshift__',
+        '__and__',
+        '__xor__',
+        '__or__',
+        '__lt__',
+        '__le__',
+        '__eq__',
+        '__ne__',
+        '__gt__',
+        '__ge__',
+        '__radd__',
+        '__rsub__',
+        '__rmul__',
+        '__rtruediv__',
+        '__rfloordiv__',
+        )
+
+# ufuncs that implement operators, and can write into an out buffer
+LAZY_UFUNCS: tp.Dict[str, np.ufunc] = {
+        '__pos__': np.positive,
+        '__neg__': np.negative,
+        '__abs__': np.absolute,
+        '__invert__': np.invert,
+        '__add__': np.add,
+        '__sub__': np.subtract,
+        '__mul__': np.multiply,
+        '__truediv__': np.true_divide,
+        '__floordiv__': np.floor_divide,
+        '__mod__': np.remainder,
+        '__pow__': np.power,
+        '__lshift__': np.left_shift,
+        '__rshift__': np.right_shift,
+        '__and__': np.bitwise_and,
+        '__xor__': np.bitwise_xor,
+        '__or__': np.bitwise_or,
+        '__lt__': np.less,
+        '__le__': np.less_equal,
+        '__eq__': np.equal,
+        '__ne__': np.not_equal,
+        '__gt__': np.greater,
+        '__ge__': np.greater_equal,
+        }
+
+# reverse operators, mapped to the operator applied with operands swapped
+LAZY_OPERATORS_REVERSE = {
+        '__radd__': '__add__',
+        '__rsub__': '__sub__',
+        '__rmul__': '__mul__',
+        '__rtruediv__': '__truediv__',
+        '__rfloordiv__': '__floordiv__',
+        }
+
+# the count of elements in each chunk evaluated, such that the buffers of all operators fit in cache
+LAZY_CHUNK_ELEMENTS = 16_384
+
+#-------------------------------------------------------------------------------
+
+class InterfaceLazy(Interface[TVContainer_co]):
+    '''
+    A deferred expression of operators applied to containers and elements. Containers must have the same index (and, for :obj:`Frame`, the same columns). Calling ``evaluate()`` returns a container of the result.
+    '''
+    __slots__ = (
+            '_container',
+            '_operator',
+            '_operands',
+            )
+    _INTERFACE = INTERFACE_LAZY
+
+    def __init__(self,
+            container: TVContainer_co,
+            *,
+            operator: tp.Optional[str] = None,
+            operands: tp.Tuple[tp.Any, ...] = (),
+            ) -> None:
+        '''
+        Args:
+            container: for a leaf, the container of values; otherwise, a container with the index (and columns) of the result.
+            operator: the name of the operator applied to ``operands``, or None for a leaf.
+        '''
+        self._container: TVContainer_co = container
+        self._operator = operator
+        self._operands = operands
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}: {self._repr_expression()}>'
+
+    def _repr_expression(self) -> str:
+        if self._operator is None:
+            return f'{self._container.__class__.__name__}({self._container.name!r})'
+        parts = ', '.join(operand._repr_expression() if isinstance(operand, InterfaceLazy)
+                else repr(operand) for operand in self._operands)
+        return f'{self._operator}({parts})'
+
+    #---------------------------------------------------------------------------
+    def _to_operand(self, other: tp.Any) -> tp.Any:
+        '''Return ``other`` as a lazy expression if it is a container, validating that it is aligned with this expression, or as an element.
+        '''
+        from static_frame.core.frame import Frame
+        from static_frame.core.series import Series
+
+        if isinstance(other, (Series, Frame)):
+            other = InterfaceLazy(other)
+        if isinstance(other, InterfaceLazy):
+            container = self._container
+            other_container = other._container
+            if other_container is container:
+                return other
+            if (other_container.ndim != container.ndim
+                    or not (other_container.index is container.index
+                    or other_container.index.equals(container.index))
+                    or (container.ndim == 2 and not (
+                    other_container.columns is container.columns # type: ignore
+                    or other_container.columns.equals(container.columns)))): # type: ignore
+                raise RuntimeError('containers in a lazy expression must have the same shape, index, and columns.')
+            return other
+        if isinstance(other, np.ndarray) or (hasattr(other, '__len__') and not isinstance(other, str)):
+            raise RuntimeError('lazy expressions can only be formed with aligned containers or elements.')
+        return other
+
+    def _binary(self, operator: str, other: tp.Any) -> InterfaceLazy[TVContainer_co]:
+        return self.__class__(self._container,
+                operator=operator,
+                operands=(self, self._to_operand(other)),
+                )
+
+    def _unary(self, operator: str) -> InterfaceLazy[TVContainer_co]:
+        return self.__class__(self._container,
+                operator=operator,
+                operands=(self,),
+                )
+
+    #---------------------------------------------------------------------------
+    def __getitem__(self, key: TLocSelector) -> InterfaceLazy[tp.Any]:
+        '''
+        Select columns from a :obj:`Frame` to form a lazy expression.
+        '''
+        from static_frame.core.frame import Frame
+        from static_frame.core.series import Series
+
+        if self._operator is not None or not isinstance(self._container, Frame):
+            raise RuntimeError('only columns of a Frame can be selected in a lazy expression.')
+        post = self._container.__getitem__(key)
+        if not isinstance(post, (Series, Frame)):
+            raise RuntimeError('selections in a lazy expression must return a container.')
+        return self.__class__(post) # type: ignore
+
+    #---------------------------------------------------------------------------
+    def _iter_leaves(self) -> tp.Iterator[InterfaceLazy[tp.Any]]:
+        if self._operator is None:
+            yield self
+            return
+        for operand in self._operands:
+            if isinstance(operand, InterfaceLazy):
+                yield from operand._iter_leaves()
+
+    def _iter_elements(self) -> tp.Iterator[tp.Any]:
+        for operand in self._operands:
+            if isinstance(operand, InterfaceLazy):
+                yield from operand._iter_elements()
+            else:
+                yield operand
+
+    def _is_fusable(self) -> bool:
+        '''Return True if this expression can be evaluated in chunks with ufuncs: all leaves must be numeric (and, for a :obj:`Frame`, of a single dtype), and all elements must be numeric.
+        '''
+        for leaf in self._iter_leaves():
+            container = leaf._container
+            if container.ndim == 1:
+                if container.dtype.kind not in DTYPE_NUMERICABLE_KINDS: # type: ignore
+                    return False
+            else:
+                blocks = container._blocks # type: ignore
+                if not blocks._blocks:
+                    return False
+                dtype = blocks._blocks[0].dtype
+                if dtype.kind not in DTYPE_NUMERICABLE_KINDS or any(
+                        b.dtype != dtype for b in blocks._blocks):
+                    return False
+        for element in self._iter_elements():
+            if not isinstance(element, (bool, int, float, complex, np.number, np.bool_)):
+                return False
+        return True
+
+    def _evaluate_eager(self) -> tp.Any:
+        '''Evaluate this expression with the operators of the containers, allocating a container for each operator.
+        '''
+        if self._operator is None:
+            return self._container
+        operands = [operand._evaluate_eager() if isinstance(operand, InterfaceLazy)
+                else operand for operand in self._operands]
+        return OPERATORS[self._operator](*operands)
+
+    def _evaluate_chunks(self, chunk_size: int) -> TNDArrayAny:
+        '''Evaluate this expression in chunks of ``chunk_size`` rows, returning an array of all rows. After the first chunk, the result of each operator is written into the buffer allocated for that operator in the first chunk; if a buffer is only used once, it is reused by the operator that consumes it.
+        '''
+        # flatten the expression into steps in evaluation order; a sub-expression used more than once is evaluated once
+        steps: tp.List[tp.Tuple[tp.Any, ...]] = []
+        positions: tp.Dict[int, int] = {}
+        uses: tp.List[int] = []
+
+        def flatten(node: tp.Any) -> tp.Tuple[bool, tp.Any]:
+            # returns if the operand is a step, and its position or element
+            if not isinstance(node, InterfaceLazy):
+                return False, node
+            key = id(node)
+            if key in positions:
+                uses[positions[key]] += 1
+                return True, positions[key]
+            if node._operator is None:
+                container = node._container
+                if container.ndim == 1:
+                    step: tp.Tuple[tp.Any, ...] = ('leaf', container.values)
+                else:
+                    blocks = container._blocks # type: ignore
+                    if len(blocks._blocks) == 1 and blocks._blocks[0].ndim == 2:
+                        step = ('leaf', blocks._blocks[0])
+                    else:
+                        step = ('blocks', blocks)
+            else:
+                operator = node._operator
+                operands = [flatten(operand) for operand in node._operands]
+                if operator in LAZY_OPERATORS_REVERSE:
+                    operator = LAZY_OPERATORS_REVERSE[operator]
+                    operands.reverse()
+                step = ('ufunc', LAZY_UFUNCS[operator], operands)
+            positions[key] = len(steps)
+            steps.append(step)
+            uses.append(1)
+            return True, positions[key]
+
+        flatten(self)
+        container = self._container
+        count = container.shape[0]
+        root = len(steps) - 1
+
+        post: tp.Optional[TNDArrayAny] = None
+        buffers: tp.List[tp.Optional[TNDArrayAny]] = [None] * len(steps)
+        results: tp.List[tp.Any] = [None] * len(steps)
+
+        for start in range(0, count, chunk_size):
+            end = min(start + chunk_size, count)
+            rows = end - start
+            for i, step in enumerate(steps):
+                if step[0] == 'leaf':
+                    results[i] = step[1][start: end]
+                elif step[0] == 'blocks':
+                    results[i] = step[1]._extract_array(row_key=slice(start, end))
+                else:
+                    args = [results[position] if is_step else position
+                            for is_step, position in step[2]]
+                    if i == root and post is not None:
+                        out = post[start: end]
+                    elif buffers[i] is not None:
+                        out = buffers[i][:rows] # type: ignore
+                    else:
+                        out = None
+                    results[i] = step[1](*args, out=out)
+
+            if post is None:
+                # the first chunk determines the dtype of the result and of buffers
+                result = results[root]
+                post = np.empty((count,) + result.shape[1:], dtype=result.dtype)
+                post[:rows] = result
+                for i, step in enumerate(steps):
+                    if step[0] != 'ufunc' or i == root:
+                        continue
+                    # reuse the buffer of an operand used only by this step, if it has the same dtype
+                    for is_step, position in step[2]:
+                        if (is_step and uses[position] == 1
+                                and steps[position][0] == 'ufunc'
+                                and buffers[position] is not None
+                                and buffers[position].dtype == results[i].dtype # type: ignore
+                                and buffers[position].shape == results[i].shape): # type: ignore
+                            buffers[i] = buffers[position]
+                            break
+                    else:
+                        buffers[i] = results[i]
+
+        assert post is not None
+        post.flags.writeable = False
+        return post
+
+    #---------------------------------------------------------------------------
+    def evaluate(self, *, chunk_size: tp.Optional[int] = None) -> TVContainer_co:
+        '''
+        Evaluate the expression, returning a container with the index (and columns) of the containers in the expression. Numeric expressions are evaluated in chunks of rows, reusing buffers for the result of each operator; other expressions are evaluated with the operators of the containers.
+
+        Args:
+            chunk_size: the number of rows evaluated in each chunk; if not provided, a count of rows is chosen such that the buffers of each operator fit in cache.
+        '''
+        container = self._container
+        if self._operator is None:
+            return container
+        if chunk_size is not None and chunk_size < 1:
+            raise RuntimeError('chunk_size must be greater than zero.')
+
+        if not len(container) or not self._is_fusable():
+            with WarningsSilent():
+                return self._evaluate_eager() # type: ignore
+
+        width = 1 if container.ndim == 1 else container.shape[1]
+        if chunk_size is None:
+            chunk_size = max(LAZY_CHUNK_ELEMENTS // width, 1)
+
+        with WarningsSilent():
+            post = self._evaluate_chunks(chunk_size)
+
+        # as with operators of containers, the name is retained only if no other container is an operand
+        leaves = list(self._iter_leaves())
+        name = container.name if len(leaves) == 1 else None
+
+        if container.ndim == 1:
+            return container.__class__(post,
+                    index=container.index,
+                    name=name,
+                    ) # type: ignore
+        return container.__class__(TypeBlocks.from_blocks(post),
+                index=container.index,
+                columns=container.columns, # type: ignore
+                name=name,
+                own_data=True,
+                ) # type: ignore
+
+    #---------------------------------------------------------------------------
+    def __pos__(self) -> InterfaceLazy[TVContainer_co]:
+        return self._unary('__pos__')
+
+    def __neg__(self) -> InterfaceLazy[TVContainer_co]:
+        return self._unary('__neg__')
+
+    def __abs__(self) -> InterfaceLazy[TVContainer_co]:
+        return self._unary('__abs__')
+
+    def __invert__(self) -> InterfaceLazy[TVContainer_co]:
+        return self._unary('__invert__')
+
+    def __add__(self, other: tp.Any) -> InterfaceLazy[TVContainer_co]:
+        return self._binary('__add__', other)
+
+    def __sub__(self, other: tp.Any) -> InterfaceLazy[TVContainer_co]:
+        return self._binary('__sub__', other)
+
+    def __mul__(self, other: tp.Any) -> InterfaceLazy[TVContainer_co]:
+        return self._binary('__mul__', other)
+
+    def __truediv__(self, other: tp.Any) -> InterfaceLazy[TVContainer_co]:
+        return self._binary('__truediv__', other)
+
+    def __floordiv__(self, other: tp.Any) -> InterfaceLazy[TVContainer_co]:
+        return self._binary('__floordiv__', other)
+
+    def __mod__(self, other: tp.Any) -> InterfaceLazy[TVContainer_co]:
+        return self._binary('__mod__', other)
+
+    def __pow__(self, other: tp.Any) -> InterfaceLazy[TVContainer_co]:
+        return self._binary('__pow__', other)
+
+    def __lshift__(self, other: tp.Any) -> InterfaceLazy[TVContainer_co]:
+        return self._binary('__lshift__', other)
+
+    def __rshift__(self, other: tp.Any) -> InterfaceLazy[TVContainer_co]:
+        return self._binary('__rshift__', other)
+
+    def __and__(self, other: tp.Any) -> InterfaceLazy[TVContainer_co]:
+        return self._binary('__and__', other)
+
+    def __xor__(self, other: tp.Any) -> InterfaceLazy[TVContainer_co]:
+        return self._binary('__xor__', other)
+
+    def __or__(self, other: tp.Any) -> InterfaceLazy[TVContainer_co]:
+        return self._binary('__or__', other)
+
+    def __lt__(self, other: tp.Any) -> InterfaceLazy[TVContainer_co]:
+        return self._binary('__lt__', other)
+
+    def __le__(self, other: tp.Any) -> InterfaceLazy[TVContainer_co]:
+        return self._binary('__le__', other)
+
+    def __eq__(self, other: tp.Any) -> InterfaceLazy[TVContainer_co]: # type: ignore
+        return self._binary('__eq__', other)
+
+    def __ne__(self, other: tp.Any) -> InterfaceLazy[TVContainer_co]: # type: ignore
+        return self._binary('__ne__', other)
+
+    def __gt__(self, other: tp.Any) -> InterfaceLazy[TVContainer_co]:
+        return self._binary('__gt__', other)
+
+    def __ge__(self, other: tp.Any) -> InterfaceLazy[TVContainer_co]:
+        return self._binary('__ge__', other)
+
+    def __radd__(self, other: tp.Any) -> InterfaceLazy[TVContainer_co]:
+        return self._binary('__radd__', other)
+
+    def __rsub__(self, other: tp.Any) -> InterfaceLazy[TVContainer_co]:
+        return self._binary('__rsub__', other)
+
+    def __rmul__(self, other: tp.Any) -> InterfaceLazy[TVContainer_co]:
+        return self._binary('__rmul__', other)
+
+    def __rtruediv__(self, other: tp.Any) -> InterfaceLazy[TVContainer_co]:
+        return self._binary('__rtruediv__', other)
+
+    def __rfloordiv__(self, other: tp.Any) -> InterfaceLazy[TVContainer_co]:
+        return self._binary('__rfloordiv__', other)
@@ -0,0 +1,383 @@
+'''
+A mask-backed representation of a 1D integer or Boolean array with missing values, where values retain their dtype and missing values are marked by a validity mask.
+'''
+from __future__ import annotations
+
+import numpy as np
+import typing_extensions as tp
+from arraykit import resolve_dtype
+from arraykit import resolve_dtype_iter
+
+from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_BOOL_KIND
+from static_frame.core.util import DTYPE_FLOAT_DEFAULT
+from static_frame.core.util import DTYPE_FLOAT_KIND
+from static_frame.core.util import DTYPE_INT_DEFAULT
+from static_frame.core.util import DTYPE_INT_KINDS
+from static_frame.core.util import DTYPE_OBJECT
+from static_frame.core.util import DTYPE_OBJECT_KIND
+from static_frame.core.util import PositionsAllocator
+from static_frame.core.util import dtype_from_element
+from static_frame.core.util import isna_array
+
+if tp.TYPE_CHECKING:
+    import pyarrow  # pylint: disable=W0611 #pragma: no cover
+
+    from static_frame.core.generic_aliases import TSeriesAny  # pylint: disable=W0611 #pragma: no cover
+    from static_frame.core.index_base import IndexBase  # pylint: disable=W0611 #pragma: no cover
+    from static_frame.core.util import TLabel  # pylint: disable=W0611 #pragma: no cover
+    TNDArrayAny = np.ndarray[tp.Any, tp.Any] # pylint: disable=W0611 #pragma: no cover
+    TDtypeAny = np.dtype[tp.Any] # pylint: disable=W0611 #pragma: no cover
+
+_NULLABLE_KINDS = frozenset(DTYPE_INT_KINDS + (DTYPE_BOOL_KIND,))
+
+def _immutable(array: TNDArrayAny) -> TNDArrayAny:
+    if array.flags.writeable:
+        array = array.copy()
+        array.flags.writeable = False
+    return array
+
+def _unpack_bitmap(buffer: tp.Any, offset: int, count: int) -> TNDArrayAny:
+    '''Return a Boolean array of ``count`` elements from an Arrow bitmap buffer, where bits are in little-endian order, starting at bit ``offset``.
+    '''
+    bits = np.unpackbits(
+            np.frombuffer(buffer, dtype=np.uint8),
+            count=offset + count,
+            bitorder='little',
+            )
+    return bits[offset:].astype(DTYPE_BOOL)
+
+#-------------------------------------------------------------------------------
+
+class NullableArray:
+    '''
+    An immutable 1D integer or Boolean array with missing values, stored as an array of values of the original dtype and a Boolean validity mask, as used by Arrow. Unlike converting to float or object, values retain their dtype and memory; ``isna()``, ``fillna()``, ``dropna()``, and reductions use the mask directly. Missing positions in the values array are set to zero (or False).
+
+    This type is not yet public: as :obj:`TypeBlocks` holds only NumPy arrays without validity masks, it is not yet held by containers.
+    '''
+    __slots__ = (
+            '_values',
+            '_valid',
+            '_array',
+            )
+
+    _values: TNDArrayAny
+    _valid: tp.Optional[TNDArrayAny]
+    _array: tp.Optional[TNDArrayAny]
+
+    @classmethod
+    def from_array(cls,
+            array: TNDArrayAny,
+            *,
+            dtype: tp.Optional[TDtypeAny] = None,
+            ) -> tp.Self:
+        '''Create a :obj:`NullableArray` from a 1D array, where NaN and None are missing values. Float or object arrays are converted to ``dtype``; if ``dtype`` is not provided, it is found from the values that are not missing.
+        '''
+        if array.ndim != 1:
+            raise RuntimeError('a NullableArray must be created from a 1D array.')
+        if array.dtype.kind in _NULLABLE_KINDS:
+            if dtype is not None:
+                array = array.astype(dtype)
+            return cls(array, None)
+
+        valid = ~isna_array(array)
+        present = array[valid]
+        if dtype is None:
+            dtype = DTYPE_INT_DEFAULT
+            if array.dtype.kind == DTYPE_OBJECT_KIND and len(present):
+                dtype_found = resolve_dtype_iter(dtype_from_element(v) for v in present)
+                # integral floats are converted to integers below
+                if dtype_found.kind != DTYPE_FLOAT_KIND:
+                    dtype = dtype_found
+        dtype = np.dtype(dtype)
+        if dtype.kind not in _NULLABLE_KINDS:
+            raise RuntimeError(f'a NullableArray cannot be created with dtype {dtype}.')
+
+        values = np.zeros(len(array), dtype=dtype)
+        converted = present.astype(dtype)
+        if (converted != present).any():
+            raise RuntimeError(f'values cannot be converted to {dtype} without loss.')
+        values[valid] = converted
+        return cls(values, valid)
+
+    @classmethod
+    def from_arrow(cls, value: tp.Union[pyarrow.Array, pyarrow.ChunkedArray]) -> tp.Self:
+        '''Create a :obj:`NullableArray` from a ``pyarrow.Array`` or ``pyarrow.ChunkedArray`` of integers or Booleans, mapping the Arrow validity bitmap to the mask and the Arrow data buffer to the values.
+        '''
+        import pyarrow
+
+        if isinstance(value, pyarrow.ChunkedArray):
+            value = value.combine_chunks()
+        count = len(value)
+        offset = value.offset
+        buffer_validity, buffer_data = value.buffers()
+
+        if pyarrow.types.is_boolean(value.type):
+            values = _unpack_bitmap(buffer_data, offset, count)
+        elif pyarrow.types.is_integer(value.type):
+            dtype = np.dtype(value.type.to_pandas_dtype())
+            values = np.frombuffer(buffer_data, dtype=dtype, count=offset + count)[offset:]
+        else:
+            raise RuntimeError(f'a NullableArray cannot be created from Arrow type {value.type}.')
+
+        if buffer_validity is None or value.null_count == 0:
+            return cls(values, None)
+        valid = _unpack_bitmap(buffer_validity, offset, count)
+        # Arrow does not define the data of null slots
+        values = np.where(valid, values, values.dtype.type(0))
+        return cls(values, valid)
+
+    def __init__(self,
+            values: TNDArrayAny,
+            valid: tp.Optional[TNDArrayAny],
+            ) -> None:
+        '''Initializer for internal use; use :obj:`NullableArray.from_array` or :obj:`NullableArray.from_arrow`.
+        '''
+        self._values = _immutable(values)
+        self._valid = None if valid is None or valid.all() else _immutable(valid)
+        self._array = None
+
+    #---------------------------------------------------------------------------
+    # properties
+
+    @property
+    def values(self) -> TNDArrayAny:
+        '''The immutable array of values, where missing positions are zero (or False).'''
+        return self._values
+
+    @property
+    def valid(self) -> TNDArrayAny:
+        '''The immutable Boolean validity mask, True where values are not missing.'''
+        if self._valid is None:
+            valid = np.full(len(self._values), True, dtype=DTYPE_BOOL)
+            valid.flags.writeable = False
+            return valid
+        return self._valid
+
+    @property
+    def dtype(self) -> TDtypeAny:
+        return self._values.dtype
+
+    @property
+    def shape(self) -> tp.Tuple[int]:
+        return self._values.shape # type: ignore
+
+    @property
+    def ndim(self) -> int:
+        return 1
+
+    @property
+    def size(self) -> int:
+        return self._values.size
+
+    @property
+    def nbytes(self) -> int:
+        '''The bytes of values and mask.'''
+        return self._values.nbytes + (0 if self._valid is None else self._valid.nbytes) # type: ignore
+
+    @property
+    def null_count(self) -> int:
+        return 0 if self._valid is None else len(self._valid) - int(self._valid.sum())
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}: {len(self._values)} elements, {self.null_count} missing, {self.dtype}>'
+
+    def to_array(self) -> TNDArrayAny:
+        '''Return an immutable array of the values with missing values as NaN (for integers) or None (for Booleans); if there are no missing values, the values are returned. The array is created on first call.
+        '''
+        if self._valid is None:
+            return self._values
+        if self._array is None:
+            if self.dtype.kind == DTYPE_BOOL_KIND:
+                array = self._values.astype(DTYPE_OBJECT)
+                array[~self._valid] = None
+            else:
+                array = self._values.astype(DTYPE_FLOAT_DEFAULT)
+                array[~self._valid] = np.nan
+            array.flags.writeable = False
+            self._array = array
+        return self._array
+
+    def __array__(self, dtype: tp.Optional[TDtypeAny] = None) -> TNDArrayAny:
+        if dtype is None:
+            return self.to_array()
+        return self.to_array().astype(dtype)
+
+    def __getitem__(self, key: tp.Any) -> tp.Any:
+        '''Select by position; an integer returns an element (or None if missing), other selections return a :obj:`NullableArray`.
+        '''
+        values = self._values[key]
+        if values.__class__ is not np.ndarray:
+            if self._valid is not None and not self._valid[key]:
+                return None
+            return values
+        return self.__class__(values, None if self._valid is None else self._valid[key])
+
+    def equals(self, other: tp.Any) -> bool:
+        '''Return True if ``other`` is a :obj:`NullableArray` with the same dtype, values, and missing positions.
+        '''
+        if id(other) == id(self):
+            return True
+        if not isinstance(other, NullableArray):
+            return False
+        if self.dtype != other.dtype or len(self) != len(other):
+            return False
+        if (self._valid is None) != (other._valid is None):
+            return False
+        if self._valid is not None and (self._valid != other._valid).any(): # type: ignore
+            return False
+        return bool((self._values == other._values).all())
+
+    #---------------------------------------------------------------------------
+    # missing values
+
+    def isna(self) -> TNDArrayAny:
+        '''Return an immutable Boolean array that is True where values are missing.
+        '''
+        if self._valid is None:
+            post = np.full(len(self._values), False, dtype=DTYPE_BOOL)
+        else:
+            post = ~self._valid
+        post.flags.writeable = False
+        return post
+
+    def notna(self) -> TNDArrayAny:
+        '''Return an immutable Boolean array that is True where values are not missing.
+        '''
+        return self.valid
+
+    def dropna(self) -> TNDArrayAny:
+        '''Return an immutable array of the values that are not missing.
+        '''
+        if self._valid is None:
+            return self._values
+        post = self._values[self._valid]
+        post.flags.writeable = False
+        return post
+
+    def fillna(self, value: tp.Any) -> TNDArrayAny:
+        '''Return an immutable array with missing values replaced by ``value``; the dtype is retained if it can hold ``value``.
+        '''
+        if self._valid is None:
+            return self._values
+        dtype = resolve_dtype(self.dtype, dtype_from_element(value))
+        post = self._values.astype(dtype)
+        post[~self._valid] = value
+        post.flags.writeable = False
+        return post
+
+    def _fillna_directional(self, *, forward: bool, limit: int) -> tp.Self:
+        if self._valid is None:
+            return self
+        valid = self._valid if forward else self._valid[::-1]
+        positions = PositionsAllocator.get(len(valid))
+        # for each position, the position of the last valid value, or -1
+        source = np.where(valid, positions, -1)
+        np.maximum.accumulate(source, out=source)
+        fill = source >= 0
+        if limit:
+            fill &= (positions - source) <= limit
+        source = np.where(fill, source, positions)
+        if not forward:
+            source = len(valid) - 1 - source[::-1]
+            fill = fill[::-1]
+        return self.__class__(self._values[source], fill)
+
+    def fillna_forward(self, limit: int = 0) -> tp.Self:
+        '''Return a new :obj:`NullableArray` after feeding forward the last valid value across contiguous missing values; leading missing values remain.
+
+        Args:
+            limit: the maximum count of missing values to fill; if 0, there is no limit.
+        '''
+        return self._fillna_directional(forward=True, limit=limit)
+
+    def fillna_backward(self, limit: int = 0) -> tp.Self:
+        '''Return a new :obj:`NullableArray` after feeding backward the next valid value across contiguous missing values; trailing missing values remain.
+
+        Args:
+            limit: the maximum count of missing values to fill; if 0, there is no limit.
+        '''
+        return self._fillna_directional(forward=False, limit=limit)
+
+    #---------------------------------------------------------------------------
+    # reductions
+
+    def _reduce(self,
+            func: tp.Callable[..., tp.Any],
+            skipna: bool,
+            where: bool = False,
+            ) -> tp.Any:
+        if self._valid is None:
+            values = self._values
+        elif not skipna:
+            return np.nan
+        elif where:
+            # reduce with a where mask, avoiding a copy of valid values
+            return func(self._values, where=self._valid)
+        else:
+            values = self.dropna()
+        if not where and not len(values):
+            # reductions without an identity (min, max, mean) of no values
+            return np.nan
+        return func(values)
+
+    def count(self) -> int:
+        '''Return the count of values that are not missing.'''
+        return len(self._values) - self.null_count
+
+    def sum(self, *, skipna: bool = True) -> tp.Any:
+        return self._reduce(np.sum, skipna, where=True)
+
+    def prod(self, *, skipna: bool = True) -> tp.Any:
+        return self._reduce(np.prod, skipna, where=True)
+
+    def min(self, *, skipna: bool = True) -> tp.Any:
+        return self._reduce(np.min, skipna)
+
+    def max(self, *, skipna: bool = True) -> tp.Any:
+        return self._reduce(np.max, skipna)
+
+    def mean(self, *, skipna: bool = True) -> tp.Any:
+        return self._reduce(np.mean, skipna)
+
+    def all(self, *, skipna: bool = True) -> tp.Any:
+        return self._reduce(np.all, skipna, where=True)
+
+    def any(self, *, skipna: bool = True) -> tp.Any:
+        return self._reduce(np.any, skipna, where=True)
+
+    #---------------------------------------------------------------------------
+    # exporters
+
+    def to_arrow(self) -> pyarrow.Array:
+        '''Return a ``pyarrow.Array``, where the mask is packed into the Arrow validity bitmap and the values are used as the Arrow data buffer.
+        '''
+        import pyarrow
+
+        count = len(self._values)
+        if self.dtype.kind == DTYPE_BOOL_KIND:
+            arrow_type = pyarrow.bool_()
+            data = np.packbits(self._values, bitorder='little')
+        else:
+            arrow_type = pyarrow.from_numpy_dtype(self.dtype)
+            data = self._values
+        validity = None if self._valid is None else pyarrow.py_buffer(
+                np.packbits(self._valid, bitorder='little'))
+        return pyarrow.Array.from_buffers(
+                arrow_type,
+                count,
+                [validity, pyarrow.py_buffer(np.ascontiguousarray(data))],
+                null_count=self.null_count,
+                )
+
+    def to_series(self, *,
+            index: tp.Optional[tp.Union[IndexBase, tp.Iterable[TLabel]]] = None,
+            name: TLabel = None,
+            ) -> TSeriesAny:
+        '''Return a :obj:`Series` of the values, with missing values as NaN (for integers) or None (for Booleans).
+        '''
+        from static_frame.core.series import Series
+        return Series(self.to_array(), index=index, name=name)
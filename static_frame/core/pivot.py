@@ -17,6 +17,11 @@ from static_frame.core.index_base import IndexBase
 from static_frame.core.index_hierarchy import IndexHierarchy
 from static_frame.core.type_blocks import TypeBlocks
 from static_frame.core.util import DEFAULT_FAST_SORT_KIND
+from static_frame.core.util import DEFAULT_STABLE_SORT_KIND
+from static_frame.core.util import DTYPE_INT_DEFAULT
+from static_frame.core.util import DTYPE_INT_KINDS
+from static_frame.core.util import DTYPE_UINT_DEFAULT
+from static_frame.core.util import PositionsAllocator
 from static_frame.core.util import TCallableAny
 from static_frame.core.util import TDepthLevel
 from static_frame.core.util import TIndexCtor
@@ -26,6 +31,8 @@ from static_frame.core.util import TName
 from static_frame.core.util import TSortKinds
 from static_frame.core.util import TUFunc
 from static_frame.core.util import dtype_from_element
+from static_frame.core.util import get_concurrent_executor
+from static_frame.core.util import isna_array
 from static_frame.core.util import iterable_to_array_1d
 from static_frame.core.util import ufunc_dtype_to_dtype
 from static_frame.core.util import ufunc_unique
@@ -229,8 +236,8 @@ def pivot_records_items_to_blocks(*,
                 dtype_resolved = resolve_dtype(array.dtype, fill_value_dtype) # type: ignore
                 if array.dtype != dtype_resolved: # type: ignore
                     array = array.astype(dtype_resolved) #type: ignore
-                    array[fill_targets] = fill_value
                     arrays[arrays_key] = array # re-assign new array
+                array[fill_targets] = fill_value
             array.flags.writeable = False # type: ignore
     else:
         for arrays_key in range(len(arrays)): #pylint: disable=C0200
@@ -379,6 +386,64 @@ def pivot_items_to_frame(*,
             )
 
 
+def pivot_sub_to_blocks(
+        sub: TypeBlocks,
+        *,
+        single: bool,
+        index_fields_iloc: tp.List[int],
+        index_depth: int,
+        data_fields_iloc: tp.List[int],
+        func_single: tp.Optional[TUFunc],
+        func_map: tp.Sequence[tp.Tuple[TLabel, TUFunc]],
+        func_no: bool,
+        dtype_single: tp.Optional[TDtypeAny],
+        dtypes: tp.Tuple[tp.Optional[TDtypeAny], ...],
+        index_outer: IndexBase,
+        fill_value: tp.Any,
+        fill_value_dtype: TDtypeAny,
+        kind: TSortKinds,
+        ) -> tp.List[TNDArrayAny]:
+    '''
+    Return the arrays of the columns of one group of ``columns_fields``, given the sub-blocks of that group.
+    '''
+    if single:
+        return [pivot_items_to_block(blocks=sub,
+                group_fields_iloc=index_fields_iloc,
+                group_depth=index_depth,
+                data_field_iloc=data_fields_iloc[0],
+                func_single=func_single,
+                dtype=dtype_single,
+                index_outer=index_outer,
+                fill_value=fill_value,
+                fill_value_dtype=fill_value_dtype,
+                kind=kind,
+                )]
+    return pivot_records_items_to_blocks(
+            blocks=sub,
+            group_fields_iloc=index_fields_iloc,
+            group_depth=index_depth,
+            data_fields_iloc=data_fields_iloc,
+            func_single=func_single,
+            func_map=func_map,
+            func_no=func_no,
+            fill_value=fill_value,
+            fill_value_dtype=fill_value_dtype,
+            index_outer=index_outer,
+            dtypes=dtypes,
+            kind=kind,
+            )
+
+def pivot_subs_to_blocks(
+        subs: tp.Sequence[TypeBlocks],
+        *,
+        sub_to_blocks: tp.Callable[[TypeBlocks], tp.List[TNDArrayAny]],
+        ) -> tp.List[TNDArrayAny]:
+    '''
+    Return the arrays of the columns of a partition of groups of ``columns_fields``; this is a module-level function such that it can be called in another process.
+    '''
+    return list(chain.from_iterable(map(sub_to_blocks, subs)))
+
+
 def pivot_core(
         *,
         frame: TFrameAny,
@@ -391,8 +456,13 @@ def pivot_core(
         fill_value: object = np.nan,
         index_constructor: TIndexCtorSpecifier = None,
         kind: TSortKinds = DEFAULT_FAST_SORT_KIND,
+        max_workers: tp.Optional[int] = None,
+        use_threads: bool = False,
         ) -> TFrameAny:
     '''Core implementation of Frame.pivot(). The Frame has already been reduced to just relevant columns, and all fields groups are normalized as lists of hashables.
+
+    Args:
+        max_workers: if provided, with ``columns_fields``, the columns of each data field and function, or of each partition of groups of ``columns_fields``, are computed in parallel.
     '''
     from static_frame.core.frame import Frame
     from static_frame.core.series import Series
@@ -427,7 +497,7 @@ def pivot_core(
                 depth_reference=columns_depth,
                 name=columns_name)
 
-    dtype_single: TDtypeAny | None
+    dtype_single: TDtypeAny | None = None
     dtype_map = frame.dtypes # returns a Series
 
     dtypes_per_data_fields: tp.Tuple[TDtypeAny | None, ...]
@@ -498,66 +568,100 @@ def pivot_core(
     #---------------------------------------------------------------------------
     # Second major branch: we are grouping by index and columns fields. This is done with an outer and inner gruop by. The index is calculated ahead of time.
 
+    index_outer = pivot_outer_index(frame=frame,
+                index_fields=index_fields,
+                index_depth=index_depth,
+                index_constructor=index_constructor,
+                )
+
+    if not func_no:
+        tb = pivot_scatter_to_blocks(
+                blocks=frame._blocks,
+                index_fields_iloc=index_fields_iloc,
+                columns_fields_iloc=columns_fields_iloc,
+                data_fields_iloc=data_fields_iloc,
+                funcs=(func_single,) if func_single else tuple(f for _, f in func_map),
+                index_outer=index_outer,
+                fill_value=fill_value,
+                fill_value_dtype=fill_value_dtype,
+                resolve_all=data_fields_len == 1 and func_single is not None,
+                max_workers=max_workers,
+                use_threads=use_threads,
+                )
+        if tb is not None:
+            blocks, groups = tb
+            return frame.__class__(blocks,
+                    index=index_outer,
+                    columns=columns_constructor(chain.from_iterable( # pyright: ignore
+                            extrapolate_column_fields(
+                                    columns_fields,
+                                    group,
+                                    data_fields,
+                                    func_fields,
+                                    ) for group in groups)),
+                    own_data=True,
+                    own_index=True,
+                    own_columns=True,
+                    )
+
     # avoid doing a multi-column-style selection if not needed
     if len(columns_fields) == 1:
         retuple_group_label = True
     else:
         retuple_group_label = False
 
-    columns_loc_to_iloc = frame.columns._loc_to_iloc
     # group by on 1 or more columns fields
     # NOTE: explored doing one group on index and columns that insert into pre-allocated arrays, but that proved slower than this approach
     group_key: int | tp.List[int] = columns_fields_iloc if len(columns_fields_iloc) > 1 else columns_fields_iloc[0]
 
-    index_outer = pivot_outer_index(frame=frame,
-                index_fields=index_fields,
-                index_depth=index_depth,
-                index_constructor=index_constructor,
-                )
-
     # collect subframes based on an index of tuples and columns of tuples (if depth > 1)
-    sub_blocks = []
+    subs: tp.List[TypeBlocks] = []
     sub_columns_collected: tp.List[TLabel] = []
 
     for group, _, sub in frame._blocks.group(axis=0, key=group_key, kind=kind):
         # derive the column fields represented by this group
-        sub_columns = extrapolate_column_fields(
+        sub_columns_collected.extend(extrapolate_column_fields(
                 columns_fields,
                 group if not retuple_group_label else (group,), # type: ignore
                 data_fields,
                 func_fields,
+                ))
+        subs.append(sub)
+
+    sub_to_blocks = partial(pivot_sub_to_blocks,
+            # if each group has only one column, we only need to extract one column out of the sub blocks
+            single=data_fields_len == 1 and not func_fields,
+            index_fields_iloc=index_fields_iloc,
+            index_depth=index_depth,
+            data_fields_iloc=data_fields_iloc,
+            func_single=func_single,
+            func_map=func_map,
+            func_no=func_no,
+            dtype_single=dtype_single,
+            dtypes=dtypes_per_data_fields,
+            index_outer=index_outer,
+            fill_value=fill_value,
+            fill_value_dtype=fill_value_dtype,
+            kind=kind,
+            )
+
+    sub_blocks: tp.List[TNDArrayAny]
+    if max_workers is None:
+        sub_blocks = list(chain.from_iterable(map(sub_to_blocks, subs)))
+    else:
+        # contiguous partitions of groups retain the order of columns
+        bounds = np.linspace(0, len(subs), min(max_workers, len(subs)) + 1).astype(DTYPE_INT_DEFAULT)
+        partitions = [subs[start: end] for start, end in zip(bounds[:-1], bounds[1:])]
+        pool_executor = get_concurrent_executor(
+                use_threads=use_threads,
+                max_workers=max_workers,
+                mp_context=None,
                 )
-        sub_columns_collected.extend(sub_columns)
-
-        sub_frame: TFrameAny
-        # if sub_columns length is 1, that means that we only need to extract one column out of the sub blocks
-        if len(sub_columns) == 1: # type: ignore
-            sub_blocks.append(pivot_items_to_block(blocks=sub,
-                            group_fields_iloc=index_fields_iloc,
-                            group_depth=index_depth,
-                            data_field_iloc=data_fields_iloc[0],
-                            func_single=func_single,
-                            dtype=dtype_single,
-                            index_outer=index_outer,
-                            fill_value=fill_value,
-                            fill_value_dtype=fill_value_dtype,
-                            kind=kind,
-                            ))
-        else:
-            sub_blocks.extend(pivot_records_items_to_blocks(
-                            blocks=sub,
-                            group_fields_iloc=index_fields_iloc,
-                            group_depth=index_depth,
-                            data_fields_iloc=data_fields_iloc,
-                            func_single=func_single,
-                            func_map=func_map,
-                            func_no=func_no,
-                            fill_value=fill_value,
-                            fill_value_dtype=fill_value_dtype,
-                            index_outer=index_outer,
-                            dtypes=dtypes_per_data_fields,
-                            kind=kind,
-                            ))
+        with pool_executor() as executor:
+            sub_blocks = list(chain.from_iterable(executor.map(
+                    partial(pivot_subs_to_blocks, sub_to_blocks=sub_to_blocks),
+                    partitions,
+                    )))
 
     tb = TypeBlocks.from_blocks(sub_blocks)
     return frame.__class__(tb,
@@ -569,6 +673,253 @@ def pivot_core(
             )
 
 
+#-------------------------------------------------------------------------------
+# functions that, applied to numeric data fields, are evaluated for all cells of a pivot at once by scattering values into a dense array of cells; each is mapped to a reduction and whether NaN values are skipped
+
+PIVOT_SCATTER_FUNCS: tp.Dict[tp.Any, tp.Tuple[str, bool]] = {
+        np.sum: ('sum', False),
+        np.nansum: ('sum', True),
+        np.mean: ('mean', False),
+        np.nanmean: ('mean', True),
+        np.min: ('min', False),
+        np.nanmin: ('min', True),
+        np.max: ('max', False),
+        np.nanmax: ('max', True),
+        len: ('count', False),
+        }
+
+
+def pivot_codes(values: TNDArrayAny) -> tp.Tuple[TNDArrayAny, TNDArrayAny]:
+    '''
+    Return the sorted unique values of a 1D array of non-object values, and the position of each value in those unique values. Integers within a range not much greater than their count are coded by counting, without a sort; otherwise, unique values are found with an unstable sort, and each value is coded with ``np.searchsorted``.
+    '''
+    kind = values.dtype.kind
+    if kind == 'b':
+        values = values.astype(DTYPE_INT_DEFAULT)
+    if kind == 'b' or kind in DTYPE_INT_KINDS:
+        low = values.min()
+        span = int(values.max()) - int(low) + 1
+        if span <= 4 * len(values) + 1024:
+            offsets = (values - low).astype(DTYPE_INT_DEFAULT, copy=False)
+            present = np.bincount(offsets, minlength=span) > 0
+            uniques = np.nonzero(present)[0] + low
+            codes = (np.cumsum(present) - 1)[offsets]
+            if kind == 'b':
+                uniques = uniques.astype(bool)
+            else:
+                uniques = uniques.astype(values.dtype, copy=False)
+            return uniques, codes
+
+    uniques = ufunc_unique1d(values)
+    return uniques, np.searchsorted(uniques, values)
+
+
+def pivot_factorize(
+        blocks: TypeBlocks,
+        fields_iloc: tp.Sequence[int],
+        ) -> tp.Optional[tp.Tuple[TNDArrayAny, tp.Sequence[tp.Tuple[TLabel, ...]]]]:
+    '''
+    Return integer codes for the values of one or more fields, where codes are dense and ordered as the sorted unique values, as well as the tuple of field values of each code. Returns None if any field has object or NA values, as these might not sort.
+    '''
+    codes: tp.Optional[TNDArrayAny] = None
+    for iloc in fields_iloc:
+        values = blocks._extract_array_column(iloc)
+        if values.dtype.kind == 'O' or isna_array(values).any():
+            return None
+        uniques, codes_field = pivot_codes(values)
+        if codes is None:
+            codes = codes_field
+        else: # combine with prior fields, then re-factorize to keep codes dense
+            uniques, codes = pivot_codes(codes * len(uniques) + codes_field)
+
+    if len(fields_iloc) == 1:
+        return codes, [(label,) for label in uniques] # type: ignore
+    # as when grouping, take labels from the rows of all fields, such that values are converted as in a consolidated array
+    first = np.full(len(uniques), len(codes), dtype=DTYPE_INT_DEFAULT) # type: ignore
+    np.minimum.at(first, codes, np.arange(len(codes))) # type: ignore
+    rows = blocks._extract_array(row_key=first, column_key=list(fields_iloc))
+    return codes, [tuple(row) for row in rows] # type: ignore
+
+
+def pivot_scatter_reduce(
+        values: TNDArrayAny,
+        cells: TNDArrayAny,
+        size: int,
+        name: str,
+        skipna: bool,
+        ) -> TNDArrayAny:
+    '''
+    Reduce ``values`` into an array of ``size`` cells, where ``cells`` gives the cell of each value. Sums are accumulated with ``np.bincount`` (floats) or ``np.add.at`` (integers), extremes with ``np.minimum.at`` or ``np.maximum.at``.
+    '''
+    kind = values.dtype.kind
+    isna = np.isnan(values) if kind == 'f' else None
+    if isna is not None and not isna.any():
+        isna = None
+
+    if name == 'count':
+        return np.bincount(cells, minlength=size)
+
+    if name == 'sum' or name == 'mean':
+        if kind == 'f':
+            post = np.bincount(cells,
+                    weights=values if isna is None or not skipna else np.where(isna, 0, values),
+                    minlength=size,
+                    )
+        else:
+            post = np.zeros(size, dtype=DTYPE_UINT_DEFAULT if kind == 'u' else DTYPE_INT_DEFAULT)
+            np.add.at(post, cells, values)
+        if name == 'sum':
+            return post
+        counts = np.bincount(cells if isna is None or not skipna else cells[~isna],
+                minlength=size,
+                )
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return post / counts # type: ignore
+
+    # min or max
+    if kind == 'f':
+        initial = np.inf if name == 'min' else -np.inf
+        ufunc = (np.fmin if name == 'min' else np.fmax) if skipna else (np.minimum if name == 'min' else np.maximum)
+    else:
+        initial = (True if name == 'min' else False) if kind == 'b' else (
+                np.iinfo(values.dtype).max if name == 'min' else np.iinfo(values.dtype).min)
+        ufunc = np.minimum if name == 'min' else np.maximum
+    post = np.full(size, initial, dtype=values.dtype)
+    with np.errstate(invalid='ignore'):
+        # comparisons with NaN are expected
+        ufunc.at(post, cells, values)
+    if isna is not None and skipna:
+        # as with np.nanmin, cells without any non-NaN values are NaN
+        post[np.bincount(cells[~isna], minlength=size) == 0] = np.nan
+    return post
+
+
+def pivot_scatter_to_blocks(*,
+        blocks: TypeBlocks,
+        index_fields_iloc: tp.Sequence[int],
+        columns_fields_iloc: tp.Sequence[int],
+        data_fields_iloc: tp.Sequence[int],
+        funcs: tp.Sequence[TUFunc],
+        index_outer: IndexBase,
+        fill_value: tp.Any,
+        fill_value_dtype: TDtypeAny,
+        resolve_all: bool,
+        max_workers: tp.Optional[int] = None,
+        use_threads: bool = False,
+        ) -> tp.Optional[tp.Tuple[TypeBlocks, tp.Sequence[tp.Tuple[TLabel, ...]]]]:
+    '''
+    For a pivot on index and columns fields with only functions in ``PIVOT_SCATTER_FUNCS``, factorize index and columns fields to integer codes, and reduce each data field into a dense array of all cells at once. Cells without records are given ``fill_value``, found by counting records per cell. Returns the blocks and the tuple of columns field values of each group of columns, or None if the pivot is not supported.
+
+    Args:
+        resolve_all: if True, as for a single data field and function, the dtype of all columns is resolved with the dtype of ``fill_value``; otherwise, only columns that need to be filled are resolved.
+        max_workers: if provided, the reduction of each data field and function is done in parallel.
+    '''
+    if not len(blocks):
+        return None
+    try:
+        reductions = [PIVOT_SCATTER_FUNCS[func] for func in funcs]
+    except (KeyError, TypeError): # not supported, or not hashable
+        return None
+
+    dtypes = blocks.dtypes
+    for iloc in data_fields_iloc:
+        if dtypes[iloc].kind not in 'biuf' and any(name != 'count' for name, _ in reductions):
+            return None
+
+    factorized_index = pivot_factorize(blocks, index_fields_iloc)
+    if factorized_index is None:
+        return None
+    factorized_columns = pivot_factorize(blocks, columns_fields_iloc)
+    if factorized_columns is None:
+        return None
+
+    codes_index, labels_index = factorized_index
+    codes_columns, groups = factorized_columns
+
+    # index_outer is ordered as the sorted unique index values, but labels might have been converted by an index constructor; map each code to its row by label
+    if len(index_fields_iloc) == 1:
+        rows = index_outer._loc_to_iloc([label for (label,) in labels_index])
+    else:
+        rows = index_outer._loc_to_iloc(labels_index)
+    rows = np.asarray(rows, dtype=DTYPE_INT_DEFAULT)
+
+    count_rows = len(index_outer)
+    count_groups = len(groups)
+    size = count_rows * count_groups
+    cells = rows[codes_index] * count_groups + codes_columns
+
+    # cells without any records need to be filled
+    fill = (np.bincount(cells, minlength=size) == 0).reshape(count_rows, count_groups)
+    fill_groups = fill.any(axis=0)
+
+    # each data field and function pair is reduced independently
+    pairs = [(blocks._extract_array_column(iloc), func, name, skipna)
+            for iloc in data_fields_iloc
+            for func, (name, skipna) in zip(funcs, reductions)
+            ]
+    values_all = [values for values, _, _, _ in pairs]
+    names = [name for _, _, name, _ in pairs]
+    skipnas = [skipna for _, _, _, skipna in pairs]
+
+    reduced: tp.List[TNDArrayAny]
+    if max_workers is None or len(pairs) == 1:
+        reduced = list(map(pivot_scatter_reduce,
+                values_all,
+                repeat(cells),
+                repeat(size),
+                names,
+                skipnas,
+                ))
+    else:
+        pool_executor = get_concurrent_executor(
+                use_threads=use_threads,
+                max_workers=max_workers,
+                mp_context=None,
+                )
+        with pool_executor() as executor:
+            reduced = list(executor.map(pivot_scatter_reduce,
+                    values_all,
+                    repeat(cells),
+                    repeat(size),
+                    names,
+                    skipnas,
+                    ))
+
+    arrays = []
+    dtypes_final = []
+    for (values, func, name, _), post in zip(pairs, reduced):
+        dtype = DTYPE_INT_DEFAULT if name == 'count' else ufunc_dtype_to_dtype(func, values.dtype)
+        post = post.astype(dtype, copy=False).reshape(count_rows, count_groups) # type: ignore
+        arrays.append(post)
+        dtype_fill = resolve_dtype(dtype, fill_value_dtype) # type: ignore
+        if resolve_all and name != 'count':
+            dtypes_final.append([dtype_fill] * count_groups)
+        else:
+            dtypes_final.append([dtype_fill if f else dtype for f in fill_groups])
+
+    # columns are ordered by group, then by data field and function
+    width = len(arrays)
+    dtypes_unique = set(chain.from_iterable(dtypes_final))
+    if len(dtypes_unique) == 1:
+        block = np.empty((count_rows, count_groups * width), dtype=dtypes_unique.pop())
+        for i, array in enumerate(arrays):
+            block[:, i::width] = array
+        if fill_groups.any():
+            block[np.repeat(fill, width, axis=1)] = fill_value
+        block.flags.writeable = False
+        return TypeBlocks.from_blocks(block), groups
+
+    columns = []
+    for j in range(count_groups):
+        for i, array in enumerate(arrays):
+            column = array[:, j].astype(dtypes_final[i][j])
+            if fill_groups[j]:
+                column[fill[:, j]] = fill_value
+            column.flags.writeable = False
+            columns.append(column)
+    return TypeBlocks.from_blocks(columns), groups
+
+
 #-------------------------------------------------------------------------------
 
 def pivot_outer_index(
@@ -694,6 +1045,228 @@ def pivot_index_map(*,
             )
 
 
+#-------------------------------------------------------------------------------
+# when the labels of the contract axis are a complete product of groups and targets, each group having every target exactly once, pivot_stack and pivot_unstack are reshapes of blocks, and new indices are formed from the levels and indexers of the source indices
+
+class PivotIndexComplete(tp.NamedTuple):
+    positions: TNDArrayAny # 2D: for each group (row) and target (column), the position on the contract axis
+    group_select: TNDArrayAny
+    target_select: TNDArrayAny
+
+def _pivot_appearance(codes: TNDArrayAny) -> tp.Tuple[TNDArrayAny, TNDArrayAny]:
+    '''Given integer codes, return, for each element, the ordinal of its code in order of first appearance, and the position of the first appearance of each code.
+    '''
+    _, first, inverse = np.unique(codes, return_index=True, return_inverse=True)
+    appearance = np.argsort(first, kind=DEFAULT_STABLE_SORT_KIND)
+    ordinals = np.empty(len(first), dtype=DTYPE_INT_DEFAULT)
+    ordinals[appearance] = PositionsAllocator.get(len(first))
+    return ordinals[inverse.reshape(-1)], first[appearance]
+
+def _pivot_depth_codes(index: IndexBase, select: TNDArrayAny) -> tp.Optional[TNDArrayAny]:
+    '''Return, for each label, a code that is unique for the combination of the labels at the selected depths, or None if codes would overflow.
+    '''
+    if index.depth == 1:
+        return PositionsAllocator.get(len(index)) if select[0] else np.zeros(len(index), dtype=DTYPE_INT_DEFAULT)
+    depths = np.nonzero(select)[0].tolist()
+    if not depths:
+        return np.zeros(len(index), dtype=DTYPE_INT_DEFAULT)
+    if len(depths) == 1:
+        return index.indexer_at_depth(depths[0]) # type: ignore
+    dims = [len(index.index_at_depth(d)) for d in depths] # type: ignore
+    if sum(np.log2(max(d, 1)) for d in dims) >= 62:
+        return None
+    return np.ravel_multi_index(tuple(index.indexer_at_depth(d) for d in depths), dims) # type: ignore
+
+def pivot_index_complete(
+        index: IndexBase,
+        depth_level: TDepthLevel,
+        ) -> tp.Optional[PivotIndexComplete]:
+    '''
+    If the labels of ``index`` are a complete product of groups (the depths that remain) and targets (the depths at ``depth_level``), return the position of each group and target, with groups and targets in the order of first appearance; otherwise, return None.
+    '''
+    if not len(index) or index._recache: # type: ignore
+        return None
+    target_select = np.full(index.depth, False)
+    target_select[depth_level] = True
+    group_select = ~target_select
+
+    codes_group = _pivot_depth_codes(index, group_select)
+    codes_target = _pivot_depth_codes(index, target_select)
+    if codes_group is None or codes_target is None:
+        return None
+
+    ordinals_group, first_group = _pivot_appearance(codes_group)
+    ordinals_target, first_target = _pivot_appearance(codes_target)
+    count_group = len(first_group)
+    count_target = len(first_target)
+    if count_group * count_target != len(index):
+        return None
+
+    positions = np.full(len(index), -1, dtype=DTYPE_INT_DEFAULT)
+    positions[ordinals_group * count_target + ordinals_target] = PositionsAllocator.get(len(index))
+    if (positions < 0).any(): # a group has a target more than once
+        return None
+    return PivotIndexComplete(
+            positions=positions.reshape(count_group, count_target),
+            group_select=group_select,
+            target_select=target_select,
+            )
+
+def _pivot_levels(
+        index: IndexBase,
+        select: TNDArrayAny,
+        ) -> tp.Tuple[tp.List[Index[tp.Any]], tp.List[TNDArrayAny]]:
+    '''Return the indices and indexers of the selected depths; an index of depth one is its own level, with positions as indexers.
+    '''
+    if index.depth == 1:
+        if not select[0]:
+            return [], []
+        level: Index[tp.Any] = index if index.name is None else index.rename(None) # type: ignore
+        return [level], [PositionsAllocator.get(len(index))]
+    levels = []
+    indexers = []
+    for d in np.nonzero(select)[0]:
+        level = index.index_at_depth(d) # type: ignore
+        levels.append(level if level.name is None else level.rename(None))
+        indexers.append(index.indexer_at_depth(d)) # type: ignore
+    return levels, indexers
+
+def _pivot_hierarchy(
+        cls: tp.Type[IndexHierarchy],
+        levels: tp.List[Index[tp.Any]],
+        indexers: tp.List[TNDArrayAny],
+        ) -> IndexBase:
+    '''Form an index from levels and indexers, where all labels of each level are used. A single level is selected from its indexer.
+    '''
+    if len(levels) == 1:
+        return levels[0]._extract_iloc(indexers[0]) # type: ignore
+    array = np.array(indexers, dtype=DTYPE_INT_DEFAULT)
+    array.flags.writeable = False
+    return cls(levels, indexers=array) # type: ignore
+
+def pivot_stack_complete(
+        frame: TFrameAny,
+        depth_level: TDepthLevel,
+        ) -> tp.Optional[TFrameAny]:
+    '''
+    Implementation of Frame.pivot_stack() for columns that are a complete product of groups and targets: each new column is a group's columns, read row-major, such that values are copied once, and the new index is formed from the indexers of the index and columns.
+    '''
+    columns_src = frame.columns
+    complete = pivot_index_complete(columns_src, depth_level)
+    if complete is None:
+        return None
+    positions = complete.positions
+    count_group, count_target = positions.shape
+    count_row = len(frame.index)
+
+    values_src = frame._blocks
+    if values_src.unified:
+        values = values_src._blocks[0]
+        if values.ndim == 1:
+            values = values.reshape(-1, 1)
+        # order columns by group, then target; rows become (row, target) pairs
+        values = values[:, positions.reshape(-1)] if (positions.reshape(-1) != PositionsAllocator.get(positions.size)).any() else values
+        block = np.ascontiguousarray(values.reshape(count_row, count_group, count_target).transpose(0, 2, 1))
+        block = block.reshape(count_row * count_target, count_group)
+        block.flags.writeable = False
+        blocks = TypeBlocks.from_blocks(block)
+    else:
+        def gen() -> tp.Iterator[TNDArrayAny]:
+            for columns in positions:
+                array = values_src._extract_array(column_key=columns).reshape(-1)
+                array.flags.writeable = False
+                yield array
+        blocks = TypeBlocks.from_blocks(gen())
+
+    levels_row, indexers_row = _pivot_levels(frame.index, np.full(frame.index.depth, True))
+    levels_target, indexers_target = _pivot_levels(columns_src, complete.target_select)
+    first_target = positions[0]
+    index = _pivot_hierarchy(IndexHierarchy,
+            levels_row + levels_target,
+            [np.repeat(i, count_target) for i in indexers_row]
+            + [np.tile(i[first_target], count_row) for i in indexers_target],
+            )
+
+    columns: tp.Optional[IndexBase] = None
+    if complete.group_select.any():
+        levels_group, indexers_group = _pivot_levels(columns_src, complete.group_select)
+        first_group = positions[:, 0]
+        columns = _pivot_hierarchy(frame._COLUMNS_HIERARCHY_CONSTRUCTOR,
+                levels_group,
+                [i[first_group] for i in indexers_group],
+                )
+    return frame.__class__(blocks,
+            index=index,
+            columns=columns,
+            name=frame.name,
+            own_data=True,
+            )
+
+def pivot_unstack_complete(
+        frame: TFrameAny,
+        depth_level: TDepthLevel,
+        ) -> tp.Optional[TFrameAny]:
+    '''
+    Implementation of Frame.pivot_unstack() for an index that is a complete product of groups and targets: each column becomes a 2D block of groups by targets, a reshaped view of the column when rows are ordered by group then target, or by target then group, and the new columns are formed from the indexers of the columns and index.
+    '''
+    index_src = frame.index
+    if not frame._blocks.shape[1]:
+        return None
+    complete = pivot_index_complete(index_src, depth_level)
+    if complete is None:
+        return None
+    positions = complete.positions
+    count_group, count_target = positions.shape
+    count = positions.size
+    count_column = len(frame.columns)
+
+    ordered = PositionsAllocator.get(count)
+    if (positions.reshape(-1) == ordered).all():
+        layout = 0 # rows ordered by group, then target
+    elif (positions.T.reshape(-1) == ordered).all():
+        layout = 1 # rows ordered by target, then group
+    else:
+        layout = 2
+
+    def gen() -> tp.Iterator[TNDArrayAny]:
+        for block in frame._blocks._blocks:
+            if layout == 2:
+                block = block[positions.reshape(-1)]
+            for column in (block.T if block.ndim == 2 else (block,)):
+                if layout == 1:
+                    array = column.reshape(count_target, count_group).T
+                else:
+                    array = column.reshape(count_group, count_target)
+                array.flags.writeable = False
+                yield array
+
+    blocks = TypeBlocks.from_blocks(gen())
+
+    levels_column, indexers_column = _pivot_levels(frame.columns, np.full(frame.columns.depth, True))
+    levels_target, indexers_target = _pivot_levels(index_src, complete.target_select)
+    first_target = positions[0]
+    columns = _pivot_hierarchy(frame._COLUMNS_HIERARCHY_CONSTRUCTOR,
+            levels_column + levels_target,
+            [np.repeat(i, count_target) for i in indexers_column]
+            + [np.tile(i[first_target], count_column) for i in indexers_target],
+            )
+
+    index: tp.Optional[IndexBase] = None
+    if complete.group_select.any():
+        levels_group, indexers_group = _pivot_levels(index_src, complete.group_select)
+        first_group = positions[:, 0]
+        index = _pivot_hierarchy(IndexHierarchy,
+                levels_group,
+                [i[first_group] for i in indexers_group],
+                )
+    return frame.__class__(blocks,
+            index=index,
+            columns=columns,
+            name=frame.name,
+            own_data=True,
+            )
+
+
 #-------------------------------------------------------------------------------
 class PivotDeriveConstructors(tp.NamedTuple):
     contract_dst: tp.Optional[tp.Iterable[TLabel]]
@@ -855,7 +855,7 @@ class Quilt(ContainerBase, StoreClientMixin):
 
     #---------------------------------------------------------------------------
     def _axis_window_items(self, *,
-            size: int,
+            size: tp.Union[int, np.timedelta64],
             axis: int = 0,
             step: int = 1,
             window_sized: bool = True,
@@ -865,7 +865,7 @@ class Quilt(ContainerBase, StoreClientMixin):
             label_missing_skips: bool = True,
             label_missing_raises: bool = False,
             start_shift: int = 0,
-            size_increment: int = 0,
+            size_increment: tp.Union[int, np.timedelta64] = 0,
             as_array: bool = False,
             ) -> tp.Iterator[tp.Tuple[TLabel, tp.Any]]:
         '''Generator of index, processed-window pairs.
@@ -889,7 +889,7 @@ class Quilt(ContainerBase, StoreClientMixin):
                 )
 
     def _axis_window(self, *,
-            size: int,
+            size: tp.Union[int, np.timedelta64],
             axis: int = 0,
             step: int = 1,
             window_sized: bool = True,
@@ -899,7 +899,7 @@ class Quilt(ContainerBase, StoreClientMixin):
             label_missing_skips: bool = True,
             label_missing_raises: bool = False,
             start_shift: int = 0,
-            size_increment: int = 0,
+            size_increment: tp.Union[int, np.timedelta64] = 0,
             as_array: bool = False,
             ) -> tp.Iterator[TFrameAny]:
         yield from (x for _, x in axis_window_items(
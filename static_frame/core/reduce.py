@@ -0,0 +1,920 @@
+'''
+Vectorized reductions of groups and windows, where each reduction is applied to all groups or windows of each block at once.
+'''
+from __future__ import annotations
+
+from functools import partial
+from itertools import chain
+
+import numpy as np
+import typing_extensions as tp
+
+from static_frame.core.container_util import axis_window_positions
+from static_frame.core.exception import AxisInvalid
+from static_frame.core.index_base import IndexBase
+from static_frame.core.type_blocks import TypeBlocks
+from static_frame.core.util import DTYPE_FLOAT_DEFAULT
+from static_frame.core.util import DTYPE_INEXACT_KINDS
+from static_frame.core.util import DTYPE_INT_DEFAULT
+from static_frame.core.util import DTYPE_INT_KINDS
+from static_frame.core.util import DTYPE_NAT_KINDS
+from static_frame.core.util import DTYPE_UINT_DEFAULT
+from static_frame.core.util import INT_TYPES
+from static_frame.core.util import TCallableAny
+from static_frame.core.util import TLabel
+from static_frame.core.util import TUFunc
+from static_frame.core.util import array_ufunc_axis_skipna
+from static_frame.core.util import isna_array
+from static_frame.core.util import iterable_to_array_1d
+
+if tp.TYPE_CHECKING:
+    from static_frame.core.generic_aliases import TFrameAny  # pylint: disable=W0611 #pragma: no cover
+    from static_frame.core.generic_aliases import TSeriesAny  # pylint: disable=W0611 #pragma: no cover
+    TNDArrayAny = np.ndarray[tp.Any, tp.Any] # pylint: disable=W0611 #pragma: no cover
+    TDtypeAny = np.dtype[tp.Any] # pylint: disable=W0611 #pragma: no cover
+    # a function that, given a block, the start of each group (or window), the size of each group (or window), and skipna, returns a reduced block, or None if the block's dtype is not supported
+    TReduceBlock = tp.Callable[
+            [TNDArrayAny, TNDArrayAny, TNDArrayAny, bool],
+            tp.Optional[TNDArrayAny],
+            ] # pylint: disable=W0611 #pragma: no cover
+
+#-------------------------------------------------------------------------------
+
+def _sizes_broadcast(values: TNDArrayAny, sizes: TNDArrayAny) -> TNDArrayAny:
+    '''Return group sizes in a shape that broadcasts against the reduction of ``values``.
+    '''
+    return sizes if values.ndim == 1 else sizes[:, np.newaxis]
+
+
+def reduce_sum(
+        values: TNDArrayAny,
+        starts: TNDArrayAny,
+        sizes: TNDArrayAny,
+        skipna: bool,
+        ) -> tp.Optional[TNDArrayAny]:
+    kind = values.dtype.kind
+    if kind in DTYPE_INEXACT_KINDS:
+        if skipna:
+            isna = np.isnan(values)
+            if isna.any():
+                values = np.where(isna, 0, values)
+        return np.add.reduceat(values, starts, axis=0)
+    if kind == 'b' or kind == 'i':
+        return np.add.reduceat(values, starts, axis=0, dtype=DTYPE_INT_DEFAULT)
+    if kind == 'u':
+        return np.add.reduceat(values, starts, axis=0, dtype=DTYPE_UINT_DEFAULT)
+    if kind == 'm': # NaT propagates, as with np.sum
+        return np.add.reduceat(values, starts, axis=0)
+    return None
+
+
+def reduce_mean(
+        values: TNDArrayAny,
+        starts: TNDArrayAny,
+        sizes: TNDArrayAny,
+        skipna: bool,
+        ) -> tp.Optional[TNDArrayAny]:
+    kind = values.dtype.kind
+    if kind in DTYPE_INEXACT_KINDS:
+        counts = _sizes_broadcast(values, sizes)
+        if skipna:
+            isna = np.isnan(values)
+            if isna.any():
+                counts = np.add.reduceat(~isna, starts, axis=0, dtype=DTYPE_INT_DEFAULT)
+                values = np.where(isna, 0, values)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            post = np.add.reduceat(values, starts, axis=0) / counts
+        return post.astype(values.dtype, copy=False)
+    if kind == 'b' or kind in DTYPE_INT_KINDS:
+        post = np.add.reduceat(values, starts, axis=0, dtype=DTYPE_FLOAT_DEFAULT)
+        return post / _sizes_broadcast(values, sizes)
+    return None
+
+
+def _reduce_extreme(
+        values: TNDArrayAny,
+        starts: TNDArrayAny,
+        skipna: bool,
+        ufunc: TUFunc,
+        fill: float,
+        ) -> tp.Optional[TNDArrayAny]:
+    kind = values.dtype.kind
+    if kind == 'f':
+        if skipna:
+            isna = np.isnan(values)
+            if isna.any():
+                post = ufunc.reduceat(np.where(isna, fill, values), starts, axis=0)
+                # groups without any valid values are NaN, as with np.nanmin
+                post[~np.logical_or.reduceat(~isna, starts, axis=0)] = np.nan
+                return post # type: ignore
+        return ufunc.reduceat(values, starts, axis=0) # type: ignore
+    if kind == 'b' or kind in DTYPE_INT_KINDS or kind in DTYPE_NAT_KINDS:
+        # NaT propagates, as with np.min
+        return ufunc.reduceat(values, starts, axis=0) # type: ignore
+    return None
+
+
+def reduce_min(
+        values: TNDArrayAny,
+        starts: TNDArrayAny,
+        sizes: TNDArrayAny,
+        skipna: bool,
+        ) -> tp.Optional[TNDArrayAny]:
+    return _reduce_extreme(values, starts, skipna, np.minimum, np.inf)
+
+
+def reduce_max(
+        values: TNDArrayAny,
+        starts: TNDArrayAny,
+        sizes: TNDArrayAny,
+        skipna: bool,
+        ) -> tp.Optional[TNDArrayAny]:
+    return _reduce_extreme(values, starts, skipna, np.maximum, -np.inf)
+
+
+def reduce_var(
+        values: TNDArrayAny,
+        starts: TNDArrayAny,
+        sizes: TNDArrayAny,
+        skipna: bool,
+        ddof: int = 0,
+        ) -> tp.Optional[TNDArrayAny]:
+    kind = values.dtype.kind
+    if kind == 'b' or kind in DTYPE_INT_KINDS:
+        values = values.astype(DTYPE_FLOAT_DEFAULT)
+    elif kind != 'f':
+        return None
+
+    counts = _sizes_broadcast(values, sizes)
+    isna = None
+    if skipna:
+        isna = np.isnan(values)
+        if isna.any():
+            counts = np.add.reduceat(~isna, starts, axis=0, dtype=DTYPE_INT_DEFAULT)
+        else:
+            isna = None
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.add.reduceat(values if isna is None else np.where(isna, 0, values),
+                starts,
+                axis=0,
+                ) / counts
+        # deviations from the mean of each group, in the order of values
+        deviation = values - np.repeat(mean, sizes, axis=0)
+        if isna is not None:
+            deviation[isna] = 0
+        post = np.add.reduceat(deviation * deviation, starts, axis=0) / (counts - ddof)
+
+    # as with np.var, groups with too few values are NaN
+    post[np.broadcast_to(counts - ddof <= 0, post.shape)] = np.nan
+    return post.astype(values.dtype, copy=False)
+
+
+def reduce_std(
+        values: TNDArrayAny,
+        starts: TNDArrayAny,
+        sizes: TNDArrayAny,
+        skipna: bool,
+        ddof: int = 0,
+        ) -> tp.Optional[TNDArrayAny]:
+    post = reduce_var(values, starts, sizes, skipna, ddof)
+    if post is None:
+        return None
+    return np.sqrt(post, out=post)
+
+
+def reduce_count(
+        values: TNDArrayAny,
+        starts: TNDArrayAny,
+        sizes: TNDArrayAny,
+        skipna: bool,
+        ) -> tp.Optional[TNDArrayAny]:
+    if not skipna:
+        return np.broadcast_to(_sizes_broadcast(values, sizes),
+                (len(sizes),) + values.shape[1:],
+                ).astype(DTYPE_INT_DEFAULT)
+    return np.add.reduceat(~isna_array(values), starts, axis=0, dtype=DTYPE_INT_DEFAULT)
+
+
+def reduce_fallback(
+        values: TNDArrayAny,
+        starts: TNDArrayAny,
+        sizes: TNDArrayAny,
+        *,
+        skipna: bool,
+        ufunc: TUFunc,
+        ufunc_skipna: TUFunc,
+        ) -> tp.Iterator[TNDArrayAny]:
+    '''
+    Reduce each group of each column with the same functions used by ``Frame`` reductions; used for dtypes that cannot be reduced in a single vectorized operation. Yields one array per column.
+    '''
+    columns = (values,) if values.ndim == 1 else (values[:, i] for i in range(values.shape[1]))
+    for column in columns:
+        array, _ = iterable_to_array_1d(
+                (array_ufunc_axis_skipna(column[start: start + size],
+                        skipna=skipna,
+                        axis=0,
+                        ufunc=ufunc,
+                        ufunc_skipna=ufunc_skipna,
+                        ) for start, size in zip(starts, sizes)),
+                count=len(starts),
+                )
+        yield array
+
+# map of reduction name to a block reduction function and the ufuncs used for fallback reductions
+REDUCE_FUNCTIONS: tp.Dict[str, tp.Tuple[TReduceBlock, tp.Optional[TUFunc], tp.Optional[TUFunc]]] = {
+        'sum': (reduce_sum, np.sum, np.nansum),
+        'mean': (reduce_mean, np.mean, np.nanmean),
+        'min': (reduce_min, np.min, np.nanmin),
+        'max': (reduce_max, np.max, np.nanmax),
+        'var': (reduce_var, np.var, np.nanvar),
+        'std': (reduce_std, np.std, np.nanstd),
+        'count': (reduce_count, None, None),
+        }
+
+# reductions that accept a ``ddof`` argument
+REDUCE_DDOF = frozenset(('var', 'std'))
+
+#-------------------------------------------------------------------------------
+# window reductions: windows, given as starts and sizes, can overlap, and are reduced with differences of cumulative sums or, for extremes, with extremes of power-of-two spans; windows that share a start, as do expanding windows, are reduced with running sums and extremes
+
+def _window_start_shared(starts: TNDArrayAny) -> tp.Optional[int]:
+    '''If all windows start at the same position, as do expanding windows, return that position; otherwise, return None.
+    '''
+    if len(starts) and starts[0] == starts[-1] and (starts == starts[0]).all():
+        return int(starts[0])
+    return None
+
+
+def _window_take(running: TNDArrayAny, positions: TNDArrayAny) -> TNDArrayAny:
+    '''Select ``positions`` of a running sum or extreme; as expanding windows grow by one element, consecutive positions are selected with a slice rather than a copy.
+    '''
+    if (len(positions) > 1
+            and positions[-1] - positions[0] == len(positions) - 1
+            and (positions[1:] - positions[:-1] == 1).all()):
+        return running[positions[0]: positions[-1] + 1]
+    return running[positions]
+
+
+def _window_cumulative(
+        values: TNDArrayAny,
+        starts: TNDArrayAny,
+        sizes: TNDArrayAny,
+        dtype: tp.Optional[TDtypeAny] = None,
+        ) -> TNDArrayAny:
+    '''Sum each window as the difference of two values of a cumulative sum. If all windows share a start, each window is a single value of a cumulative sum from that start.
+    '''
+    start = _window_start_shared(starts)
+    if start is not None:
+        size_max = int(sizes.max())
+        cumulative = np.empty((size_max + 1,) + values.shape[1:],
+                dtype=values.dtype if dtype is None else dtype,
+                )
+        cumulative[0] = 0
+        np.cumsum(values[start: start + size_max], axis=0, dtype=dtype, out=cumulative[1:])
+        return _window_take(cumulative, sizes)
+
+    cumulative = np.zeros((len(values) + 1,) + values.shape[1:],
+            dtype=values.dtype if dtype is None else dtype,
+            )
+    np.cumsum(values, axis=0, dtype=dtype, out=cumulative[1:])
+    # NOTE: for integers, wrap-around of the cumulative sum is undone by the difference
+    return cumulative[starts + sizes] - cumulative[starts] # type: ignore
+
+
+def _window_sum_float(
+        values: TNDArrayAny,
+        starts: TNDArrayAny,
+        sizes: TNDArrayAny,
+        skipna: bool,
+        ) -> tp.Tuple[TNDArrayAny, TNDArrayAny]:
+    '''Return the sum and count of float values of each window. As an infinity or NaN in a cumulative sum would propagate to all subsequent windows, only finite values are accumulated; non-finite values are counted per window and applied afterwards.
+    '''
+    finite = np.isfinite(values)
+    if finite.all():
+        return (_window_cumulative(values, starts, sizes, DTYPE_FLOAT_DEFAULT),
+                _sizes_broadcast(values, sizes))
+
+    post = _window_cumulative(np.where(finite, values, 0), starts, sizes, DTYPE_FLOAT_DEFAULT)
+    isna = np.isnan(values)
+    counts = _window_cumulative(~isna, starts, sizes, DTYPE_INT_DEFAULT)
+
+    has_pos = _window_cumulative(values == np.inf, starts, sizes, DTYPE_INT_DEFAULT) > 0
+    has_neg = _window_cumulative(values == -np.inf, starts, sizes, DTYPE_INT_DEFAULT) > 0
+    post[has_pos] = np.inf
+    post[has_neg] = -np.inf
+    post[has_pos & has_neg] = np.nan
+
+    if not skipna:
+        post[counts != _sizes_broadcast(values, sizes)] = np.nan
+        return post, _sizes_broadcast(values, sizes)
+    return post, counts
+
+
+def window_sum(
+        values: TNDArrayAny,
+        starts: TNDArrayAny,
+        sizes: TNDArrayAny,
+        skipna: bool,
+        ) -> tp.Optional[TNDArrayAny]:
+    kind = values.dtype.kind
+    if kind == 'f':
+        post, _ = _window_sum_float(values, starts, sizes, skipna)
+        return post.astype(values.dtype, copy=False)
+    if kind == 'b' or kind == 'i':
+        return _window_cumulative(values, starts, sizes, DTYPE_INT_DEFAULT)
+    if kind == 'u':
+        return _window_cumulative(values, starts, sizes, DTYPE_UINT_DEFAULT)
+    return None
+
+
+def window_mean(
+        values: TNDArrayAny,
+        starts: TNDArrayAny,
+        sizes: TNDArrayAny,
+        skipna: bool,
+        ) -> tp.Optional[TNDArrayAny]:
+    kind = values.dtype.kind
+    if kind == 'f':
+        post, counts = _window_sum_float(values, starts, sizes, skipna)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            post = post / counts
+        return post.astype(values.dtype, copy=False)
+    if kind == 'b' or kind in DTYPE_INT_KINDS:
+        post = _window_cumulative(values, starts, sizes,
+                DTYPE_UINT_DEFAULT if kind == 'u' else DTYPE_INT_DEFAULT,
+                )
+        return post / _sizes_broadcast(values, sizes)
+    return None
+
+
+def window_var(
+        values: TNDArrayAny,
+        starts: TNDArrayAny,
+        sizes: TNDArrayAny,
+        skipna: bool,
+        ddof: int = 0,
+        ) -> tp.Optional[TNDArrayAny]:
+    kind = values.dtype.kind
+    if kind == 'b' or kind in DTYPE_INT_KINDS:
+        values = values.astype(DTYPE_FLOAT_DEFAULT)
+    elif kind != 'f':
+        return None
+
+    finite = np.isfinite(values)
+    all_finite = finite.all()
+    counts = _sizes_broadcast(values, sizes)
+    if all_finite:
+        shift = values.mean(axis=0)
+        shifted = values - shift
+    else:
+        isna = np.isnan(values)
+        if skipna:
+            counts = _window_cumulative(~isna, starts, sizes, DTYPE_INT_DEFAULT)
+        count_finite = finite.sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            shift = np.where(finite, values, 0).sum(axis=0) / count_finite
+        shift = np.where(count_finite > 0, shift, 0)
+        shifted = np.where(finite, values - shift, 0)
+
+    # shifting by the mean of each column reduces the loss of precision of subtracting sums of squares
+    sums = _window_cumulative(shifted, starts, sizes)
+    squares = _window_cumulative(shifted * shifted, starts, sizes)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        post = (squares - sums * sums / counts) / (counts - ddof)
+    np.maximum(post, 0, out=post)
+
+    # as rounding errors of the cumulative sums are not relative to the window, set windows of a single repeated value to exactly zero
+    changed = np.zeros(values.shape, dtype=bool)
+    if all_finite:
+        np.not_equal(values[1:], values[:-1], out=changed[1:])
+        post[_window_cumulative(changed, starts + 1, sizes - 1, DTYPE_INT_DEFAULT) == 0] = 0
+    else:
+        # compare each value to the previous non-NaN value
+        positions = np.arange(len(values)).reshape((-1,) + (1,) * (values.ndim - 1))
+        previous = np.where(isna, 0, positions)
+        np.maximum.accumulate(previous, axis=0, out=previous)
+        repeated = np.take_along_axis(values, previous, axis=0)
+        np.not_equal(repeated[1:], repeated[:-1], out=changed[1:])
+        changed[1:] &= ~np.isnan(repeated[:-1])
+        # only count changes after the first non-NaN value of each window, as the change at that value is from a value before the window
+        following = np.full((len(values) + 1,) + values.shape[1:], len(values), dtype=DTYPE_INT_DEFAULT)
+        following[:-1] = np.where(isna, len(values), positions)
+        following = np.minimum.accumulate(following[::-1], axis=0)[::-1]
+        ends = starts + sizes
+        if values.ndim == 2:
+            ends = np.broadcast_to(ends[:, np.newaxis], (len(ends), values.shape[1]))
+        firsts = np.minimum(following[starts] + 1, ends)
+        cumulative = np.zeros((len(values) + 1,) + values.shape[1:], dtype=DTYPE_INT_DEFAULT)
+        np.cumsum(changed, axis=0, dtype=DTYPE_INT_DEFAULT, out=cumulative[1:])
+        if values.ndim == 1:
+            count_changed = cumulative[ends] - cumulative[firsts]
+        else:
+            count_changed = (np.take_along_axis(cumulative, ends, axis=0)
+                    - np.take_along_axis(cumulative, firsts, axis=0))
+        post[count_changed == 0] = 0
+    # a single value has no variance
+    post[np.broadcast_to(counts == 1, post.shape)] = 0
+
+    # as with np.var, windows with too few values are NaN
+    post[np.broadcast_to(counts - ddof <= 0, post.shape)] = np.nan
+    if not all_finite:
+        # infinities, and NaN when not skipped, make the window NaN
+        invalid = ~finite if not skipna else np.isinf(values)
+        post[_window_cumulative(invalid, starts, sizes, DTYPE_INT_DEFAULT) > 0] = np.nan
+    return post.astype(values.dtype, copy=False)
+
+
+def window_std(
+        values: TNDArrayAny,
+        starts: TNDArrayAny,
+        sizes: TNDArrayAny,
+        skipna: bool,
+        ddof: int = 0,
+        ) -> tp.Optional[TNDArrayAny]:
+    post = window_var(values, starts, sizes, skipna, ddof)
+    if post is None:
+        return None
+    return np.sqrt(post, out=post)
+
+
+def _window_extreme(
+        values: TNDArrayAny,
+        starts: TNDArrayAny,
+        sizes: TNDArrayAny,
+        skipna: bool,
+        ufunc: TUFunc,
+        fill: float,
+        ) -> tp.Optional[TNDArrayAny]:
+    '''Reduce each window with ``ufunc``. Extremes of spans of 1, 2, 4, ... elements are derived from the previous span; each window is then the extreme of two, possibly overlapping, spans of the largest power of two not greater than the window size. This requires O(n log(size)) operations, rather than O(n * size). If all windows share a start, each window is a single value of a running extreme from that start, requiring O(n) operations.
+    '''
+    kind = values.dtype.kind
+    if not (kind == 'f'
+            or kind == 'b'
+            or kind in DTYPE_INT_KINDS
+            or kind in DTYPE_NAT_KINDS):
+        return None
+
+    isna = None
+    if kind == 'f' and skipna:
+        isna = np.isnan(values)
+        if isna.any():
+            values = np.where(isna, fill, values)
+        else:
+            isna = None
+
+    post = np.empty((len(starts),) + values.shape[1:], dtype=values.dtype)
+    if not len(starts):
+        return post
+
+    start = _window_start_shared(starts)
+    if start is not None:
+        running = ufunc.accumulate(values[start: start + sizes.max()], axis=0)
+        post[:] = _window_take(running, sizes - 1)
+    else:
+        # for each window, the exponent of the largest power of two not greater than its size
+        exponents = np.frexp(sizes)[1] - 1
+        spans = values
+        span = 1
+        for exponent in range(exponents.max() + 1):
+            if exponent:
+                spans = ufunc(spans[:-span], spans[span:])
+                span *= 2
+            selected = exponents == exponent
+            if selected.any():
+                starts_selected = starts[selected]
+                post[selected] = ufunc(spans[starts_selected],
+                        spans[starts_selected + sizes[selected] - span],
+                        )
+
+    if isna is not None:
+        # windows without any valid values are NaN, as with np.nanmin
+        post[_window_cumulative(~isna, starts, sizes, DTYPE_INT_DEFAULT) == 0] = np.nan
+    return post
+
+
+def window_min(
+        values: TNDArrayAny,
+        starts: TNDArrayAny,
+        sizes: TNDArrayAny,
+        skipna: bool,
+        ) -> tp.Optional[TNDArrayAny]:
+    return _window_extreme(values, starts, sizes, skipna, np.minimum, np.inf)
+
+
+def window_max(
+        values: TNDArrayAny,
+        starts: TNDArrayAny,
+        sizes: TNDArrayAny,
+        skipna: bool,
+        ) -> tp.Optional[TNDArrayAny]:
+    return _window_extreme(values, starts, sizes, skipna, np.maximum, -np.inf)
+
+
+def window_count(
+        values: TNDArrayAny,
+        starts: TNDArrayAny,
+        sizes: TNDArrayAny,
+        skipna: bool,
+        ) -> tp.Optional[TNDArrayAny]:
+    if not skipna:
+        return np.broadcast_to(_sizes_broadcast(values, sizes),
+                (len(sizes),) + values.shape[1:],
+                ).astype(DTYPE_INT_DEFAULT)
+    return _window_cumulative(~isna_array(values), starts, sizes, DTYPE_INT_DEFAULT)
+
+# as REDUCE_FUNCTIONS, but for possibly overlapping windows
+WINDOW_FUNCTIONS: tp.Dict[str, tp.Tuple[TReduceBlock, tp.Optional[TUFunc], tp.Optional[TUFunc]]] = {
+        'sum': (window_sum, np.sum, np.nansum),
+        'mean': (window_mean, np.mean, np.nanmean),
+        'min': (window_min, np.min, np.nanmin),
+        'max': (window_max, np.max, np.nanmax),
+        'var': (window_var, np.var, np.nanvar),
+        'std': (window_std, np.std, np.nanstd),
+        'count': (window_count, None, None),
+        }
+
+#-------------------------------------------------------------------------------
+
+class ReduceGroup:
+    '''
+    Reductions of all groups of a :obj:`Frame`, returning a :obj:`Frame` with a row per group (or, for axis 1 groups, a column per group). Rows are sorted and group boundaries found once; each reduction is then applied to all groups of a block at once with ``np.ufunc.reduceat``. If ``broadcast`` is provided, the reduction of each group is instead taken into every row of that group, returning a :obj:`Frame` aligned to the grouped :obj:`Frame`.
+    '''
+    __slots__ = (
+            '_blocks',
+            '_starts',
+            '_sizes',
+            '_index',
+            '_columns',
+            '_constructor',
+            '_transpose',
+            '_broadcast',
+            )
+
+    _FUNCTIONS = REDUCE_FUNCTIONS
+
+    def __init__(self, *,
+            blocks: TypeBlocks,
+            starts: TNDArrayAny,
+            index: IndexBase,
+            columns: IndexBase,
+            constructor: tp.Type[TFrameAny],
+            transpose: bool = False,
+            broadcast: tp.Optional[TNDArrayAny] = None,
+            ) -> None:
+        '''
+        Args:
+            blocks: values to be reduced, with rows ordered by group.
+            starts: the position of the first row of each group.
+            index: the labels of the groups or, if ``broadcast`` is provided, the labels of the rows of the grouped container.
+            columns: the labels of the columns of ``blocks``.
+            constructor: the class of the returned container.
+            transpose: if True, transpose the returned container, as is necessary for axis 1 groups.
+            broadcast: optionally, the group position of each row of the grouped container, used to take group reductions into rows.
+        '''
+        self._blocks = blocks
+        self._starts = starts
+        self._sizes = np.diff(np.append(starts, blocks.shape[0]))
+        self._index = index
+        self._columns = columns
+        self._constructor = constructor
+        self._transpose = transpose
+        self._broadcast = broadcast
+
+    def _reduce_block(self,
+            values: TNDArrayAny,
+            name: str,
+            skipna: bool,
+            **kwargs: tp.Any,
+            ) -> tp.Iterator[TNDArrayAny]:
+        '''
+        Reduce all groups of a block with the function given by ``name``, yielding one or more immutable arrays that, together, have a column per column of ``values``.
+
+        Args:
+            kwargs: additional arguments, such as ``ddof``, given to the reduction function.
+        '''
+        func, ufunc, ufunc_skipna = self._FUNCTIONS[name]
+        if kwargs:
+            func = partial(func, **kwargs)
+            ufunc = partial(ufunc, **kwargs) # type: ignore
+            ufunc_skipna = partial(ufunc_skipna, **kwargs) # type: ignore
+
+        arrays: tp.Iterable[TNDArrayAny]
+        post = func(values, self._starts, self._sizes, skipna)
+        if post is not None:
+            arrays = (post,)
+        elif ufunc is None or ufunc_skipna is None:
+            raise NotImplementedError(f'no reduction for {values.dtype}') #pragma: no cover
+        else:
+            arrays = reduce_fallback(values,
+                    self._starts,
+                    self._sizes,
+                    skipna=skipna,
+                    ufunc=ufunc,
+                    ufunc_skipna=ufunc_skipna,
+                    )
+        for array in arrays:
+            if self._broadcast is not None:
+                # a single take of group reductions into rows
+                array = array[self._broadcast]
+            array.flags.writeable = False
+            yield array
+
+    def _to_container(self,
+            blocks: TypeBlocks,
+            columns: IndexBase,
+            *,
+            own_columns: bool = False,
+            ) -> TFrameAny:
+        post = self._constructor(blocks,
+                index=self._index,
+                columns=columns,
+                own_data=True,
+                own_columns=own_columns,
+                )
+        if self._transpose:
+            return post.T
+        return post
+
+    def _reduce(self, name: str, *, skipna: bool, **kwargs: tp.Any) -> TFrameAny:
+        blocks = TypeBlocks.from_blocks(chain.from_iterable(
+                self._reduce_block(block, name, skipna, **kwargs)
+                for block in self._blocks._blocks
+                ))
+        return self._to_container(blocks, self._columns)
+
+    #---------------------------------------------------------------------------
+    def sum(self, *, skipna: bool = True) -> TFrameAny:
+        '''Sum values of each group.
+
+        Args:
+            skipna: If True, NA values are ignored.
+        '''
+        return self._reduce('sum', skipna=skipna)
+
+    def mean(self, *, skipna: bool = True) -> TFrameAny:
+        '''Return the mean of values of each group.
+
+        Args:
+            skipna: If True, NA values are ignored.
+        '''
+        return self._reduce('mean', skipna=skipna)
+
+    def min(self, *, skipna: bool = True) -> TFrameAny:
+        '''Return the minimum of values of each group.
+
+        Args:
+            skipna: If True, NA values are ignored.
+        '''
+        return self._reduce('min', skipna=skipna)
+
+    def max(self, *, skipna: bool = True) -> TFrameAny:
+        '''Return the maximum of values of each group.
+
+        Args:
+            skipna: If True, NA values are ignored.
+        '''
+        return self._reduce('max', skipna=skipna)
+
+    def var(self, *, skipna: bool = True, ddof: int = 0) -> TFrameAny:
+        '''Return the variance of values of each group.
+
+        Args:
+            skipna: If True, NA values are ignored.
+            ddof: Delta degrees of freedom.
+        '''
+        return self._reduce('var', skipna=skipna, ddof=ddof)
+
+    def std(self, *, skipna: bool = True, ddof: int = 0) -> TFrameAny:
+        '''Return the standard deviation of values of each group.
+
+        Args:
+            skipna: If True, NA values are ignored.
+            ddof: Delta degrees of freedom.
+        '''
+        return self._reduce('std', skipna=skipna, ddof=ddof)
+
+    def count(self, *, skipna: bool = True) -> TFrameAny:
+        '''Return the count of values of each group.
+
+        Args:
+            skipna: If True, only non-NA values are counted.
+        '''
+        return self._reduce('count', skipna=skipna)
+
+    #---------------------------------------------------------------------------
+    def aggregate(self,
+            spec: tp.Mapping[TLabel, tp.Union[str, tp.Iterable[str]]],
+            *,
+            skipna: bool = True,
+            ddof: int = 0,
+            ) -> TFrameAny:
+        '''Apply one or more reductions to each of one or more columns, returning a :obj:`Frame` with hierarchical columns of column label and reduction name.
+
+        Args:
+            spec: a mapping of column label to the name, or an iterable of names, of reductions; names are ``sum``, ``mean``, ``min``, ``max``, ``var``, ``std``, and ``count``.
+            skipna: If True, NA values are ignored.
+            ddof: Delta degrees of freedom, used by ``var`` and ``std``.
+        '''
+        labels: tp.List[tp.Tuple[TLabel, str]] = []
+        # for each block, the columns of that block needed by each reduction
+        block_to_name_columns: tp.Dict[int, tp.Dict[str, tp.List[int]]] = {}
+        targets: tp.List[tp.Tuple[int, int, str]] = []
+
+        for label, names in spec.items():
+            iloc = self._columns._loc_to_iloc(label)
+            if not isinstance(iloc, INT_TYPES):
+                raise RuntimeError(f'label {label!r} must select a single column.')
+            block_idx, column = self._blocks._index[iloc]
+            for name in ((names,) if isinstance(names, str) else names):
+                if name not in self._FUNCTIONS:
+                    raise RuntimeError(f'unsupported reduction {name!r}; must be one of {", ".join(self._FUNCTIONS)}.')
+                labels.append((label, name))
+                targets.append((block_idx, column, name))
+                name_columns = block_to_name_columns.setdefault(block_idx, {})
+                columns = name_columns.setdefault(name, [])
+                if column not in columns:
+                    columns.append(column)
+
+        def kwargs_for(name: str) -> tp.Dict[str, tp.Any]:
+            return {'ddof': ddof} if name in REDUCE_DDOF else {}
+
+        # for each block, gather all needed columns once, then apply each reduction to the needed columns
+        results: tp.Dict[tp.Tuple[int, int, str], TNDArrayAny] = {}
+        for block_idx, name_columns in block_to_name_columns.items():
+            block = self._blocks._blocks[block_idx]
+            if block.ndim == 1:
+                for name in name_columns:
+                    results[(block_idx, 0, name)] = next(self._reduce_block(
+                            block, name, skipna, **kwargs_for(name)))
+                continue
+
+            gather_columns = sorted(set(chain.from_iterable(name_columns.values())))
+            gather_positions = {c: i for i, c in enumerate(gather_columns)}
+            gathered = block[:, gather_columns]
+
+            for name, columns in name_columns.items():
+                if len(columns) == len(gather_columns):
+                    values = gathered
+                    columns = gather_columns
+                else:
+                    values = gathered[:, [gather_positions[c] for c in columns]]
+                column_iter = iter(columns)
+                for post in self._reduce_block(values, name, skipna, **kwargs_for(name)):
+                    if post.ndim == 1:
+                        results[(block_idx, next(column_iter), name)] = post
+                    else:
+                        for i in range(post.shape[1]):
+                            results[(block_idx, next(column_iter), name)] = post[:, i]
+
+        blocks = TypeBlocks.from_blocks(results[target] for target in targets)
+        columns = self._constructor._COLUMNS_HIERARCHY_CONSTRUCTOR.from_labels(labels)
+        return self._to_container(blocks, columns, own_columns=True)
+
+
+class ReduceWindow(ReduceGroup):
+    '''
+    Reductions of all windows of a :obj:`Series` or :obj:`Frame`, returning a container with a value (or row) per window, labelled as windows are labelled by ``iter_window_items``. Windows are found once; each reduction is then applied to all windows of a block at once, with differences of cumulative sums or, for extremes, with extremes of power-of-two spans.
+    '''
+    __slots__ = (
+            '_name',
+            )
+
+    _FUNCTIONS = WINDOW_FUNCTIONS
+
+    def __init__(self, *,
+            blocks: TypeBlocks,
+            starts: TNDArrayAny,
+            sizes: TNDArrayAny,
+            index: IndexBase,
+            columns: tp.Optional[IndexBase],
+            constructor: tp.Type[tp.Union[TFrameAny, TSeriesAny]],
+            transpose: bool = False,
+            name: TLabel = None,
+            ) -> None:
+        '''
+        Args:
+            blocks: values to be reduced, with windows along rows.
+            starts: the position of the first row of each window.
+            sizes: the count of rows of each window.
+            index: the labels of the windows.
+            columns: the labels of the columns of ``blocks``, or None if reducing a :obj:`Series`.
+            constructor: the class of the returned container.
+            transpose: if True, transpose the returned container, as is necessary for axis 1 windows.
+            name: the name of the returned container.
+        '''
+        self._blocks = blocks
+        self._starts = starts
+        self._sizes = sizes
+        self._index = index
+        self._columns = columns # type: ignore
+        self._constructor = constructor # type: ignore
+        self._transpose = transpose
+        self._broadcast = None
+        self._name = name
+
+    @classmethod
+    def from_container(cls,
+            container: tp.Union[TFrameAny, TSeriesAny],
+            *,
+            size: tp.Union[int, np.timedelta64],
+            axis: int = 0,
+            step: int = 1,
+            window_sized: bool = True,
+            window_func: tp.Optional[TCallableAny] = None,
+            window_valid: tp.Optional[TCallableAny] = None,
+            label_shift: int = 0,
+            label_missing_skips: bool = True,
+            label_missing_raises: bool = False,
+            start_shift: int = 0,
+            size_increment: tp.Union[int, np.timedelta64] = 0,
+            ) -> ReduceWindow:
+        '''
+        Given the arguments of ``iter_window``, return a :obj:`ReduceWindow` of the windows of ``container``.
+        '''
+        if window_func is not None or window_valid is not None:
+            raise RuntimeError('window_func and window_valid are not supported by window reductions; use apply.')
+
+        columns: tp.Optional[IndexBase]
+        if container.ndim == 1:
+            labels = container.index
+            blocks = TypeBlocks.from_blocks(container.values)
+            columns = None
+        elif axis == 0:
+            labels = container.index
+            blocks = container._blocks # type: ignore
+            columns = container.columns # type: ignore
+        elif axis == 1:
+            labels = container.columns # type: ignore
+            blocks = container._blocks.transpose() # type: ignore
+            columns = container.index
+        else:
+            raise AxisInvalid(f'invalid axis: {axis}')
+
+        starts, sizes, positions = axis_window_positions(
+                labels=labels,
+                size=size,
+                step=step,
+                window_sized=window_sized,
+                label_shift=label_shift,
+                label_missing_skips=label_missing_skips,
+                label_missing_raises=label_missing_raises,
+                start_shift=start_shift,
+                size_increment=size_increment,
+                )
+        if (positions < 0).any():
+            index = labels.from_labels(
+                    [None if p < 0 else labels._extract_iloc_by_int(p) for p in positions],
+                    name=labels.name,
+                    )
+        else:
+            index = labels._extract_iloc(positions)
+
+        return cls(blocks=blocks,
+                starts=starts,
+                sizes=sizes,
+                index=index,
+                columns=columns,
+                constructor=container.__class__,
+                transpose=axis == 1,
+                name=container.name,
+                )
+
+    def _to_container(self, # type: ignore
+            blocks: TypeBlocks,
+            columns: tp.Optional[IndexBase],
+            *,
+            own_columns: bool = False,
+            ) -> tp.Union[TFrameAny, TSeriesAny]:
+        if columns is None:
+            return self._constructor(blocks._blocks[0], # type: ignore
+                    index=self._index,
+                    name=self._name,
+                    )
+        post = self._constructor(blocks,
+                index=self._index,
+                columns=columns,
+                own_data=True,
+                own_columns=own_columns,
+                name=self._name,
+                )
+        if self._transpose:
+            return post.T
+        return post
+
+    def aggregate(self, # type: ignore
+            spec: tp.Mapping[TLabel, tp.Union[str, tp.Iterable[str]]],
+            *,
+            skipna: bool = True,
+            ddof: int = 0,
+            ) -> TFrameAny:
+        '''Apply one or more reductions to each of one or more columns, returning a :obj:`Frame` with hierarchical columns of column label and reduction name. Only available for windows of a :obj:`Frame`.
+
+        Args:
+            spec: a mapping of column label to the name, or an iterable of names, of reductions.
+            skipna: If True, NA values are ignored.
+            ddof: Delta degrees of freedom, used by ``var`` and ``std``.
+        '''
+        if self._columns is None:
+            raise RuntimeError('aggregate requires windows of a Frame.')
+        return ReduceGroup.aggregate(self, spec, skipna=skipna, ddof=ddof)
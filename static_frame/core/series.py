@@ -40,6 +40,7 @@ from static_frame.core.display_config import DisplayConfig
 from static_frame.core.display_config import DisplayFormats
 from static_frame.core.doc_str import doc_inject
 from static_frame.core.doc_str import doc_update
+from static_frame.core.ewm import EWM
 from static_frame.core.exception import AxisInvalid
 from static_frame.core.exception import ErrorInitSeries
 from static_frame.core.exception import RelabelInvalid
@@ -60,7 +61,8 @@ from static_frame.core.node_iter import IterNodeGroup
 from static_frame.core.node_iter import IterNodeGroupOther
 from static_frame.core.node_iter import IterNodeNoArgMapable
 from static_frame.core.node_iter import IterNodeType
-from static_frame.core.node_iter import IterNodeWindow
+from static_frame.core.node_iter import IterNodeWindowReducible
+from static_frame.core.node_lazy import InterfaceLazy
 from static_frame.core.node_re import InterfaceRe
 from static_frame.core.node_selector import InterfaceAssignTrio
 from static_frame.core.node_selector import InterfaceSelectTrio
@@ -70,6 +72,7 @@ from static_frame.core.node_str import InterfaceString
 from static_frame.core.node_values import InterfaceValues
 from static_frame.core.rank import RankMethod
 from static_frame.core.rank import rank_1d
+from static_frame.core.reduce import ReduceWindow
 from static_frame.core.style_config import STYLE_CONFIG_DEFAULT
 from static_frame.core.style_config import StyleConfig
 from static_frame.core.style_config import style_config_css_factory
@@ -811,6 +814,13 @@ class Series(ContainerOperand, tp.Generic[TVIndex, TVDtype]):
                 blocks_to_container=blocks_to_container,
                 )
 
+    @property
+    def via_lazy(self) -> InterfaceLazy[TSeriesAny]:
+        '''
+        Interface for deferring the evaluation of binary and unary operators, such that chained operators are evaluated together in chunks of rows.
+        '''
+        return InterfaceLazy(self)
+
     def via_fill_value(self,
             fill_value: object = np.nan,
             ) -> InterfaceFillValue[TSeriesAny]:
@@ -1035,50 +1045,54 @@ class Series(ContainerOperand, tp.Generic[TVIndex, TVDtype]):
 
     #---------------------------------------------------------------------------
     @property
-    def iter_window(self) -> IterNodeWindow[TSeriesAny]:
+    def iter_window(self) -> IterNodeWindowReducible[TSeriesAny]:
         function_values = partial(self._axis_window, as_array=False)
         function_items = partial(self._axis_window_items, as_array=False)
-        return IterNodeWindow(
+        return IterNodeWindowReducible(
                 container=self,
                 function_values=function_values,
                 function_items=function_items,
+                function_reduce=self._axis_window_reduce,
                 yield_type=IterNodeType.VALUES,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
                 )
 
     @property
-    def iter_window_items(self) -> IterNodeWindow[TSeriesAny]:
+    def iter_window_items(self) -> IterNodeWindowReducible[TSeriesAny]:
         function_values = partial(self._axis_window, as_array=False)
         function_items = partial(self._axis_window_items, as_array=False)
-        return IterNodeWindow(
+        return IterNodeWindowReducible(
                 container=self,
                 function_values=function_values,
                 function_items=function_items,
+                function_reduce=self._axis_window_reduce,
                 yield_type=IterNodeType.ITEMS,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
                 )
 
 
     @property
-    def iter_window_array(self) -> IterNodeWindow[TSeriesAny]:
+    def iter_window_array(self) -> IterNodeWindowReducible[TSeriesAny]:
         function_values = partial(self._axis_window, as_array=True)
         function_items = partial(self._axis_window_items, as_array=True)
-        return IterNodeWindow(
+        return IterNodeWindowReducible(
                 container=self,
                 function_values=function_values,
                 function_items=function_items,
+                function_reduce=self._axis_window_reduce,
                 yield_type=IterNodeType.VALUES,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
                 )
 
     @property
-    def iter_window_array_items(self) -> IterNodeWindow[TSeriesAny]:
+    def iter_window_array_items(self) -> IterNodeWindowReducible[TSeriesAny]:
         function_values = partial(self._axis_window, as_array=True)
         function_items = partial(self._axis_window_items, as_array=True)
-        return IterNodeWindow(
+        return IterNodeWindowReducible(
                 container=self,
                 function_values=function_values,
                 function_items=function_items,
+                function_reduce=self._axis_window_reduce,
                 yield_type=IterNodeType.ITEMS,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
                 )
@@ -1713,6 +1727,9 @@ class Series(ContainerOperand, tp.Generic[TVIndex, TVDtype]):
                 raise NotImplementedError('Operator application to greater dimensionalities will result in an array with more than 1 dimension.')
         elif other.__class__ is InterfaceFillValue:
             raise RuntimeError('via_fill_value interfaces can only be used on the left-hand side of binary expressions.')
+        elif other.__class__ is InterfaceLazy:
+            # defer to the reverse operator of the lazy expression
+            return NotImplemented
         else:
             name = self._name
 
@@ -2101,7 +2118,7 @@ class Series(ContainerOperand, tp.Generic[TVIndex, TVDtype]):
 
 
     def _axis_window_items(self, *,
-            size: int,
+            size: tp.Union[int, np.timedelta64],
             axis: int = 0,
             step: int = 1,
             window_sized: bool = True,
@@ -2111,7 +2128,7 @@ class Series(ContainerOperand, tp.Generic[TVIndex, TVDtype]):
             label_missing_skips: bool = True,
             label_missing_raises: bool = False,
             start_shift: int = 0,
-            size_increment: int = 0,
+            size_increment: tp.Union[int, np.timedelta64] = 0,
             as_array: bool = False,
             ) -> tp.Iterator[tp.Tuple[TLabel, tp.Union[TNDArrayAny, TSeriesAny]]]:
         '''Generator of index, processed-window pairs.
@@ -2134,7 +2151,7 @@ class Series(ContainerOperand, tp.Generic[TVIndex, TVDtype]):
                 )
 
     def _axis_window(self, *,
-            size: int,
+            size: tp.Union[int, np.timedelta64],
             axis: int = 0,
             step: int = 1,
             window_sized: bool = True,
@@ -2144,7 +2161,7 @@ class Series(ContainerOperand, tp.Generic[TVIndex, TVDtype]):
             label_missing_skips: bool = True,
             label_missing_raises: bool = False,
             start_shift: int = 0,
-            size_increment: int = 0,
+            size_increment: tp.Union[int, np.timedelta64] = 0,
             as_array: bool = False,
             ) -> tp.Iterator[tp.Union[TNDArrayAny, TSeriesAny]]:
         yield from (x for _, x in axis_window_items(
@@ -2164,6 +2181,33 @@ class Series(ContainerOperand, tp.Generic[TVIndex, TVDtype]):
                 derive_label=False,
                 ))
 
+    def _axis_window_reduce(self, *,
+            size: tp.Union[int, np.timedelta64],
+            axis: int = 0,
+            step: int = 1,
+            window_sized: bool = True,
+            window_func: tp.Optional[TCallableAny] = None,
+            window_valid: tp.Optional[TCallableAny] = None,
+            label_shift: int = 0,
+            label_missing_skips: bool = True,
+            label_missing_raises: bool = False,
+            start_shift: int = 0,
+            size_increment: tp.Union[int, np.timedelta64] = 0,
+            ) -> ReduceWindow:
+        return ReduceWindow.from_container(self,
+                size=size,
+                axis=axis,
+                step=step,
+                window_sized=window_sized,
+                window_func=window_func,
+                window_valid=window_valid,
+                label_shift=label_shift,
+                label_missing_skips=label_missing_skips,
+                label_missing_raises=label_missing_raises,
+                start_shift=start_shift,
+                size_increment=size_increment,
+                )
+
     #---------------------------------------------------------------------------
 
     @property
@@ -3068,6 +3112,29 @@ class Series(ContainerOperand, tp.Generic[TVIndex, TVDtype]):
         # by convention, we return just the corner
         return np.corrcoef(self.values, other)[0, -1] #type: ignore [no-any-return]
 
+    def ewm(self,
+            *,
+            span: tp.Optional[float] = None,
+            halflife: tp.Optional[float] = None,
+            alpha: tp.Optional[float] = None,
+            adjust: bool = True,
+            ) -> EWM:
+        '''
+        Return an :obj:`EWM`, providing exponentially weighted moving statistics, such as ``mean()``, ``var()``, and ``std()``, as a :obj:`Series` with the same index. Exactly one of ``span``, ``halflife``, or ``alpha`` must be provided.
+
+        Args:
+            span: the decay in terms of span, where ``alpha`` is 2 / (span + 1).
+            halflife: the decay in terms of half-life, where ``alpha`` is 1 - exp(-ln(2) / halflife).
+            alpha: the smoothing factor, greater than 0 and less than or equal to 1.
+            adjust: if True, weights are normalized by the sum of weights of all observations; if False, statistics are given by the recurrence of weighting each new observation by ``alpha``.
+        '''
+        return EWM(self,
+                span=span,
+                halflife=halflife,
+                alpha=alpha,
+                adjust=adjust,
+                )
+
     #---------------------------------------------------------------------------
 
     @doc_inject(selector='searchsorted', label_type='iloc (integer)')
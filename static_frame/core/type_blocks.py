@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from concurrent.futures import Future
+from contextvars import ContextVar
 from functools import partial
 from itertools import chain
+from itertools import groupby
 from itertools import repeat
 from itertools import zip_longest
+from threading import Lock
 
 import numpy as np
 import typing_extensions as tp
@@ -34,7 +38,10 @@ from static_frame.core.node_selector import InterGetItemLocReduces
 from static_frame.core.style_config import StyleConfig
 from static_frame.core.util import DEFAULT_FAST_SORT_KIND
 from static_frame.core.util import DEFAULT_SORT_KIND
+from static_frame.core.util import DEFAULT_STABLE_SORT_KIND
 from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_INT_DEFAULT
+from static_frame.core.util import DTYPE_NUMERICABLE_KINDS
 from static_frame.core.util import DTYPE_OBJECT
 from static_frame.core.util import EMPTY_ARRAY
 from static_frame.core.util import EMPTY_ARRAY_OBJECT
@@ -59,6 +66,7 @@ from static_frame.core.util import array2d_to_tuples
 from static_frame.core.util import array_shift
 from static_frame.core.util import array_signature
 from static_frame.core.util import array_to_groups_and_locations
+from static_frame.core.util import array_to_groups_and_locations_hashed
 from static_frame.core.util import array_ufunc_axis_skipna
 from static_frame.core.util import arrays_equal
 from static_frame.core.util import binary_transition
@@ -67,6 +75,7 @@ from static_frame.core.util import concat_resolved
 from static_frame.core.util import dtype_from_element
 from static_frame.core.util import dtype_to_fill_value
 from static_frame.core.util import full_for_fill
+from static_frame.core.util import get_concurrent_executor
 from static_frame.core.util import isfalsy_array
 from static_frame.core.util import isin_array
 from static_frame.core.util import isna_array
@@ -102,14 +111,12 @@ def group_match(
         extract: if provided, will be used to select from the group on the opposite axis
 
     Returns:
-        Generator of group, selection pairs, where selection is an np.ndarray. Returned is as an np.ndarray if key is more than one column.
+        Generator of group, selection pairs, where selection is an np.ndarray of integer positions. Returned is as an np.ndarray if key is more than one column.
     '''
     # NOTE: in axis_values we determine zero size by looking for empty _blocks; not sure if that is appropriate here.
     if blocks._index.shape[0] == 0 or blocks._index.shape[1] == 0: # zero sized
         return
 
-    unique_axis = None
-
     if group_source is not None:
         pass
     elif axis == 0:
@@ -122,18 +129,24 @@ def group_match(
         raise AxisInvalid(f'invalid axis: {axis}')
 
     groups: tp.Iterable[tp.Any]
-    groups, locations = array_to_groups_and_locations(
-            group_source,
-            axis,
-            )
-
-    if group_source.ndim > 1:
-        # NOTE: this is expensive!
-        # make the groups hashable for usage in index construction
-        if axis == 0:
-            groups = array2d_to_tuples(groups)
-        else:
-            groups = array2d_to_tuples(groups.T)
+    if group_source.dtype == DTYPE_OBJECT:
+        # hashing finds groups of unsortable values in one pass; 2D groups are returned as tuples
+        groups, locations = array_to_groups_and_locations_hashed(
+                group_source,
+                axis,
+                )
+    else:
+        groups, locations = array_to_groups_and_locations(
+                group_source,
+                axis,
+                )
+        if group_source.ndim > 1:
+            # NOTE: this is expensive!
+            # make the groups hashable for usage in index construction
+            if axis == 0:
+                groups = array2d_to_tuples(groups)
+            else:
+                groups = array2d_to_tuples(groups.T)
 
     if drop:
         # axis 0 means we return row groups; key is a column key
@@ -158,12 +171,14 @@ def group_match(
         else:
             row_key = None if not drop else drop_mask
 
-    # NOTE: we create one mutable Boolean array to serve as the selection for each group; as this array is yielded out, the caller must use it before the next iteration, which is assumed to alway be the case.
-    selection = np.empty(len(locations), dtype=DTYPE_BOOL)
+    # a stable sort of group codes provides, for each group, a contiguous range of positions in original order
+    ordering = np.argsort(locations, kind=DEFAULT_STABLE_SORT_KIND)
+    ends = np.cumsum(np.bincount(locations))
 
-    for idx, g in enumerate(groups):
-        # derive a Boolean array of fixed size showing where value in this group are found from the original TypeBlocks
-        np.equal(locations, idx, out=selection)
+    start = 0
+    for g, end in zip(groups, ends):
+        selection = ordering[start: end]
+        start = end
 
         if axis == 0: # return row
             yield g, selection, func(
@@ -176,6 +191,20 @@ def group_match(
                     column_key=selection,
                     )
 
+def group_sorted_transitions(group_source: TNDArrayAny) -> TNDArrayAny:
+    '''
+    Given a sorted group source, where a 2D group source has a group value per row, return the positions at which each group, after the first, begins.
+    '''
+    # find iloc positions where new value is not equal to previous; drop the first as roll wraps
+    if group_source.ndim == 2:
+        if group_source.dtype == DTYPE_OBJECT:
+            # NOTE: cannot get view of object; use string
+            consolidated = view_2d_as_1d(group_source.astype(str))
+        else:
+            consolidated = view_2d_as_1d(group_source)
+        return np.flatnonzero(consolidated != roll_1d(consolidated, 1))[1:]
+    return np.flatnonzero(group_source != roll_1d(group_source, 1))[1:]
+
 def group_sorted(
         blocks: TypeBlocks,
         *,
@@ -244,18 +273,8 @@ def group_sorted(
         else:
             row_key = None if not drop else drop_mask
 
-    # find iloc positions where new value is not equal to previous; drop the first as roll wraps
-    if group_source.ndim == 2:
-        group_to_tuple = True
-        if group_source.dtype == DTYPE_OBJECT:
-            # NOTE: cannot get view of object; use string
-            consolidated = view_2d_as_1d(group_source.astype(str))
-        else:
-            consolidated = view_2d_as_1d(group_source)
-        transitions = np.flatnonzero(consolidated != roll_1d(consolidated, 1))[1:]
-    else:
-        group_to_tuple = False
-        transitions = np.flatnonzero(group_source != roll_1d(group_source, 1))[1:]
+    group_to_tuple = group_source.ndim == 2
+    transitions = group_sorted_transitions(group_source)
 
     start = 0
     for t in transitions:
@@ -420,6 +439,235 @@ def assign_inner_from_iloc_by_sequence(
     return value, assigned_target
 
 
+#-------------------------------------------------------------------------------
+
+class BlocksFragmentation(tp.NamedTuple):
+    '''Characteristics of the partitioning of the columns of a :obj:`TypeBlocks` into blocks.
+    '''
+    columns: int # count of columns
+    blocks: int # count of blocks
+    blocks_1d: int # count of 1D blocks
+    runs: int # count of runs of adjacent blocks of the same dtype, or the count of blocks after consolidation
+    excess: int # count of blocks removed by consolidation
+
+
+class ConsolidationPolicy:
+    '''
+    Thresholds at which the blocks of a :obj:`FrameGO` are automatically consolidated after adding columns, with counters of when consolidation was evaluated and performed. The active policy is ``TypeBlocks.CONSOLIDATION_POLICY``; by default, blocks are never automatically consolidated.
+
+    Args:
+        blocks_min: The count of blocks at which consolidation is evaluated; if None, blocks are never automatically consolidated.
+        excess_ratio: The minimum ratio of blocks removed by consolidation to all blocks.
+        columns_min: Blocks of at least this many columns are not consolidated, such that repeated consolidation does not copy previously consolidated columns.
+    '''
+    __slots__ = (
+            'blocks_min',
+            'excess_ratio',
+            'columns_min',
+            'count_evaluated',
+            'count_consolidated',
+            'count_blocks_removed',
+            '_lock',
+            )
+
+    def __init__(self, *,
+            blocks_min: tp.Optional[int] = None,
+            excess_ratio: float = 0.5,
+            columns_min: int = 256,
+            ) -> None:
+        if blocks_min is not None and blocks_min < 2:
+            raise RuntimeError('blocks_min must be greater than 1.')
+        if not 0 < excess_ratio <= 1:
+            raise RuntimeError('excess_ratio must be greater than 0 and less than or equal to 1.')
+        if columns_min < 2:
+            raise RuntimeError('columns_min must be greater than 1.')
+        self.blocks_min = blocks_min
+        self.excess_ratio = excess_ratio
+        self.columns_min = columns_min
+        self._lock = Lock()
+        self.reset()
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}: blocks_min {self.blocks_min}, excess_ratio {self.excess_ratio}, columns_min {self.columns_min}, evaluated {self.count_evaluated}, consolidated {self.count_consolidated}, blocks removed {self.count_blocks_removed}>'
+
+    def reset(self) -> None:
+        '''Set all counters to zero.
+        '''
+        with self._lock:
+            self.count_evaluated = 0
+            self.count_consolidated = 0
+            self.count_blocks_removed = 0
+
+    def _iter_blocks(self, blocks: tp.Sequence[TNDArrayAny]) -> tp.Iterator[TNDArrayAny]:
+        # consolidate runs of blocks narrower than columns_min
+        group: tp.List[TNDArrayAny] = []
+        for block in blocks:
+            if block.ndim == 2 and block.shape[1] >= self.columns_min:
+                yield from TypeBlocks.consolidate_blocks(group)
+                group = []
+                yield block
+            else:
+                group.append(block)
+        yield from TypeBlocks.consolidate_blocks(group)
+
+    def apply(self, blocks: TypeBlocks) -> TypeBlocks:
+        '''
+        Return ``blocks``, or, if thresholds are crossed, a new :obj:`TypeBlocks` with adjacent blocks of the same dtype consolidated.
+        '''
+        if self.blocks_min is None or len(blocks._blocks) < self.blocks_min:
+            return blocks
+        fragmentation = blocks.fragmentation
+        if fragmentation.excess < fragmentation.blocks * self.excess_ratio:
+            with self._lock:
+                self.count_evaluated += 1
+            return blocks
+        post = TypeBlocks.from_blocks(self._iter_blocks(blocks._blocks))
+        with self._lock:
+            self.count_evaluated += 1
+            self.count_consolidated += 1
+            self.count_blocks_removed += fragmentation.blocks - len(post._blocks)
+        return post
+
+
+class ThreadPoolPolicy:
+    '''
+    Configuration of a thread pool used to process independent blocks, or chunks of one large block, in reductions (``TypeBlocks.ufunc_axis_skipna()``), in ufunc application, and in type conversion. As NumPy releases the GIL for most numeric routines, blocks can be processed concurrently. The process-wide policy is ``TypeBlocks.THREAD_POOL_POLICY``; a policy can be made active for the current thread (or asynchronous task) by using it as a context manager, without changing the policy of other threads. Threads are configured only by the active policy; operations do not take per-call arguments for threads.
+
+    Args:
+        max_workers: The count of threads; if None or 1, blocks are processed sequentially.
+        size_min: The minimum count of elements for which threads are used.
+    '''
+    __slots__ = (
+            'max_workers',
+            'size_min',
+            'count_dispatched',
+            '_lock',
+            )
+
+    def __init__(self, *,
+            max_workers: tp.Optional[int] = None,
+            size_min: int = 1_000_000,
+            ) -> None:
+        if max_workers is not None and max_workers < 1:
+            raise RuntimeError('max_workers must be greater than zero.')
+        self.max_workers = max_workers
+        self.size_min = size_min
+        self.count_dispatched = 0
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}: max_workers {self.max_workers}, size_min {self.size_min}, dispatched {self.count_dispatched}>'
+
+    def __enter__(self) -> ThreadPoolPolicy:
+        _THREAD_POOL_POLICIES.set(_THREAD_POOL_POLICIES.get() + (self,))
+        return self
+
+    def __exit__(self, *args: tp.Any) -> None:
+        _THREAD_POOL_POLICIES.set(_THREAD_POOL_POLICIES.get()[:-1])
+
+    def _dispatch(self) -> None:
+        with self._lock:
+            self.count_dispatched += 1
+
+    def active(self, size: int) -> bool:
+        '''Return True if threads are to be used to process ``size`` elements.
+        '''
+        return self.max_workers is not None and self.max_workers > 1 and size >= self.size_min
+
+    def map(self,
+            func: tp.Callable[..., tp.Any],
+            *iterables: tp.Iterable[tp.Any],
+            ) -> tp.List[tp.Any]:
+        '''Return the results, in order, of calling ``func`` on the items of ``iterables`` with a thread pool.
+        '''
+        self._dispatch()
+        pool_executor = get_concurrent_executor(
+                use_threads=True,
+                max_workers=self.max_workers,
+                mp_context=None,
+                )
+        with pool_executor() as executor:
+            return list(executor.map(func, *iterables))
+
+    def apply_parts(self,
+            parts_factory: tp.Callable[[tp.Callable[[TNDArrayAny], tp.Any]], tp.Iterable[tp.Any]],
+            func: tp.Callable[[TNDArrayAny], TNDArrayAny],
+            *,
+            dtype: tp.Optional[TDtypeAny] = None,
+            ) -> tp.List[TNDArrayAny]:
+        '''
+        Return the arrays produced by ``parts_factory``, a callable that, given a function to apply to selected arrays, returns an iterable of arrays; selected arrays are processed with ``func`` by threads.
+
+        Args:
+            dtype: If provided, ``func`` is a conversion to ``dtype``; large numeric arrays are then converted by chunks of rows into a pre-allocated array.
+        '''
+        self._dispatch()
+        pool_executor = get_concurrent_executor(
+                use_threads=True,
+                max_workers=self.max_workers,
+                mp_context=None,
+                )
+        with pool_executor() as executor:
+            pending: tp.List[Future[tp.Any]] = []
+
+            def submit(array: TNDArrayAny) -> tp.Any:
+                if (dtype is not None
+                        and array.size >= self.size_min
+                        and len(array) > 1
+                        and array.dtype.kind in DTYPE_NUMERICABLE_KINDS
+                        and dtype.kind in DTYPE_NUMERICABLE_KINDS
+                        ):
+                    post = np.empty(array.shape, dtype=dtype)
+                    for s in self.bounds(len(array)):
+                        pending.append(executor.submit(np.copyto, post[s], array[s], casting='unsafe'))
+                    return post
+                return executor.submit(func, array)
+
+            parts = list(parts_factory(submit))
+            for f in pending:
+                f.result()
+            return [p.result() if isinstance(p, Future) else p for p in parts]
+
+    def bounds(self, count: int) -> tp.List[slice]:
+        '''Return contiguous slices partitioning ``count`` into at most ``max_workers`` chunks.
+        '''
+        chunks = max(min(self.max_workers or 1, count), 1)
+        bounds = np.linspace(0, count, chunks + 1).astype(DTYPE_INT_DEFAULT)
+        return [slice(start, end) for start, end in zip(bounds[:-1], bounds[1:])]
+
+    def reduce(self,
+            func: tp.Callable[..., TNDArrayAny],
+            array: TNDArrayAny,
+            axis: int,
+            ) -> TNDArrayAny:
+        '''Apply a reducing ``func`` to a 2D ``array`` along ``axis`` by partitioning the other axis into chunks processed by threads. Chunks are only formed if they are contiguous in memory, as reducing strided chunks is slower than reducing the whole array.
+        '''
+        if axis == 0 and array.flags.f_contiguous:
+            chunks = [array[NULL_SLICE, s] for s in self.bounds(array.shape[1])]
+        elif axis == 1 and array.flags.c_contiguous:
+            chunks = [array[s] for s in self.bounds(array.shape[0])]
+        else:
+            chunks = []
+        if len(chunks) <= 1:
+            return func(array=array, axis=axis)
+        return np.concatenate(self.map(partial(func, axis=axis), chunks)) # type: ignore
+
+
+# policies entered as context managers, per thread or asynchronous task; the last is active
+_THREAD_POOL_POLICIES: ContextVar[tp.Tuple[ThreadPoolPolicy, ...]] = ContextVar(
+        '_THREAD_POOL_POLICIES',
+        default=(),
+        )
+
+def thread_pool_policy_active() -> ThreadPoolPolicy:
+    '''Return the policy entered as a context manager in the current context, or ``TypeBlocks.THREAD_POOL_POLICY``.
+    '''
+    policies = _THREAD_POOL_POLICIES.get()
+    if policies:
+        return policies[-1]
+    return TypeBlocks.THREAD_POOL_POLICY
+
+
 #-------------------------------------------------------------------------------
 
 class TypeBlocks(ContainerOperand):
@@ -434,6 +682,8 @@ class TypeBlocks(ContainerOperand):
             )
 
     STATIC = False
+    CONSOLIDATION_POLICY = ConsolidationPolicy()
+    THREAD_POOL_POLICY = ThreadPoolPolicy()
 
     #---------------------------------------------------------------------------
     # constructors
@@ -663,6 +913,27 @@ class TypeBlocks(ContainerOperand):
     def unified(self) -> bool:
         return len(self._blocks) <= 1
 
+    @property
+    def fragmentation(self) -> BlocksFragmentation:
+        '''Return the count of columns, blocks, 1D blocks, runs of adjacent blocks of the same dtype, and blocks removed by consolidation.
+        '''
+        blocks_1d = 0
+        runs = 0
+        dtype_previous = None
+        for b in self._blocks:
+            if b.ndim == 1:
+                blocks_1d += 1
+            if dtype_previous is None or b.dtype != dtype_previous:
+                runs += 1
+                dtype_previous = b.dtype
+        return BlocksFragmentation(
+                columns=self._index.columns,
+                blocks=len(self._blocks),
+                blocks_1d=blocks_1d,
+                runs=runs,
+                excess=len(self._blocks) - runs,
+                )
+
     @property
     def unified_dtypes(self) -> bool:
         '''Return True if all blocks have the same dtype.
@@ -1177,6 +1448,58 @@ class TypeBlocks(ContainerOperand):
                             yield values
                         col_src += 1
 
+    def _take_blocks_fill_by_element(self, *,
+            indexer: TNDArrayAny,
+            fill_value: tp.Any,
+            ) -> tp.Iterator[TNDArrayAny]:
+        '''
+        Given an integer array of row positions, where -1 marks a row to be filled with ``fill_value``, return a generator of blocks of the selected rows. Adjacent blocks of the same dtype are gathered into a single block, such that each is taken once.
+        '''
+        size = len(indexer)
+        fill = indexer < 0
+        fill_count = int(fill.sum())
+        if fill_count:
+            dtype_fill = dtype_from_element(fill_value)
+            # take the first row for fill positions, to be overwritten
+            indexer = np.where(fill, 0, indexer)
+        take = size > fill_count # if False, all rows are filled
+
+        for dtype, group in groupby(self._blocks, key=lambda b: b.dtype):
+            blocks = list(group)
+            if len(blocks) == 1 and not fill_count:
+                values = blocks[0][indexer]
+                values.flags.writeable = False
+                yield values
+                continue
+
+            if fill_count:
+                dtype = resolve_dtype(dtype, dtype_fill)
+            if len(blocks) == 1 and blocks[0].ndim == 1:
+                values = np.empty(size, dtype=dtype)
+                if take:
+                    values[NULL_SLICE] = blocks[0][indexer]
+            else:
+                width = sum(1 if b.ndim == 1 else b.shape[1] for b in blocks)
+                values = np.empty((size, width), dtype=dtype)
+                if take:
+                    start = 0
+                    for b in blocks:
+                        if b.ndim == 1:
+                            values[NULL_SLICE, start] = b[indexer]
+                            start += 1
+                        else:
+                            end = start + b.shape[1]
+                            values[NULL_SLICE, start: end] = b[indexer]
+                            start = end
+            if fill_count:
+                values[fill] = full_for_fill(dtype,
+                        (fill_count,) + values.shape[1:],
+                        fill_value,
+                        resolve_fill_value_dtype=False,
+                        )
+            values.flags.writeable = False
+            yield values
+
     #---------------------------------------------------------------------------
     def sort(self,
             axis: int | np.integer[tp.Any],
@@ -1316,9 +1639,15 @@ class TypeBlocks(ContainerOperand):
                 ufunc_skipna=ufunc_skipna,
                 )
 
+        policy = thread_pool_policy_active()
+        threaded = policy.active(self.size)
+
         result: TNDArrayAny
         if self.unified:
-            result = func(array=column_2d_filter(self._blocks[0]), axis=axis)
+            if threaded:
+                result = policy.reduce(func, column_2d_filter(self._blocks[0]), axis)
+            else:
+                result = func(array=column_2d_filter(self._blocks[0]), axis=axis)
             result.flags.writeable = False
             return result
 
@@ -1337,7 +1666,10 @@ class TypeBlocks(ContainerOperand):
                     shape=self._index.shape,
                     dtype=self._index.dtype,
                     )
-            result = func(array=array, axis=axis)
+            if threaded:
+                result = policy.reduce(func, array, axis)
+            else:
+                result = func(array=array, axis=axis)
             result.flags.writeable = False
             return result
 
@@ -1370,44 +1702,69 @@ class TypeBlocks(ContainerOperand):
                     dtype = self._index.dtype
 
         out = np.empty(shape, dtype=dtype)
-        for idx, b in enumerate(self._blocks):
-            if axis == 0: # Combine rows, end with columns shape.
-                if size_one_unity and b.size == 1 and not skipna:
-                    # No function call is necessary; if skipna could turn NaN to zero.
-                    end = pos + 1
-                    # Can assign an array, even 2D, as an element if size is 1
-                    out[pos] = b
-                elif b.ndim == 1:
-                    end = pos + 1
+
+        def reduce_rows(b: TNDArrayAny, pos: int) -> None:
+            # Combine rows, end with columns shape.
+            if size_one_unity and b.size == 1 and not skipna:
+                # No function call is necessary; if skipna could turn NaN to zero.
+                # Can assign an array, even 2D, as an element if size is 1
+                out[pos] = b
+            elif b.ndim == 1:
+                out[pos] = func(array=b, axis=axis)
+            else:
+                span = b.shape[1]
+                if span == 1: # just one column, reducing to one value
                     out[pos] = func(array=b, axis=axis)
                 else:
-                    span = b.shape[1]
-                    end = pos + span
-                    if span == 1: # just one column, reducing to one value
-                        out[pos] = func(array=b, axis=axis)
-                    else:
-                        func(array=b, axis=axis, out=out[pos: end])
-                pos = end
+                    func(array=b, axis=axis, out=out[pos: pos + span])
+
+        def reduce_columns(b: TNDArrayAny, idx: int, rows: slice) -> None:
+            # Combine columns, end with block length shape and then call func again, for final result
+            if b.size == 1 and size_one_unity and not skipna:
+                out[rows, idx] = b
+            elif b.ndim == 1:
+                # if this is a composable, numeric single columns we just copy it and process it later; but if this is a logical application (and, or) then it is already Boolean
+                if out.dtype == DTYPE_BOOL and b.dtype != DTYPE_BOOL:
+                    # making 2D with axis 0 func will result in element-wise operation
+                    out[rows, idx] = func(array=column_2d_filter(b[rows]), axis=1)
+                else: # otherwise, keep as is
+                    out[rows, idx] = b[rows]
             else:
-                # Combine columns, end with block length shape and then call func again, for final result
-                if b.size == 1 and size_one_unity and not skipna:
-                    out[NULL_SLICE, idx] = b
-                elif b.ndim == 1:
-                    # if this is a composable, numeric single columns we just copy it and process it later; but if this is a logical application (and, or) then it is already Boolean
-                    if out.dtype == DTYPE_BOOL and b.dtype != DTYPE_BOOL:
-                        # making 2D with axis 0 func will result in element-wise operation
-                        out[NULL_SLICE, idx] = func(array=column_2d_filter(b), axis=1)
-                    else: # otherwise, keep as is
-                        out[NULL_SLICE, idx] = b
+                func(array=b[rows], axis=axis, out=out[rows, idx])
+
+        if threaded:
+            # blocks write to disjoint regions of out; large blocks are divided into chunks of columns (axis 0, if contiguous) or rows (axis 1)
+            args: tp.List[tp.Tuple[tp.Any, ...]] = []
+            for idx, b in enumerate(self._blocks):
+                large = b.size >= policy.size_min
+                if axis == 0:
+                    if large and b.ndim == 2 and b.flags.f_contiguous:
+                        args.extend((b[NULL_SLICE, s], pos + s.start) for s in policy.bounds(b.shape[1]))
+                    else:
+                        args.append((b, pos))
+                    pos += 1 if b.ndim == 1 else b.shape[1]
+                elif large:
+                    args.extend((b, idx, s) for s in policy.bounds(len(b)))
+                else:
+                    args.append((b, idx, NULL_SLICE))
+            policy.map(lambda a: (reduce_rows if axis == 0 else reduce_columns)(*a), args)
+        else:
+            for idx, b in enumerate(self._blocks):
+                if axis == 0:
+                    reduce_rows(b, pos)
+                    pos += 1 if b.ndim == 1 else b.shape[1]
                 else:
-                    func(array=b, axis=axis, out=out[NULL_SLICE, idx])
+                    reduce_columns(b, idx, NULL_SLICE)
 
         if axis == 0: # nothing more to do
             out.flags.writeable = False
             return out
 
         # If axis 1 and composable, can call function one more time on remaining components. Note that composability is problematic in cases where overflow is possible
-        result = func(array=out, axis=1)
+        if threaded:
+            result = policy.reduce(func, out, 1)
+        else:
+            result = func(array=out, axis=1)
         result.flags.writeable = False
         return result
 
@@ -1557,7 +1914,28 @@ class TypeBlocks(ContainerOperand):
         Generator-producer of np.ndarray.
         '''
         dtype = validate_dtype_specifier(dtype)
+        policy = thread_pool_policy_active()
+        if policy.active(self.size):
+            yield from policy.apply_parts(
+                    partial(self._astype_blocks_parts, column_key, dtype),
+                    partial(np.ndarray.astype, dtype=dtype),
+                    dtype=dtype,
+                    )
+        else:
+            yield from self._astype_blocks_parts(
+                    column_key,
+                    dtype,
+                    partial(np.ndarray.astype, dtype=dtype),
+                    )
 
+    def _astype_blocks_parts(self,
+            column_key: TILocSelector,
+            dtype: TDtypeAny,
+            convert: tp.Callable[[TNDArrayAny], tp.Any],
+            ) -> tp.Iterator[tp.Any]:
+        '''
+        Generator-producer of np.ndarray, or of the results of ``convert`` applied to the arrays to be converted to ``dtype``.
+        '''
         # block slices must be in ascending order, not key order
         block_slices = iter(self._key_to_block_slices(
                 column_key,
@@ -1590,7 +1968,7 @@ class TypeBlocks(ContainerOperand):
                     continue # there may be more slices for this block
 
                 if b.ndim == 1: # given 1D array, our row key is all we need
-                    parts.append(b.astype(dtype))
+                    parts.append(convert(b))
                     part_start_last = 1
                     target_block_idx = target_slice = None
                     break
@@ -1609,7 +1987,7 @@ class TypeBlocks(ContainerOperand):
                     # yield un changed components before and after
                     parts.append(b[NULL_SLICE, slice(part_start_last, target_start)])
 
-                parts.append(b[NULL_SLICE, target_slice].astype(dtype))
+                parts.append(convert(b[NULL_SLICE, target_slice]))
                 part_start_last = target_stop
 
                 target_block_idx = target_slice = None
@@ -1754,6 +2132,22 @@ class TypeBlocks(ContainerOperand):
 
         Generator producer of np.ndarray.
         '''
+        policy = thread_pool_policy_active()
+        if policy.active(self.size):
+            yield from policy.apply_parts(
+                    partial(self._ufunc_blocks_parts, column_key),
+                    func,
+                    )
+        else:
+            yield from self._ufunc_blocks_parts(column_key, func)
+
+    def _ufunc_blocks_parts(self,
+            column_key: TILocSelector,
+            func: tp.Callable[[TNDArrayAny], tp.Any],
+            ) -> tp.Iterator[tp.Any]:
+        '''
+        Generator producer of np.ndarray, or of the results of ``func`` applied to the arrays to be processed.
+        '''
         # block slices must be in ascending order, not key order
         block_slices = iter(self._key_to_block_slices(
                 column_key,
@@ -1224,6 +1224,51 @@ def argsort_array(array: TNDArrayAny, kind: TSortKinds = DEFAULT_STABLE_SORT_KIN
 
     return array.argsort(kind=kind)
 
+def argpartition_extreme(
+        array: TNDArrayAny,
+        count: int,
+        *,
+        largest: bool,
+        ordered: bool = True,
+        ) -> TNDArrayAny:
+    '''
+    Return the positions of the ``count`` largest (or smallest) values of a 1D array, excluding NA values, found with ``np.argpartition`` rather than a sort. Of values equal to the boundary value, those at lower positions are selected.
+
+    Args:
+        largest: if True, select the largest values; otherwise, the smallest.
+        ordered: if True, positions are ordered from most to least extreme value, with equal values ordered by position; otherwise, positions are ascending.
+    '''
+    positions: tp.Optional[TNDArrayAny] = None
+    if array.dtype.kind in DTYPE_NA_KINDS:
+        isna = isna_array(array)
+        if isna.any():
+            positions = np.flatnonzero(~isna)
+            array = array[positions]
+
+    size = len(array)
+    if count <= 0:
+        selected = np.empty(0, dtype=DTYPE_INT_DEFAULT)
+    elif count >= size:
+        selected = PositionsAllocator.get(size)
+    else:
+        kth = size - count if largest else count - 1
+        threshold = array[np.argpartition(array, kth)[kth]]
+        beyond = np.flatnonzero(array > threshold if largest else array < threshold)
+        equal = np.flatnonzero(array == threshold)[:count - len(beyond)]
+        selected = np.sort(np.concatenate((beyond, equal)))
+
+    if ordered and len(selected) > 1:
+        values = array[selected]
+        if largest:
+            # a stable sort of reversed values, reversed, orders equal values by position
+            selected = selected[::-1][np.argsort(values[::-1], kind=DEFAULT_STABLE_SORT_KIND)[::-1]]
+        else:
+            selected = selected[np.argsort(values, kind=DEFAULT_STABLE_SORT_KIND)]
+
+    if positions is not None:
+        return positions[selected]
+    return selected
+
 def ufunc_unique1d(array: TNDArrayAny) -> TNDArrayAny:
     '''
     Find the unique elements of an array, ignoring shape. Optimized from NumPy implementation based on assumption of 1D array.
@@ -2080,6 +2125,48 @@ def array_to_groups_and_locations(
         return ufunc_unique1d_indexer(array)
     return ufunc_unique2d_indexer(array, axis=unique_axis)
 
+def array_to_groups_and_locations_hashed(
+        array: TNDArrayAny,
+        unique_axis: int = 0,
+        ) -> tp.Tuple[TNDArrayAny, TNDArrayAny]:
+    '''Locations are index positions for each group. Groups are found by hashing each element (or, for 2D arrays, a tuple of each row or column) in a single pass, permitting unsortable and mixed-type values. Groups are sorted if sortable, otherwise ordered by first appearance; for 2D arrays, groups are returned as a 1D object array of tuples.
+
+    Args:
+        unique_axis: only used if ndim > 1
+    '''
+    if array.ndim == 1:
+        labels: tp.Iterable[tp.Any] = array
+    elif unique_axis == 0:
+        labels = array2d_to_tuples(array)
+    else:
+        labels = array2d_to_tuples(array.T)
+
+    codes: tp.Dict[tp.Any, int] = {}
+    count = array.shape[0] if array.ndim == 1 or unique_axis == 0 else array.shape[1]
+    locations = np.fromiter(
+            (codes.setdefault(label, len(codes)) for label in labels),
+            count=count,
+            dtype=DTYPE_INT_DEFAULT,
+            )
+    groups = np.empty(len(codes), dtype=DTYPE_OBJECT)
+    for i, label in enumerate(codes): # dictionaries are ordered by insertion
+        groups[i] = label
+    del codes
+
+    try:
+        order = np.argsort(groups, kind=DEFAULT_STABLE_SORT_KIND)
+    except TypeError:
+        order = None
+    if order is not None:
+        groups = groups[order]
+        remap = np.empty(len(order), dtype=DTYPE_INT_DEFAULT)
+        remap[order] = PositionsAllocator.get(len(order))
+        locations = remap[locations]
+
+    groups.flags.writeable = False
+    locations.flags.writeable = False
+    return groups, locations
+
 # def isna_element(value: tp.Any) -> bool:
 #     '''Return Boolean if value is an NA. This does not yet handle pd.NA
 #     '''
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import os
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from static_frame import Series
+from static_frame.core.categorical import Categorical
+from static_frame.core.categorical import dtype_codes
+from static_frame.core.categorical import factorize
+from static_frame.test.test_case import TestCase
+from static_frame.test.test_case import temp_file
+
+
+class TestUnit(TestCase):
+
+    def test_dtype_codes_a(self) -> None:
+        self.assertEqual(dtype_codes(0), np.dtype(np.uint8))
+        self.assertEqual(dtype_codes(256), np.dtype(np.uint8))
+        self.assertEqual(dtype_codes(257), np.dtype(np.uint16))
+        self.assertEqual(dtype_codes(70_000), np.dtype(np.uint32))
+
+    def test_factorize_a(self) -> None:
+        unique, indexer = factorize(np.array(['c', 'a', 'c', 'b']))
+        self.assertEqual(unique.tolist(), ['a', 'b', 'c'])
+        self.assertEqual(indexer.tolist(), [2, 0, 2, 1])
+
+        # unorderable values retain their order of appearance
+        unique, indexer = factorize(np.array([None, 'x', 3, 'x'], dtype=object))
+        self.assertEqual(unique.tolist(), [None, 'x', 3])
+        self.assertEqual(indexer.tolist(), [0, 1, 2, 1])
+
+    #---------------------------------------------------------------------------
+
+    def test_categorical_from_array_a(self) -> None:
+        a = np.array(['b', 'a', 'c', 'a', 'b', 'b', 'a'])
+        c = Categorical.from_array(a)
+        self.assertEqual(repr(c), '<Categorical: 7 elements, 3 categories, <U1>')
+        self.assertEqual(c.codes.dtype, np.dtype(np.uint8))
+        self.assertEqual(c.codes.tolist(), [1, 0, 2, 0, 1, 1, 0])
+        self.assertEqual(c.categories.tolist(), ['a', 'b', 'c'])
+        self.assertEqual(c.nbytes, 7 + 12)
+        self.assertEqual((c.shape, c.ndim, c.size, len(c)), ((7,), 1, 7, 7))
+        self.assertFalse(c.codes.flags.writeable)
+
+        self.assertEqual(c.values.tolist(), a.tolist())
+        self.assertIs(c.values, c.values)
+        self.assertFalse(c.values.flags.writeable)
+        self.assertEqual(np.asarray(c, dtype=object).dtype, np.dtype(object))
+        self.assertEqual(list(c), a.tolist())
+
+        with self.assertRaises(RuntimeError):
+            Categorical.from_array(a.reshape(7, 1))
+
+    def test_categorical_from_array_b(self) -> None:
+        c1 = Categorical.from_array(np.array([2.0, np.nan, 1.0, np.nan]))
+        self.assertEqual(c1.codes.tolist(), [1, 2, 0, 2])
+        self.assertEqual(len(c1.categories), 3)
+
+        c2 = Categorical.from_array(np.array([None, 'x', 3, 'x'], dtype=object))
+        self.assertEqual(c2.categories.tolist(), [None, 'x', 3])
+        self.assertEqual(c2.argsort().tolist(), [0, 1, 3, 2])
+
+        with self.assertRaises(TypeError):
+            Categorical.from_array(np.array([[1], 'a', [1]], dtype=object))
+
+    def test_categorical_from_codes_a(self) -> None:
+        c = Categorical.from_codes(np.array([0, 1, 1, 0]), np.array(['x', 'y']), ordered=True)
+        self.assertEqual(c.values.tolist(), ['x', 'y', 'y', 'x'])
+        self.assertEqual(c.codes.dtype, np.dtype(np.uint8))
+
+        with self.assertRaises(RuntimeError):
+            Categorical.from_codes(np.array([0, 2]), np.array(['x', 'y']))
+        with self.assertRaises(RuntimeError):
+            Categorical.from_codes(np.array([0.0]), np.array(['x', 'y']))
+        with self.assertRaises(RuntimeError):
+            Categorical.from_codes(np.array([[0]]), np.array(['x', 'y']))
+
+    #---------------------------------------------------------------------------
+
+    def test_categorical_compare_a(self) -> None:
+        a = np.array(['b', 'a', 'c', 'a', 'b'])
+        c = Categorical.from_array(a)
+        self.assertEqual((c == 'a').tolist(), (a == 'a').tolist())
+        self.assertEqual((c != 'a').tolist(), (a != 'a').tolist())
+        self.assertEqual((c < 'b').tolist(), (a < 'b').tolist())
+        self.assertEqual((c <= 'b').tolist(), (a <= 'b').tolist())
+        self.assertEqual((c > 'a').tolist(), (a > 'a').tolist())
+        self.assertEqual((c >= 'c').tolist(), (a >= 'c').tolist())
+        self.assertEqual((c == 'z').tolist(), [False] * 5)
+        self.assertFalse((c == 'a').flags.writeable)
+
+        self.assertEqual((c == a[::-1]).tolist(), (a == a[::-1]).tolist())
+        self.assertEqual((c == c[::-1]).tolist(), (a == a[::-1]).tolist())
+        self.assertEqual((c == Categorical.from_array(a[::-1])).tolist(), (a == a[::-1]).tolist())
+
+    def test_categorical_isin_a(self) -> None:
+        a = np.array(['b', 'a', 'c', 'a', 'b'])
+        c = Categorical.from_array(a)
+        self.assertEqual(c.isin(('a', 'c', 'z')).tolist(), [False, True, True, True, False])
+        self.assertEqual(c.isin(()).tolist(), [False] * 5)
+
+    def test_categorical_equals_a(self) -> None:
+        a = np.array(['b', 'a', 'c'])
+        c = Categorical.from_array(a)
+        self.assertTrue(c.equals(c))
+        self.assertTrue(c.equals(Categorical.from_array(a)))
+        self.assertTrue(c.equals(Categorical.from_codes(np.array([0, 1, 2]), np.array(['b', 'a', 'c']))))
+        self.assertFalse(c.equals(Categorical.from_array(a[::-1])))
+        self.assertFalse(c.equals(Categorical.from_array(a.astype(object))))
+        self.assertFalse(c.equals(a))
+
+    def test_categorical_equals_b(self) -> None:
+        a = np.array([2.0, np.nan, 1.0, np.nan])
+        c = Categorical.from_array(a)
+        self.assertTrue(c.equals(Categorical.from_array(a)))
+        self.assertTrue(c.equals(Categorical.from_codes(np.array([0, 2, 1, 2]), np.array([2.0, 1.0, np.nan]))))
+        self.assertFalse(c.equals(Categorical.from_array(np.array([2.0, np.nan, 1.0, 1.0]))))
+
+        c2 = Categorical.from_array(np.array([None, 'a', None], dtype=object))
+        self.assertTrue(c2.equals(Categorical.from_array(np.array([None, 'a', None], dtype=object))))
+
+    #---------------------------------------------------------------------------
+
+    def test_categorical_getitem_a(self) -> None:
+        c = Categorical.from_array(np.array(['b', 'a', 'c', 'a']))
+        self.assertEqual(c[2], 'c')
+        c2 = c[[3, 0]]
+        self.assertIs(c2.categories, c.categories)
+        self.assertEqual(c2.values.tolist(), ['a', 'b'])
+        self.assertFalse(c2.codes.flags.writeable)
+        self.assertEqual(c[1:].values.tolist(), ['a', 'c', 'a'])
+
+    def test_categorical_sort_a(self) -> None:
+        a = np.array(['b', 'a', 'c', 'a', 'b', 'b', 'a'])
+        c = Categorical.from_array(a)
+        s = Series(a)
+        self.assertEqual(c.argsort().tolist(), s.sort_values().index.values.tolist())
+        self.assertEqual(c.argsort(ascending=False).tolist(),
+                s.sort_values(ascending=False).index.values.tolist())
+        self.assertEqual(c.sort().values.tolist(), sorted(a))
+
+        # unordered categories are sorted by rank
+        c2 = Categorical.from_codes(np.array([0, 1, 2, 0]), np.array(['c', 'a', 'b']))
+        self.assertEqual(c2.sort().values.tolist(), ['a', 'b', 'c', 'c'])
+
+    def test_categorical_group_a(self) -> None:
+        c = Categorical.from_codes(np.array([1, 0, 1, 1]), np.array(['x', 'y', 'z']), ordered=True)
+        self.assertEqual([(k, v.tolist()) for k, v in c.iter_group_positions()],
+                [('x', [1]), ('y', [0, 2, 3])])
+        self.assertEqual(c.unique().tolist(), ['x', 'y'])
+
+    #---------------------------------------------------------------------------
+
+    def test_categorical_to_series_a(self) -> None:
+        c = Categorical.from_array(np.array(['b', 'a']))
+        s = c.to_series(index=('x', 'y'), name='foo')
+        self.assertEqual(s.to_pairs(), (('x', 'b'), ('y', 'a')))
+        self.assertEqual(s.name, 'foo')
+
+    def test_categorical_to_npz_a(self) -> None:
+        for a in (
+                np.array(['b', 'a', 'c', 'a']),
+                np.array(['b', 'a', 'c', 'a'], dtype=object),
+                np.array([3, 1, 3]),
+                np.array([2.0, np.nan, 1.0, np.nan]),
+                ):
+            c1 = Categorical.from_array(a)
+            with temp_file('.npz') as fp:
+                c1.to_npz(fp)
+                c2 = Categorical.from_npz(fp)
+            self.assertTrue(c2.equals(c1))
+            self.assertEqual(c2.dtype, a.dtype)
+            self.assertEqual(c2.codes.dtype, c1.codes.dtype)
+
+        c3 = Categorical.from_array(np.array([None, 'a'], dtype=object))
+        with temp_file('.npz') as fp:
+            with self.assertRaises(RuntimeError):
+                c3.to_npz(fp)
+
+    def test_categorical_to_npy_a(self) -> None:
+        c1 = Categorical.from_array(np.array(['b', 'a', 'c', 'a'], dtype=object))
+        with TemporaryDirectory() as fp:
+            os.rmdir(fp) # let it be re-created
+            c1.to_npy(fp)
+            c2 = Categorical.from_npy(fp)
+        self.assertTrue(c2.equals(c1))
+        self.assertEqual(c2.argsort().tolist(), [1, 3, 0, 2])
+
+    def test_categorical_to_npy_b(self) -> None:
+        c1 = Categorical.from_array(np.array([np.nan, 0.5, np.nan, -1.0]))
+        with TemporaryDirectory() as fp:
+            os.rmdir(fp) # let it be re-created
+            c1.to_npy(fp)
+            c2 = Categorical.from_npy(fp)
+        self.assertTrue(c2.equals(c1))
+        self.assertEqual(np.isnan(c2.values).tolist(), [True, False, True, False])
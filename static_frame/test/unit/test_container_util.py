@@ -17,6 +17,8 @@ from static_frame import Series
 from static_frame.core.container_util import ContainerMap
 from static_frame.core.container_util import apex_to_name
 from static_frame.core.container_util import apply_binary_operator_blocks_columnar
+from static_frame.core.container_util import axis_window_items
+from static_frame.core.container_util import axis_window_positions
 from static_frame.core.container_util import bloc_key_normalize
 from static_frame.core.container_util import container_to_exporter_attr
 from static_frame.core.container_util import get_block_match
@@ -33,6 +35,7 @@ from static_frame.core.container_util import matmul
 from static_frame.core.container_util import pandas_to_numpy
 from static_frame.core.container_util import pandas_version_under_1
 from static_frame.core.exception import AxisInvalid
+from static_frame.core.exception import InvalidWindowLabel
 from static_frame.core.fill_value_auto import FillValueAuto
 from static_frame.core.frame import FrameHE
 from static_frame.core.util import ManyToOneType
@@ -902,6 +905,64 @@ class TestUnit(TestCase):
         post = group_from_container(idx, s, None, 0)
         self.assertEqual(post.tolist(), [[0], [None], [0]])
 
+    #---------------------------------------------------------------------------
+
+    def test_axis_window_positions_a(self) -> None:
+        s = Series(range(10))
+        for kwargs in (
+                dict(size=3),
+                dict(size=3, step=2, window_sized=False),
+                dict(size=2, window_sized=False, start_shift=-1),
+                dict(size=2, window_sized=False, start_shift=-1, label_missing_skips=False),
+                dict(size=4, label_shift=-2, start_shift=3),
+                dict(size=1, size_increment=2, step=3, window_sized=False),
+                ):
+            starts, sizes, positions = axis_window_positions(labels=s.index, **kwargs) # type: ignore
+            windows = [(w[0], len(w)) for _, w in axis_window_items(source=s, as_array=True, **kwargs)] # type: ignore
+            self.assertEqual(list(zip(starts.tolist(), sizes.tolist())), windows)
+
+            labels = [label for label, _ in axis_window_items(source=s, **kwargs)] # type: ignore
+            self.assertEqual([None if p < 0 else p for p in positions], labels)
+
+    def test_axis_window_positions_b(self) -> None:
+        with self.assertRaises(RuntimeError):
+            axis_window_positions(labels=Index(range(10)), size=0)
+        with self.assertRaises(RuntimeError):
+            axis_window_positions(labels=Index(range(10)), size=2, step=-1)
+        with self.assertRaises(InvalidWindowLabel):
+            axis_window_positions(labels=Index(range(10)), size=2, label_shift=1, label_missing_raises=True)
+
+        starts, sizes, positions = axis_window_positions(labels=Index(()), size=2)
+        self.assertEqual((len(starts), len(sizes), len(positions)), (0, 0, 0))
+
+    def test_axis_window_positions_c(self) -> None:
+        labels = IndexSecond(('2024-01-01T00:00:00', '2024-01-01T00:00:30', '2024-01-01T00:01:10', '2024-01-01T00:01:20', '2024-01-01T00:03:00'))
+
+        starts, sizes, positions = axis_window_positions(labels=labels, size=np.timedelta64(1, 'm'), window_sized=False)
+        self.assertEqual(starts.tolist(), [0, 0, 1, 1, 4])
+        self.assertEqual(sizes.tolist(), [1, 2, 2, 3, 1])
+        self.assertEqual(positions.tolist(), [0, 1, 2, 3, 4])
+
+        starts, sizes, positions = axis_window_positions(labels=labels, size=np.timedelta64(60, 's'), step=2)
+        self.assertEqual(starts.tolist(), [1, 4])
+        self.assertEqual(sizes.tolist(), [2, 1])
+        self.assertEqual(positions.tolist(), [2, 4])
+
+        starts, sizes, positions = axis_window_positions(labels=labels, size=np.timedelta64(1, 'm'), label_shift=1, label_missing_skips=False)
+        self.assertEqual(positions.tolist(), [3, 4, -1])
+
+    def test_axis_window_positions_d(self) -> None:
+        with self.assertRaises(RuntimeError):
+            axis_window_positions(labels=Index(range(3)), size=np.timedelta64(1, 'm'))
+        with self.assertRaises(RuntimeError):
+            axis_window_positions(labels=IndexDate(('2024-01-02', '2024-01-01')), size=np.timedelta64(1, 'D'))
+        with self.assertRaises(RuntimeError):
+            axis_window_positions(labels=IndexDate(('2024-01-01', '2024-01-02')), size=np.timedelta64(0, 'D'))
+
+        starts, _, _ = axis_window_positions(labels=IndexDate(()), size=np.timedelta64(1, 'D'))
+        self.assertEqual(len(starts), 0)
+
+
 
     def test_get_containers(self) -> None:
         keys_gc = set(cls.__name__ for cls in TestCase.get_containers())
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import numpy as np
+
+from static_frame import EWM
+from static_frame import Frame
+from static_frame import FrameGO
+from static_frame import Series
+from static_frame.core.ewm import decayed_cumsum
+from static_frame.core.ewm import ewm_alpha
+from static_frame.core.ewm import linear_recurrence
+from static_frame.core.exception import AxisInvalid
+from static_frame.test.test_case import TestCase
+
+nan = np.nan
+
+
+class TestUnit(TestCase):
+
+    def test_ewm_alpha_a(self) -> None:
+        self.assertEqual(ewm_alpha(span=3), 0.5)
+        self.assertEqual(ewm_alpha(halflife=1), 0.5)
+        self.assertEqual(ewm_alpha(alpha=0.25), 0.25)
+
+        with self.assertRaises(RuntimeError):
+            ewm_alpha()
+        with self.assertRaises(RuntimeError):
+            ewm_alpha(span=3, alpha=0.5)
+        with self.assertRaises(RuntimeError):
+            ewm_alpha(span=0.5)
+        with self.assertRaises(RuntimeError):
+            ewm_alpha(halflife=0)
+        with self.assertRaises(RuntimeError):
+            ewm_alpha(alpha=1.5)
+
+    def test_decayed_cumsum_a(self) -> None:
+        values = np.arange(1, 3001, dtype=float).reshape(1000, 3) % 7
+        for decay in (0.0, 0.3, 0.95, 0.9999):
+            expected = np.empty_like(values)
+            total = np.zeros(3)
+            for i, row in enumerate(values):
+                total = decay * total + row
+                expected[i] = total
+            post = decayed_cumsum(values, decay)
+            self.assertTrue(np.allclose(post, expected, rtol=1e-10))
+            self.assertTrue(np.allclose(decayed_cumsum(values[:, 0], decay), expected[:, 0], rtol=1e-10))
+
+        self.assertEqual(decayed_cumsum(np.array(()), 0.5).tolist(), [])
+
+    def test_linear_recurrence_a(self) -> None:
+        factors = np.arange(600, dtype=float).reshape(200, 3) % 5 / 4
+        terms = np.arange(600, dtype=float).reshape(200, 3) % 7
+        expected = np.empty_like(terms)
+        post = np.zeros(3)
+        for i in range(len(terms)):
+            post = (factors[i] * post if i else 0.0) + terms[i]
+            expected[i] = post
+        self.assertTrue(np.allclose(linear_recurrence(factors, terms), expected, rtol=1e-10))
+        self.assertTrue(np.allclose(linear_recurrence(factors[:, 1], terms[:, 1]), expected[:, 1], rtol=1e-10))
+
+        self.assertEqual(linear_recurrence(np.array(()), np.array(())).tolist(), [])
+
+    #---------------------------------------------------------------------------
+
+    def test_ewm_series_a(self) -> None:
+        s = Series((1.0, 2.0, nan, 3.0, 5.0), index=tuple('abcde'), name='x')
+        e = s.ewm(alpha=0.5)
+        self.assertIs(e.__class__, EWM)
+        self.assertEqual(repr(e), '<EWM: alpha 0.5, adjust True, axis 0>')
+
+        post1 = e.mean()
+        self.assertEqual(post1.name, 'x')
+        self.assertEqual(round(post1, 6).to_pairs(),
+                (('a', 1.0), ('b', 1.666667), ('c', 1.666667), ('d', 2.636364), ('e', 4.037037)))
+
+        post2 = e.var()
+        self.assertEqual(round(post2, 6).fillna(-1).to_pairs(),
+                (('a', -1.0), ('b', 0.5), ('c', 0.5), ('d', 0.961538), ('e', 2.737624)))
+
+        post3 = e.std(bias=True)
+        self.assertEqual(round(post3, 6).to_pairs(),
+                (('a', 0.0), ('b', 0.471405), ('c', 0.471405), ('d', 0.642824), ('e', 1.231725)))
+
+        post4 = e.mean(skipna=False)
+        self.assertEqual(round(post4, 6).fillna(-1).to_pairs(),
+                (('a', 1.0), ('b', 1.666667), ('c', -1.0), ('d', -1.0), ('e', -1.0)))
+
+    def test_ewm_series_b(self) -> None:
+        s = Series((1, 2, 3, 4))
+        post1 = s.ewm(alpha=0.5, adjust=False).mean()
+        self.assertEqual(post1.dtype, np.dtype(float))
+        self.assertEqual(post1.values.tolist(), [1.0, 1.5, 2.25, 3.125])
+
+        post2 = s.ewm(alpha=1).mean()
+        self.assertEqual(post2.values.tolist(), [1.0, 2.0, 3.0, 4.0])
+
+        post3 = Series((nan, 1.0, nan, 2.0)).ewm(alpha=1).mean()
+        self.assertEqual(post3.fillna(-1).values.tolist(), [-1.0, 1.0, 1.0, 2.0])
+
+        with self.assertRaises(AxisInvalid):
+            s.ewm(alpha=0.5).__class__(s, alpha=0.5, axis=1)
+
+    #---------------------------------------------------------------------------
+
+    def test_ewm_frame_a(self) -> None:
+        f = Frame.from_fields(
+                ((1, 2, 3, 4), (1.0, 0.0, 1.0, 0.0), np.array((1, 2, 3, 4), dtype=np.float32)),
+                columns=('a', 'b', 'c'),
+                name='f',
+                )
+        post = f.ewm(span=3).mean()
+        self.assertEqual(post.name, 'f')
+        self.assertEqual(post.dtypes.values.tolist(),
+                [np.dtype(float), np.dtype(float), np.dtype(np.float32)])
+        self.assertEqual(round(post[['a', 'b']], 6).to_pairs(),
+                (('a', ((0, 1.0), (1, 1.666667), (2, 2.428571), (3, 3.266667))), ('b', ((0, 1.0), (1, 0.333333), (2, 0.714286), (3, 0.333333))))
+                )
+        self.assertTrue(np.allclose(post['c'].values, post['a'].values))
+
+    def test_ewm_frame_b(self) -> None:
+        f = FrameGO.from_fields(
+                ((1, 2, 3, 4), (1.0, 0.0, 1.0, 0.0), (1, 2, 3, 4)),
+                columns=('a', 'b', 'c'),
+                )
+        post = f.ewm(halflife=1, axis=1).mean()
+        self.assertIs(post.__class__, FrameGO)
+        self.assertEqual(round(post, 6).to_pairs(),
+                (('a', ((0, 1.0), (1, 2.0), (2, 3.0), (3, 4.0))), ('b', ((0, 1.0), (1, 0.666667), (2, 1.666667), (3, 1.333333))), ('c', ((0, 1.0), (1, 1.428571), (2, 2.428571), (3, 2.857143))))
+                )
+
+        with self.assertRaises(AxisInvalid):
+            f.ewm(span=2, axis=2)
+
+    def test_ewm_frame_c(self) -> None:
+        f = Frame(np.arange(200, dtype=float).reshape(100, 2) % 9)
+        post = f.ewm(span=10).std()
+        for label in f.columns:
+            self.assertTrue(np.allclose(
+                    post[label].values,
+                    f[label].ewm(span=10).std().values,
+                    equal_nan=True,
+                    ))
+        self.assertTrue(np.isnan(post.iloc[0].values).all())
+
+    def test_ewm_series_c(self) -> None:
+        # without adjustment, the prior statistic decays through NA values
+        s = Series((1.0, nan, 2.0, 4.0, nan, nan, 3.0))
+        e = s.ewm(alpha=0.5, adjust=False)
+        self.assertEqual(round(e.mean(), 6).values.tolist(),
+                [1.0, 1.0, 1.666667, 2.833333, 2.833333, 2.833333, 2.966667])
+        self.assertEqual(round(e.var(), 6).fillna(-1).values.tolist(),
+                [-1.0, -1.0, 0.5, 2.409091, 2.409091, 2.409091, 0.867742])
+        self.assertEqual(round(e.std(bias=True), 6).values.tolist(),
+                [0.0, 0.0, 0.471405, 1.213352, 1.213352, 1.213352, 0.546707])
+        self.assertEqual(round(e.mean(skipna=False), 6).fillna(-1).values.tolist(),
+                [1.0, -1.0, -1.0, -1.0, -1.0, -1.0, -1.0])
+
+        s2 = Series((nan, 1.0, 2.0, nan, 4.0))
+        self.assertEqual(round(s2.ewm(alpha=0.25, adjust=False).mean(), 6).fillna(-1).values.tolist(),
+                [-1.0, 1.0, 1.25, 1.25, 2.096154])
+
+    def test_ewm_series_d(self) -> None:
+        # a single observation has no unbiased variance
+        s = Series((-0.23, nan, nan, nan, -0.525))
+        for adjust in (True, False):
+            post = s.ewm(alpha=0.9, adjust=adjust).var()
+            self.assertEqual(np.isnan(post.values).tolist(), [True, True, True, True, False])
+        self.assertEqual(round(s.ewm(alpha=0.9).var().iloc[-1], 6), 0.043513)
+
+    def test_ewm_series_e(self) -> None:
+        # after a long NA gap with fast decay, the variance does not lose precision to subtraction
+        s = Series([100.0, 103.0, 98.0] + [nan] * 15 + [101.0])
+        self.assertAlmostEqual(s.ewm(alpha=0.9).var().iloc[-1], 4.238738738738739, places=10)
+        self.assertAlmostEqual(s.ewm(alpha=0.9).std().iloc[-1], 4.238738738738739 ** 0.5, places=10)
+
+        s2 = Series([100.0, 103.0, 98.0] + [nan] * 10 + [101.0])
+        post = s2.ewm(alpha=0.9).var(bias=True).iloc[-1]
+        self.assertAlmostEqual(post / 9.409999999816589e-11, 1.0, places=10)
+
+    def test_ewm_frame_d(self) -> None:
+        f = Frame.from_dict(dict(
+                a=(nan, 1.0, 2.0, nan, 4.0),
+                b=(3.0, nan, nan, 1.0, 2.0),
+                ))
+        e = f.ewm(alpha=0.25, adjust=False)
+        self.assertEqual(round(e.mean(), 6).fillna(-1).to_pairs(),
+                (('a', ((0, -1.0), (1, 1.0), (2, 1.25), (3, 1.25), (4, 2.096154))), ('b', ((0, 3.0), (1, 3.0), (2, 3.0), (3, 2.255814), (4, 2.19186))))
+                )
+        self.assertEqual(round(e.var(), 6).fillna(-1).to_pairs(),
+                (('a', ((0, -1.0), (1, -1.0), (2, 0.5), (3, 0.5), (4, 2.873626))), ('b', ((0, -1.0), (1, -1.0), (2, -1.0), (3, 2.0), (4, 1.118124))))
+                )
@@ -1982,6 +1982,39 @@ class TestUnit(TestCase):
         self.assertEqual(f.to_pairs(),
                 (('x', (('c', 2), ('b', 3), ('a', 4))), ('y', (('c', 4), ('b', 3), ('a', 2)))))
 
+    def test_frame_setitem_p(self) -> None:
+        # by default, added columns are not consolidated
+        f1 = sf.FrameGO(index=range(3))
+        for i in range(300):
+            f1[i] = np.arange(3)
+        self.assertEqual(len(f1._blocks.shapes), 300)
+
+        policy = TypeBlocks.CONSOLIDATION_POLICY
+        TypeBlocks.CONSOLIDATION_POLICY = sf.ConsolidationPolicy(blocks_min=8, columns_min=8)
+        try:
+            f = sf.FrameGO(index=range(3))
+            for i in range(20):
+                f[i] = np.arange(3) + i
+            self.assertEqual(f._blocks.shapes.tolist(), [(3, 8), (3, 7), (3,), (3,), (3,), (3,), (3,)])
+            self.assertEqual(f.iloc[1].values.tolist(), list(range(1, 21)))
+
+            f.extend(Frame(np.arange(6).reshape(3, 2), columns=('a', 'b')))
+            f.extend(Series((1.5, 2.5, 3.5), name='c'))
+            # the block of 8 columns is retained
+            self.assertEqual(f._blocks.shapes.tolist(), [(3, 8), (3, 14), (3,)])
+
+            policy_active = TypeBlocks.CONSOLIDATION_POLICY
+            self.assertEqual((policy_active.count_consolidated, policy_active.count_blocks_removed), (3, 19))
+
+            # an explicit request to not consolidate is not overridden
+            f2 = Frame.from_concat([f[i] for i in range(20)], axis=1)
+            self.assertEqual(len(f2._blocks.shapes), 20)
+            f3 = Frame.from_concat([f[i] for i in range(20)], axis=1, consolidate_blocks=True)
+            self.assertEqual(f3._blocks.shapes.tolist(), [(3, 20)])
+            self.assertEqual(f3.iloc[2].values.tolist(), list(range(2, 22)))
+        finally:
+            TypeBlocks.CONSOLIDATION_POLICY = policy
+
     #---------------------------------------------------------------------------
 
     def test_frame_extend_items_a(self) -> None:
@@ -5445,6 +5478,47 @@ class TestUnit(TestCase):
 
     #---------------------------------------------------------------------------
 
+    def test_frame_nlargest_a(self) -> None:
+        f1 = Frame.from_records(
+                (('a', 1, 1.5), ('b', 2, nan), ('a', 3, 2.0), ('c', 4, nan), ('b', 3, 1.0)),
+                columns=('k', 'i', 'f'),
+                index=('v', 'w', 'x', 'y', 'z'),
+                )
+        post1 = f1.nlargest('i', 3)
+        # of equal values, the first is selected and ordered first
+        self.assertEqual(post1.index.values.tolist(), ['y', 'x', 'z'])
+        self.assertEqual(post1.fillna(0).to_pairs(),
+                (('k', (('y', 'c'), ('x', 'a'), ('z', 'b'))), ('i', (('y', 4), ('x', 3), ('z', 3))), ('f', (('y', 0.0), ('x', 2.0), ('z', 1.0))))
+                )
+        post2 = f1.nlargest('f', 10)
+        self.assertEqual(post2.index.values.tolist(), ['x', 'v', 'z'])
+        self.assertEqual(f1.nlargest('k', 0).shape, (0, 3))
+
+        with self.assertRaises(RuntimeError):
+            f1.nlargest(['i', 'f'], 2)
+
+    def test_frame_nsmallest_a(self) -> None:
+        f1 = FrameGO.from_records(
+                (('a', 1, 1.5), ('b', 2, nan), ('a', 3, 2.0), ('c', 4, nan), ('b', 3, 1.0)),
+                columns=('k', 'i', 'f'),
+                index=('v', 'w', 'x', 'y', 'z'),
+                )
+        post1 = f1.nsmallest('k', 3)
+        self.assertIs(post1.__class__, FrameGO)
+        self.assertEqual(post1.index.values.tolist(), ['v', 'x', 'w'])
+        post2 = f1.nsmallest('f', 2)
+        self.assertEqual(post2['f'].values.tolist(), [1.0, 1.5])
+
+        f2 = ff.parse('s(100,3)|v(int,float,dtD)')
+        for label in (0, 1, 2):
+            for count in (1, 7, 99):
+                self.assertEqual(
+                        f2.nsmallest(label, count).index.values.tolist(),
+                        f2.sort_values(label, kind='mergesort').index.values[:count].tolist(),
+                        )
+
+    #---------------------------------------------------------------------------
+
     def test_frame_relabel_a(self) -> None:
         # reindex both axis
         records = (
@@ -14171,6 +14245,66 @@ class TestUnit(TestCase):
                 )
 
 
+    def test_frame_pivot_unstack_d(self) -> None:
+        index = IndexHierarchy.from_product(
+                IndexDate.from_date_range('2020-01-01', '2020-01-03'),
+                ('x', 'y'),
+                )
+        f1 = Frame.from_fields(
+                (np.arange(6), np.arange(6) * 0.5),
+                index=index,
+                columns=('a', 'b'),
+                name='f',
+                )
+        f2 = f1.pivot_unstack()
+        self.assertEqual(f2.name, 'f')
+        self.assertIs(f2.index.__class__, IndexDate)
+        self.assertEqual(f2.dtypes.values.tolist(),
+                [np.dtype(int), np.dtype(int), np.dtype(float), np.dtype(float)])
+        self.assertEqual(f2.to_pairs(),
+                ((('a', 'x'), ((datetime.date(2020, 1, 1), 0), (datetime.date(2020, 1, 2), 2), (datetime.date(2020, 1, 3), 4))), (('a', 'y'), ((datetime.date(2020, 1, 1), 1), (datetime.date(2020, 1, 2), 3), (datetime.date(2020, 1, 3), 5))), (('b', 'x'), ((datetime.date(2020, 1, 1), 0.0), (datetime.date(2020, 1, 2), 1.0), (datetime.date(2020, 1, 3), 2.0))), (('b', 'y'), ((datetime.date(2020, 1, 1), 0.5), (datetime.date(2020, 1, 2), 1.5), (datetime.date(2020, 1, 3), 2.5))))
+                )
+        # a complete index is unstacked into views of the source blocks
+        self.assertTrue(all(np.shares_memory(b1, b2)
+                for b1, b2 in zip(f1._blocks._blocks, f2._blocks._blocks)))
+
+        f3 = f2.pivot_stack()
+        self.assertTrue(f3.equals(f1.rename(None), compare_dtype=True, compare_class=True))
+        self.assertEqual(f3.index.index_types.values.tolist(), [IndexDate, Index])
+
+    def test_frame_pivot_unstack_e(self) -> None:
+        # rows ordered by target, then group, and in no order, of a complete index
+        index = IndexHierarchy.from_labels((('y', 2), ('x', 1), ('y', 1), ('x', 2)))
+        f1 = FrameGO.from_fields(((1, 2, 3, 4), ('a', 'b', 'c', 'd')), index=index)
+        f2 = f1.pivot_unstack(0)
+        self.assertIs(f2.__class__, FrameGO)
+        self.assertEqual(f2.to_pairs(),
+                (((0, 'y'), ((2, 1), (1, 3))), ((0, 'x'), ((2, 4), (1, 2))), ((1, 'y'), ((2, 'a'), (1, 'c'))), ((1, 'x'), ((2, 'd'), (1, 'b'))))
+                )
+        f2[(2, 'z')] = -1
+        self.assertEqual(f2[(2, 'z')].values.tolist(), [-1, -1])
+
+        f3 = f1.iloc[[1, 3, 2, 0]].pivot_unstack(0)
+        self.assertEqual(f3.to_pairs(),
+                (((0, 'x'), ((1, 2), (2, 4))), ((0, 'y'), ((1, 3), (2, 1))), ((1, 'x'), ((1, 'b'), (2, 'd'))), ((1, 'y'), ((1, 'c'), (2, 'a'))))
+                )
+
+    def test_frame_pivot_stack_complete_a(self) -> None:
+        f1 = Frame.from_fields(
+                ((1, 2), (1.5, 2.5), (3, 4), (3.5, 4.5)),
+                columns=IndexHierarchy.from_product(('p', 'q'), ('x', 'y')),
+                index=('r', 's'),
+                )
+        f2 = f1.pivot_stack()
+        self.assertEqual(f2.dtypes.values.tolist(), [np.dtype(float), np.dtype(float)])
+        self.assertEqual(f2.to_pairs(),
+                (('p', ((('r', 'x'), 1.0), (('r', 'y'), 1.5), (('s', 'x'), 2.0), (('s', 'y'), 2.5))), ('q', ((('r', 'x'), 3.0), (('r', 'y'), 3.5), (('s', 'x'), 4.0), (('s', 'y'), 4.5))))
+                )
+        f3 = f1.pivot_stack(0)
+        self.assertEqual(f3.to_pairs(),
+                (('x', ((('r', 'p'), 1.0), (('r', 'q'), 3.0), (('s', 'p'), 2.0), (('s', 'q'), 4.0))), ('y', ((('r', 'p'), 1.5), (('r', 'q'), 3.5), (('s', 'p'), 2.5), (('s', 'q'), 4.5))))
+                )
+
 
     #---------------------------------------------------------------------------
 
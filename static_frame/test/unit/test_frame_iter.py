@@ -828,6 +828,130 @@ class TestUnit(TestCase):
 
     #---------------------------------------------------------------------------
 
+    def test_frame_iter_group_reduce_a(self) -> None:
+        f = Frame.from_records(
+                (('a', 1, 1.5, True), ('b', 2, nan, False), ('a', 3, 2.0, True), ('c', 4, nan, False)),
+                columns=('k', 'i', 'f', 'b'),
+                index=('w', 'x', 'y', 'z'),
+                )
+        r = f.iter_group('k', drop=True).reduce
+
+        post1 = r.sum()
+        self.assertEqual(post1.index.name, 'k')
+        self.assertEqual(post1.to_pairs(),
+                (('i', (('a', 4), ('b', 2), ('c', 4))), ('f', (('a', 3.5), ('b', 0.0), ('c', 0.0))), ('b', (('a', 2), ('b', 0), ('c', 0))))
+                )
+        post2 = r.mean()
+        self.assertEqual(post2.fillna(-1).to_pairs(),
+                (('i', (('a', 2.0), ('b', 2.0), ('c', 4.0))), ('f', (('a', 1.75), ('b', -1.0), ('c', -1.0))), ('b', (('a', 1.0), ('b', 0.0), ('c', 0.0))))
+                )
+        post3 = r.min()
+        self.assertEqual(post3.dtypes.values.tolist(),
+                [np.dtype(int), np.dtype(float), np.dtype(bool)]
+                )
+        self.assertEqual(post3.fillna(-1).to_pairs(),
+                (('i', (('a', 1), ('b', 2), ('c', 4))), ('f', (('a', 1.5), ('b', -1.0), ('c', -1.0))), ('b', (('a', True), ('b', False), ('c', False))))
+                )
+        post4 = r.max()
+        self.assertEqual(post4['i'].values.tolist(), [3, 2, 4])
+        post5 = r.count()
+        self.assertEqual(post5.to_pairs(),
+                (('i', (('a', 2), ('b', 1), ('c', 1))), ('f', (('a', 2), ('b', 0), ('c', 0))), ('b', (('a', 2), ('b', 1), ('c', 1))))
+                )
+
+    def test_frame_iter_group_reduce_b(self) -> None:
+        f1 = ff.parse('s(60,6)|v(int,float,bool,str,dtD,int)')
+        f1 = f1.assign[4](f1[4].iloc[::7].reindex(f1.index, fill_value=np.datetime64('nat'))) # introduce NaT
+        f2 = f1.assign[1](f1[1].iloc[::3].reindex(f1.index)) # introduce NaN
+        f2 = f2.assign[5](f2[5] % 4)
+
+        def round_float(v: tp.Any) -> tp.Any:
+            return round(v, 6) if isinstance(v, float) else v
+
+        for func in ('sum', 'min', 'max', 'count'):
+            for skipna in (True, False):
+                frame = f2 if func != 'sum' else f2.drop[4]
+                post = getattr(frame.iter_group(5).reduce, func)(skipna=skipna)
+                for label, group in frame.iter_group_items(5):
+                    expected = getattr(group, func)(skipna=skipna)
+                    # summation order may differ in the last float digits
+                    self.assertEqual(
+                            post.loc[label].fillna(None).iter_element().apply(round_float).values.tolist(),
+                            expected.fillna(None).iter_element().apply(round_float).values.tolist(),
+                            )
+
+        post = f2[[0, 1, 2, 5]].iter_group(5).reduce.mean()
+        for label, group in f2[[0, 1, 2, 5]].iter_group_items(5):
+            self.assertTrue(np.allclose(
+                    post.loc[label].values.astype(float),
+                    group.mean().values.astype(float),
+                    equal_nan=True,
+                    ))
+
+    def test_frame_iter_group_reduce_c(self) -> None:
+        f = Frame.from_records(
+                ((1, 2, 1), (3, 4, 1), (5, 6, 2)),
+                index=('x', 'y', 'z'),
+                columns=('p', 'q', 'r'),
+                )
+        post1 = f.iter_group('z', axis=1).reduce.sum()
+        self.assertEqual(post1.columns.name, 'z')
+        self.assertEqual(post1.to_pairs(),
+                ((2, (('x', 1), ('y', 1), ('z', 2))), (5, (('x', 1), ('y', 3), ('z', 5))), (6, (('x', 2), ('y', 4), ('z', 6))))
+                )
+        post2 = f.iter_group('z', axis=1, drop=True).reduce.max()
+        self.assertEqual(post2.to_pairs(),
+                ((2, (('x', 1), ('y', 1))), (5, (('x', 1), ('y', 3))), (6, (('x', 2), ('y', 4))))
+                )
+        with self.assertRaises(AxisInvalid):
+            f.iter_group('p', axis=2).reduce
+
+    def test_frame_iter_group_reduce_d(self) -> None:
+        f1 = Frame.from_records(
+                ((1, 2), (None, 4), ('a', 6), (1, 1)),
+                columns=('k', 'v'),
+                )
+        # unsortable keys are ordered by first appearance
+        post1 = f1.iter_group('k', drop=True).reduce.sum()
+        self.assertEqual(post1.to_pairs(),
+                (('v', ((1, 3), (None, 4), ('a', 6))),)
+                )
+
+        f2 = Frame.from_records(
+                (('a', 1, 10), ('b', 2, 20), ('a', 1, 30), ('a', 2, 40)),
+                columns=('p', 'q', 'r'),
+                )
+        post2 = f2.iter_group(['p', 'q'], drop=True).reduce.sum()
+        self.assertEqual(post2.index.name, None)
+        self.assertEqual(post2.to_pairs(),
+                (('r', ((('a', 1), 40), (('a', 2), 40), (('b', 2), 20))),)
+                )
+        post3 = f2.iter_group_array('p').reduce.count()
+        self.assertEqual(post3.to_pairs(),
+                (('p', (('a', 3), ('b', 1))), ('q', (('a', 3), ('b', 1))), ('r', (('a', 3), ('b', 1))))
+                )
+
+    def test_frame_iter_group_reduce_e(self) -> None:
+        f1 = FrameGO.from_records(
+                (('a', nan), ('b', 2.0), ('a', 3.0)),
+                columns=('k', 'v'),
+                )
+        post1 = f1.iter_group('k', drop=True).reduce.sum(skipna=False)
+        self.assertIs(post1.__class__, FrameGO)
+        self.assertEqual(post1.fillna(-1).to_pairs(),
+                (('v', (('a', -1.0), ('b', 2.0))),)
+                )
+        post2 = f1.iter_group('k', drop=True).reduce.count(skipna=False)
+        self.assertEqual(post2.to_pairs(),
+                (('v', (('a', 2), ('b', 1))),)
+                )
+
+        f2 = Frame.from_fields(((), ()), columns=('k', 'v'), dtypes=(str, int))
+        post3 = f2.iter_group('k').reduce.sum()
+        self.assertEqual(post3.shape, (0, 2))
+
+    #---------------------------------------------------------------------------
+
     def test_frame_iter_group_labels_a(self) -> None:
 
         records = (
@@ -1298,6 +1422,48 @@ class TestUnit(TestCase):
         self.assertEqual(len(post), 18)
         self.assertTrue(all(f.shape == (3, 4) for f in post))
 
+    def test_frame_iter_window_reduce_a(self) -> None:
+        f1 = ff.parse('s(8,4)|v(int,float,bool,dtD)|i(I,str)').rename('f')
+        f2 = f1.iter_window(size=3, step=2).reduce.max()
+        self.assertEqual(f2.name, 'f')
+        self.assertEqual(f2.dtypes.values.tolist(),
+                [np.dtype(int), np.dtype(float), np.dtype(bool), np.dtype('<M8[D]')])
+        self.assertEqual(f2.to_pairs(),
+                ((0, (('zUvW', 92867), ('zmVj', 175579), ('z5l6', 175579))), (1, (('zUvW', 3243.94), ('zmVj', 114.58), ('z5l6', 2812.54))), (2, (('zUvW', True), ('zmVj', True), ('z5l6', True))), (3, (('zUvW', np.datetime64('2427-01-09')), ('zmVj', np.datetime64('2509-12-29')), ('z5l6', np.datetime64('2509-12-29')))))
+                )
+
+    def test_frame_iter_window_reduce_b(self) -> None:
+        f1 = ff.parse('s(8,2)|v(int,float)|i(I,str)')
+        f2 = f1.iter_window(size=4, window_sized=False, label_shift=-3).reduce.mean()
+        self.assertEqual(round(f2, 2).to_pairs(),
+                ((0, (('zZbu', 25816.25), ('ztsv', 91715.25), ('zUvW', 83190.5), ('zkuW', 98519.75), ('zmVj', 137767.75), ('z2Oo', 125164.0), ('z5l6', 158362.0), ('zCE3', 170440.0))), (1, (('zZbu', 481.15), ('ztsv', -208.09), ('zUvW', -315.94), ('zkuW', 221.19), ('zmVj', -663.61), ('z2Oo', 237.77), ('z5l6', -1049.62), ('zCE3', -3424.62))))
+                )
+
+        f3 = f1.iter_window(size=3).reduce.aggregate({0: ('min', 'max'), 1: 'sum'})
+        self.assertEqual(f3.columns.values.tolist(), [[0, 'min'], [0, 'max'], [1, 'sum']])
+        self.assertEqual(f3.index.values.tolist(), ['zUvW', 'zkuW', 'zmVj', 'z2Oo', 'z5l6', 'zCE3'])
+        self.assertEqual(f3[(0, 'max')].values.tolist(), [92867, 92867, 175579, 175579, 175579, 170440])
+
+    def test_frame_iter_window_reduce_c(self) -> None:
+        f1 = ff.parse('s(3,5)|v(int)')
+        f2 = f1.iter_window(size=2, axis=1).reduce.sum()
+        self.assertEqual(f2.to_pairs(),
+                ((1, ((0, 74180), (1, 51710), (2, 90696))), (2, ((0, 158549), (1, 50144), (2, 35934))), (3, ((0, 125369), (1, 126322), (2, 197129))), (4, ((0, 187785), (1, 181305), (2, 337364))))
+                )
+        with self.assertRaises(AxisInvalid):
+            f1.iter_window(size=2, axis=2).reduce.sum()
+
+    def test_frame_iter_window_reduce_d(self) -> None:
+        f1 = Frame.from_dict(dict(a=(1, 2, 3, 4, 5, 6), b=(1.5, 0.5, 2.0, 1.0, 3.0, np.nan)),
+                index=IndexDate(('2024-01-01', '2024-01-02', '2024-01-05', '2024-01-06', '2024-01-07', '2024-01-20')),
+                )
+        f2 = f1.iter_window(size=np.timedelta64(3, 'D')).reduce.mean()
+        self.assertEqual(f2.fillna(-1).to_pairs(),
+                (('a', ((np.datetime64('2024-01-05'), 3.0), (np.datetime64('2024-01-06'), 3.5), (np.datetime64('2024-01-07'), 4.0), (np.datetime64('2024-01-20'), 6.0))), ('b', ((np.datetime64('2024-01-05'), 2.0), (np.datetime64('2024-01-06'), 1.5), (np.datetime64('2024-01-07'), 2.0), (np.datetime64('2024-01-20'), -1.0))))
+                )
+        post = f1.iter_window(size=np.timedelta64(3, 'D')).apply(lambda f: f['a'].mean())
+        self.assertEqual(post.values.tolist(), f2['a'].values.tolist())
+
     #---------------------------------------------------------------------------
 
     def test_frame_axis_interface_a(self) -> None:
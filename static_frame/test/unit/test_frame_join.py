@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import frame_fixtures as ff
 import numpy as np
 
 import static_frame as sf
@@ -470,6 +471,393 @@ class TestUnit(TestCase):
                 )
 
 
+    def test_frame_join_m(self) -> None:
+        # NaN never matches, while None matches None
+        f1 = sf.Frame.from_dict(dict(a=(1.0, np.nan, 3.0), b=(None, 'x', 'y')))
+        f2 = sf.Frame.from_dict(dict(c=(np.nan, 3.0, 1.0), d=('y', 'y', None)))
+
+        f3 = f1.join_inner(f2, left_columns='a', right_columns='c', include_index=True)
+        self.assertEqual(f3.to_pairs(),
+                (('a', ((0, 1.0), (2, 3.0))), ('b', ((0, None), (2, 'y'))), ('c', ((0, 1.0), (2, 3.0))), ('d', ((0, None), (2, 'y'))))
+                )
+
+        f4 = f1.join_inner(f2, left_columns=['a', 'b'], right_columns=['c', 'd'], include_index=True)
+        self.assertEqual(f4.to_pairs(),
+                (('a', ((0, 1.0), (2, 3.0))), ('b', ((0, None), (2, 'y'))), ('c', ((0, 1.0), (2, 3.0))), ('d', ((0, None), (2, 'y'))))
+                )
+
+    def test_frame_join_n(self) -> None:
+        # unsortable, mixed-type keys, with integers matching equal floats
+        f1 = sf.Frame.from_dict(dict(a=('x', 3, None, (1, 2)), b=range(4)))
+        f2 = sf.Frame.from_dict(dict(c=(3.0, (1, 2), 'x', 'x'), d=range(4)))
+
+        f3 = f1.join_left(f2, left_columns='a', right_columns='c', fill_value=None)
+        self.assertEqual(f3.to_pairs(),
+                (('a', ((0, 'x'), (1, 'x'), (2, 3), (3, (1, 2)), (4, None))), ('b', ((0, 0), (1, 0), (2, 1), (3, 3), (4, 2))), ('c', ((0, 'x'), (1, 'x'), (2, 3.0), (3, (1, 2)), (4, None))), ('d', ((0, 2), (1, 3), (2, 0), (3, 1), (4, None))))
+                )
+
+    def test_frame_join_factorize_a(self) -> None:
+        from static_frame.core.join import _join_factorize
+        from static_frame.core.type_blocks import TypeBlocks
+
+        tb1 = TypeBlocks.from_blocks((np.array((1, 2, 1)), np.array(('a', 'b', 'b'))))
+        tb2 = TypeBlocks.from_blocks((np.array((2.0, np.nan)), np.array(('b', 'a'))))
+
+        codes_left, codes_right, count = _join_factorize(tb1, tb2)
+        self.assertEqual(count, 3)
+        self.assertEqual(codes_left.tolist(), [0, 2, 1])
+        self.assertEqual(codes_right.tolist(), [2, -1])
+
+    def test_frame_join_pairs_a(self) -> None:
+        from static_frame.core.join import _join_pairs
+
+        # right is built
+        match_left, match_right = _join_pairs(
+                np.array((0, 1, -1, 0, 2)),
+                np.array((1, 0, 0, -1)),
+                3,
+                )
+        self.assertEqual(match_left.tolist(), [0, 0, 1, 3, 3])
+        self.assertEqual(match_right.tolist(), [1, 2, 0, 1, 2])
+
+        # left is built
+        match_left, match_right = _join_pairs(
+                np.array((0, 1, 0)),
+                np.array((1, 0, 0, -1, 1)),
+                2,
+                )
+        self.assertEqual(match_left.tolist(), [0, 0, 1, 1, 2, 2])
+        self.assertEqual(match_right.tolist(), [1, 2, 0, 4, 1, 2])
+
+        match_left, match_right = _join_pairs(
+                np.array((), dtype=np.int64),
+                np.array((0, 1)),
+                2,
+                )
+        self.assertEqual(match_left.tolist(), [])
+        self.assertEqual(match_right.tolist(), [])
+
+
+    def test_frame_join_o(self) -> None:
+        # one to one column joins take rows by position, not by index label
+        f1 = sf.Frame.from_dict(dict(a=(1, 2, 3), b=('p', 'q', 'r')))
+        f2 = sf.Frame.from_dict(dict(c=(3, 1, 4), d=(True, False, True)))
+
+        f3 = f1.join_right(f2, left_columns='a', right_columns='c', fill_value=None)
+        self.assertEqual(f3.to_pairs(),
+                (('a', ((0, 3), (1, 1), (2, None))), ('b', ((0, 'r'), (1, 'p'), (2, None))), ('c', ((0, 3), (1, 1), (2, 4))), ('d', ((0, True), (1, False), (2, True))))
+                )
+
+        f4 = f1.join_outer(f2, left_columns='a', right_columns='c', fill_value=None, include_index=True)
+        # as index labels collide, a composite index is used
+        self.assertEqual(f4.index.values.tolist(),
+                [(0, 1), (1, None), (2, 0), (None, 2)]
+                )
+        self.assertEqual(f4.to_pairs(),
+                (('a', (((0, 1), 1), ((1, None), 2), ((2, 0), 3), ((None, 2), None))), ('b', (((0, 1), 'p'), ((1, None), 'q'), ((2, 0), 'r'), ((None, 2), None))), ('c', (((0, 1), 1), ((1, None), None), ((2, 0), 3), ((None, 2), 4))), ('d', (((0, 1), False), ((1, None), None), ((2, 0), True), ((None, 2), True))))
+                )
+
+    def test_frame_join_p(self) -> None:
+        # wide right frames retain dtypes, resolving only when filled
+        f1 = sf.Frame.from_dict(dict(a=('x', 'y', 'z')), index=('x', 'y', 'z'))
+        f2 = sf.Frame.from_element(1, index=('z', 'x'), columns=range(200))
+        f2 = f2.assign[150:].apply(lambda s: s * 0.5)
+
+        f3 = f1.join_inner(f2, left_depth_level=0, right_depth_level=0, right_template='r{}')
+        self.assertEqual(f3.shape, (2, 201))
+        self.assertEqual(f3.dtypes.values.tolist()[-2:], [np.dtype(float), np.dtype(float)])
+        self.assertEqual(f3.dtypes.values.tolist()[1], np.dtype(int))
+        self.assertEqual(f3.iloc[:, 0].values.tolist(), ['x', 'z'])
+
+        f4 = f1.join_left(f2, left_depth_level=0, right_depth_level=0, right_template='r{}', fill_value=0)
+        self.assertEqual(f4.dtypes.values.tolist()[1], np.dtype(int))
+        self.assertEqual(f4['r0'].values.tolist(), [1, 0, 1])
+        self.assertEqual(f4['r199'].values.tolist(), [0.5, 0.0, 0.5])
+
+
+    #---------------------------------------------------------------------------
+
+    def test_frame_join_strategy_a(self) -> None:
+        f1 = sf.Frame.from_dict(dict(a=(1, 2, 2, 4), b=('p', 'q', 'r', 's')))
+        f2 = sf.Frame.from_dict(dict(c=(2, 2, 3, 4), d=('w', 'x', 'y', 'z')))
+
+        for join_type in ('join_inner', 'join_left', 'join_right', 'join_outer'):
+            f3 = getattr(f1, join_type)(f2, left_columns='a', right_columns='c', fill_value=None, include_index=True, strategy='hash')
+            f4 = getattr(f1, join_type)(f2, left_columns='a', right_columns='c', fill_value=None, include_index=True, strategy='sort')
+            f5 = getattr(f1, join_type)(f2, left_columns='a', right_columns='c', fill_value=None, include_index=True)
+            self.assertTrue(f3.equals(f4, compare_dtype=True))
+            self.assertTrue(f3.equals(f5, compare_dtype=True))
+
+        f6 = f1.join_inner(f2, left_columns='a', right_columns='c', strategy='sort')
+        self.assertEqual(f6.to_pairs(),
+                (('a', ((0, 2), (1, 2), (2, 2), (3, 2), (4, 4))), ('b', ((0, 'q'), (1, 'q'), (2, 'r'), (3, 'r'), (4, 's'))), ('c', ((0, 2), (1, 2), (2, 2), (3, 2), (4, 4))), ('d', ((0, 'w'), (1, 'x'), (2, 'w'), (3, 'x'), (4, 'z'))))
+                )
+
+    def test_frame_join_strategy_b(self) -> None:
+        # unsorted right with NaN, multiple columns
+        f1 = sf.Frame.from_dict(dict(a=(1.0, np.nan, 2.0), b=('x', 'y', 'x')))
+        f2 = sf.Frame.from_dict(dict(c=(2.0, np.nan, 1.0, 2.0), d=('x', 'y', 'x', 'y')), index=tuple('pqrs'))
+
+        f3 = f1.join_left(f2, left_columns=['a', 'b'], right_columns=['c', 'd'], fill_value=None, strategy='sort')
+        f4 = f1.join_left(f2, left_columns=['a', 'b'], right_columns=['c', 'd'], fill_value=None, strategy='hash')
+        self.assertTrue(f3.equals(f4, compare_dtype=True))
+        self.assertEqual(f3.fillna(None).to_pairs(),
+                (('a', ((0, 1.0), (1, None), (2, 2.0))), ('b', ((0, 'x'), (1, 'y'), (2, 'x'))), ('c', ((0, 1.0), (1, None), (2, 2.0))), ('d', ((0, 'x'), (1, None), (2, 'x'))))
+                )
+
+    def test_frame_join_strategy_c(self) -> None:
+        f1 = sf.Frame.from_dict(dict(a=(1, 'b')))
+        f2 = sf.Frame.from_dict(dict(c=(1, 'b')))
+
+        with self.assertRaises(RuntimeError):
+            f1.join_inner(f2, left_columns='a', right_columns='c', strategy='sort')
+        with self.assertRaises(ValueError):
+            f1.join_inner(f2, left_columns='a', right_columns='c', strategy='foo')
+
+        f3 = f1.join_inner(f2, left_columns='a', right_columns='c')
+        self.assertEqual(f3.to_pairs(),
+                (('a', ((0, 1), (1, 'b'))), ('c', ((0, 1), (1, 'b'))))
+                )
+
+    def test_frame_join_target_sorted_a(self) -> None:
+        from static_frame.core.join import _join_target_sorted
+        from static_frame.core.type_blocks import TypeBlocks
+
+        self.assertTrue(_join_target_sorted(TypeBlocks.from_blocks(np.array((1, 1, 2)))))
+        self.assertFalse(_join_target_sorted(TypeBlocks.from_blocks(np.array((1, 2, 1)))))
+        self.assertFalse(_join_target_sorted(TypeBlocks.from_blocks(np.array((1.0, np.nan)))))
+        self.assertTrue(_join_target_sorted(TypeBlocks.from_blocks(np.array((), dtype=int))))
+
+        tb1 = TypeBlocks.from_blocks((np.array((1, 1, 2, 2)), np.array(('b', 'c', 'a', 'a'))))
+        self.assertTrue(_join_target_sorted(tb1))
+        tb2 = TypeBlocks.from_blocks((np.array((1, 1, 2, 2)), np.array(('b', 'a', 'a', 'a'))))
+        self.assertFalse(_join_target_sorted(tb2))
+        tb3 = TypeBlocks.from_blocks((np.array((1, 2, 3)), np.array(('c', 'b', 'a')), np.array((3, 2, 1))))
+        self.assertTrue(_join_target_sorted(tb3))
+
+    #---------------------------------------------------------------------------
+
+    def test_frame_join_asof_a(self) -> None:
+        f1 = sf.Frame.from_dict(dict(a=(1, 2, 3)),
+                index=IndexDate(('2020-01-02', '2020-01-05', '2020-01-09')))
+        f2 = sf.Frame.from_dict(dict(b=(10, 20, 30, 40)),
+                index=IndexDate(('2020-01-01', '2020-01-05', '2020-01-06', '2020-01-08')))
+
+        f3 = f1.join_asof(f2, left_depth_level=0, right_depth_level=0, include_index=True)
+        self.assertEqual(f3.to_pairs(),
+                (('a', ((np.datetime64('2020-01-02'), 1), (np.datetime64('2020-01-05'), 2), (np.datetime64('2020-01-09'), 3))), ('b', ((np.datetime64('2020-01-02'), 10), (np.datetime64('2020-01-05'), 20), (np.datetime64('2020-01-09'), 40))))
+                )
+        self.assertEqual(f3.dtypes.values.tolist(), [np.dtype(int), np.dtype(int)])
+
+        f4 = f1.join_asof(f2, left_depth_level=0, right_depth_level=0, direction='forward', fill_value=None)
+        self.assertEqual(f4['b'].values.tolist(), [20, 20, None])
+
+        f5 = f1.join_asof(f2, left_depth_level=0, right_depth_level=0, direction='nearest')
+        self.assertEqual(f5['b'].values.tolist(), [10, 20, 40])
+
+    def test_frame_join_asof_b(self) -> None:
+        f1 = sf.Frame.from_dict(dict(a=(1, 2, 3)),
+                index=sf.IndexSecond(('2020-01-01T00:00:03', '2020-01-01T00:00:05', '2020-01-01T00:00:09')))
+        f2 = sf.Frame.from_dict(dict(b=(10, 20)),
+                index=sf.IndexNanosecond(('2020-01-01T00:00:02', '2020-01-01T00:00:06')))
+
+        f3 = f1.join_asof(f2,
+                left_depth_level=0,
+                right_depth_level=0,
+                tolerance=np.timedelta64(1, 's'),
+                fill_value=0,
+                )
+        self.assertEqual(f3['b'].values.tolist(), [10, 0, 0])
+
+        f4 = f1.join_asof(f2,
+                left_depth_level=0,
+                right_depth_level=0,
+                direction='nearest',
+                tolerance=np.timedelta64(1, 's'),
+                fill_value=0,
+                )
+        self.assertEqual(f4['b'].values.tolist(), [10, 20, 0])
+
+    def test_frame_join_asof_c(self) -> None:
+        f1 = sf.Frame.from_records(
+                ((1.0, 'x', 0), (4.0, 'y', 1), (5.0, 'x', 2), (np.nan, 'x', 3), (6.0, 'z', 4)),
+                columns=('t', 's', 'a'))
+        f2 = sf.Frame.from_records(
+                ((1.0, 'y', 10), (1.0, 'x', 20), (3.0, 'x', 30), (3.0, 'x', 40), (7.0, 'z', 50)),
+                columns=('t', 's', 'b'))
+
+        f3 = f1.join_asof(f2,
+                left_columns='t',
+                right_columns='t',
+                left_by='s',
+                right_by='s',
+                right_template='r_{}',
+                fill_value=-1,
+                )
+        self.assertEqual(f3['r_b'].values.tolist(), [20, 10, 40, -1, -1])
+        self.assertEqual(f3['r_s'].values.tolist(), ['x', 'y', 'x', -1, -1])
+
+        f4 = f1.join_asof(f2,
+                left_columns='t',
+                right_columns='t',
+                left_by='s',
+                right_by='s',
+                direction='forward',
+                right_template='r_{}',
+                fill_value=-1,
+                )
+        self.assertEqual(f4['r_b'].values.tolist(), [20, -1, -1, -1, 50])
+
+    def test_frame_join_asof_d(self) -> None:
+        f1 = sf.Frame.from_dict(dict(a=(1, 2)))
+        f2 = sf.Frame.from_dict(dict(b=('p', 'q')))
+
+        with self.assertRaises(RuntimeError):
+            f1.join_asof(f2, left_columns='a', right_columns='b')
+        with self.assertRaises(RuntimeError):
+            f1.join_asof(f1, left_columns='a', right_columns='a', left_by='a')
+        with self.assertRaises(RuntimeError):
+            f1.join_asof(f1, left_columns='a')
+        with self.assertRaises(ValueError):
+            f1.join_asof(f1, left_columns='a', right_columns='a', direction='up')
+        with self.assertRaises(InvalidFillValue):
+            f1.join_asof(f1, left_columns='a', right_columns='a', fill_value=FillValueAuto)
+
+        f3 = f1.join_asof(f1.iloc[:0], left_columns='a', right_columns='a', right_template='r_{}')
+        self.assertEqual(f3.shape, (2, 2))
+        self.assertEqual(f3['r_a'].isna().values.tolist(), [True, True])
+
+
+    #---------------------------------------------------------------------------
+
+    def test_frame_join_semi_a(self) -> None:
+        f1 = sf.Frame.from_records(
+                ((1, 'a', True), (2, 'b', False), (np.nan, 'c', True), (1, 'b', False)),
+                columns=('x', 'y', 'z'),
+                index=tuple('pqrs'),
+                )
+        f2 = sf.Frame.from_records(
+                ((1, 'a'), (1, 'a'), (3, 'b'), (np.nan, 'c')),
+                columns=('x', 'y'),
+                )
+        f3 = f1.join_semi(f2, left_columns=['x', 'y'], right_columns=['x', 'y'])
+        self.assertEqual(f3.to_pairs(),
+                (('x', (('p', 1.0),)), ('y', (('p', 'a'),)), ('z', (('p', True),)))
+                )
+        f4 = f1.join_semi(f2, left_columns='x', right_columns='x')
+        self.assertEqual(f4.index.values.tolist(), ['p', 's'])
+
+        f5 = f1.join_semi(f1, left_columns='y', right_columns='y')
+        self.assertIs(f5, f1)
+
+        f6 = f1.to_frame_go().join_semi(f2.iloc[:0], left_depth_level=0, right_depth_level=0)
+        self.assertEqual(f6.shape, (0, 3))
+        self.assertIs(f6.__class__, sf.FrameGO)
+
+    def test_frame_join_anti_a(self) -> None:
+        f1 = sf.Frame.from_records(
+                ((1, 'a', True), (2, 'b', False), (np.nan, 'c', True), (1, 'b', False)),
+                columns=('x', 'y', 'z'),
+                index=tuple('pqrs'),
+                )
+        f2 = sf.Frame.from_records(
+                ((1, 'a'), (3, 'b'), (np.nan, 'c')),
+                columns=('x', 'y'),
+                index=tuple('qrs')
+                )
+        f3 = f1.join_anti(f2, left_columns=['x', 'y'], right_columns=['x', 'y'])
+        self.assertEqual(f3.index.values.tolist(), ['q', 'r', 's'])
+
+        f4 = f1.join_anti(f2, left_depth_level=0, right_depth_level=0)
+        self.assertEqual(f4.to_pairs(),
+                (('x', (('p', 1.0),)), ('y', (('p', 'a'),)), ('z', (('p', True),)))
+                )
+        with self.assertRaises(RuntimeError):
+            f1.join_anti(f2, left_columns=['x', 'y'], right_columns='x')
+        with self.assertRaises(RuntimeError):
+            f1.join_anti(f2, left_columns='x')
+
+    #---------------------------------------------------------------------------
+
+    def test_frame_join_index_a(self) -> None:
+        f1 = sf.Frame.from_records(
+                ((1, 'a', 0), (2, 'b', 1), (np.nan, 'c', 2), (1, 'b', 3), (3, None, 4)),
+                columns=('x', 'y', 'z'),
+                )
+        f2 = sf.Frame.from_records(
+                ((1, 'b', True), (1, 'b', False), (3, None, True), (np.nan, 'c', False)),
+                columns=('p', 'q', 'r'),
+                index=tuple('ABCD'),
+                ).to_frame_go()
+        ji = sf.JoinIndex(f2, columns=['p', 'q'])
+        self.assertEqual(ji.depth, 2)
+        self.assertIs(ji.frame.__class__, sf.Frame)
+
+        for method in ('join_inner', 'join_left', 'join_right', 'join_outer'):
+            post = getattr(f1, method)(ji, left_columns=['x', 'y'], include_index=True, fill_value=None)
+            ref = getattr(f1, method)(f2, left_columns=['x', 'y'], right_columns=['p', 'q'], include_index=True, fill_value=None)
+            self.assertTrue(post.equals(ref, compare_dtype=True))
+
+        f3 = f1.join_inner(ji, left_columns=['x', 'y'])
+        self.assertEqual(f3.to_pairs(),
+                (('x', ((0, 1.0), (1, 1.0), (2, 3.0))), ('y', ((0, 'b'), (1, 'b'), (2, None))), ('z', ((0, 3), (1, 3), (2, 4))), ('p', ((0, 1.0), (1, 1.0), (2, 3.0))), ('q', ((0, 'b'), (1, 'b'), (2, None))), ('r', ((0, True), (1, False), (2, True))))
+                )
+
+    def test_frame_join_index_b(self) -> None:
+        f1 = sf.Frame.from_dict(dict(a=(1, 2, 3)), index=IndexDate(('2020-01-01', '2020-01-02', '2020-01-03')))
+        f2 = sf.Frame.from_dict(dict(b=(True, False)), index=IndexDate(('2020-01-03', '2020-01-01')))
+        ji = sf.JoinIndex(f2, depth_level=0)
+
+        f3 = f1.join_left(ji, left_depth_level=0, include_index=True, fill_value=None)
+        self.assertEqual(f3['b'].values.tolist(), [False, None, True])
+        f4 = f1.join_left(sf.JoinIndex(f2.iloc[:0], depth_level=0), left_depth_level=0)
+        self.assertEqual(f4['b'].isna().values.tolist(), [True, True, True])
+
+        with self.assertRaises(RuntimeError):
+            sf.JoinIndex(f2)
+        with self.assertRaises(RuntimeError):
+            f1.join_left(ji, left_depth_level=0, right_depth_level=0)
+        with self.assertRaises(RuntimeError):
+            f1.join_left(ji, left_depth_level=0, left_columns='a')
+
+    #---------------------------------------------------------------------------
+
+    def test_frame_join_partitions_a(self) -> None:
+        from static_frame.core.join import _join_partitions
+        from static_frame.core.type_blocks import TypeBlocks
+
+        tb1 = TypeBlocks.from_blocks((np.array((1, 2, 3, 0)), np.array(('a', 'b', 'c', 'd'))))
+        tb2 = TypeBlocks.from_blocks((np.array((3.0, 1.0, 2.0, -0.0)), np.array(('c', 'a', 'b', 'd'), dtype=object)))
+        p1, p2 = _join_partitions(tb1, tb2, 7)
+        self.assertEqual(p1.tolist(), p2[[1, 2, 0, 3]].tolist())
+        self.assertTrue((p1 < 7).all())
+
+        p3, p4 = _join_partitions(tb1, tb2, 1)
+        self.assertEqual(p3.tolist(), [0, 0, 0, 0])
+        self.assertEqual(p4.tolist(), [0, 0, 0, 0])
+
+    def test_frame_join_partitions_b(self) -> None:
+        f1 = ff.parse('s(40,3)|v(int,str,bool)').assign[0].apply(lambda s: s % 7)
+        f2 = ff.parse('s(30,3)|v(int,float,bool)').assign[0].apply(lambda s: s % 5)
+
+        for method in ('join_inner', 'join_left', 'join_right', 'join_outer'):
+            ref = getattr(f1, method)(f2, left_columns=[0, 2], right_columns=[0, 2], include_index=True, fill_value=None, right_template='r{}')
+            for max_workers in (1, 4):
+                post = getattr(f1, method)(f2, left_columns=[0, 2], right_columns=[0, 2], include_index=True, fill_value=None, right_template='r{}', max_workers=max_workers, use_threads=True)
+                self.assertTrue(post.equals(ref, compare_dtype=True))
+
+        with self.assertRaises(RuntimeError):
+            f1.join_inner(f2, left_columns=0, right_columns=0, max_workers=0)
+
+    @skip_win
+    def test_frame_join_partitions_c(self) -> None:
+        f1 = sf.Frame.from_dict(dict(a=(1, 2, 3, 2), b=('p', 'q', 'r', 's')))
+        f2 = sf.Frame.from_dict(dict(c=(2, 3, 4), d=(True, False, True)))
+
+        post = f1.join_left(f2, left_columns='a', right_columns='c', fill_value=None, max_workers=2)
+        ref = f1.join_left(f2, left_columns='a', right_columns='c', fill_value=None)
+        self.assertTrue(post.equals(ref, compare_dtype=True))
+
 
     # def test_frame_join_sort_a(self) -> None:
     #     from static_frame.core.join import join_sort
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import frame_fixtures as ff
+import numpy as np
+
+from static_frame import Frame
+from static_frame import FrameGO
+from static_frame import InterfaceLazy
+from static_frame import Series
+from static_frame.test.test_case import TestCase
+
+
+class TestUnit(TestCase):
+
+    def test_frame_via_lazy_a(self) -> None:
+        f = ff.parse('s(100,4)|v(float)|c(I,str)')
+        lf = f.via_lazy
+        e = (lf['zZbu'] * lf['ztsv'] + lf['zUvW']) / lf['zkuW']
+        self.assertIs(e.__class__, InterfaceLazy)
+        self.assertEqual(repr(e),
+                "<InterfaceLazy: __truediv__(__add__(__mul__(Series('zZbu'), Series('ztsv')), Series('zUvW')), Series('zkuW'))>"
+                )
+        expected = (f['zZbu'] * f['ztsv'] + f['zUvW']) / f['zkuW']
+        for chunk_size in (None, 1, 7, 100, 1000):
+            post = e.evaluate(chunk_size=chunk_size)
+            self.assertTrue(post.equals(expected, compare_dtype=True, compare_name=True))
+            self.assertFalse(post.values.flags.writeable)
+
+        with self.assertRaises(RuntimeError):
+            e.evaluate(chunk_size=0)
+
+    def test_frame_via_lazy_b(self) -> None:
+        f = FrameGO.from_fields(((1, 2, 3), (4, 5, 6), (0.5, 0.0, 2.0)),
+                columns=('a', 'b', 'c'),
+                name='x',
+                )
+        lf = f.via_lazy
+        pairs = (
+                (lf['a'] * 2 + 1, f['a'] * 2 + 1),
+                (-lf['a'] // lf['b'], -f['a'] // f['b']),
+                (lf['a'] / lf['c'], f['a'] / f['c']),
+                (10 - lf['a'], 10 - f['a']),
+                (abs(lf['c'] - 1), abs(f['c'] - 1)),
+                ((lf['a'] > 1) & (lf['b'] < 6), (f['a'] > 1) & (f['b'] < 6)),
+                (f['b'] - lf['a'], f['b'] - f['a']),
+                (lf[['a', 'b']] ** 2, f[['a', 'b']] ** 2),
+                (lf * 2 - lf, f * 2 - f),
+                )
+        for e, expected in pairs:
+            post = e.evaluate(chunk_size=2)
+            self.assertTrue(post.equals(expected,
+                    compare_dtype=True,
+                    compare_name=True,
+                    compare_class=True,
+                    ))
+
+    def test_frame_via_lazy_c(self) -> None:
+        # a sub-expression used more than once is evaluated once per chunk
+        s = Series(np.arange(10), name='a')
+        x = s.via_lazy * 3
+        post = (x + x * x).evaluate(chunk_size=4)
+        self.assertEqual(post.values.tolist(), (s * 3 + (s * 3) ** 2).values.tolist())
+        self.assertEqual(post.name, None)
+        self.assertEqual((x + 1).evaluate().name, 'a')
+
+        # a leaf evaluates to its container
+        self.assertIs(s.via_lazy.evaluate(), s)
+
+    def test_frame_via_lazy_d(self) -> None:
+        # non-numeric values are evaluated with the operators of the containers
+        s = Series(('a', 'b'), index=('x', 'y'))
+        self.assertEqual((s.via_lazy + 'c').evaluate().to_pairs(),
+                (('x', 'ac'), ('y', 'bc')))
+
+        f = Frame.from_fields(((1, 2), (3.5, 4.5)), columns=('a', 'b'))
+        post = (f.via_lazy * 2).evaluate()
+        self.assertEqual(post.dtypes.values.tolist(), [np.dtype(int), np.dtype(float)])
+        self.assertEqual(post.to_pairs(), (('a', ((0, 2), (1, 4))), ('b', ((0, 7.0), (1, 9.0)))))
+
+        self.assertEqual((Series((), dtype=float).via_lazy + 1).evaluate().values.tolist(), [])
+
+    def test_frame_via_lazy_e(self) -> None:
+        f = ff.parse('s(3,2)|v(float)')
+        with self.assertRaises(RuntimeError):
+            f.via_lazy[0] + Series((1.0, 2.0, 3.0), index=('a', 'b', 'c'))
+        with self.assertRaises(RuntimeError):
+            f.via_lazy + f[0]
+        with self.assertRaises(RuntimeError):
+            f.via_lazy[0] + np.arange(3)
+        with self.assertRaises(RuntimeError):
+            (f.via_lazy + 1)[0]
+        with self.assertRaises(RuntimeError):
+            f[0].via_lazy[0]
@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import frame_fixtures as ff
+import numpy as np
+
+from static_frame import Frame
+from static_frame import FrameGO
+from static_frame import GroupBy
+from static_frame import TypeBlocks
+from static_frame.core.exception import AxisInvalid
+from static_frame.core.group_by import extreme_select
+from static_frame.test.test_case import TestCase
+
+nan = np.nan
+
+
+class TestUnit(TestCase):
+
+    def test_group_by_a(self) -> None:
+        f = Frame.from_records(
+                (('a', 1, 1.5), ('b', 2, nan), ('a', 3, 2.0), ('c', 4, nan)),
+                columns=('k', 'i', 'f'),
+                index=('w', 'x', 'y', 'z'),
+                )
+        g = f.group_by('k', drop=True)
+        self.assertIs(g.__class__, GroupBy)
+        self.assertEqual(len(g), 3)
+        self.assertEqual(list(g), ['a', 'b', 'c'])
+        self.assertEqual(g.labels.name, 'k')
+        self.assertEqual(repr(g), '<GroupBy: 3 groups, axis 0>')
+
+        post = dict(g.items())
+        self.assertEqual(post['a'].to_pairs(),
+                (('i', (('w', 1), ('y', 3))), ('f', (('w', 1.5), ('y', 2.0))))
+                )
+        self.assertEqual([v.shape for v in g.values()], [(2, 2), (1, 2), (1, 2)])
+
+        # groups are the same as those from iter_group
+        for (l1, f1), (l2, f2) in zip(g.items(), f.iter_group_items('k', drop=True)):
+            self.assertEqual(l1, l2)
+            self.assertTrue(f1.equals(f2, compare_dtype=True, compare_class=True))
+
+    def test_group_by_b(self) -> None:
+        f = ff.parse('s(20,4)|v(int,float,bool,str)').assign[0].apply(lambda s: s % 3)
+        g = f.group_by(0)
+
+        # multiple reductions share the same grouping
+        self.assertEqual(g.reduce.sum().to_pairs(),
+                f.iter_group(0).reduce.sum().to_pairs())
+        self.assertEqual(g.reduce.count().to_pairs(),
+                f.iter_group(0).reduce.count().to_pairs())
+        self.assertEqual(g.reduce.max().to_pairs(),
+                f.iter_group(0).reduce.max().to_pairs())
+
+        post = g.apply(lambda f: f.shape[0], name='count')
+        self.assertEqual(post.name, 'count')
+        self.assertEqual(post.to_pairs(), ((0, 6), (1, 8), (2, 6)))
+
+    def test_group_by_c(self) -> None:
+        f = FrameGO.from_records(
+                ((1, 2, 1), (3, 4, 1), (5, 6, 2)),
+                index=('x', 'y', 'z'),
+                columns=('p', 'q', 'r'),
+                )
+        g = f.group_by('z', axis=1, drop=True)
+        self.assertEqual(list(g), [2, 5, 6])
+
+        post1 = dict(g.items())
+        self.assertIs(post1[2].__class__, FrameGO)
+        self.assertEqual(post1[2].to_pairs(), (('r', (('x', 1), ('y', 1))),))
+        self.assertEqual(post1[5].to_pairs(), (('p', (('x', 1), ('y', 3))),))
+
+        post2 = g.reduce.sum()
+        self.assertIs(post2.__class__, FrameGO)
+        self.assertEqual(post2.to_pairs(),
+                ((2, (('x', 1), ('y', 1))), (5, (('x', 1), ('y', 3))), (6, (('x', 2), ('y', 4))))
+                )
+
+        with self.assertRaises(AxisInvalid):
+            f.group_by('p', axis=2)
+
+    def test_group_by_d(self) -> None:
+        # unsortable keys are grouped by hashing
+        f1 = Frame.from_records(
+                ((1, 2), (None, 4), ('a', 6), (1, 1)),
+                columns=('k', 'v'),
+                )
+        g1 = f1.group_by('k')
+        self.assertEqual(list(g1), [1, None, 'a'])
+        self.assertEqual([v.index.values.tolist() for v in g1.values()],
+                [[0, 3], [1], [2]])
+
+        f2 = Frame.from_records(
+                (('a', 1, 10), ('b', 2, 20), ('a', 1, 30)),
+                columns=('p', 'q', 'r'),
+                )
+        g2 = f2.group_by(['p', 'q'])
+        self.assertEqual(list(g2), [('a', 1), ('b', 2)])
+        self.assertEqual(g2.labels.name, None)
+
+    def test_group_by_e(self) -> None:
+        f = Frame.from_fields(((), ()), columns=('k', 'v'), dtypes=(str, int))
+        g = f.group_by('k')
+        self.assertEqual(len(g), 0)
+        self.assertEqual(list(g.items()), [])
+        self.assertEqual(g.apply(len).shape, (0,))
+
+    #---------------------------------------------------------------------------
+
+    def test_group_by_aggregate_a(self) -> None:
+        f = Frame.from_records(
+                (('a', 1, 1.5, 10), ('b', 2, nan, 20), ('a', 3, 2.0, 30), ('c', 4, nan, 40)),
+                columns=('k', 'price', 'f', 'qty'),
+                )
+        post = f.group_by('k').reduce.aggregate(
+                {'price': ('sum', 'max'), 'qty': 'mean', 'f': ['count', 'min']})
+        self.assertEqual(post.columns.values.tolist(),
+                [['price', 'sum'], ['price', 'max'], ['qty', 'mean'], ['f', 'count'], ['f', 'min']]
+                )
+        self.assertEqual(post.dtypes.values.tolist(),
+                [np.dtype(int), np.dtype(int), np.dtype(float), np.dtype(int), np.dtype(float)]
+                )
+        self.assertEqual(post.fillna(-1).to_pairs(),
+                ((('price', 'sum'), (('a', 4), ('b', 2), ('c', 4))), (('price', 'max'), (('a', 3), ('b', 2), ('c', 4))), (('qty', 'mean'), (('a', 20.0), ('b', 20.0), ('c', 40.0))), (('f', 'count'), (('a', 2), ('b', 0), ('c', 0))), (('f', 'min'), (('a', 1.5), ('b', -1.0), ('c', -1.0))))
+                )
+
+    def test_group_by_aggregate_b(self) -> None:
+        # columns of consolidated blocks are gathered once per block
+        tb = TypeBlocks.from_blocks((
+                np.arange(30) % 4,
+                np.arange(60).reshape(30, 2) % 7,
+                np.linspace(0, 1, 60).reshape(30, 2),
+                np.array([str(i % 5) for i in range(30)]),
+                ))
+        f = Frame(tb)
+        self.assertEqual(f._blocks.shapes.tolist(), [(30,), (30, 2), (30, 2), (30,)])
+        g = f.group_by(0, drop=True)
+
+        spec = {4: ('min', 'sum'), 2: 'max', 1: ('sum', 'max'), 5: 'max', 3: 'mean'}
+        post = g.reduce.aggregate(spec)
+        for label, names in spec.items():
+            for name in ((names,) if isinstance(names, str) else names):
+                expected = getattr(f[[0, label]].group_by(0, drop=True).reduce, name)()[label]
+                self.assertEqual(post[(label, name)].values.tolist(), expected.values.tolist())
+                self.assertEqual(post[(label, name)].dtype, expected.dtype)
+
+    def test_group_by_aggregate_c(self) -> None:
+        f = FrameGO.from_records(
+                ((1, 2, 1), (3, 4, 1), (5, 6, 2)),
+                index=('x', 'y', 'z'),
+                columns=('p', 'q', 'r'),
+                )
+        post = f.group_by('z', axis=1).reduce.aggregate({'x': ('sum', 'min'), 'y': 'max'})
+        self.assertIs(post.__class__, FrameGO)
+        self.assertEqual(post.to_pairs(),
+                ((2, ((('x', 'sum'), 1), (('x', 'min'), 1), (('y', 'max'), 1))), (5, ((('x', 'sum'), 1), (('x', 'min'), 1), (('y', 'max'), 3))), (6, ((('x', 'sum'), 2), (('x', 'min'), 2), (('y', 'max'), 4))))
+                )
+
+        with self.assertRaises(RuntimeError):
+            f.group_by('z', axis=1).reduce.aggregate({'x': 'median'})
+        with self.assertRaises(KeyError):
+            f.group_by('r').reduce.aggregate({'s': 'sum'})
+
+    #---------------------------------------------------------------------------
+
+    def test_group_by_var_a(self) -> None:
+        f = Frame.from_records(
+                (('a', 1, 1.5), ('b', 2, nan), ('a', 3, 2.0), ('c', 4, nan), ('b', 6, 1.0), ('a', 8, 4.5)),
+                columns=('k', 'i', 'f'),
+                )
+        g = f.group_by('k', drop=True)
+        for ddof in (0, 1):
+            for skipna in (True, False):
+                post1 = g.reduce.var(skipna=skipna, ddof=ddof)
+                post2 = g.reduce.std(skipna=skipna, ddof=ddof)
+                for label, group in g.items():
+                    self.assertTrue(np.allclose(
+                            post1.loc[label].values.astype(float),
+                            group.var(skipna=skipna, ddof=ddof).values.astype(float),
+                            equal_nan=True,
+                            ))
+                    self.assertTrue(np.allclose(
+                            post2.loc[label].values.astype(float),
+                            group.std(skipna=skipna, ddof=ddof).values.astype(float),
+                            equal_nan=True,
+                            ))
+
+        post3 = g.reduce.aggregate({'i': ('var', 'std')}, ddof=1)
+        self.assertEqual(round(post3, 4).fillna(-1).to_pairs(),
+                ((('i', 'var'), (('a', 13.0), ('b', 8.0), ('c', -1.0))), (('i', 'std'), (('a', 3.6056), ('b', 2.8284), ('c', -1.0))))
+                )
+
+    #---------------------------------------------------------------------------
+
+    def test_group_by_transform_a(self) -> None:
+        f = Frame.from_records(
+                (('a', 1, 1.5), ('b', 2, nan), ('a', 3, 2.0), ('c', 4, nan), ('b', 6, 1.0)),
+                columns=('k', 'i', 'f'),
+                index=('v', 'w', 'x', 'y', 'z'),
+                )
+        t = f.group_by('k', drop=True).transform
+
+        post1 = t.sum()
+        self.assertEqual(post1.index.values.tolist(), ['v', 'w', 'x', 'y', 'z'])
+        self.assertEqual(post1.to_pairs(),
+                (('i', (('v', 4), ('w', 8), ('x', 4), ('y', 4), ('z', 8))), ('f', (('v', 3.5), ('w', 1.0), ('x', 3.5), ('y', 0.0), ('z', 1.0))))
+                )
+
+        # de-meaning and z-scoring within groups
+        post2 = f[['i', 'f']] - t.mean()
+        self.assertEqual(post2.fillna(0).to_pairs(),
+                (('i', (('v', -1.0), ('w', -2.0), ('x', 1.0), ('y', 0.0), ('z', 2.0))), ('f', (('v', -0.25), ('w', 0.0), ('x', 0.25), ('y', 0.0), ('z', 0.0))))
+                )
+        post3 = post2 / t.std()
+        self.assertEqual(post3['i'].fillna(0).values.tolist(), [-1.0, -1.0, 1.0, 0.0, 1.0])
+
+        post4 = t.aggregate({'i': ('min', 'count')})
+        self.assertEqual(post4.to_pairs(),
+                ((('i', 'min'), (('v', 1), ('w', 2), ('x', 1), ('y', 4), ('z', 2))), (('i', 'count'), (('v', 2), ('w', 2), ('x', 2), ('y', 1), ('z', 2))))
+                )
+
+    def test_group_by_transform_b(self) -> None:
+        f1 = FrameGO.from_records(
+                ((1, 2, 1), (3, 4, 1), (5, 6, 2)),
+                index=('x', 'y', 'z'),
+                columns=('p', 'q', 'r'),
+                )
+        post1 = f1.group_by('z', axis=1, drop=True).transform.max()
+        self.assertIs(post1.__class__, FrameGO)
+        self.assertEqual(post1.to_pairs(),
+                (('p', (('x', 1), ('y', 3))), ('q', (('x', 2), ('y', 4))), ('r', (('x', 1), ('y', 1))))
+                )
+
+        # unsortable keys
+        f2 = Frame.from_records(
+                ((1, 2), (None, 4), ('a', 6), (1, 1)),
+                columns=('k', 'v'),
+                )
+        post2 = f2.group_by('k', drop=True).transform.sum()
+        self.assertEqual(post2.to_pairs(),
+                (('v', ((0, 3), (1, 4), (2, 6), (3, 3))),)
+                )
+
+    #---------------------------------------------------------------------------
+
+    def test_group_by_nlargest_a(self) -> None:
+        f = Frame.from_records(
+                (('a', 1, 1.5), ('b', 2, nan), ('a', 3, 2.0), ('c', 4, nan), ('b', 6, 1.0), ('a', 3, 4.0)),
+                columns=('k', 'i', 'f'),
+                index=('u', 'v', 'w', 'x', 'y', 'z'),
+                )
+        g = f.group_by('k')
+        post1 = g.nlargest('i', 2)
+        self.assertEqual(post1.fillna(0).to_pairs(),
+                (('k', (('w', 'a'), ('z', 'a'), ('y', 'b'), ('v', 'b'), ('x', 'c'))), ('i', (('w', 3), ('z', 3), ('y', 6), ('v', 2), ('x', 4))), ('f', (('w', 2.0), ('z', 4.0), ('y', 1.0), ('v', 0.0), ('x', 0.0))))
+                )
+        post2 = g.nsmallest('f', 1)
+        self.assertEqual(post2.index.values.tolist(), ['u', 'y'])
+        self.assertEqual(g.nlargest('i', 0).shape, (0, 3))
+
+        with self.assertRaises(RuntimeError):
+            g.nlargest(['i', 'f'], 2)
+
+    def test_group_by_nlargest_b(self) -> None:
+        f = ff.parse('s(200,3)|v(int,float,int)').assign[0].apply(lambda s: s % 7)
+        g = f.group_by(0)
+        for count in (1, 3, 40):
+            for largest in (True, False):
+                post = g.nlargest(1, count) if largest else g.nsmallest(1, count)
+                expected = [(f.nlargest(1, count) if largest else f.nsmallest(1, count)).index.values.tolist()
+                        for _, f in g.items()]
+                self.assertEqual(post.index.values.tolist(), sum(expected, []))
+
+        h = Frame.from_records(((1, 2, 1, 9), (3, 4, 1, 0), (5, 6, 2, 5)), index=('x', 'y', 'z'))
+        self.assertEqual(h.group_by('z', axis=1).nlargest('x', 1).columns.values.tolist(), [2, 3, 1])
+
+    def test_group_by_nlargest_c(self) -> None:
+        # a group large enough to be partitioned, small groups with ties and NaN, and counts selected by sort or by repeated reductions
+        keys = np.concatenate((np.full(5000, 0), np.arange(1, 2001) % 300 + 1))
+        values = np.concatenate((np.arange(5000) % 17, np.arange(2000) % 5)).astype(float)
+        values[::11] = nan
+        f = Frame.from_fields((keys, values, values.astype(object)), columns=('k', 'v', 'o'))
+        g = f.group_by('k')
+        for label in ('v', 'o'):
+            for count in (2, 9):
+                for largest in (True, False):
+                    post = g.nlargest(label, count) if largest else g.nsmallest(label, count)
+                    expected = [(f.nlargest(label, count) if largest else f.nsmallest(label, count)).index.values.tolist()
+                            for _, f in g.items()]
+                    self.assertEqual(post.index.values.tolist(), sum(expected, []))
+
+    def test_extreme_select_a(self) -> None:
+        values = np.array([3, 1, 3, 2, 7, 7, 7, 5])
+        sizes = np.array([4, 1, 3])
+        self.assertEqual(extreme_select(values, sizes, 2, largest=True).tolist(), [0, 2, 4, 5, 6])
+        self.assertEqual(extreme_select(values, sizes, 2, largest=False).tolist(), [1, 3, 4, 5, 7])
+        self.assertEqual(extreme_select(values[:0], sizes[:0], 2, largest=True).tolist(), [])
+
+        values_f = np.array([-np.inf, -np.inf, 1.0])
+        self.assertEqual(extreme_select(values_f, np.array([3]), 3, largest=True).tolist(), [0, 1, 2])
+
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
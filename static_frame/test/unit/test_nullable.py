@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import numpy as np
+import pyarrow as pa
+
+from static_frame import Series
+from static_frame.core.nullable import NullableArray
+from static_frame.test.test_case import TestCase
+
+nan = np.nan
+
+
+class TestUnit(TestCase):
+
+    def test_nullable_from_array_a(self) -> None:
+        n = NullableArray.from_array(np.array([1.0, nan, 3.0, nan, 5.0]))
+        self.assertEqual(repr(n), '<NullableArray: 5 elements, 2 missing, int64>')
+        self.assertEqual(n.values.tolist(), [1, 0, 3, 0, 5])
+        self.assertEqual(n.valid.tolist(), [True, False, True, False, True])
+        self.assertEqual((n.shape, n.ndim, n.size, len(n), n.null_count), ((5,), 1, 5, 5, 2))
+        self.assertEqual(n.nbytes, 45)
+        self.assertFalse(n.values.flags.writeable)
+        self.assertFalse(n.valid.flags.writeable)
+
+        self.assertEqual(n.to_array().tolist()[::2], [1.0, 3.0, 5.0])
+        self.assertIs(n.to_array(), n.to_array())
+        self.assertEqual(np.asarray(n).dtype, np.dtype(float))
+
+    def test_nullable_from_array_b(self) -> None:
+        n1 = NullableArray.from_array(np.array([None, 1.0, None, 3], dtype=object))
+        self.assertEqual(n1.dtype, np.dtype(np.int64))
+        self.assertEqual(n1.values.tolist(), [0, 1, 0, 3])
+
+        n2 = NullableArray.from_array(np.array([True, None, False], dtype=object))
+        self.assertEqual(n2.dtype, np.dtype(bool))
+        self.assertEqual(n2.to_array().tolist(), [True, None, False])
+
+        n3 = NullableArray.from_array(np.array([1, 2], dtype=np.int8))
+        self.assertEqual(n3.null_count, 0)
+        self.assertIs(n3.to_array(), n3.values)
+        self.assertEqual(n3.valid.tolist(), [True, True])
+
+        n4 = NullableArray.from_array(np.array([nan, 2.0]), dtype=np.uint8)
+        self.assertEqual(n4.dtype, np.dtype(np.uint8))
+
+        with self.assertRaises(RuntimeError):
+            NullableArray.from_array(np.array([1.5, nan]))
+        with self.assertRaises(RuntimeError):
+            NullableArray.from_array(np.array(['a', None], dtype=object))
+        with self.assertRaises(RuntimeError):
+            NullableArray.from_array(np.array([[1]]))
+
+    def test_nullable_getitem_a(self) -> None:
+        n = NullableArray.from_array(np.array([1.0, nan, 3.0]))
+        self.assertEqual(n[0], 1)
+        self.assertEqual(n[1], None)
+        self.assertEqual(n[1:].to_array().tolist()[1], 3.0)
+        self.assertEqual(n[[0, 2]].null_count, 0)
+
+    def test_nullable_equals_a(self) -> None:
+        n = NullableArray.from_array(np.array([1.0, nan, 3.0]))
+        self.assertTrue(n.equals(n))
+        self.assertTrue(n.equals(NullableArray.from_array(np.array([1, None, 3], dtype=object))))
+        self.assertFalse(n.equals(NullableArray.from_array(np.array([1.0, 0.0, 3.0]))))
+        self.assertFalse(n.equals(NullableArray.from_array(np.array([1.0, nan, nan]))))
+        self.assertFalse(n.equals(NullableArray.from_array(np.array([1.0, nan, 3.0]), dtype=np.int32)))
+        self.assertFalse(n.equals(n.values))
+
+    #---------------------------------------------------------------------------
+
+    def test_nullable_isna_a(self) -> None:
+        n = NullableArray.from_array(np.array([1.0, nan, 3.0, nan]))
+        self.assertEqual(n.isna().tolist(), [False, True, False, True])
+        self.assertEqual(n.notna().tolist(), [True, False, True, False])
+        self.assertEqual(n.dropna().tolist(), [1, 3])
+        self.assertEqual(n.dropna().dtype, np.dtype(np.int64))
+
+        n2 = NullableArray.from_array(np.array([1, 2]))
+        self.assertEqual(n2.isna().tolist(), [False, False])
+        self.assertIs(n2.dropna(), n2.values)
+
+    def test_nullable_fillna_a(self) -> None:
+        n = NullableArray.from_array(np.array([1.0, nan, 3.0, nan]))
+        post1 = n.fillna(-1)
+        self.assertEqual(post1.tolist(), [1, -1, 3, -1])
+        self.assertEqual(post1.dtype, np.dtype(np.int64))
+        self.assertFalse(post1.flags.writeable)
+
+        post2 = n.fillna(0.5)
+        self.assertEqual(post2.tolist(), [1.0, 0.5, 3.0, 0.5])
+
+        post3 = n.fillna('x')
+        self.assertEqual(post3.tolist(), [1, 'x', 3, 'x'])
+
+    def test_nullable_fillna_directional_a(self) -> None:
+        a = np.array([nan, 1.0, nan, nan, 3.0, nan])
+        n = NullableArray.from_array(a)
+        s = Series(a)
+        for limit in (0, 1, 2):
+            self.assertEqual(
+                    np.nan_to_num(n.fillna_forward(limit).to_array(), nan=-1).tolist(),
+                    s.fillna_forward(limit).fillna(-1).values.tolist(),
+                    )
+            self.assertEqual(
+                    np.nan_to_num(n.fillna_backward(limit).to_array(), nan=-1).tolist(),
+                    s.fillna_backward(limit).fillna(-1).values.tolist(),
+                    )
+        self.assertEqual(n.fillna_forward().dtype, np.dtype(np.int64))
+
+        n2 = NullableArray.from_array(np.array([1, 2]))
+        self.assertIs(n2.fillna_forward(), n2)
+
+    #---------------------------------------------------------------------------
+
+    def test_nullable_reduce_a(self) -> None:
+        n = NullableArray.from_array(np.array([2.0, nan, 3.0, nan, 5.0]))
+        self.assertEqual(n.count(), 3)
+        self.assertEqual(n.sum(), 10)
+        self.assertEqual(n.prod(), 30)
+        self.assertEqual(n.min(), 2)
+        self.assertEqual(n.max(), 5)
+        self.assertEqual(n.mean(), 10 / 3)
+        self.assertTrue(np.isnan(n.sum(skipna=False)))
+        self.assertTrue(np.isnan(n.max(skipna=False)))
+
+        n2 = NullableArray.from_array(np.array([nan, nan]))
+        self.assertEqual(n2.sum(), 0)
+        self.assertTrue(np.isnan(n2.min()))
+
+        n3 = NullableArray.from_array(np.array([4, 5]))
+        self.assertEqual((n3.sum(skipna=False), n3.min(skipna=False)), (9, 4))
+
+        n4 = NullableArray.from_array(np.array([], dtype=np.int64))
+        self.assertEqual(n4.null_count, 0)
+        self.assertTrue(np.isnan(n4.min()))
+        self.assertTrue(np.isnan(n4.max(skipna=False)))
+        self.assertTrue(np.isnan(n4.mean()))
+        self.assertEqual((n4.sum(), n4.prod(), n4.all(), n4.any()), (0, 1, True, False))
+
+    def test_nullable_reduce_b(self) -> None:
+        n = NullableArray.from_array(np.array([True, None, True], dtype=object))
+        self.assertTrue(n.all())
+        self.assertTrue(n.any())
+        self.assertTrue(np.isnan(n.all(skipna=False)))
+        self.assertEqual(n.sum(), 2)
+
+    #---------------------------------------------------------------------------
+
+    def test_nullable_arrow_a(self) -> None:
+        a = pa.array([1, None, 3, None, 5], type=pa.int32())
+        n = NullableArray.from_arrow(a)
+        self.assertEqual(n.dtype, np.dtype(np.int32))
+        self.assertEqual(n.values.tolist(), [1, 0, 3, 0, 5])
+        self.assertEqual(n.null_count, 2)
+        self.assertTrue(n.to_arrow().equals(a))
+
+        # sliced arrays have an offset into buffers
+        a2 = a.slice(1, 3)
+        n2 = NullableArray.from_arrow(a2)
+        self.assertEqual(n2.values.tolist(), [0, 3, 0])
+        self.assertTrue(n2.to_arrow().equals(a2))
+
+        n3 = NullableArray.from_arrow(pa.chunked_array([[1, 2], [None, 4]]))
+        self.assertEqual(n3.isna().tolist(), [False, False, True, False])
+
+        n4 = NullableArray.from_arrow(pa.array([1, 2], type=pa.uint16()))
+        self.assertEqual(n4.null_count, 0)
+        self.assertEqual(n4.dtype, np.dtype(np.uint16))
+        self.assertTrue(n4.to_arrow().equals(pa.array([1, 2], type=pa.uint16())))
+
+        with self.assertRaises(RuntimeError):
+            NullableArray.from_arrow(pa.array([1.5]))
+
+    def test_nullable_arrow_b(self) -> None:
+        a = pa.array([True, None, False, True, None, True, True, False, True])
+        n = NullableArray.from_arrow(a)
+        self.assertEqual(n.dtype, np.dtype(bool))
+        self.assertEqual(n.to_array().tolist(), a.to_pylist())
+        self.assertTrue(n.to_arrow().equals(a))
+        self.assertTrue(NullableArray.from_arrow(a.slice(3)).to_arrow().equals(a.slice(3)))
+
+    def test_nullable_to_series_a(self) -> None:
+        n = NullableArray.from_array(np.array([True, None], dtype=object))
+        s = n.to_series(index=('a', 'b'), name='x')
+        self.assertEqual(s.to_pairs(), (('a', True), ('b', None)))
+        self.assertEqual(s.name, 'x')
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import warnings
+
 import frame_fixtures as ff
 import numpy as np
+import typing_extensions as tp
 
 from static_frame.core.frame import Frame
 from static_frame.core.index import Index
 from static_frame.core.index_hierarchy import IndexHierarchy
+from static_frame.core.pivot import PIVOT_SCATTER_FUNCS
+from static_frame.core.pivot import pivot_codes
+from static_frame.core.pivot import pivot_factorize
+from static_frame.core.pivot import pivot_index_complete
 from static_frame.core.pivot import pivot_items_to_block
 from static_frame.core.pivot import pivot_items_to_frame
 from static_frame.test.test_case import TestCase
@@ -106,6 +113,206 @@ class TestUnit(TestCase):
                 ((2, (((0, 0), 463099), ((0, 1), -88017), ((0, 2), 35021), ((1, 0), 92867), ((1, 2), 96520), ((2, 0), 172133), ((2, 1), 279191), ((2, 2), 13448), ((3, 0), 255338), ((3, 1), 372807), ((3, 2), 155574))), (3, (((0, 0), 348362), ((0, 1), 175579), ((0, 2), 105269), ((1, 0), 58768), ((1, 2), 13448), ((2, 0), 84967), ((2, 1), 239151), ((2, 2), 170440), ((3, 0), 269300), ((3, 1), 204528), ((3, 2), 493169))))
                 )
 
+    #---------------------------------------------------------------------------
+
+    def test_pivot_codes_a(self) -> None:
+        uniques, codes = pivot_codes(np.array((30, 10, 30, 20)))
+        self.assertEqual(uniques.tolist(), [10, 20, 30])
+        self.assertEqual(codes.tolist(), [2, 0, 2, 1])
+
+        # a sparse range of integers is sorted
+        uniques, codes = pivot_codes(np.array((2**40, -5, 2**40)))
+        self.assertEqual(uniques.tolist(), [-5, 2**40])
+        self.assertEqual(codes.tolist(), [1, 0, 1])
+
+        uniques, codes = pivot_codes(np.array(('b', 'a', 'b')))
+        self.assertEqual(uniques.tolist(), ['a', 'b'])
+        self.assertEqual(codes.tolist(), [1, 0, 1])
+
+        uniques, codes = pivot_codes(np.array((True, False, True)))
+        self.assertEqual(uniques.tolist(), [False, True])
+        self.assertEqual(codes.tolist(), [1, 0, 1])
+
+    def test_pivot_factorize_a(self) -> None:
+        f = Frame.from_records((('b', 2, 1.0), ('a', 1, 2.0), ('b', 1, 3.0), ('b', 2, 4.0)))
+        codes, labels = pivot_factorize(f._blocks, [0, 1]) # type: ignore
+        self.assertEqual(codes.tolist(), [2, 0, 1, 2])
+        self.assertEqual(labels, [('a', 1), ('b', 1), ('b', 2)])
+
+        # NaN and object values are not factorized
+        f2 = Frame.from_records((('b', 2, np.nan), ('a', None, 1.0)))
+        self.assertIsNone(pivot_factorize(f2._blocks, [1]))
+        self.assertIsNone(pivot_factorize(f2._blocks, [2]))
+
+    #---------------------------------------------------------------------------
+
+    def _pivot_grouped(self, frame: Frame, **kwargs: tp.Any) -> Frame:
+        # evaluate a pivot without the scatter fast path
+        funcs = dict(PIVOT_SCATTER_FUNCS)
+        PIVOT_SCATTER_FUNCS.clear()
+        try:
+            return frame.pivot(**kwargs)
+        finally:
+            PIVOT_SCATTER_FUNCS.update(funcs)
+
+    def test_pivot_scatter_a(self) -> None:
+        f = Frame.from_records((
+                ('x', 'a', 1.0, 1),
+                ('x', 'b', np.nan, 2),
+                ('y', 'a', 3.0, 3),
+                ('y', 'a', 5.0, 4),
+                ('z', 'b', 2.0, 5),
+                ), columns=('i', 'c', 'v', 'w'))
+
+        post1 = f.pivot('i', 'c', 'v', func=np.nansum)
+        self.assertEqual(post1.fillna(-1).to_pairs(),
+                (('a', (('x', 1.0), ('y', 8.0), ('z', -1.0))), ('b', (('x', 0.0), ('y', -1.0), ('z', 2.0))))
+                )
+        post2 = f.pivot('i', 'c', 'v', func=np.sum, fill_value=0)
+        self.assertEqual(post2.fillna(-1).to_pairs(),
+                (('a', (('x', 1.0), ('y', 8.0), ('z', 0.0))), ('b', (('x', -1.0), ('y', 0.0), ('z', 2.0))))
+                )
+        post3 = f.pivot('i', 'c', 'w', func=np.mean)
+        self.assertEqual(post3.fillna(-1).to_pairs(),
+                (('a', (('x', 1.0), ('y', 3.5), ('z', -1.0))), ('b', (('x', 2.0), ('y', -1.0), ('z', 5.0))))
+                )
+        post4 = f.pivot('i', 'c', 'w', func=len, fill_value=0)
+        self.assertEqual(post4.dtypes.values.tolist(), [np.dtype(int), np.dtype(int)])
+        self.assertEqual(post4.to_pairs(),
+                (('a', (('x', 1), ('y', 2), ('z', 0))), ('b', (('x', 1), ('y', 0), ('z', 1))))
+                )
+
+    def test_pivot_scatter_b(self) -> None:
+        f = ff.parse('s(200,5)|v(int,str,int,float,bool)').assign[0].apply(
+                lambda s: s % 7).assign[2].apply(lambda s: s % 3)
+        funcs = (np.sum, np.nansum, np.mean, np.nanmean, np.min, np.nanmin, np.max, np.nanmax, len)
+        for func in funcs + ({'a': np.nanmax, 'b': len},): # type: ignore
+            for data_fields in (3, 4, [3, 4]):
+                for fill_value in (np.nan, 0, None):
+                    kwargs = dict(index_fields=0,
+                            columns_fields=2,
+                            data_fields=data_fields,
+                            func=func,
+                            fill_value=fill_value,
+                            )
+                    post = f.pivot(**kwargs)
+                    expected = self._pivot_grouped(f, **kwargs)
+                    self.assertEqual(post.dtypes.values.tolist(), expected.dtypes.values.tolist())
+                    self.assertTrue(post.columns.equals(expected.columns))
+                    self.assertTrue(post.index.equals(expected.index))
+                    self.assertTrue(np.allclose(
+                            post.fillna(-1).values.astype(float),
+                            expected.fillna(-1).values.astype(float),
+                            ))
+
+    def test_pivot_scatter_c(self) -> None:
+        f = Frame.from_records((
+                (1, 10, 'p', 'a', 1.0),
+                (1, 20, 'q', 'b', 2.0),
+                (2, 10, 'p', 'a', 3.0),
+                (2, 10, 'p', 'b', 4.0),
+                ), columns=('i', 'k', 'j', 'c', 'v'))
+        kwargs = dict(index_fields=('i', 'k'),
+                columns_fields=('c', 'j'),
+                data_fields='v',
+                func=np.nanmax,
+                fill_value=0,
+                )
+        post = f.pivot(**kwargs)
+        self.assertEqual(post.to_pairs(), self._pivot_grouped(f, **kwargs).to_pairs())
+        self.assertEqual(post.to_pairs(),
+                ((('a', 'p'), (((1, 10), 1.0), ((1, 20), 0.0), ((2, 10), 3.0))), (('b', 'p'), (((1, 10), 0.0), ((1, 20), 0.0), ((2, 10), 4.0))), (('b', 'q'), (((1, 10), 0.0), ((1, 20), 2.0), ((2, 10), 0.0))))
+                )
+
+    def test_pivot_scatter_d(self) -> None:
+        # extremes of NaN values do not warn
+        f = Frame.from_records((
+                ('a', 'x', 1.0),
+                ('a', 'x', np.nan),
+                ('b', 'y', 2.0),
+                ('b', 'x', np.nan),
+                ), columns=('i', 'c', 'v'))
+        for func in (np.min, np.max):
+            with warnings.catch_warnings():
+                warnings.simplefilter('error')
+                post = f.pivot('i', 'c', 'v', func=func)
+            self.assertEqual(post.fillna(-1).to_pairs(),
+                    (('x', (('a', -1.0), ('b', -1.0))), ('y', (('a', -1.0), ('b', 2.0))))
+                    )
+
+    def test_pivot_records_fill_a(self) -> None:
+        # when a fill value does not change the dtype, cells without records are still filled
+        f = Frame.from_records((
+                ('x', 'a', 1, 10),
+                ('y', 'b', 2, 20),
+                ), columns=('i', 'c', 'v', 'w'))
+        post = self._pivot_grouped(f,
+                index_fields='i',
+                columns_fields='c',
+                data_fields=('v', 'w'),
+                func=np.sum,
+                fill_value=0,
+                )
+        self.assertEqual(post.to_pairs(),
+                ((('a', 'v'), (('x', 1), ('y', 0))), (('a', 'w'), (('x', 10), ('y', 0))), (('b', 'v'), (('x', 0), ('y', 2))), (('b', 'w'), (('x', 0), ('y', 20))))
+                )
+
+    def test_pivot_parallel_a(self) -> None:
+        f = ff.parse('s(40,5)|v(int,str,bool,float)|i(I,str)').assign[0].apply(lambda s: s % 4)
+        for func in (np.nansum, {'max': np.max, 'mean': np.mean}, np.median):
+            kwargs = dict(index_fields=0,
+                    columns_fields=(1, 2),
+                    data_fields=(3, 4),
+                    func=func,
+                    )
+            post1 = f.pivot(**kwargs)
+            post2 = f.pivot(**kwargs, max_workers=3, use_threads=True)
+            self.assertTrue(post1.equals(post2, compare_dtype=True))
+            post3 = self._pivot_grouped(f, **kwargs, max_workers=2, use_threads=True)
+            self.assertTrue(post1.equals(post3, compare_dtype=True))
+
+    def test_pivot_parallel_b(self) -> None:
+        f = ff.parse('s(20,4)|v(int,bool,float)').assign[0].apply(lambda s: s % 3)
+        post1 = f.pivot(0, 1, 2, func=np.median, fill_value=0)
+        post2 = f.pivot(0, 1, 2, func=np.median, fill_value=0, max_workers=2)
+        self.assertTrue(post1.equals(post2, compare_dtype=True))
+
+        # more workers than groups of columns fields
+        post3 = self._pivot_grouped(f, index_fields=0, columns_fields=1, data_fields=(2, 3), func=np.sum, max_workers=8, use_threads=True)
+        post4 = self._pivot_grouped(f, index_fields=0, columns_fields=1, data_fields=(2, 3), func=np.sum)
+        self.assertTrue(post3.equals(post4, compare_dtype=True))
+
+        with self.assertRaises(RuntimeError):
+            f.pivot(0, 1, 2, max_workers=0)
+
+    #---------------------------------------------------------------------------
+
+    def test_pivot_index_complete_a(self) -> None:
+        ih1 = IndexHierarchy.from_product(('a', 'b', 'c'), (1, 2))
+        post1 = pivot_index_complete(ih1, -1)
+        assert post1 is not None
+        self.assertEqual(post1.positions.tolist(), [[0, 1], [2, 3], [4, 5]])
+        self.assertEqual(post1.target_select.tolist(), [False, True])
+
+        post2 = pivot_index_complete(ih1, 0)
+        assert post2 is not None
+        self.assertEqual(post2.positions.tolist(), [[0, 2, 4], [1, 3, 5]])
+
+        post3 = pivot_index_complete(Index(('x', 'y')), 0)
+        assert post3 is not None
+        self.assertEqual(post3.positions.tolist(), [[0, 1]])
+
+    def test_pivot_index_complete_b(self) -> None:
+        # groups and targets are ordered by first appearance
+        ih1 = IndexHierarchy.from_labels((('b', 2), ('a', 1), ('b', 1), ('a', 2)))
+        post1 = pivot_index_complete(ih1, 1)
+        assert post1 is not None
+        self.assertEqual(post1.positions.tolist(), [[0, 2], [3, 1]])
+
+        # incomplete
+        ih2 = IndexHierarchy.from_labels((('b', 2), ('a', 1), ('b', 1)))
+        self.assertIsNone(pivot_index_complete(ih2, 1))
+
 
 if __name__ == '__main__':
     import unittest
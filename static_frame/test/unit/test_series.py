@@ -4095,6 +4095,114 @@ class TestUnit(TestCase):
         self.assertEqual(len(list(s.iter_window_items(size=2, window_sized=False, start_shift=-1))), 10)
         self.assertEqual(len(list(s.iter_window_items(size=2, window_sized=False, start_shift=-1, label_missing_skips=False))), 11)
 
+    def test_series_iter_window_duration_a(self) -> None:
+        s = sf.Series((1, 2, 3, 4, 5),
+                index=sf.IndexSecond(('2024-01-01T00:00:00', '2024-01-01T00:00:30', '2024-01-01T00:01:10', '2024-01-01T00:01:20', '2024-01-01T00:03:00')),
+                )
+        post1 = s.iter_window(size=np.timedelta64(1, 'm'), window_sized=False).apply(lambda w: w.values.tolist())
+        self.assertEqual(post1.values.tolist(), [[1], [1, 2], [2, 3], [2, 3, 4], [5]])
+
+        post2 = s.iter_window(size=np.timedelta64(1, 'm')).reduce.sum()
+        self.assertEqual(post2.to_pairs(),
+                ((np.datetime64('2024-01-01T00:01:10'), 5), (np.datetime64('2024-01-01T00:01:20'), 9), (np.datetime64('2024-01-01T00:03:00'), 5)))
+
+        post3 = s.iter_window(size=np.timedelta64(2, 'm'), window_sized=False, label_shift=-1).reduce.max()
+        self.assertEqual(post3.values.tolist(), [2, 3, 4, 5])
+
+        with self.assertRaises(RuntimeError):
+            sf.Series((1, 2)).iter_window(size=np.timedelta64(1, 'm')).reduce.sum()
+
+    def test_series_iter_window_reduce_a(self) -> None:
+        s = sf.Series((3, 1, np.nan, 4, 1, 5, np.nan, np.nan, 2, 6),
+                index=self.get_letters(10),
+                name='x',
+                )
+        for name in ('sum', 'mean', 'min', 'max', 'var', 'std', 'count'):
+            for kwargs in (
+                    dict(size=3),
+                    dict(size=3, step=2, window_sized=False),
+                    dict(size=4, label_shift=-3, start_shift=-2, window_sized=False),
+                    ):
+                post = getattr(s.iter_window(**kwargs).reduce, name)() # type: ignore
+                expected = s.iter_window(**kwargs).apply(lambda w: getattr(w, name)()) # type: ignore
+                self.assertEqual(post.name, 'x')
+                self.assertEqual(post.index.values.tolist(), expected.index.values.tolist())
+                self.assertEqual(
+                        round(post, 8).fillna(-1).values.tolist(),
+                        round(expected, 8).fillna(-1).values.tolist(),
+                        )
+
+    def test_series_iter_window_reduce_b(self) -> None:
+        s = sf.Series((1, 2, 3, 4, 5, 6), index=self.get_letters(6))
+
+        post1 = s.iter_window(size=2, step=2).reduce.sum()
+        self.assertEqual(post1.dtype, np.dtype(int))
+        self.assertEqual(post1.to_pairs(), (('b', 3), ('d', 7), ('f', 11)))
+
+        post2 = s.iter_window(size=3, label_shift=-1).reduce.max()
+        self.assertEqual(post2.to_pairs(), (('b', 3), ('c', 4), ('d', 5), ('e', 6)))
+
+        post3 = s.iter_window(size=2, window_sized=False, start_shift=-1, label_missing_skips=False).reduce.count()
+        self.assertEqual(post3.to_pairs(),
+                (('a', 1), ('b', 2), ('c', 2), ('d', 2), ('e', 2), ('f', 2), (None, 1)))
+
+        post4 = s.iter_window(size=2).reduce.var(ddof=1)
+        self.assertEqual(post4.values.tolist(), [0.5] * 5)
+
+        with self.assertRaises(RuntimeError):
+            s.iter_window(size=2, window_valid=lambda w: True).reduce.sum()
+        with self.assertRaises(RuntimeError):
+            s.iter_window(size=2).reduce.aggregate({0: 'sum'})
+
+    def test_series_iter_window_reduce_c(self) -> None:
+        s = sf.Series((1.0, np.inf, -np.inf, 2.0, np.nan, 4.0))
+        post1 = s.iter_window(size=2).reduce.sum()
+        self.assertEqual(post1.fillna(0).values.tolist(),
+                [np.inf, 0, -np.inf, 2.0, 4.0])
+        post2 = s.iter_window(size=2).reduce.sum(skipna=False)
+        self.assertEqual(post2.fillna(0).values.tolist(),
+                [np.inf, 0, -np.inf, 0, 0])
+        post3 = s.iter_window(size=2).reduce.var()
+        self.assertEqual(post3.fillna(-1).values.tolist(),
+                [-1, -1, -1, 0.0, 0.0])
+
+    def test_series_iter_window_reduce_d(self) -> None:
+        s = sf.Series((3.0, np.nan, 1.0, 4.0, 1.0, 5.0), index=tuple('abcdef'))
+        it = s.iter_window(size=1, step=0, size_increment=1)
+
+        self.assertEqual(it.reduce.min().to_pairs(),
+                (('a', 3.0), ('b', 3.0), ('c', 1.0), ('d', 1.0), ('e', 1.0), ('f', 1.0)))
+        self.assertEqual(it.reduce.max().to_pairs(),
+                (('a', 3.0), ('b', 3.0), ('c', 3.0), ('d', 4.0), ('e', 4.0), ('f', 5.0)))
+        self.assertEqual(it.reduce.sum().to_pairs(),
+                (('a', 3.0), ('b', 3.0), ('c', 4.0), ('d', 8.0), ('e', 9.0), ('f', 14.0)))
+        self.assertEqual(it.reduce.max(skipna=False).fillna(-1).values.tolist(),
+                [3.0, -1, -1, -1, -1, -1])
+
+        for name in ('sum', 'mean', 'min', 'max', 'std', 'count'):
+            post = getattr(it.reduce, name)()
+            expected = it.apply(lambda w: getattr(w, name)())
+            self.assertTrue(np.allclose(post.values, expected.values, equal_nan=True))
+
+    def test_series_iter_window_reduce_e(self) -> None:
+        s = sf.Series(np.array((5, 2, 8, 1), dtype=np.int64))
+        # windows of a shifted start all begin at the first element
+        it = s.iter_window(size=2, start_shift=-1, step=0, size_increment=1, window_sized=False)
+        self.assertEqual(it.reduce.min().values.tolist(), [5, 2, 2, 1])
+        self.assertEqual(it.reduce.max().values.tolist(), [5, 5, 8, 8])
+        self.assertEqual(it.reduce.sum().values.tolist(), [5, 7, 15, 16])
+        self.assertEqual(it.reduce.var().values.tolist(),
+                it.apply(lambda w: w.var()).values.tolist())
+
+    def test_series_iter_window_reduce_f(self) -> None:
+        # windows of a single repeated value are exactly zero, even if preceded by a different value before the window
+        s = sf.Series((4.0, np.nan, 2.0, 0.1, 0.1, np.nan, 0.1))
+        it2 = s.iter_window(size=2)
+        self.assertEqual(round(it2.reduce.var(), 6).values.tolist(), [0.0, 0.0, 0.9025, 0.0, 0.0, 0.0])
+        self.assertEqual(it2.reduce.std().values[[0, 1, 3, 4, 5]].tolist(), [0.0] * 5)
+        it3 = s.iter_window(size=3)
+        self.assertEqual(it3.reduce.std().values[3:].tolist(), [0.0, 0.0])
+        self.assertEqual(it3.reduce.var(ddof=1).fillna(-1).values.tolist()[3:], [0.0, 0.0])
 
 
     #---------------------------------------------------------------------------
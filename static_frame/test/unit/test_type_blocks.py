@@ -2,13 +2,17 @@ from __future__ import annotations
 
 import copy
 import pickle
+from concurrent.futures import ThreadPoolExecutor
 from itertools import zip_longest
 
 import frame_fixtures as ff
 import numpy as np
+import typing_extensions as tp
 from arraykit import ErrorInitTypeBlocks
 from arraykit import immutable_filter
 
+from static_frame import ConsolidationPolicy
+from static_frame import ThreadPoolPolicy
 from static_frame import TypeBlocks
 from static_frame import mloc
 from static_frame.core.container_util import get_col_dtype_factory
@@ -20,6 +24,7 @@ from static_frame.core.frame import Frame
 from static_frame.core.index_correspondence import IndexCorrespondence
 from static_frame.core.type_blocks import group_match
 from static_frame.core.type_blocks import group_sorted
+from static_frame.core.type_blocks import thread_pool_policy_active
 from static_frame.core.util import NULL_SLICE
 from static_frame.core.util import isna_array
 from static_frame.test.test_case import TestCase
@@ -2547,6 +2552,44 @@ class TestUnit(TestCase):
         self.assertEqual(len(tb2._blocks), 1)
 
     #---------------------------------------------------------------------------
+    def test_type_blocks_take_blocks_fill_by_element_a(self) -> None:
+        a1 = np.array([1, 2, 3])
+        a2 = np.array([4, 5, 6])
+        a3 = np.array([[False, True], [True, False], [False, False]])
+        a4 = np.array(['b', 'c', 'd'])
+        tb1 = TypeBlocks.from_blocks((a1, a2, a3, a4))
+
+        tb2 = TypeBlocks.from_blocks(tb1._take_blocks_fill_by_element(
+                indexer=np.array((2, 0, 0)),
+                fill_value=None,
+                ))
+        # adjacent int blocks are gathered into one block
+        self.assertEqual(tb2.shapes.tolist(), [(3, 2), (3, 2), (3,)])
+        self.assertEqual(tb2.values.tolist(),
+                [[3, 6, False, False, 'd'], [1, 4, False, True, 'b'], [1, 4, False, True, 'b']]
+                )
+
+        tb3 = TypeBlocks.from_blocks(tb1._take_blocks_fill_by_element(
+                indexer=np.array((-1, 1, -1)),
+                fill_value=0,
+                ))
+        self.assertEqual(tb3.dtypes.tolist(),
+                [np.dtype(int), np.dtype(int), np.dtype(object), np.dtype(object), np.dtype(object)]
+                )
+        self.assertEqual(tb3.values.tolist(),
+                [[0, 0, 0, 0, 0], [2, 5, True, False, 'c'], [0, 0, 0, 0, 0]]
+                )
+
+    def test_type_blocks_take_blocks_fill_by_element_b(self) -> None:
+        tb1 = TypeBlocks.from_blocks((np.array((), dtype=int), np.array((), dtype=str)))
+
+        tb2 = TypeBlocks.from_blocks(tb1._take_blocks_fill_by_element(
+                indexer=np.array((-1, -1)),
+                fill_value=(1, 2),
+                ))
+        self.assertEqual(tb2.dtypes.tolist(), [np.dtype(object), np.dtype(object)])
+        self.assertEqual(tb2.values.tolist(), [[(1, 2), (1, 2)], [(1, 2), (1, 2)]])
+
     def test_type_blocks_resize_blocks_a1(self) -> None:
 
         a1 = np.array([1, 2, 3])
@@ -3918,6 +3961,25 @@ class TestUnit(TestCase):
         self.assertEqual([p[2].__class__ for p in post], [np.ndarray, np.ndarray])
         self.assertEqual([p[2].shape for p in post], [(3, 3), (4, 3)])
 
+    def test_type_blocks_group_match_g(self) -> None:
+        a1 = np.array([None, 'a', (1, 2), None, 'a', 3], dtype=object)
+        a2 = np.arange(6)
+        tb1 = TypeBlocks.from_blocks((a1, a2))
+        post = tuple(group_match(tb1, axis=0, key=0, drop=True))
+        self.assertEqual([p[0] for p in post], [None, 'a', (1, 2), 3])
+        self.assertEqual([p[1].tolist() for p in post], [[0, 3], [1, 4], [2], [5]])
+        self.assertEqual([p[2].values.tolist() for p in post],
+                [[[0], [3]], [[1], [4]], [[2]], [[5]]])
+
+    def test_type_blocks_group_match_h(self) -> None:
+        # values of different types with the same string representation are distinct
+        a1 = np.array([1, '1', 1, None], dtype=object)
+        a2 = np.array(['a', 'a', 'a', 'b'], dtype=object)
+        tb1 = TypeBlocks.from_blocks((a1, a2, np.arange(4)))
+        post = tuple(group_match(tb1, axis=0, key=[0, 1], extract=2, as_array=True))
+        self.assertEqual([p[0] for p in post], [(1, 'a'), ('1', 'a'), (None, 'b')])
+        self.assertEqual([p[2].tolist() for p in post], [[0, 2], [1], [3]])
+
 
     #---------------------------------------------------------------------------
 
@@ -4126,6 +4188,124 @@ class TestUnit(TestCase):
         tb1 = TypeBlocks.from_blocks((a1, ))
         self.assertTrue(tb1.unified_dtypes)
 
+    #---------------------------------------------------------------------------
+    def test_type_blocks_fragmentation_a(self) -> None:
+        a1 = np.array([1, 2, 3])
+        a2 = np.array([[1, 2], [3, 4], [5, 6]])
+        a3 = np.array([1.5, 2.5, 3.5])
+        a4 = np.array([4, 5, 6])
+        tb1 = TypeBlocks.from_blocks((a1, a2, a3, a4, a4))
+        self.assertEqual(tuple(tb1.fragmentation), (6, 5, 4, 3, 2))
+        self.assertEqual(tb1.fragmentation.runs, len(tb1.consolidate()._blocks))
+
+        tb2 = TypeBlocks.from_blocks((), shape_reference=(3, 0))
+        self.assertEqual(tuple(tb2.fragmentation), (0, 0, 0, 0, 0))
+
+    def test_type_blocks_consolidation_policy_a(self) -> None:
+        policy = ConsolidationPolicy(blocks_min=4, excess_ratio=0.5, columns_min=4)
+        a1 = np.array([1, 2, 3])
+        a2 = np.array([1.5, 2.5, 3.5])
+
+        tb1 = TypeBlocks.from_blocks((a1, a1, a1))
+        self.assertIs(policy.apply(tb1), tb1)
+        self.assertEqual(policy.count_evaluated, 0)
+
+        # excess of 1 of 4 blocks
+        tb2 = TypeBlocks.from_blocks((a1, a2, a1, a1))
+        self.assertIs(policy.apply(tb2), tb2)
+        self.assertEqual(policy.count_evaluated, 1)
+        self.assertEqual(policy.count_consolidated, 0)
+
+        tb3 = TypeBlocks.from_blocks((a1, a1, a1, a2, a2))
+        tb4 = policy.apply(tb3)
+        self.assertEqual(tb4.shapes.tolist(), [(3, 3), (3, 2)])
+        self.assertTrue((tb4.values == tb3.values).all())
+        self.assertEqual((policy.count_evaluated, policy.count_consolidated, policy.count_blocks_removed), (2, 1, 3))
+
+        # blocks of at least columns_min columns are not consolidated
+        tb5 = TypeBlocks.from_blocks((np.arange(12).reshape(3, 4), a1, a1, a1))
+        tb6 = policy.apply(tb5)
+        self.assertEqual(tb6.shapes.tolist(), [(3, 4), (3, 3)])
+        self.assertEqual(tb6.mloc[0], tb5.mloc[0])
+
+        policy.reset()
+        self.assertEqual(repr(policy), '<ConsolidationPolicy: blocks_min 4, excess_ratio 0.5, columns_min 4, evaluated 0, consolidated 0, blocks removed 0>')
+
+        # the default policy never consolidates
+        self.assertIs(ConsolidationPolicy().apply(tb3), tb3)
+        self.assertIs(TypeBlocks.CONSOLIDATION_POLICY.blocks_min, None)
+
+        # a block narrower than columns_min is consolidated with its neighbors
+        tb7 = ConsolidationPolicy(blocks_min=4, columns_min=5).apply(tb5)
+        self.assertEqual(tb7.shapes.tolist(), [(3, 7)])
+
+        with self.assertRaises(RuntimeError):
+            ConsolidationPolicy(columns_min=1)
+        with self.assertRaises(RuntimeError):
+            ConsolidationPolicy(blocks_min=1)
+        with self.assertRaises(RuntimeError):
+            ConsolidationPolicy(excess_ratio=0)
+
+    #---------------------------------------------------------------------------
+    def test_type_blocks_thread_pool_policy_a(self) -> None:
+        tb = TypeBlocks.from_blocks((
+                np.arange(40, dtype=float).reshape(10, 4) / 3,
+                np.arange(10),
+                np.arange(30).reshape(10, 3),
+                np.arange(10) % 3 == 0,
+                ))
+        tb_float = TypeBlocks.from_blocks(np.arange(60, dtype=float).reshape(10, 6))
+
+        def apply(tb: TypeBlocks) -> tp.Iterator[tp.Any]:
+            for axis in (0, 1):
+                for ufunc, skipna, composable in (
+                        (np.sum, True, True),
+                        (np.prod, False, True),
+                        (np.all, False, True),
+                        (np.max, True, True),
+                        (np.mean, True, False),
+                        ):
+                    yield tb.ufunc_axis_skipna(
+                            skipna=skipna,
+                            axis=axis,
+                            ufunc=ufunc,
+                            ufunc_skipna=ufunc,
+                            composable=composable,
+                            dtypes=(),
+                            size_one_unity=True,
+                            ).tolist()
+            yield [b.tolist() for b in tb._astype_blocks(list(range(tb.shape[1])), np.float32)]
+            yield [b.dtype for b in tb._astype_blocks([0, 3, 5], str)]
+            yield [b.tolist() for b in tb._ufunc_blocks([1, 2, 4], lambda a: a * 2)]
+
+        policy = ThreadPoolPolicy(max_workers=3, size_min=8)
+        for target in (tb, tb_float):
+            expected = list(apply(target))
+            with policy as p:
+                self.assertIs(thread_pool_policy_active(), policy)
+                self.assertIs(p, policy)
+                post = list(apply(target))
+            self.assertEqual(post, expected)
+        self.assertIs(thread_pool_policy_active(), TypeBlocks.THREAD_POOL_POLICY)
+        self.assertEqual(policy.count_dispatched, 25)
+
+        # a policy entered in one thread is not active in other threads
+        def active_in_thread() -> ThreadPoolPolicy:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                return executor.submit(thread_pool_policy_active).result()
+
+        policy_outer = ThreadPoolPolicy(max_workers=2)
+        with policy_outer:
+            with policy:
+                self.assertIs(thread_pool_policy_active(), policy)
+                self.assertIs(active_in_thread(), TypeBlocks.THREAD_POOL_POLICY)
+            self.assertIs(thread_pool_policy_active(), policy_outer)
+        self.assertEqual(policy.bounds(5), [slice(0, 1), slice(1, 3), slice(3, 5)])
+
+        with self.assertRaises(RuntimeError):
+            ThreadPoolPolicy(max_workers=0)
+        self.assertFalse(ThreadPoolPolicy(max_workers=1, size_min=0).active(10))
+
     #---------------------------------------------------------------------------
     def test_type_blocks_key_to_block_slices_exception(self) -> None:
         # as this is an loc-is-iloc index, the key gets passed directly to type blocks
@@ -40,12 +40,14 @@ from static_frame.core.util import argmax_1d
 from static_frame.core.util import argmax_2d
 from static_frame.core.util import argmin_1d
 from static_frame.core.util import argmin_2d
+from static_frame.core.util import argpartition_extreme
 from static_frame.core.util import array1d_to_last_contiguous_to_edge
 from static_frame.core.util import array_from_element_apply
 from static_frame.core.util import array_from_element_method
 from static_frame.core.util import array_sample
 from static_frame.core.util import array_shift
 from static_frame.core.util import array_to_duplicated
+from static_frame.core.util import array_to_groups_and_locations_hashed
 from static_frame.core.util import array_ufunc_axis_skipna
 from static_frame.core.util import binary_transition
 from static_frame.core.util import blocks_to_array_2d
@@ -452,6 +454,54 @@ class TestUnit(TestCase):
         self.assertEqual(post4.tolist(),
             [False, True, False, False, False, False])
 
+    def test_argpartition_extreme_a(self) -> None:
+        a1 = np.array([3, 1, 4, 1, 5, 9, 2, 6, 5, 3])
+        self.assertEqual(argpartition_extreme(a1, 3, largest=True).tolist(), [5, 7, 4])
+        self.assertEqual(argpartition_extreme(a1, 3, largest=False).tolist(), [1, 3, 6])
+        # of equal values, those at lower positions are selected
+        self.assertEqual(argpartition_extreme(a1, 4, largest=True).tolist(), [5, 7, 4, 8])
+        self.assertEqual(argpartition_extreme(a1, 4, largest=True, ordered=False).tolist(), [4, 5, 7, 8])
+        self.assertEqual(argpartition_extreme(a1, 20, largest=False).tolist(),
+                [1, 3, 6, 0, 9, 2, 4, 8, 7, 5])
+        self.assertEqual(argpartition_extreme(a1, 0, largest=False).tolist(), [])
+
+    def test_argpartition_extreme_b(self) -> None:
+        a1 = np.array([np.nan, 2.0, np.nan, 0.5, 2.0])
+        self.assertEqual(argpartition_extreme(a1, 2, largest=True).tolist(), [1, 4])
+        self.assertEqual(argpartition_extreme(a1, 5, largest=False).tolist(), [3, 1, 4])
+
+        a2 = np.array(['b', None, 'a', 'c'], dtype=object)
+        self.assertEqual(argpartition_extreme(a2, 2, largest=False).tolist(), [2, 0])
+
+    def test_array_to_groups_and_locations_hashed_a(self) -> None:
+        a1 = np.array([3, None, 'a', 3, (1, 2), 'a', None], dtype=object)
+        groups, locations = array_to_groups_and_locations_hashed(a1)
+        # unsortable groups are ordered by first appearance
+        self.assertEqual(groups.tolist(), [3, None, 'a', (1, 2)])
+        self.assertEqual(locations.tolist(), [0, 1, 2, 0, 3, 2, 1])
+        self.assertFalse(locations.flags.writeable)
+
+        a2 = np.array(['c', 'a', 'c', 'b'], dtype=object)
+        groups, locations = array_to_groups_and_locations_hashed(a2)
+        # sortable groups are sorted
+        self.assertEqual(groups.tolist(), ['a', 'b', 'c'])
+        self.assertEqual(locations.tolist(), [2, 0, 2, 1])
+
+    def test_array_to_groups_and_locations_hashed_b(self) -> None:
+        a1 = np.array([[1, 'a'], [None, 'b'], [1, 'a'], [1, '1']], dtype=object)
+        groups, locations = array_to_groups_and_locations_hashed(a1)
+        self.assertEqual(groups.tolist(), [(1, 'a'), (None, 'b'), (1, '1')])
+        self.assertEqual(locations.tolist(), [0, 1, 0, 2])
+
+        groups, locations = array_to_groups_and_locations_hashed(a1.T, unique_axis=1)
+        self.assertEqual(groups.tolist(), [(1, 'a'), (None, 'b'), (1, '1')])
+        self.assertEqual(locations.tolist(), [0, 1, 0, 2])
+
+        groups, locations = array_to_groups_and_locations_hashed(
+                np.array([[1, 'a'], [1, '1'], [1, 'a']], dtype=object))
+        self.assertEqual(groups.tolist(), [(1, '1'), (1, 'a')])
+        self.assertEqual(locations.tolist(), [1, 0, 1])
+
     def test_datetime64_not_aligned_a(self) -> None:
         a1 = np.array(['1999', '2000'], dtype='datetime64[Y]')
         a2 = np.array(['1999', '2001'], dtype='datetime64[Y]')